@@ -10,10 +10,12 @@ For idempotency persistence, see ``powertools.idempotency``.
 Submodules
 ----------
 models    Pydantic table schemas: Refund, WaitlistEntry
-reads     get_item, query, process_stream (Powertools BatchProcessor)
+reads     get_item, batch_get, query, query_pages, parallel_scan,
+          process_stream (Powertools BatchProcessor)
 writes    put_item, batch_write  (accepts model instances or plain dicts)
 updates   patch_item, soft_delete  (flat and dotted-path nested fields)
 deletes   hard_delete, batch_delete
+coalesce  WriteBuffer, write_behind  (coalesced / transactional write-behind)
 
 Quick reference
 ---------------
@@ -33,6 +35,8 @@ Quick reference
     item  = reads.get_item(REFUNDS, "rf-abc123")
     items = reads.query(REFUNDS, index="customer-index",
                         key_cond=Key("customer_id").eq(cid), scan_forward=False)
+    items = reads.batch_get(REFUNDS, ["rf-abc123", "rf-def456"])
+    for item in reads.parallel_scan(REFUNDS, segments=8): ...
 
     # Update (flat or nested)
     updates.patch_item(REFUNDS, "rf-abc123", "refunds", status="completed")
@@ -43,6 +47,12 @@ Quick reference
     deletes.hard_delete(REFUNDS, "rf-abc123", "refunds")
     deletes.batch_delete(REFUNDS, ["rf-abc123", "rf-def456"], "refunds")
 
+    # Write-behind: repeated patches to one id become one UpdateItem on exit
+    from aws.dynamo.coalesce import write_behind
+
+    @write_behind
+    def lambda_handler(event, context): ...
+
     # DynamoDB Streams
     from aws.dynamo.reads import DynamoDBRecord
 
@@ -53,6 +63,14 @@ Quick reference
         return reads.process_stream(event, handle_record, context)
 """
 
-from aws.dynamo import deletes, models, reads, updates, writes
+import importlib
+
+__all__ = ["coalesce", "deletes", "models", "reads", "updates", "writes"]
+
 
-__all__ = ["deletes", "models", "reads", "updates", "writes"]
+def __getattr__(name: str):
+    # Submodules load on first use: ``reads`` pulls in the Powertools batch
+    # utilities and ``models`` pydantic, which handlers that only write skip.
+    if name in __all__:
+        return importlib.import_module(f"aws.dynamo.{name}")
+    raise AttributeError(f"module 'aws.dynamo' has no attribute {name!r}")
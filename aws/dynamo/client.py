@@ -7,14 +7,17 @@ For config/parameter tables, see ``powertools.parameters.make_dynamo_config``.
 For idempotency state, see ``powertools.idempotency``.
 
 Behavior modules:
-    reads     get_item, query, DynamoDB Stream batch processing (Powertools)
+    reads     get_item, batch_get, query(_pages), parallel_scan,
+              DynamoDB Stream batch processing (Powertools)
     writes    put_item, batch_write
     updates   patch_item, soft_delete  (supports dotted nested paths)
     deletes   hard_delete, batch_delete
+    coalesce  WriteBuffer, write_behind  (write-behind batching per invocation)
 """
 
 import os
 from collections import deque
+from contextvars import ContextVar
 from typing import Any
 
 import logging
@@ -26,6 +29,9 @@ logger = logging.getLogger(__name__)  # stdlib logger; Lambda replaces root hand
 REGION = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
 dynamo = boto3.resource("dynamodb", region_name=REGION)
 
+# The open ``coalesce.WriteBuffer``, if any; put_item / patch_item enqueue into it.
+write_buffer: ContextVar[Any] = ContextVar("dynamo_write_buffer", default=None)
+
 
 def build_update_expr(fields: dict[str, Any]) -> tuple[str, dict, dict]:
     """Build a SET expression from a dict of field → value pairs.
@@ -52,7 +58,7 @@ def build_update_expr(fields: dict[str, Any]) -> tuple[str, dict, dict]:
 
 def log_op(name: str, event: str, **kwargs) -> None:
     """Log a table operation at INFO using ``{name}.{event}`` naming."""
-    logger.info(f"{name}.{event}", **kwargs)
+    logger.info(f"{name}.{event}", extra=kwargs)
 
 
 def batch_mutate(table, items, op, name: str, event: str) -> None:
@@ -0,0 +1,234 @@
+"""Write-behind buffering for DynamoDB puts and patches within one invocation.
+
+``WriteBuffer`` holds writes until the block (or decorated handler) exits:
+
+- patches to the same ``id`` coalesce into one ``UpdateItem`` (later values win)
+- a patch after a buffered put is folded into the put's item
+- unconditional puts go out through ``client.batch_mutate`` (25-item chunks)
+- conditional writes are grouped into ``TransactWriteItems`` calls of up to 100
+
+While a buffer is open, ``writes.put_item``, ``updates.patch_item`` and
+``updates.soft_delete`` enqueue into it instead of writing immediately, so
+existing call sites coalesce without changes. Reads inside the block do not
+see buffered writes. If the block raises, nothing is written — the Lambda
+retry replays the whole invocation.
+
+Conditional writes are independent: one whose condition fails is reported in
+``failed`` and dropped from its transaction, and the rest are resubmitted.
+
+Usage
+-----
+    from boto3.dynamodb.conditions import Attr
+    from aws.dynamo.coalesce import WriteBuffer, write_behind
+
+    @write_behind
+    def lambda_handler(event, context):
+        return reads.process_stream(event, handle_record, context)
+
+    with WriteBuffer() as buf:
+        buf.put(REFUNDS, item, "refunds", condition=Attr("id").not_exists())
+        buf.patch(REFUNDS, "rf-abc123", "refunds", {"status": "completed"},
+                  condition=Attr("status").eq("pending"))
+    buf.failed   # → [PendingWrite(...)] for conditions that did not hold
+"""
+
+import copy
+import functools
+import random
+import time
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import Any
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from botocore.exceptions import ClientError
+from pydantic import BaseModel
+
+from aws.dynamo.client import batch_mutate, build_update_expr, log_op, logger, write_buffer
+from aws.dynamo.updates import apply_update
+from aws.dynamo.writes import to_dynamo_item
+
+TRANSACT_MAX_ITEMS = 100  # DynamoDB TransactWriteItems hard limit per request
+
+_RETRYABLE_CANCELLATIONS = frozenset({"None", "TransactionConflict", "ThrottlingError", "ProvisionedThroughputExceeded"})
+
+
+@dataclass
+class PendingWrite:
+    """One buffered write: a full ``item`` (put) or SET ``fields`` (update)."""
+
+    table: Any
+    item_id: str
+    name: str
+    item: dict | None = None
+    fields: dict[str, Any] = field(default_factory=dict)
+    condition: ConditionBase | None = None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.table.name, self.item_id
+
+    def absorb(self, fields: dict[str, Any]) -> bool:
+        """Merge an unconditional patch into this write; False if it can't be merged."""
+        if self.condition is not None:
+            return False
+        if self.item is not None:
+            item = copy.deepcopy(self.item)
+            for path, value in fields.items():
+                *parents, leaf = path.split(".")
+                target = item
+                for part in parents:
+                    target = target.setdefault(part, {})
+                    if not isinstance(target, dict):
+                        return False
+                target[leaf] = value
+            self.item = item
+            return True
+        # One UpdateExpression can't SET both ``a`` and ``a.b``.
+        if any(_overlaps(new, old) for new in fields for old in self.fields if new != old):
+            return False
+        self.fields.update(fields)
+        return True
+
+    def transact_item(self, builder: ConditionExpressionBuilder) -> dict:
+        built = builder.build_expression(self.condition)
+        names = dict(built.attribute_name_placeholders)
+        values = dict(built.attribute_value_placeholders)
+        request: dict[str, Any] = {"TableName": self.table.name, "ConditionExpression": built.condition_expression}
+        if self.item is not None:
+            request["Item"] = self.item
+        else:
+            expr, set_names, set_values = build_update_expr(self.fields)
+            names.update(set_names)
+            values.update(set_values)
+            request.update(Key={"id": self.item_id}, UpdateExpression=expr)
+        request.update(
+            **({"ExpressionAttributeNames": names} if names else {}),
+            **({"ExpressionAttributeValues": values} if values else {}),
+        )
+        return {"Put" if self.item is not None else "Update": request}
+
+
+def _overlaps(a: str, b: str) -> bool:
+    return a.startswith(b + ".") or b.startswith(a + ".")
+
+
+def _rounds(queue: list[PendingWrite]) -> list[list[PendingWrite]]:
+    """Split writes into rounds holding at most one write per item, in buffer order."""
+    rounds: list[list[PendingWrite]] = []
+    depth: dict[tuple[str, str], int] = {}
+    for op in queue:
+        depth[op.key] = index = depth.get(op.key, -1) + 1
+        if index == len(rounds):
+            rounds.append([])
+        rounds[index].append(op)
+    return rounds
+
+
+class WriteBuffer:
+    """Collects puts and patches, writing them in as few round trips as possible on exit."""
+
+    def __init__(self, *, max_attempts: int = 5, base_delay: float = 0.05):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.failed: list[PendingWrite] = []
+        self._queue: list[PendingWrite] = []
+        self._latest: dict[tuple[str, str], PendingWrite] = {}
+        self._token = None
+
+    def __enter__(self) -> "WriteBuffer":
+        self._token = write_buffer.set(self)
+        return self
+
+    def __exit__(self, exc_type, *exc: Any) -> None:
+        write_buffer.reset(self._token)
+        if exc_type is None:
+            self.failed.extend(self.flush())
+        if self.failed:
+            logger.warning(
+                "dynamo.write_buffer.conditions_failed",
+                extra={"ids": [op.item_id for op in self.failed]},
+            )
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    # ── enqueue ───────────────────────────────────────────────────────────
+
+    def _enqueue(self, op: PendingWrite) -> None:
+        self._queue.append(op)
+        self._latest[op.key] = op
+
+    def put(self, table, item: BaseModel | dict, name: str, *, condition: ConditionBase | None = None) -> None:
+        """Buffer a full-item write; an unconditional put replaces any unconditional pending write."""
+        data = to_dynamo_item(item)
+        latest = self._latest.get((table.name, data["id"]))
+        if condition is None and latest is not None and latest.condition is None:
+            latest.item, latest.fields = data, {}
+            return
+        self._enqueue(PendingWrite(table, data["id"], name, item=data, condition=condition))
+
+    def patch(
+        self, table, item_id: str, name: str, fields: dict[str, Any], *, condition: ConditionBase | None = None
+    ) -> None:
+        """Buffer a SET of ``fields`` (dotted paths allowed), coalescing with earlier patches to ``item_id``."""
+        latest = self._latest.get((table.name, item_id))
+        if condition is None and latest is not None and latest.absorb(fields):
+            return
+        self._enqueue(PendingWrite(table, item_id, name, fields=dict(fields), condition=condition))
+
+    # ── flush ─────────────────────────────────────────────────────────────
+
+    def flush(self) -> list[PendingWrite]:
+        """Write everything buffered so far; returns conditional writes whose condition failed."""
+        queue, self._queue, self._latest = self._queue, [], {}
+        failed: list[PendingWrite] = []
+        for round_ in _rounds(queue):
+            puts = [op for op in round_ if op.condition is None and op.item is not None]
+            for _, group in groupby(sorted(puts, key=lambda op: op.table.name), key=lambda op: op.table.name):
+                ops = list(group)
+                batch_mutate(ops[0].table, [op.item for op in ops], lambda batch, item: batch.put_item(Item=item), ops[0].name, "batch_write")
+            for op in round_:
+                if op.condition is None and op.item is None:
+                    apply_update(op.table, op.item_id, op.name, "update", op.fields, fields=list(op.fields))
+            conditional = [op for op in round_ if op.condition is not None]
+            for start in range(0, len(conditional), TRANSACT_MAX_ITEMS):
+                failed.extend(self._transact(conditional[start : start + TRANSACT_MAX_ITEMS]))
+        return failed
+
+    def _transact(self, ops: list[PendingWrite]) -> list[PendingWrite]:
+        """Commit ``ops`` in one transaction, dropping and reporting any whose condition fails."""
+        client = ops[0].table.meta.client  # the resource's client: plain Python values in and out
+        failed: list[PendingWrite] = []
+        for attempt in range(self.max_attempts):
+            builder = ConditionExpressionBuilder()
+            try:
+                client.transact_write_items(TransactItems=[op.transact_item(builder) for op in ops])
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "TransactionCanceledException":
+                    raise
+                codes = [reason.get("Code", "None") for reason in e.response.get("CancellationReasons", [])]
+                if len(codes) != len(ops) or not set(codes) <= _RETRYABLE_CANCELLATIONS | {"ConditionalCheckFailed"}:
+                    raise
+                failed += [op for op, code in zip(ops, codes) if code == "ConditionalCheckFailed"]
+                ops = [op for op, code in zip(ops, codes) if code != "ConditionalCheckFailed"]
+                if not ops:
+                    return failed
+                if "ConditionalCheckFailed" not in codes:
+                    time.sleep(self.base_delay * 2**attempt * random.uniform(0.5, 1.0))
+                continue
+            for op in ops:
+                log_op(op.name, "put" if op.item is not None else "update", id=op.item_id, conditional=True)
+            return failed
+        raise RuntimeError(f"TransactWriteItems still cancelled after {self.max_attempts} attempts ({len(ops)} writes)")
+
+
+def write_behind(handler):
+    """Decorator: run a Lambda handler inside a ``WriteBuffer``, flushing when it returns."""
+
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        with WriteBuffer():
+            return handler(event, context)
+
+    return wrapper
@@ -1,7 +1,22 @@
 """DynamoDB read operations.
 
-Covers point lookups, index queries, and DynamoDB Stream batch processing
-via the Powertools BatchProcessor (partial failure checkpointing).
+Covers point lookups, batched lookups, paginated index queries, parallel
+scans, and DynamoDB Stream batch processing via the Powertools
+BatchProcessor (partial failure checkpointing).
+
+Every multi-item read follows ``LastEvaluatedKey`` — a query or scan past
+DynamoDB's 1 MB page limit is never silently truncated.
+
+Bulk usage
+----------
+    from aws.dynamo import reads
+
+    for page in reads.query_pages(TABLE, index="league-index", key_cond=Key("league_id").eq(lid)):
+        ...                                            # one DynamoDB page at a time
+
+    items = reads.batch_get(TABLE, ids)                # 100-key chunks, UnprocessedKeys retried
+    for item in reads.parallel_scan(TABLE, segments=8):
+        ...                                            # segments scanned concurrently
 
 Stream usage
 ------------
@@ -17,24 +32,68 @@ Stream usage
 
     # process_stream logs batch size before and succeeded/failed counts after.
     # Failed records are checkpointed back to the stream for retry only.
+    # Record writes are buffered and flushed once per batch (coalesce.WriteBuffer).
 """
 
+import random
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from typing import Any
 
+import boto3
 from aws_lambda_powertools.utilities.batch import BatchProcessor, EventType, process_partial_response  # pyright: ignore[reportMissingImports]
 from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import DynamoDBRecord  # noqa: F401 — re-exported  # pyright: ignore[reportMissingImports]
 from boto3.dynamodb.conditions import Attr
 
 from aws.dynamo.client import log_op
+from aws.dynamo.coalesce import WriteBuffer
 
 STREAM_PROCESSOR = BatchProcessor(event_type=EventType.DynamoDBStreams)
 
+BATCH_GET_MAX_KEYS = 100  # DynamoDB BatchGetItem hard limit per request
+
+
+def _not_deleted(include_deleted: bool) -> dict:
+    return {"FilterExpression": Attr("deleted_at").not_exists()} if not include_deleted else {}
+
 
 def get_item(table, item_id: str) -> dict | None:
     """Fetch one item by primary key ``id``. Returns None if not found."""
     return table.get_item(Key={"id": item_id}).get("Item")
 
 
+def query_pages(
+    table,
+    *,
+    index: str,
+    key_cond: Any,
+    scan_forward: bool = True,
+    page_size: int | None = None,
+    include_deleted: bool = False,
+) -> Iterator[list[dict]]:
+    """Yield each page of a GSI query, following ``LastEvaluatedKey`` to the end.
+
+    ``page_size`` caps items *evaluated* per request (DynamoDB ``Limit``); the
+    soft-delete filter runs after it, so a page may hold fewer — or none.
+    """
+    kwargs: dict[str, Any] = {
+        "IndexName": index,
+        "KeyConditionExpression": key_cond,
+        "ScanIndexForward": scan_forward,
+        **_not_deleted(include_deleted),
+        **({"Limit": page_size} if page_size is not None else {}),
+    }
+    while True:
+        response = table.query(**kwargs)
+        yield response["Items"]
+        if "LastEvaluatedKey" not in response:
+            return
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
 def query(
     table,
     *,
@@ -44,7 +103,7 @@ def query(
     limit: int | None = None,
     include_deleted: bool = False,
 ) -> list[dict]:
-    """Query a GSI and return matching items.
+    """Query a GSI and return matching items, across as many pages as it takes.
 
     Args:
         table:           boto3 Table resource.
@@ -66,13 +125,108 @@ def query(
             limit=50,
         )
     """
-    return table.query(
-        IndexName=index,
-        KeyConditionExpression=key_cond,
-        ScanIndexForward=scan_forward,
-        **({"FilterExpression": Attr("deleted_at").not_exists()} if not include_deleted else {}),
-        **({"Limit": limit} if limit is not None else {}),
-    )["Items"]
+    pages = query_pages(
+        table,
+        index=index,
+        key_cond=key_cond,
+        scan_forward=scan_forward,
+        page_size=limit,
+        include_deleted=include_deleted,
+    )
+    items = (item for page in pages for item in page)
+    return list(islice(items, limit) if limit is not None else items)
+
+
+def parallel_scan(
+    table,
+    *,
+    segments: int = 4,
+    filter_expr: Any = None,
+    include_deleted: bool = False,
+    page_size: int | None = None,
+) -> Iterator[dict]:
+    """Scan the whole table as ``segments`` parallel ``Segment``/``TotalSegments`` slices.
+
+    Each segment is paged on a worker thread, one page in flight per segment;
+    items are yielded as pages land, so order is not defined. boto3 resources
+    are not thread-safe, so every worker thread gets its own Table.
+
+    Args:
+        filter_expr:     Optional boto3 condition, ANDed with the soft-delete filter.
+        page_size:       Items evaluated per request (DynamoDB ``Limit``).
+    """
+    if not include_deleted:
+        live = Attr("deleted_at").not_exists()
+        filter_expr = live if filter_expr is None else filter_expr & live
+    base: dict[str, Any] = {
+        "TotalSegments": segments,
+        **({"FilterExpression": filter_expr} if filter_expr is not None else {}),
+        **({"Limit": page_size} if page_size is not None else {}),
+    }
+    meta = table.meta.client.meta
+    local = threading.local()
+
+    def scan_page(segment: int, start_key: dict | None) -> tuple[int, dict]:
+        if not hasattr(local, "table"):
+            resource = boto3.session.Session().resource(
+                "dynamodb", region_name=meta.region_name, endpoint_url=meta.endpoint_url
+            )
+            local.table = resource.Table(table.name)
+        kwargs = {**base, "Segment": segment, **({"ExclusiveStartKey": start_key} if start_key else {})}
+        return segment, local.table.scan(**kwargs)
+
+    with ThreadPoolExecutor(max_workers=segments) as pool:
+        in_flight = {pool.submit(scan_page, segment, None) for segment in range(segments)}
+        try:
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    segment, response = future.result()
+                    if "LastEvaluatedKey" in response:
+                        in_flight.add(pool.submit(scan_page, segment, response["LastEvaluatedKey"]))
+                    yield from response["Items"]
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def batch_get(
+    table,
+    ids: Iterable[str],
+    *,
+    include_deleted: bool = False,
+    max_attempts: int = 8,
+    base_delay: float = 0.05,
+    max_delay: float = 2.0,
+) -> list[dict]:
+    """Fetch items by ``id`` via BatchGetItem, 100 keys per request.
+
+    ``UnprocessedKeys`` (throttling, or the 16 MB response cap) are re-requested
+    with jittered exponential backoff; after ``max_attempts`` rounds a
+    ``RuntimeError`` is raised rather than returning a silent partial result.
+    Duplicate ids are fetched once. Results follow the order of ``ids``;
+    missing ids are skipped.
+    """
+    wanted = list(dict.fromkeys(ids))
+    client = table.meta.client  # the resource's client: plain Python values in and out
+    found: dict[str, dict] = {}
+    for start in range(0, len(wanted), BATCH_GET_MAX_KEYS):
+        keys = [{"id": item_id} for item_id in wanted[start : start + BATCH_GET_MAX_KEYS]]
+        for attempt in range(max_attempts):
+            response = client.batch_get_item(RequestItems={table.name: {"Keys": keys}})
+            for item in response.get("Responses", {}).get(table.name, []):
+                found[item["id"]] = item
+            keys = response.get("UnprocessedKeys", {}).get(table.name, {}).get("Keys", [])
+            if not keys:
+                break
+            time.sleep(min(max_delay, base_delay * 2**attempt) * random.uniform(0.5, 1.0))
+        else:
+            raise RuntimeError(f"batch_get {table.name}: {len(keys)} keys still unprocessed after {max_attempts} attempts")
+    return [
+        found[item_id]
+        for item_id in wanted
+        if item_id in found and (include_deleted or "deleted_at" not in found[item_id])
+    ]
 
 
 def process_stream(event: dict, record_handler, context) -> dict:
@@ -82,17 +236,22 @@ def process_stream(event: dict, record_handler, context) -> dict:
     Failed records are checkpointed back to the stream; successful records are
     not reprocessed on the next invocation.
 
+    Records run inside a ``coalesce.WriteBuffer``: their ``put_item`` /
+    ``patch_item`` calls are flushed once after the batch, so records touching
+    the same item coalesce into one write.
+
     The ``record_handler`` receives a typed ``DynamoDBRecord``; import it via:
         from aws.dynamo.reads import DynamoDBRecord
     """
     count = len(event.get("Records", []))
     log_op("dynamo.stream", "batch_start", count=count)
-    result = process_partial_response(
-        event=event,
-        record_handler=record_handler,
-        processor=STREAM_PROCESSOR,
-        context=context,
-    )
+    with WriteBuffer():
+        result = process_partial_response(
+            event=event,
+            record_handler=record_handler,
+            processor=STREAM_PROCESSOR,
+            context=context,
+        )
     failed = len(result.get("batchItemFailures", []))
     log_op("dynamo.stream", "batch_end", total=count, failed=failed, succeeded=count - failed)
     return result
@@ -16,12 +16,15 @@ Nested attribute example
         **{"metadata.source": "google", "metadata.reviewed_by": "admin@bars.com"},
     )
     # → SET #metadata.#source = :metadata_source, #metadata.#reviewed_by = :metadata_reviewed_by
+
+Inside a ``coalesce.WriteBuffer``, ``patch_item`` and ``soft_delete`` are buffered
+and patches to the same id coalesce into one UpdateItem.
 """
 
 from datetime import datetime, timezone
 from typing import Any
 
-from aws.dynamo.client import build_update_expr, log_op
+from aws.dynamo.client import build_update_expr, log_op, write_buffer
 
 
 def apply_update(table, item_id: str, name: str, op: str, data: dict[str, Any], **log_extras) -> None:
@@ -42,9 +45,14 @@ def apply_update(table, item_id: str, name: str, op: str, data: dict[str, Any],
 
 def patch_item(table, item_id: str, name: str, **fields: Any) -> None:
     """Patch specific fields (including dotted nested paths) on an existing item."""
+    if (buffer := write_buffer.get()) is not None:
+        return buffer.patch(table, item_id, name, fields)
     apply_update(table, item_id, name, "update", fields, fields=list(fields))
 
 
 def soft_delete(table, item_id: str, name: str) -> None:
     """Set ``deleted_at`` to now; preserves item for audit history."""
-    apply_update(table, item_id, name, "soft_delete", {"deleted_at": datetime.now(timezone.utc).isoformat()})
+    fields = {"deleted_at": datetime.now(timezone.utc).isoformat()}
+    if (buffer := write_buffer.get()) is not None:
+        return buffer.patch(table, item_id, name, fields)
+    apply_update(table, item_id, name, "soft_delete", fields)
@@ -8,11 +8,13 @@ Both functions accept either a Pydantic model instance (``Refund``,
 ``WaitlistEntry``) or a plain dict. Model instances are validated on
 construction; ``to_dynamo_item`` calls ``model_dump(exclude_none=True)`` to
 strip None-valued optional fields before the DynamoDB write.
+
+Inside a ``coalesce.WriteBuffer``, ``put_item`` is buffered until the block exits.
 """
 
 from pydantic import BaseModel
 
-from aws.dynamo.client import batch_mutate, log_op
+from aws.dynamo.client import batch_mutate, log_op, write_buffer
 
 
 def to_dynamo_item(item: BaseModel | dict) -> dict:
@@ -26,6 +28,8 @@ def to_dynamo_item(item: BaseModel | dict) -> dict:
 
 def put_item(table, item: BaseModel | dict, name: str) -> None:
     """Write a full item (create or overwrite). ``name`` is used as the log prefix."""
+    if (buffer := write_buffer.get()) is not None:
+        return buffer.put(table, item, name)
     data = to_dynamo_item(item)
     table.put_item(Item=data)
     log_op(name, "put", id=data.get("id"))
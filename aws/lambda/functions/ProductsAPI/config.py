@@ -3,7 +3,7 @@ Configuration for the ShopifyProductUpdates lambda.
 
 Period config (displayBracket, requiredTags, statusValue per period name, plus
 division display strings) lives in ``data/period_templates.yaml`` and is
-loaded once at import — update by editing the YAML and redeploying.
+loaded once, on first use — update by editing the YAML and redeploying.
 
 Image IDs (Shopify MediaImage GIDs, stored as integers) live in SSM Parameter
 Store under ``SSM_IMAGES_PATH`` as a JSON object keyed by sport name.  They are
@@ -23,9 +23,12 @@ Usage:
 import os
 from pathlib import Path
 
-import yaml
-from aws_lambda_powertools.utilities import parameters
 from box import Box
+from powertools.lazy import lazy, lazy_import
+
+# Imported on first use, so invocations that never read period config or SSM skip them.
+yaml = lazy_import("yaml")
+parameters = lazy_import("aws_lambda_powertools.utilities.parameters")
 
 CACHE_TTL_SECONDS = 300
 
@@ -36,7 +39,8 @@ SOLD_OUT_IMAGES_PATH = os.environ.get(
 
 _PERIOD_CONFIG_FILE = Path(__file__).parent / "data" / "period_templates.yaml"
 
-_ssm = parameters.SSMProvider()
+# Built on first use — constructing the provider creates a boto3 client.
+_ssm = lazy(lambda: parameters.SSMProvider())
 
 
 def _load_period_config() -> Box:
@@ -45,7 +49,7 @@ def _load_period_config() -> Box:
     return Box(raw, box_dots=False)
 
 
-PERIOD_CONFIG: Box = _load_period_config()
+PERIOD_CONFIG: Box = lazy(_load_period_config)
 
 
 def load_images() -> Box:
@@ -12,6 +12,16 @@ Event shape (all keys required; null allowed where semantically optional):
         "sourcePeriod":  "veteran" | null,
         "inventoryToAdd": 120 | null
     }
+
+Batch shape — every season opening in the same minute, in one invocation:
+    {
+        "action":  "phase-transition",
+        "seasons": [{"seasonId": ..., "targetPeriod": ..., ...}, ...]   # ≤ 100
+    }
+One BatchGetItem, one SSM read, a handful of aliased Shopify documents
+(``shopify_batch``) and one TransactWriteItems for the statuses — see
+``handle_batch``. Seasons that fail validation or Shopify are reported in
+``failed`` and left at their old status; the rest still transition.
 """
 
 import json
@@ -20,14 +30,26 @@ from typing import Any
 from box import Box
 
 from ..config import PERIOD_CONFIG, load_images
-from ..repo import get_season, upsert_season
+from ..repo import TRANSACT_MAX_ITEMS, get_season, get_seasons, upsert_season, upsert_seasons
 from ..responses import err, ok
+from ..shopify_batch import ProductChange, apply_shopify_batch
 from ..shopify_ops import apply_shopify
 
 _REQUIRED = {"seasonId", "targetPeriod"}
 
 
+def _derive(season: Box, target_period: str) -> tuple[Box, str, list[str]]:
+    """Period config, new title and merged tags for ``season`` entering ``target_period``."""
+    period = PERIOD_CONFIG.periods[target_period]
+    division = PERIOD_CONFIG.divisions.get(season.division, season.division)
+    bracket = period.displayBracket.format(division=division)
+    return period, f"{season.baseTitle} {bracket}", sorted(set(season.tags) | set(period.requiredTags))
+
+
 def handle(raw_event: dict[str, Any]) -> dict[str, Any]:
+    if "seasons" in raw_event:
+        return handle_batch(raw_event)
+
     missing = _REQUIRED - raw_event.keys()
     if missing:
         return err(400, "Missing required fields", missing=sorted(missing))
@@ -44,12 +66,7 @@ def handle(raw_event: dict[str, Any]) -> dict[str, Any]:
         return err(400, f"Unknown targetPeriod: {event.targetPeriod!r}", known=known)
 
     images = load_images()
-    period = PERIOD_CONFIG.periods[event.targetPeriod]
-    division = PERIOD_CONFIG.divisions.get(season.division, season.division)
-
-    bracket = period.displayBracket.format(division=division)
-    title = f"{season.baseTitle} {bracket}"
-    tags = sorted(set(season.tags) | set(period.requiredTags))
+    period, title, tags = _derive(season, event.targetPeriod)
     image = images[season.sport]
 
     target_variant_id = season.registrationPeriods[event.targetPeriod].shopifyVariantId
@@ -76,3 +93,70 @@ def handle(raw_event: dict[str, Any]) -> dict[str, Any]:
         "newStatus": period.statusValue,
         "newTitle": title,
     })
+
+
+def handle_batch(raw_event: dict[str, Any]) -> dict[str, Any]:
+    items = raw_event.get("seasons")
+    if not isinstance(items, list) or not items:
+        return err(400, "seasons must be a non-empty list")
+    if len(items) > TRANSACT_MAX_ITEMS:
+        return err(400, f"At most {TRANSACT_MAX_ITEMS} seasons per batch", received=len(items))
+
+    failed: dict[str, list[str]] = {}
+    events = []
+    for index, raw in enumerate(items):
+        if not isinstance(raw, dict):
+            failed[f"seasons[{index}]"] = ["season must be an object"]
+            continue
+        missing = _REQUIRED - raw.keys()
+        if missing:
+            failed[str(raw.get("seasonId"))] = [f"Missing required fields: {sorted(missing)}"]
+        elif raw["targetPeriod"] not in PERIOD_CONFIG.periods:
+            failed[raw["seasonId"]] = [f"Unknown targetPeriod: {raw['targetPeriod']!r}"]
+        else:
+            events.append(Box(raw))
+
+    seasons = get_seasons([e.seasonId for e in events])
+    images = load_images()
+
+    changes: list[ProductChange] = []
+    statuses: dict[str, dict[str, str]] = {}
+    titles: dict[str, str] = {}
+    for event in events:
+        season = seasons.get(event.seasonId)
+        if season is None:
+            failed[event.seasonId] = [f"Season not found: {event.seasonId}"]
+            continue
+        try:
+            period, title, tags = _derive(season, event.targetPeriod)
+            source = event.get("sourcePeriod")
+            changes.append(ProductChange(
+                season_id=event.seasonId,
+                product_id=season.shopifyProductId,
+                title=title,
+                tags=tags,
+                image=images[season.sport],
+                target_variant_id=season.registrationPeriods[event.targetPeriod].shopifyVariantId,
+                source_variant_id=season.registrationPeriods[source].shopifyVariantId if source else None,
+                inventory_to_add=event.get("inventoryToAdd"),
+            ))
+        except KeyError as exc:
+            failed[event.seasonId] = [f"Missing season/period config: {exc}"]
+            continue
+        statuses[event.seasonId] = {"status": period.statusValue}
+        titles[event.seasonId] = title
+
+    for season_id, errors in apply_shopify_batch(changes).items():
+        failed[season_id] = errors
+        statuses.pop(season_id, None)
+
+    if statuses:
+        upsert_seasons(statuses)
+
+    return ok({
+        "transitioned": [
+            {"seasonId": season_id, "newStatus": fields["status"], "newTitle": titles[season_id]}
+            for season_id, fields in statuses.items()
+        ],
+        "failed": [{"seasonId": season_id, "errors": errors} for season_id, errors in failed.items()],
+    })
@@ -23,6 +23,7 @@ import logging
 import os
 from typing import Any
 
+from powertools.lazy import lazy
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from shop_client import ShopifyClient, schema
 
@@ -31,13 +32,17 @@ from ..season_dates import extract_season_dates, format_date_only, split_off_dat
 
 logger = logging.getLogger(__name__)
 
-# Module-level client: reads env once per cold start. Fails fast at import time
-# if SHOPIFY__* vars are absent — intentional for Lambda.
-_client = ShopifyClient(
-    store_id=os.environ["SHOPIFY__STORE_ID"],
-    api_version=os.environ["SHOPIFY__API_VERSION"],
-    token=os.environ["SHOPIFY__TOKEN__ADMIN"],
-)
+# Env is read at import so a missing SHOPIFY__* var still fails the cold start
+# (intentional for Lambda); the client itself — schema load, connection pool —
+# is built on first use and then reused across warm invocations.
+_SHOPIFY_ENV = {
+    "store_id": os.environ["SHOPIFY__STORE_ID"],
+    "api_version": os.environ["SHOPIFY__API_VERSION"],
+    "token": os.environ["SHOPIFY__TOKEN__ADMIN"],
+}
+
+_client: ShopifyClient = lazy(lambda: ShopifyClient(**_SHOPIFY_ENV).open_sync())
+
 
 _PRODUCT_FIELDS = ["id", "title", "description_html"]
 _VARIANT_FIELDS = ["id", "title", "price"]
@@ -5,7 +5,8 @@ Routes incoming events to one of three handlers based on the ``action`` field
 
   phase-transition      EventBridge Scheduler → registration period changes
                         (title, tags, image, inventory transfer via DynamoDB
-                        season record + YAML period config).
+                        season record + YAML period config). A ``seasons``
+                        list transitions many products in one invocation.
 
   update-prices         EventBridge Scheduler → bulk variant price update for
                         the open + waitlist variants of a product.
@@ -15,7 +16,9 @@ Routes incoming events to one of three handlers based on the ``action`` field
                         when all registration-relevant variants reach 0 inventory.
 
 All handlers return the standard Lambda-proxy envelope
-``{statusCode, headers, body: json.dumps(...)}``.
+``{statusCode, headers, body: json.dumps(...)}``. The handler runs under
+``aws.dynamo.coalesce.write_behind``: single-season status writes are buffered
+and flushed (coalesced per season) when it returns, and dropped if it raises.
 
 Event routing
 ─────────────
@@ -24,6 +27,7 @@ Explicit (preferred):
 
 Inferred from key signatures when ``action`` is absent:
     seasonId + targetPeriod  → phase-transition
+    seasons                  → phase-transition (batch)
     productGid + updatedPrice  → update-prices
     admin_graphql_api_id + variants  → sold-out-image-check
 
@@ -34,6 +38,8 @@ import json
 import logging
 from typing import Any
 
+from aws.dynamo.coalesce import write_behind
+
 from .handlers import image_swap, phase_transition, update_prices
 from .responses import err
 
@@ -43,6 +49,7 @@ logger.setLevel(logging.INFO)
 _ACTION_FIELD = "action"
 _SIGNATURES: list[tuple[set[str], str]] = [
     ({"seasonId", "targetPeriod"}, "phase-transition"),
+    ({"seasons"}, "phase-transition"),
     ({"productGid", "updatedPrice"}, "update-prices"),
     ({"admin_graphql_api_id", "variants"}, "sold-out-image-check"),
 ]
@@ -72,6 +79,7 @@ def _detect_action(payload: dict[str, Any]) -> str | None:
     return None
 
 
+@write_behind
 def lambda_handler(raw_event: Any, _context: Any) -> dict[str, Any]:
     logger.info("invoked", extra={"event": raw_event})
 
@@ -89,7 +97,7 @@ def lambda_handler(raw_event: Any, _context: Any) -> dict[str, Any]:
     if action == "sold-out-image-check":
         return image_swap.handle(payload)
 
-    known = [a for _, a in _SIGNATURES]
+    known = list(dict.fromkeys(a for _, a in _SIGNATURES))
     return err(
         400,
         "Cannot determine action from event",
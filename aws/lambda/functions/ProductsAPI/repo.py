@@ -5,10 +5,17 @@ Uses PynamoDB for typed access to known fields plus MapAttribute for the
 free-form `registrationPeriods` map (so arbitrary period names work without
 schema migration). Lambda code interacts with `Box`-wrapped dicts, never with
 the PynamoDB instance directly, to keep dotted-access semantics throughout.
+
+Batch phase transitions use `get_seasons` (BatchGetItem) and `upsert_seasons`
+(one TransactWriteItems) instead of N gets and N updates. `upsert_season` goes
+through `aws.dynamo.updates.patch_item`, so inside the handler's `write_behind`
+buffer repeated upserts to one season coalesce into a single UpdateItem.
 """
 import os
 from datetime import datetime, timezone
 
+from aws.dynamo import updates
+from aws.dynamo.client import dynamo
 from box import Box
 from pynamodb.attributes import (
     ListAttribute,
@@ -17,7 +24,11 @@ from pynamodb.attributes import (
     UnicodeAttribute,
     UTCDateTimeAttribute,
 )
+from pynamodb.connection import Connection
 from pynamodb.models import Model
+from pynamodb.transactions import TransactWrite
+
+TRANSACT_MAX_ITEMS = 100  # DynamoDB TransactWriteItems hard limit per request
 
 
 class RegularSeason(Model):
@@ -47,7 +58,33 @@ def get_season(season_id: str) -> Box:
     return Box(record.attribute_values)
 
 
+def _table():
+    return dynamo.Table(RegularSeason.Meta.table_name)
+
+
 def upsert_season(season_id: str, **fields) -> None:
-    fields["updatedAt"] = datetime.now(timezone.utc)
-    actions = [getattr(RegularSeason, k).set(v) for k, v in fields.items()]
-    RegularSeason(id=season_id).update(actions=actions)
+    """SET plain-valued ``fields`` (plus ``updatedAt``, in PynamoDB's format) on one season."""
+    fields["updatedAt"] = RegularSeason.updatedAt.serialize(datetime.now(timezone.utc))
+    updates.patch_item(_table(), season_id, "regular-seasons", **fields)
+
+
+def get_seasons(season_ids: list[str]) -> dict[str, Box]:
+    """Fetch many seasons via BatchGetItem (PynamoDB pages by 100 and retries
+    unprocessed keys). Ids with no record are absent from the result."""
+    return {
+        record.id: Box(record.attribute_values)
+        for record in RegularSeason.batch_get(list(dict.fromkeys(season_ids)))
+    }
+
+
+def upsert_seasons(updates: dict[str, dict]) -> None:
+    """Apply ``{season_id: fields}`` to every season in one transaction —
+    all statuses land together or none do."""
+    if len(updates) > TRANSACT_MAX_ITEMS:
+        raise ValueError(f"upsert_seasons: {len(updates)} seasons exceeds {TRANSACT_MAX_ITEMS} per transaction")
+    now = datetime.now(timezone.utc)
+    connection = Connection(region=RegularSeason.Meta.region)
+    with TransactWrite(connection=connection) as transaction:
+        for season_id, fields in updates.items():
+            actions = [getattr(RegularSeason, k).set(v) for k, v in {**fields, "updatedAt": now}.items()]
+            transaction.update(RegularSeason(id=season_id), actions=actions)
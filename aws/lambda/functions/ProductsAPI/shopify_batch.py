@@ -0,0 +1,249 @@
+"""Batched Shopify side-effects for multi-season phase transitions.
+
+``apply_shopify_batch`` applies the same changes as ``shopify_ops.apply_shopify``
+(title + tags, featured image, inventory move) to many products at once, in a
+fixed number of round trips instead of several per product:
+
+    lookups        aliased ``product`` (current media) and ``productVariant``
+                   (inventory item + quantity) fields for every season, in as
+                   few queries as Shopify's cost cap allows (one for ~25 seasons)
+    ⌈N/25⌉ docs    aliased ``productUpdate`` mutations, one per product
+    1 doc          one ``fileUpdate`` for every image swap
+    1 doc          one ``inventoryAdjustQuantities`` for every inventory move
+                   (each shared mutation is retried at most once, see below)
+
+Inventory: the source variant (if any) is drained to 0; the target gains
+``inventory_to_add`` when given, else whatever the source held.
+
+Failures are per season. A season is validated in full (product, variants,
+inventory items) before any of its mutations are planned, so a season that
+fails validation sends Shopify nothing, and a season that fails at one step is
+left out of the later steps. The shared mutations are all-or-nothing on
+Shopify's side: when one returns userErrors, each error is charged to the
+season(s) owning the input entry its ``field`` path points at, and the other
+entries are sent again once. Errors that can't be traced to an entry fail
+every season in that mutation.
+"""
+
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from box import Box
+from powertools.lazy import lazy
+from shop_client import ResourceId, ShopifyClient, schema
+
+logger = logging.getLogger(__name__)
+
+# Env read at import, client built on first use (same contract as update_prices).
+_SHOPIFY_ENV = {
+    "store_id": os.environ["SHOPIFY__STORE_ID"],
+    "api_version": os.environ["SHOPIFY__API_VERSION"],
+    "token": os.environ["SHOPIFY__TOKEN__ADMIN"],
+}
+
+_client: ShopifyClient = lazy(lambda: ShopifyClient(**_SHOPIFY_ENV).open_sync())
+
+
+_LOCATION_GID = ResourceId.of("location", os.environ["SHOPIFY__LOCATION_ID"]).gid
+
+# The image swap only needs the product's few current images to detach.
+# Unbounded, ``media`` is ``first: 250``: ~253 points per product lookup.
+_PRODUCT_MEDIA_FIRST = 10
+_PRODUCT_MEDIA = ["id", f"media[{_PRODUCT_MEDIA_FIRST}].nodes.id"]
+_VARIANT_INVENTORY = ["id", "inventory_quantity", "inventory_item.id"]
+
+
+@dataclass
+class ProductChange:
+    """One season's transition, resolved from DynamoDB + period config."""
+
+    season_id: str
+    product_id: str
+    title: str
+    tags: list[str]
+    image: str | int
+    target_variant_id: str
+    source_variant_id: str | None = None
+    inventory_to_add: int | None = None
+
+    @property
+    def moves_inventory(self) -> bool:
+        return self.source_variant_id is not None or bool(self.inventory_to_add)
+
+
+def _user_errors(payload: Any) -> list[Any]:
+    if not payload:
+        return [Box(message="no payload returned", field=None)]
+    return list(payload.user_errors or [])
+
+
+def _entry_index(field: list[str] | None, list_key: str) -> int | None:
+    """Index into the ``list_key`` input list that a userError ``field`` path points at."""
+    path = list(field or [])
+    if list_key in path:
+        position = path.index(list_key) + 1
+        if position < len(path) and str(path[position]).isdigit():
+            return int(path[position])
+    return None
+
+
+@dataclass
+class _SharedMutation:
+    """One mutation whose ``list_key`` input list mixes entries from several seasons."""
+
+    op: Any
+    list_key: str
+    extra: dict[str, Any]
+    entries: list[dict[str, Any]]
+    owners: list[set[str]]  # season ids per entry
+
+    def call(self) -> tuple[Any, dict[str, Any]]:
+        return self.op, {**self.extra, self.list_key: self.entries}
+
+    def settle(self, payload: Any, failed: dict[str, list[str]]) -> bool:
+        """Charge any userErrors to the owners of the entries they point at; True if there were any."""
+        errors = _user_errors(payload)
+        for error in errors:
+            index = _entry_index(error.get("field"), self.list_key)
+            charged = self.owners[index] if index is not None and index < len(self.owners) else set().union(*self.owners)
+            logger.error("shopify userErrors for %s: %s", sorted(charged), error.message)
+            for season_id in charged:
+                failed[season_id].append(error.message)
+        return bool(errors)
+
+
+def apply_shopify_batch(changes: list[ProductChange]) -> dict[str, list[str]]:
+    """Apply every change; returns ``{season_id: [error, ...]}`` for seasons that failed."""
+    failed: dict[str, list[str]] = defaultdict(list)
+    if not changes:
+        return failed
+
+    # ── lookups: current media per product, inventory per variant ────────
+    products = [ResourceId.of("product", c.product_id).gid for c in changes]
+    variant_ids = list(dict.fromkeys(
+        ResourceId.of("product_variant", v).gid
+        for c in changes if c.moves_inventory
+        for v in (c.target_variant_id, c.source_variant_id) if v is not None
+    ))
+    lookups = _client.run_batch(
+        [(schema.products.queries.by_id, {"id": gid, "returns": _PRODUCT_MEDIA}) for gid in products]
+        + [(schema.variants.queries.by_id, {"id": gid, "returns": _VARIANT_INVENTORY}) for gid in variant_ids]
+    )
+    media = dict(zip(products, lookups[: len(products)]))
+    variants = dict(zip(variant_ids, lookups[len(products) :]))
+
+    # ── validate each season fully before planning any of its mutations ──
+    updates: list[tuple[str, str, ProductChange]] = []  # (season id, product gid, change)
+    image_refs: dict[str, list[tuple[str, str, str]]] = {}  # season -> [(file gid, refs key, product gid)]
+    adjustments: dict[str, list[dict[str, Any]]] = {}
+
+    for change, product_gid in zip(changes, products):
+        product = media[product_gid]
+        if product is None:
+            failed[change.season_id].append(f"product not found: {product_gid}")
+            continue
+
+        moves: list[tuple[Any, int]] = []
+        if change.moves_inventory:
+            target = variants.get(ResourceId.of("product_variant", change.target_variant_id).gid)
+            source = (
+                variants.get(ResourceId.of("product_variant", change.source_variant_id).gid)
+                if change.source_variant_id is not None
+                else None
+            )
+            if target is None or (change.source_variant_id is not None and source is None):
+                failed[change.season_id].append("variant not found for inventory move")
+                continue
+            drained = max(source.inventory_quantity or 0, 0) if source is not None else 0
+            added = change.inventory_to_add if change.inventory_to_add is not None else drained
+            moves = [(variant, delta) for variant, delta in ((source, -drained), (target, added)) if variant is not None and delta]
+            if any(not (variant.inventory_item and variant.inventory_item.id) for variant, _ in moves):
+                failed[change.season_id].append("inventory item not found for inventory move")
+                continue
+
+        updates.append((change.season_id, product_gid, change))
+        image_gid = ResourceId.of("media_image", change.image).gid
+        image_refs[change.season_id] = [(image_gid, "referencesToAdd", product_gid)] + [
+            (ResourceId.of("media_image", node.id).gid, "referencesToRemove", product_gid)
+            for node in (product.media.nodes if product.media else [])
+            if ResourceId.of("media_image", node.id).gid != image_gid
+        ]
+        adjustments[change.season_id] = [
+            {"delta": delta, "inventoryItemId": variant.inventory_item.id, "locationId": _LOCATION_GID}
+            for variant, delta in moves
+        ]
+
+    # ── 1. productUpdate per season ──────────────────────────────────────
+    payloads = _client.run_batch([
+        (schema.products.mutations["update"], {"id": product_gid, "title": change.title, "tags": change.tags})
+        for _, product_gid, change in updates
+    ])
+    for payload, (season_id, _, _) in zip(payloads, updates):
+        errors = [e.message for e in _user_errors(payload)]
+        if errors:
+            logger.error("shopify userErrors for %s: %s", season_id, errors)
+            failed[season_id].extend(errors)
+
+    # ── 2. image swaps, 3. inventory — each only for seasons still healthy ─
+    # Inventory goes last: everything before it is idempotent, so a season
+    # that fails anywhere can be re-run without moving inventory twice.
+    _apply_shared(lambda: _file_mutation(image_refs, failed), failed)
+    _apply_shared(lambda: _inventory_mutation(adjustments, failed), failed)
+    return failed
+
+
+def _file_mutation(image_refs: dict[str, list[tuple[str, str, str]]], failed: dict[str, list[str]]) -> _SharedMutation | None:
+    refs: dict[str, dict[str, list[str]]] = {}
+    owners: dict[str, set[str]] = defaultdict(set)
+    for season_id, season_refs in image_refs.items():
+        if season_id in failed:
+            continue
+        for file_gid, key, product_gid in season_refs:
+            refs.setdefault(file_gid, {"referencesToAdd": [], "referencesToRemove": []})[key].append(product_gid)
+            owners[file_gid].add(season_id)
+    if not refs:
+        return None
+    return _SharedMutation(
+        schema["files"]["mutations"]["update"], "files", {},
+        [{"id": gid, **{k: v for k, v in r.items() if v}} for gid, r in refs.items()],
+        [owners[gid] for gid in refs],
+    )
+
+
+def _inventory_mutation(adjustments: dict[str, list[dict[str, Any]]], failed: dict[str, list[str]]) -> _SharedMutation | None:
+    healthy = [(season_id, a) for season_id, season_adjustments in adjustments.items()
+               if season_id not in failed for a in season_adjustments]
+    if not healthy:
+        return None
+    return _SharedMutation(
+        schema.inventory.mutations.adjust, "changes", {"reason": "correction", "name": "available"},
+        [a for _, a in healthy], [{season_id} for season_id, _ in healthy],
+    )
+
+
+def _apply_shared(build: Callable[[], _SharedMutation | None], failed: dict[str, list[str]]) -> None:
+    """Run the mutation ``build`` plans for the seasons not yet failed.
+
+    Shopify rejects the whole mutation on any userError, so after charging the
+    culprits it is rebuilt without them and sent once more. A second failure
+    is charged to every season still in it.
+    """
+    mutation = build()
+    if mutation is None:
+        return
+    (payload,) = _client.run_batch([mutation.call()])
+    if not mutation.settle(payload, failed):
+        return
+    retry = build()
+    if retry is None:
+        return
+    (payload,) = _client.run_batch([retry.call()])
+    errors = [e.message for e in _user_errors(payload)]
+    if errors:
+        seasons = set().union(*retry.owners)
+        logger.error("shopify userErrors on retry for %s: %s", sorted(seasons), errors)
+        for season_id in seasons:
+            failed[season_id].extend(errors)
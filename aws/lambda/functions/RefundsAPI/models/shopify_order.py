@@ -5,7 +5,7 @@ from decimal import Decimal
 from functools import cached_property
 from typing import Any
 
-from registrations.refunds import SeasonDates
+from registrations.refunds import SeasonDates, season_dates_for
 from shopify_client.generated.find_orders import (
     FindOrdersOrdersNodes,
     FindOrdersOrdersNodesLineItemsNodes,
@@ -101,6 +101,7 @@ class ShopifyProduct:
     title: str
     handle: str
     description_html: str | None
+    updated_at: str | None = None
 
     @cached_property
     def league(self) -> League:
@@ -108,7 +109,7 @@ class ShopifyProduct:
 
     @cached_property
     def season_dates(self) -> SeasonDates:
-        return SeasonDates.from_html(self.description_html or "")
+        return season_dates_for(self.description_html, product_id=self.id, updated_at=self.updated_at)
 
     @classmethod
     def from_codegen(
@@ -122,6 +123,9 @@ class ShopifyProduct:
             title=node.title,
             handle=node.handle,
             description_html=str(node.description_html) if node.description_html is not None else None,
+            # Only present once the find_orders query selects product.updatedAt;
+            # until then season_dates is keyed by the HTML's hash.
+            updated_at=str(updated_at) if (updated_at := getattr(node, "updated_at", None)) else None,
         )
 
 
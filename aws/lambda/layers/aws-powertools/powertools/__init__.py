@@ -9,10 +9,12 @@ warmup          @skip_warmup keep-alive ping short-circuit
 idempotency     DynamoDB persistence store + IDEMPOTENCY_CONFIG
 feature_flags   AppConfig-backed FeatureFlags factory
 parameters      SSM Parameter Store helpers (/bars/{env}/ convention)
+lazy            lazy_import / lazy(factory) — defer heavy imports and clients
+                to first use (stdlib only; no Powertools dependency)
 
-All submodules depend on the official Powertools layer being present in the
-Lambda runtime. Do NOT bundle aws-lambda-powertools as a pip dep — add the
-official layer ARN instead.
+All submodules except ``lazy`` depend on the official Powertools layer being
+present in the Lambda runtime. Do NOT bundle aws-lambda-powertools as a pip
+dep — add the official layer ARN instead.
 
 Required Lambda environment variables
 --------------------------------------
@@ -0,0 +1,93 @@
+"""Deferred imports and first-use construction for cold-start-sensitive code.
+
+Anything a Lambda builds at module scope is paid for on every cold start,
+including by invocations that never touch it. Wrap heavy modules and clients
+here, and the cost moves to the first invocation that actually uses them.
+Warm invocations then reuse the loaded module or constructed client as before.
+
+    from powertools.lazy import lazy, lazy_import
+
+    yaml = lazy_import("yaml")              # imported on first attribute access
+    ssm = lazy(SSMProvider)                 # constructed on first attribute access
+    shop = lazy(lambda: ShopifyClient(...).open_sync())
+
+    def handle(event):
+        shop.run(...)                       # builds here once, then reused
+
+Both proxies are thread-safe and have no dependencies beyond the stdlib.
+Profile what a handler imports with ``aws/lambda/tools/import_profile.py``.
+"""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+_UNSET: Any = object()
+
+
+class Lazy(Generic[T]):
+    """Proxy that calls ``factory()`` on first attribute access and forwards to the result.
+
+    The proxy's own names are ``_lazy_*`` so they never shadow the wrapped
+    object's attributes (``ssm.get`` must reach ``SSMProvider.get``).
+    """
+
+    __slots__ = ("_lazy_factory", "_lazy_value", "_lazy_lock")
+
+    def __init__(self, factory: Callable[[], T]):
+        object.__setattr__(self, "_lazy_factory", factory)
+        object.__setattr__(self, "_lazy_value", _UNSET)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+
+    def _lazy_load(self) -> T:
+        value = self._lazy_value
+        if value is _UNSET:
+            with self._lazy_lock:
+                value = self._lazy_value
+                if value is _UNSET:
+                    value = self._lazy_factory()
+                    object.__setattr__(self, "_lazy_value", value)
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._lazy_load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._lazy_load(), name, value)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._lazy_load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = repr(self._lazy_value) if self._lazy_value is not _UNSET else "not loaded"
+        return f"<Lazy {getattr(self._lazy_factory, '__qualname__', self._lazy_factory)!s}: {state}>"
+
+
+def lazy(factory: Callable[[], T]) -> T:
+    """Wrap ``factory`` so it runs on first use. Typed as ``T`` so call sites keep their hints."""
+    return Lazy(factory)  # type: ignore[return-value]
+
+
+def lazy_import(name: str) -> ModuleType:
+    """``importlib.import_module(name)``, deferred until an attribute is first read."""
+    return Lazy(lambda: importlib.import_module(name))  # type: ignore[return-value]
+
+
+def is_loaded(obj: Any) -> bool:
+    """False while ``obj`` is a ``Lazy`` that hasn't been used yet."""
+    return not isinstance(obj, Lazy) or obj._lazy_value is not _UNSET
+
+
+def unwrap(obj: Any) -> Any:
+    """The real object behind a ``Lazy`` (loading it), or ``obj`` itself — for ``isinstance`` checks."""
+    return obj._lazy_load() if isinstance(obj, Lazy) else obj
+
+
+def reset(obj: Any) -> None:
+    """Drop what a ``Lazy`` built; the next use constructs it again (tests, credential rotation)."""
+    if isinstance(obj, Lazy):
+        with obj._lazy_lock:
+            object.__setattr__(obj, "_lazy_value", _UNSET)
@@ -50,10 +50,13 @@ from typing import Any
 
 from aws_lambda_powertools.utilities.parameters import AppConfigProvider, DynamoDBProvider, SSMProvider
 
+from powertools.lazy import lazy
+
 ENV = os.environ.get("BARS_ENV", "prod")
 PREFIX = f"/bars/{ENV}"
 
-ssm = SSMProvider()
+# Built on the first get — constructing the provider creates a boto3 client.
+ssm = lazy(SSMProvider)
 
 
 # ── SSM Parameter Store ────────────────────────────────────────────────────────
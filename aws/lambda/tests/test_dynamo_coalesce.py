@@ -0,0 +1,133 @@
+"""Unit tests for aws.dynamo.coalesce.WriteBuffer, against moto.
+
+Covers:
+- repeated patch_item / soft_delete calls on one id become a single UpdateItem
+- patches fold into a buffered put; overlapping paths split into ordered writes
+- conditional writes share one TransactWriteItems call; failed conditions are
+  reported and the rest still commit
+- nothing is written when the buffered block raises
+- write_behind flushes when the handler returns and drops everything when it raises
+- stream batches run under a buffer: records patching one item share one UpdateItem
+"""
+
+import boto3
+import pytest
+from boto3.dynamodb.conditions import Attr
+from moto import mock_aws
+
+from aws.dynamo import reads, updates, writes
+from aws.dynamo.coalesce import WriteBuffer, write_behind
+
+
+@pytest.fixture
+def table(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        table = boto3.resource("dynamodb", region_name="us-east-1").create_table(
+            TableName="refunds",
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        table.put_item(Item={"id": "rf-1", "status": "pending", "metadata": {"source": "shopify"}})
+        table.put_item(Item={"id": "rf-2", "status": "completed"})
+        yield table
+
+
+@pytest.fixture
+def calls(table):
+    """Count low-level client calls by operation name."""
+    seen: list[str] = []
+    table.meta.client.meta.events.register("before-call.dynamodb", lambda model, **_: seen.append(model.name))
+    return seen
+
+
+def test_patches_to_one_id_coalesce(table, calls):
+    @write_behind
+    def handler(event, context):
+        updates.patch_item(table, "rf-1", "refunds", status="processing")
+        updates.patch_item(table, "rf-1", "refunds", **{"metadata.reviewed_by": "admin@bars.com"})
+        updates.patch_item(table, "rf-1", "refunds", status="completed")
+        updates.soft_delete(table, "rf-2", "refunds")
+        assert table.get_item(Key={"id": "rf-1"})["Item"]["status"] == "pending"  # still buffered
+
+    assert handler({}, None) is None
+    assert calls.count("UpdateItem") == 2
+    item = table.get_item(Key={"id": "rf-1"})["Item"]
+    assert item["status"] == "completed"
+    assert item["metadata"] == {"source": "shopify", "reviewed_by": "admin@bars.com"}
+    assert "deleted_at" in table.get_item(Key={"id": "rf-2"})["Item"]
+
+
+def test_patch_folds_into_put_and_overlaps_stay_ordered(table, calls):
+    with WriteBuffer():
+        writes.put_item(table, {"id": "rf-3", "status": "new"}, "refunds")
+        updates.patch_item(table, "rf-3", "refunds", **{"metadata.source": "google"})
+        updates.patch_item(table, "rf-1", "refunds", metadata={"source": "manual"})
+        updates.patch_item(table, "rf-1", "refunds", **{"metadata.note": "late"})
+
+    assert calls.count("PutItem") == 0 and calls.count("BatchWriteItem") == 1
+    assert table.get_item(Key={"id": "rf-3"})["Item"] == {"id": "rf-3", "status": "new", "metadata": {"source": "google"}}
+    assert calls.count("UpdateItem") == 2
+    assert table.get_item(Key={"id": "rf-1"})["Item"]["metadata"] == {"source": "manual", "note": "late"}
+
+
+def test_conditional_writes_share_a_transaction(table, calls):
+    with WriteBuffer() as buf:
+        buf.put(table, {"id": "rf-4", "status": "new"}, "refunds", condition=Attr("id").not_exists())
+        buf.put(table, {"id": "rf-2", "status": "new"}, "refunds", condition=Attr("id").not_exists())
+        buf.patch(table, "rf-1", "refunds", {"status": "approved"}, condition=Attr("status").eq("pending"))
+
+    assert [op.item_id for op in buf.failed] == ["rf-2"]
+    assert calls.count("TransactWriteItems") == 2  # cancelled once, resubmitted without rf-2
+    assert table.get_item(Key={"id": "rf-4"})["Item"]["status"] == "new"
+    assert table.get_item(Key={"id": "rf-2"})["Item"]["status"] == "completed"
+    assert table.get_item(Key={"id": "rf-1"})["Item"]["status"] == "approved"
+
+
+def test_nothing_is_written_when_the_block_raises(table, calls):
+    with pytest.raises(ValueError):
+        with WriteBuffer():
+            updates.patch_item(table, "rf-1", "refunds", status="lost")
+            raise ValueError("handler failed")
+
+    assert "UpdateItem" not in calls
+    assert table.get_item(Key={"id": "rf-1"})["Item"]["status"] == "pending"
+    updates.patch_item(table, "rf-1", "refunds", status="direct")  # buffer closed → immediate write
+    assert table.get_item(Key={"id": "rf-1"})["Item"]["status"] == "direct"
+
+
+def test_write_behind_handler_that_raises_writes_nothing(table, calls):
+    @write_behind
+    def handler(event, context):
+        updates.patch_item(table, "rf-1", "refunds", status="processing")
+        updates.patch_item(table, "rf-1", "refunds", status="completed")
+        raise RuntimeError("handler failed")
+
+    with pytest.raises(RuntimeError):
+        handler({}, None)
+
+    assert "UpdateItem" not in calls
+    assert table.get_item(Key={"id": "rf-1"})["Item"]["status"] == "pending"
+
+
+def test_stream_records_patching_one_item_flush_once(table, calls):
+    def record(sequence: str, status: str) -> dict:
+        return {
+            "eventID": sequence,
+            "eventName": "MODIFY",
+            "eventSource": "aws:dynamodb",
+            "eventSourceARN": "arn:aws:dynamodb:us-east-1:123456789012:table/refunds/stream/1",
+            "dynamodb": {"Keys": {"id": {"S": "rf-1"}}, "NewImage": {"status": {"S": status}}, "SequenceNumber": sequence},
+        }
+
+    def handle_record(record: reads.DynamoDBRecord) -> None:
+        updates.patch_item(table, "rf-1", "refunds", status=f"seen-{record.dynamodb.new_image['status']}")
+
+    result = reads.process_stream({"Records": [record("1", "a"), record("2", "b")]}, handle_record, None)
+
+    assert result == {"batchItemFailures": []}
+    assert calls.count("UpdateItem") == 1
+    assert table.get_item(Key={"id": "rf-1"})["Item"]["status"] == "seen-b"
@@ -0,0 +1,116 @@
+"""Unit tests for aws.dynamo.reads bulk reads, against moto.
+
+Covers:
+- query / query_pages follow LastEvaluatedKey past a single page
+- limit caps returned items, soft-deleted items stay filtered across pages
+- parallel_scan covers every segment exactly once
+- batch_get chunks past 100 keys, dedupes, and retries UnprocessedKeys
+"""
+
+import boto3
+import pytest
+from boto3.dynamodb.conditions import Attr, Key
+from moto import mock_aws
+
+from aws.dynamo import reads
+
+
+@pytest.fixture
+def table(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        table = boto3.resource("dynamodb", region_name="us-east-1").create_table(
+            TableName="refunds",
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "id", "AttributeType": "S"},
+                {"AttributeName": "customer_id", "AttributeType": "S"},
+                {"AttributeName": "created", "AttributeType": "N"},
+            ],
+            GlobalSecondaryIndexes=[{
+                "IndexName": "customer-index",
+                "KeySchema": [
+                    {"AttributeName": "customer_id", "KeyType": "HASH"},
+                    {"AttributeName": "created", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            }],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        with table.batch_writer() as batch:
+            for i in range(250):
+                item = {"id": f"rf-{i:03d}", "customer_id": "c1" if i < 120 else "c2", "created": i}
+                if i % 10 == 0:
+                    item["deleted_at"] = "2026-01-01T00:00:00Z"
+                batch.put_item(Item=item)
+        yield table
+
+
+def test_query_pages_follow_last_evaluated_key(table):
+    pages = list(reads.query_pages(table, index="customer-index", key_cond=Key("customer_id").eq("c1"), page_size=25))
+    assert len(pages) > 1
+    ids = [item["id"] for page in pages for item in page]
+    assert len(ids) == 108  # 120 minus the 12 soft-deleted
+    assert ids == sorted(ids)
+
+
+def test_query_limit_spans_pages_and_excludes_deleted(table):
+    items = reads.query(
+        table, index="customer-index", key_cond=Key("customer_id").eq("c1"), scan_forward=False, limit=30
+    )
+    assert len(items) == 30
+    assert items[0]["id"] == "rf-119"
+    assert all("deleted_at" not in item for item in items)
+
+    everything = reads.query(table, index="customer-index", key_cond=Key("customer_id").eq("c1"), include_deleted=True)
+    assert len(everything) == 120
+
+
+def test_parallel_scan_reads_every_item_once(table):
+    items = list(reads.parallel_scan(table, segments=4, page_size=20))
+    ids = [item["id"] for item in items]
+    assert len(ids) == len(set(ids)) == 225
+
+    filtered = list(reads.parallel_scan(table, segments=3, filter_expr=Attr("customer_id").eq("c2")))
+    assert len(filtered) == 117
+
+
+def test_batch_get_chunks_and_keeps_input_order(table):
+    ids = [f"rf-{i:03d}" for i in reversed(range(1, 250))] + ["rf-001", "rf-missing"]
+    items = reads.batch_get(table, ids)
+    assert [item["id"] for item in items] == [i for i in ids[:-2] if int(i[3:]) % 10]
+    assert len(reads.batch_get(table, ["rf-010"], include_deleted=True)) == 1
+
+
+def test_batch_get_retries_unprocessed_keys(table, monkeypatch):
+    client = table.meta.client
+    real = client.batch_get_item
+    calls = []
+
+    def flaky(RequestItems):  # noqa: N803 — boto3 kwarg
+        keys = RequestItems["refunds"]["Keys"]
+        calls.append(len(keys))
+        if len(calls) == 1:
+            served, held = keys[:3], keys[3:]
+            response = real(RequestItems={"refunds": {"Keys": served}})
+            response["UnprocessedKeys"] = {"refunds": {"Keys": held}}
+            return response
+        return real(RequestItems=RequestItems)
+
+    monkeypatch.setattr(client, "batch_get_item", flaky)
+    items = reads.batch_get(table, [f"rf-{i:03d}" for i in range(1, 9)], base_delay=0)
+    assert calls == [8, 5]
+    assert len(items) == 8
+
+
+def test_batch_get_gives_up_after_max_attempts(table, monkeypatch):
+    client = table.meta.client
+    monkeypatch.setattr(
+        client,
+        "batch_get_item",
+        lambda RequestItems: {"Responses": {}, "UnprocessedKeys": RequestItems},  # noqa: N803
+    )
+    with pytest.raises(RuntimeError, match="still unprocessed after 3 attempts"):
+        reads.batch_get(table, ["rf-001"], max_attempts=3, base_delay=0)
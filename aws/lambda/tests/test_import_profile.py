@@ -0,0 +1,94 @@
+"""Unit tests for tools/import_profile.py and the powertools.lazy layer module.
+
+Covers:
+- the -X importtime tree is rebuilt from post-order output, after the marker only
+- budgets flag slow modules, total time, and import failures
+- a real profile of a throwaway handler module in a fresh interpreter
+- lazy / lazy_import defer work to first use and build once across threads
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+_LAMBDA_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_LAMBDA_ROOT / "tools"))
+sys.path.insert(0, str(_LAMBDA_ROOT / "layers" / "aws-powertools"))
+
+import import_profile  # noqa: E402
+from import_profile import MARKER, Profile, check_budget, parse_importtime  # noqa: E402
+from powertools.lazy import is_loaded, lazy, lazy_import, reset  # noqa: E402
+
+IMPORTTIME = f"""\
+import time: self [us] | cumulative | imported package
+import time:       900 |        900 | site
+{MARKER}
+import time:       100 |        100 |     botocore.utils
+import time:      2000 |       2100 |   botocore
+import time:      5000 |       7100 | boto3
+import time:       300 |        300 | handler_helpers
+import time:       400 |       7800 | handler
+"""
+
+
+def test_tree_is_rebuilt_from_post_order_output():
+    roots = parse_importtime(IMPORTTIME)
+    assert [r.name for r in roots] == ["boto3", "handler_helpers", "handler"]
+    boto3 = roots[0]
+    assert boto3.cumulative_ms == 7.1 and boto3.self_ms == 5.0
+    assert [c.name for c in boto3.children] == ["botocore"]
+    assert [c.name for c in boto3.children[0].children] == ["botocore.utils"]
+
+
+def test_budget_failures():
+    profile = Profile("Fn", "handler", parse_importtime(IMPORTTIME), wall_ms=16.0, rss_mb=50.0)
+    assert check_budget(profile, {"total_ms": 100, "rss_mb": 60, "modules": {"boto3": 10}}) == []
+    assert check_budget(profile, {"total_ms": 10, "modules": {"botocore": 1}}) == [
+        "import time 15 ms > 10 ms",
+        "botocore 2 ms > 1 ms",
+    ]
+    profile.error = "ModuleNotFoundError: No module named 'x'"
+    assert check_budget(profile, {})[0].startswith("import failed")
+
+
+def test_profiles_a_handler_in_a_fresh_interpreter(tmp_path):
+    (tmp_path / "slow_dep.py").write_text("import time\ntime.sleep(0.03)\n")
+    (tmp_path / "tiny_handler.py").write_text("import slow_dep\n")
+    entry = {"module": "tiny_handler", "paths": [str(tmp_path)], "budget": {"modules": {"slow_dep": 5}}}
+
+    profile = import_profile.profile_function("Tiny", entry, {}, repeat=1)
+
+    assert profile.error is None
+    assert [r.name for r in profile.roots][-1] == "tiny_handler"
+    assert profile.failures and profile.failures[0].startswith("slow_dep")
+    assert profile.rss_mb > 0
+
+
+def test_lazy_builds_once_on_first_use():
+    built = []
+
+    class Provider:
+        def get(self, key):
+            return f"value:{key}"
+
+    provider = lazy(lambda: built.append(1) or Provider())
+    assert not is_loaded(provider) and built == []
+
+    threads = [threading.Thread(target=provider.get, args=("k",)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert provider.get("k") == "value:k"  # the wrapped object's get, not the proxy's
+    assert built == [1] and is_loaded(provider)
+    reset(provider)
+    assert not is_loaded(provider)
+
+
+def test_lazy_import_defers_the_import():
+    sys.modules.pop("colorsys", None)
+    colorsys = lazy_import("colorsys")
+    assert "colorsys" not in sys.modules
+    assert colorsys.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1)
+    assert "colorsys" in sys.modules
@@ -0,0 +1,362 @@
+"""Unit tests for ProductsAPI batch phase transitions (shopify_batch + handle_batch).
+
+Covers:
+- a season whose variant can't be resolved sends Shopify nothing at all
+- userErrors on a shared mutation are charged to the entry's season, and the
+  other seasons' entries are sent again without it
+- a season that fails an earlier step is left out of the inventory move
+- untraceable errors fail every season in the mutation
+- the lookups for many seasons stay under Shopify's single-query cost cap
+- handle_batch reports Shopify failures and only writes statuses for the rest
+- a non-object entry in ``seasons`` fails on its own instead of failing the batch
+- single-season status writes are buffered by ``write_behind`` and coalesce
+
+Shopify is a fake client whose ``run_batch`` answers per op. ``handle_batch``
+imports ``ProductsAPI.responses`` / ``ProductsAPI.shopify_ops``, which are not
+in this tree, so minimal stand-ins are registered when they're absent.
+"""
+
+import json
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+from box import Box
+from graphql import build_schema, get_named_type, is_leaf_type
+
+_LAMBDA_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_LAMBDA_ROOT / "layers" / "shopify-client"))
+sys.path.insert(0, str(_LAMBDA_ROOT / "layers" / "aws-powertools"))
+sys.path.insert(0, str(_LAMBDA_ROOT / "functions"))
+for _key, _value in {
+    "SHOPIFY__STORE_ID": "test-store",
+    "SHOPIFY__API_VERSION": "2026-07",
+    "SHOPIFY__TOKEN__ADMIN": "test",
+    "SHOPIFY__LOCATION_ID": "1",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+from ProductsAPI import shopify_batch  # noqa: E402
+from ProductsAPI.shopify_batch import ProductChange, apply_shopify_batch  # noqa: E402
+from shop_client import MAX_QUERY_COST, ShopifyClient  # noqa: E402
+
+
+def _product(product_id: str, media_ids=()):
+    return Box(id=f"gid://shopify/Product/{product_id}", media={"nodes": [{"id": f"gid://shopify/MediaImage/{m}"} for m in media_ids]})
+
+
+def _variant(variant_id: str, quantity: int = 0, item: str | None = "auto"):
+    inventory_item = None if item is None else {"id": f"gid://shopify/InventoryItem/{variant_id if item == 'auto' else item}"}
+    return Box(id=f"gid://shopify/ProductVariant/{variant_id}", inventory_quantity=quantity, inventory_item=inventory_item)
+
+
+class FakeShopify:
+    """``run_batch`` answers queries from ``nodes`` and mutations via ``errors_for(field, kwargs)``."""
+
+    def __init__(self, nodes: dict[str, Box], errors_for=lambda field, kwargs: []):
+        self.nodes = nodes
+        self.errors_for = errors_for
+        self.mutations: list[tuple[str, dict]] = []
+
+    def run_batch(self, calls):
+        results = []
+        for op, kwargs in calls:
+            if op.field in ("product", "product_variant"):
+                results.append(self.nodes.get(kwargs["id"]))
+            else:
+                self.mutations.append((op.field, kwargs))
+                results.append(Box(user_errors=self.errors_for(op.field, kwargs)))
+        return results
+
+    def sent(self, field: str) -> list[dict]:
+        return [kwargs for f, kwargs in self.mutations if f == field]
+
+
+@pytest.fixture
+def shopify(monkeypatch):
+    def install(nodes, errors_for=lambda field, kwargs: []):
+        fake = FakeShopify({n.id: n for n in nodes}, errors_for)
+        monkeypatch.setattr(shopify_batch, "_client", fake)
+        return fake
+
+    return install
+
+
+LOOKUP_SDL = """
+schema { query: QueryRoot }
+type QueryRoot { product(id: ID!): Product productVariant(id: ID!): ProductVariant }
+type Product { id: ID! media(first: Int): MediaConnection! }
+interface Media { id: ID! }
+type MediaImage implements Media { id: ID! }
+type MediaConnection { nodes: [Media!]! }
+type ProductVariant { id: ID! inventoryQuantity: Int inventoryItem: InventoryItem! }
+type InventoryItem { id: ID! }
+"""
+
+
+def _requested_cost(parent, selection_set) -> int:
+    """Shopify's static cost of a sent selection: objects 1, connections 2 + first × contents."""
+    cost = 0
+    for selection in selection_set.selections:
+        named = get_named_type(parent.fields[selection.name.value].type)
+        if is_leaf_type(named):
+            continue
+        inner = _requested_cost(named, selection.selection_set) if selection.selection_set else 0
+        if named.name.endswith("Connection"):
+            first = next(int(a.value.value) for a in selection.arguments if a.name.value == "first")
+            cost += 2 + first * inner
+        else:
+            cost += 1 + inner
+    return cost
+
+
+class CostCheckedShopify(FakeShopify):
+    """Lookups go through the real ``ShopifyClient.run_batch``; each sent document's cost is recorded."""
+
+    def __init__(self, nodes: dict[str, Box]):
+        super().__init__(nodes)
+        self.client = ShopifyClient(store_id="test-store", api_version="2026-07", token="x")
+        self.client.__dict__["gql_schema"] = build_schema(LOOKUP_SDL)
+        self.client.execute = self._execute
+        self.costs: list[int] = []
+
+    def _execute(self, request, variable_values, **kwargs):
+        operation = request.document.definitions[0]
+        self.costs.append(_requested_cost(self.client.gql_schema.query_type, operation.selection_set))
+        return {
+            alias: self.nodes[variable_values[f"{alias}_id"]].to_dict()
+            for alias in {key.split("_")[0] for key in variable_values}
+        }
+
+    def run_batch(self, calls):
+        if all(op.field in ("product", "product_variant") for op, _ in calls):
+            return self.client.run_batch(calls)
+        return super().run_batch(calls)
+
+
+def test_lookups_for_many_seasons_stay_under_the_query_cost_cap(monkeypatch):
+    products = [str(n) for n in range(10, 40)]
+    fake = CostCheckedShopify({
+        n.id: n for p in products
+        for n in (_product(p, media_ids=[f"{p}5"]), _variant(f"{p}1", 3), _variant(f"{p}2"))
+    })
+    monkeypatch.setattr(shopify_batch, "_client", fake)
+
+    failed = apply_shopify_batch([_change(f"s{p}", p, source_variant_id=f"{p}1", target=f"{p}2") for p in products])
+
+    assert dict(failed) == {}
+    assert max(fake.costs) <= MAX_QUERY_COST
+    assert len(fake.costs) == 4  # 30 product + 60 variant lookups, 25 aliases per document
+    assert len(fake.sent("product_update")) == len(products)
+
+
+def _change(season: str, product: str, image: int = 900, **kwargs) -> ProductChange:
+    return ProductChange(season_id=season, product_id=product, title=f"T{season}", tags=["t"], image=image,
+                         target_variant_id=kwargs.pop("target", f"{product}1"), **kwargs)
+
+
+def test_season_with_missing_variant_sends_nothing(shopify):
+    fake = shopify([
+        _product("10", media_ids=[800]), _product("20"),
+        _variant("101", 5), _variant("102"), _variant("201"),
+    ])
+    failed = apply_shopify_batch([
+        _change("s1", "10", source_variant_id="101", target="102"),
+        _change("s2", "20", source_variant_id="999", target="201"),  # source variant doesn't exist
+    ])
+
+    assert dict(failed) == {"s2": ["variant not found for inventory move"]}
+    assert [u["id"] for u in fake.sent("product_update")] == ["gid://shopify/Product/10"]
+    (files,) = fake.sent("file_update")
+    assert all("gid://shopify/Product/20" not in json.dumps(f) for f in files["files"])
+    (inventory,) = fake.sent("inventory_adjust_quantities")
+    assert [c["delta"] for c in inventory["changes"]] == [-5, 5]
+
+
+def test_variant_without_inventory_item_fails_validation(shopify):
+    fake = shopify([_product("10"), _variant("101", 3, item=None), _variant("102")])
+    failed = apply_shopify_batch([_change("s1", "10", source_variant_id="101", target="102")])
+
+    assert dict(failed) == {"s1": ["inventory item not found for inventory move"]}
+    assert fake.mutations == []
+
+
+def test_shared_mutation_error_is_charged_to_its_entry_and_the_rest_retried(shopify):
+    def errors_for(field, kwargs):
+        changes = kwargs.get("changes", [])
+        bad = [i for i, c in enumerate(changes) if c["inventoryItemId"].endswith("/202")]
+        return [{"field": ["input", "changes", str(i), "inventoryItemId"], "message": "item not stocked"} for i in bad]
+
+    fake = shopify([
+        _product("10"), _product("20"), _product("30"),
+        _variant("101", 4), _variant("102"), _variant("201", 2), _variant("202"), _variant("301", 1), _variant("302"),
+    ], errors_for)
+    failed = apply_shopify_batch([
+        _change("s1", "10", source_variant_id="101", target="102"),
+        _change("s2", "20", source_variant_id="201", target="202"),
+        _change("s3", "30", source_variant_id="301", target="302"),
+    ])
+
+    assert dict(failed) == {"s2": ["item not stocked"]}
+    first, retry = fake.sent("inventory_adjust_quantities")
+    assert len(first["changes"]) == 6
+    assert {c["inventoryItemId"].rsplit("/", 1)[-1] for c in retry["changes"]} == {"101", "102", "301", "302"}
+
+
+def test_failed_image_swap_keeps_season_out_of_inventory_move(shopify):
+    def errors_for(field, kwargs):
+        if field != "file_update":
+            return []
+        return [
+            {"field": ["files", str(i), "id"], "message": "file not found"}
+            for i, f in enumerate(kwargs["files"]) if f["id"].endswith("/666")
+        ]
+
+    fake = shopify([_product("10"), _product("20"), _variant("101", 4), _variant("102"), _variant("201", 2), _variant("202")],
+                   errors_for)
+    failed = apply_shopify_batch([
+        _change("s1", "10", source_variant_id="101", target="102"),
+        _change("s2", "20", image=666, source_variant_id="201", target="202"),
+    ])
+
+    assert dict(failed) == {"s2": ["file not found"]}
+    first, retry = fake.sent("file_update")
+    assert [f["id"] for f in retry["files"]] == ["gid://shopify/MediaImage/900"]
+    (inventory,) = fake.sent("inventory_adjust_quantities")
+    assert {c["inventoryItemId"].rsplit("/", 1)[-1] for c in inventory["changes"]} == {"101", "102"}
+
+
+def test_untraceable_error_fails_every_season_in_the_mutation(shopify):
+    def errors_for(field, kwargs):
+        return [{"field": None, "message": "throttled"}] if field == "inventory_adjust_quantities" else []
+
+    fake = shopify([_product("10"), _product("20"), _variant("101", 1), _variant("102"), _variant("201", 1), _variant("202")],
+                   errors_for)
+    failed = apply_shopify_batch([
+        _change("s1", "10", source_variant_id="101", target="102"),
+        _change("s2", "20", source_variant_id="201", target="202"),
+    ])
+
+    assert dict(failed) == {"s1": ["throttled"], "s2": ["throttled"]}
+    assert len(fake.sent("inventory_adjust_quantities")) == 1  # nothing left to retry
+
+
+# ── handle_batch ─────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def phase_transition(monkeypatch):
+    pytest.importorskip("pynamodb")  # ProductsAPI.repo
+    if "ProductsAPI.responses" not in sys.modules:
+        responses = types.ModuleType("ProductsAPI.responses")
+        responses.ok = lambda body: {"statusCode": 200, "body": json.dumps(body)}
+        responses.err = lambda status, message, **detail: {"statusCode": status, "body": json.dumps({"error": message, **detail})}
+        monkeypatch.setitem(sys.modules, "ProductsAPI.responses", responses)
+    if "ProductsAPI.shopify_ops" not in sys.modules:
+        shopify_ops = types.ModuleType("ProductsAPI.shopify_ops")
+        shopify_ops.apply_shopify = lambda **kwargs: None
+        monkeypatch.setitem(sys.modules, "ProductsAPI.shopify_ops", shopify_ops)
+    from ProductsAPI.handlers import phase_transition
+
+    return phase_transition
+
+
+def _season(season_id: str, product_id: str) -> Box:
+    return Box(
+        id=season_id, sport="kickball", division="open", baseTitle=f"Kickball {season_id}", tags=["kickball"],
+        shopifyProductId=product_id,
+        registrationPeriods={"veteran": {"shopifyVariantId": f"{product_id}1"}, "early": {"shopifyVariantId": f"{product_id}2"}},
+    )
+
+
+def test_handle_batch_reports_shopify_failures_and_writes_only_the_rest(phase_transition, shopify, monkeypatch):
+    written = {}
+    monkeypatch.setattr(phase_transition, "get_seasons", lambda ids: {"s1": _season("s1", "10"), "s2": _season("s2", "20")})
+    monkeypatch.setattr(phase_transition, "load_images", lambda: Box(kickball=900))
+    monkeypatch.setattr(phase_transition, "upsert_seasons", written.update)
+    fake = shopify([_product("10"), _product("20"), _variant("101", 4), _variant("102"), _variant("201", 2)])  # no 202
+
+    response = phase_transition.handle_batch({"seasons": [
+        {"seasonId": "s1", "targetPeriod": "early", "sourcePeriod": "veteran"},
+        {"seasonId": "s2", "targetPeriod": "early", "sourcePeriod": "veteran"},
+        {"seasonId": "s3", "targetPeriod": "nope"},
+    ]})
+
+    body = json.loads(response["body"])
+    assert [t["seasonId"] for t in body["transitioned"]] == ["s1"]
+    assert {f["seasonId"]: f["errors"] for f in body["failed"]} == {
+        "s3": ["Unknown targetPeriod: 'nope'"],
+        "s2": ["variant not found for inventory move"],
+    }
+    assert list(written) == ["s1"]
+    assert [u["id"] for u in fake.sent("product_update")] == ["gid://shopify/Product/10"]
+
+
+def test_handle_batch_keeps_status_when_shared_mutation_fails(phase_transition, shopify, monkeypatch):
+    written = {}
+    monkeypatch.setattr(phase_transition, "get_seasons", lambda ids: {"s1": _season("s1", "10")})
+    monkeypatch.setattr(phase_transition, "load_images", lambda: Box(kickball=900))
+    monkeypatch.setattr(phase_transition, "upsert_seasons", written.update)
+    shopify(
+        [_product("10"), _variant("101", 4), _variant("102")],
+        lambda field, kwargs: [{"field": None, "message": "boom"}] if field == "inventory_adjust_quantities" else [],
+    )
+
+    response = phase_transition.handle_batch({"seasons": [{"seasonId": "s1", "targetPeriod": "early", "sourcePeriod": "veteran"}]})
+
+    body = json.loads(response["body"])
+    assert body["transitioned"] == [] and body["failed"] == [{"seasonId": "s1", "errors": ["boom"]}]
+    assert written == {}
+
+
+def test_handle_batch_fails_non_object_entries_per_item(phase_transition, shopify, monkeypatch):
+    monkeypatch.setattr(phase_transition, "get_seasons", lambda ids: {})
+    monkeypatch.setattr(phase_transition, "load_images", lambda: Box(kickball=900))
+    monkeypatch.setattr(phase_transition, "upsert_seasons", lambda statuses: None)
+    shopify([])
+
+    response = phase_transition.handle_batch({"seasons": ["abc", {"seasonId": "s1", "targetPeriod": "early"}]})
+
+    assert response["statusCode"] == 200
+    assert {f["seasonId"]: f["errors"] for f in json.loads(response["body"])["failed"]} == {
+        "seasons[0]": ["season must be an object"],
+        "s1": ["Season not found: s1"],
+    }
+
+
+def test_upsert_season_is_buffered_and_coalesced_by_write_behind(monkeypatch):
+    pytest.importorskip("pynamodb")
+    import boto3
+    from moto import mock_aws
+
+    from aws.dynamo.coalesce import write_behind
+    from ProductsAPI import repo
+
+    for key, value in {"AWS_DEFAULT_REGION": "us-east-1", "AWS_ACCESS_KEY_ID": "testing", "AWS_SECRET_ACCESS_KEY": "testing"}.items():
+        monkeypatch.setenv(key, value)
+    with mock_aws():
+        table = boto3.resource("dynamodb", region_name="us-east-1").create_table(
+            TableName="seasons",
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        table.put_item(Item={"id": "s1", "status": "veteran"})
+        calls: list[str] = []
+        table.meta.client.meta.events.register("before-call.dynamodb", lambda model, **_: calls.append(model.name))
+        monkeypatch.setattr(repo, "_table", lambda: table)
+
+        @write_behind
+        def handler(event, context):
+            repo.upsert_season("s1", status="early")
+            repo.upsert_season("s1", status="open")
+            assert table.get_item(Key={"id": "s1"})["Item"]["status"] == "veteran"  # still buffered
+
+        handler({}, None)
+
+        item = table.get_item(Key={"id": "s1"})["Item"]
+        assert calls.count("UpdateItem") == 1
+        assert item["status"] == "open"
+        assert repo.RegularSeason.updatedAt.deserialize(item["updatedAt"]).tzinfo is not None
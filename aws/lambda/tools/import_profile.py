@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Cold-start import profiler for the Lambda handler entry points.
+
+Imports each function's handler module in a fresh interpreter under
+``-X importtime`` — the same work a cold start does before the first event —
+and reports:
+
+  * the import tree with cumulative / self milliseconds per module,
+  * wall time and peak RSS for the whole import,
+  * with ``--memory``, retained allocations per module (tracemalloc; this
+    slows the import, so times in that run are not checked),
+
+then checks them against the budgets in ``import_profile.json`` and exits
+non-zero when a budget is exceeded or the handler fails to import.
+
+Usage (from monorepo root):
+    python aws/lambda/tools/import_profile.py                  # every function
+    python aws/lambda/tools/import_profile.py RefundsAPI --memory
+    python aws/lambda/tools/import_profile.py --min-ms 1 --depth 6 --json
+
+Each entry in ``import_profile.json`` names the handler ``module``, the
+``paths`` that stand in for the function zip + its layers (relative to
+``aws/lambda``, or absolute), and a ``budget``:
+
+    "RefundsAPI": {
+        "module": "main",
+        "paths": ["functions/RefundsAPI", "layers/aws-powertools", "layers/shopify-client"],
+        "budget": {"total_ms": 800, "rss_mb": 120, "modules": {"boto3": 200}}
+    }
+
+``modules`` budgets apply to the cumulative time of every tree node with that
+name. Handlers read their env at import, so placeholder values for the usual
+variables are set unless already present (``--env KEY=VALUE`` to override).
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+LAMBDA_ROOT = Path(__file__).resolve().parents[1]
+REPO_ROOT = LAMBDA_ROOT.parents[1]
+CONFIG_PATH = Path(__file__).with_name("import_profile.json")
+
+MARKER = "--- import_profile: handler import starts ---"
+END_MARKER = "--- import_profile: handler import ends ---"
+
+PLACEHOLDER_ENV = {
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "BARS_ENV": "dev",
+    "POWERTOOLS_SERVICE_NAME": "import-profile",
+    "SHOPIFY__API_VERSION": "2026-07",
+    "SHOPIFY__LOCATION_ID": "1",
+    "SHOPIFY__STORE_ID": "import-profile",
+    "SHOPIFY__TOKEN__ADMIN": "import-profile",
+}
+
+# Runs in the child. Only modules the interpreter has already loaded are
+# imported before the marker, so nothing the handler needs is pre-warmed.
+_CHILD = """
+import sys, time
+sys.path[:0] = {paths!r}
+if {memory!r}:
+    import tracemalloc
+    tracemalloc.start()
+import resource
+sys.stderr.write({marker!r} + "\\n")
+sys.stderr.flush()
+error = None
+started = time.perf_counter()
+try:
+    __import__({module!r})
+except BaseException as exc:
+    error = f"{{type(exc).__name__}}: {{exc}}"
+wall_ms = (time.perf_counter() - started) * 1000
+sys.stderr.write({end_marker!r} + "\\n")
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+result = {{"wall_ms": wall_ms, "rss_mb": rss_kb / (1024 if sys.platform != "darwin" else 1024 * 1024), "error": error}}
+if {memory!r}:
+    files = {{getattr(m, "__file__", None): name for name, m in list(sys.modules.items())}}
+    sizes = {{}}
+    for stat in tracemalloc.take_snapshot().statistics("filename"):
+        name = files.get(stat.traceback[0].filename, "<other>")
+        sizes[name] = sizes.get(name, 0) + stat.size
+    result["memory_kb"] = {{k: v / 1024 for k, v in sizes.items()}}
+import json
+print(json.dumps(result))
+"""
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportNode:
+    name: str
+    self_ms: float
+    cumulative_ms: float
+    children: list["ImportNode"] = field(default_factory=list)
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass
+class Profile:
+    function: str
+    module: str
+    roots: list[ImportNode]
+    wall_ms: float
+    rss_mb: float
+    error: str | None = None
+    memory_kb: dict[str, float] = field(default_factory=dict)
+    failures: list[str] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(node.cumulative_ms for node in self.roots)
+
+
+def parse_importtime(stderr: str, marker: str = MARKER, end_marker: str = END_MARKER) -> list[ImportNode]:
+    """Build the import tree from ``-X importtime`` output between ``marker`` and ``end_marker``.
+
+    CPython prints a module after everything it imported, indented two spaces
+    per level, so children are collected until their parent's line arrives.
+    """
+    _, found, tail = stderr.partition(marker)
+    section = (tail if found else stderr).partition(end_marker)[0]
+    pending: dict[int, list[ImportNode]] = {}
+    for line in section.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = len(indent) // 2
+        node = ImportNode(name, int(self_us) / 1000, int(cumulative_us) / 1000, pending.pop(depth + 1, []))
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def check_budget(profile: Profile, budget: dict[str, Any]) -> list[str]:
+    """Human-readable budget violations (empty when within budget)."""
+    failures = []
+    if profile.error:
+        failures.append(f"import failed: {profile.error}")
+    if "total_ms" in budget and profile.total_ms > budget["total_ms"]:
+        failures.append(f"import time {profile.total_ms:.0f} ms > {budget['total_ms']} ms")
+    if "rss_mb" in budget and profile.rss_mb > budget["rss_mb"]:
+        failures.append(f"peak RSS {profile.rss_mb:.0f} MB > {budget['rss_mb']} MB")
+    for name, limit in (budget.get("modules") or {}).items():
+        worst = max((n.cumulative_ms for root in profile.roots for n in root.walk() if n.name == name), default=0.0)
+        if worst > limit:
+            failures.append(f"{name} {worst:.0f} ms > {limit} ms")
+    return failures
+
+
+def run_child(module: str, paths: list[str], env: dict[str, str], *, memory: bool = False) -> tuple[str, dict[str, Any]]:
+    """Import ``module`` in a fresh interpreter; return (importtime stderr, child result)."""
+    code = _CHILD.format(paths=paths, memory=memory, marker=MARKER, end_marker=END_MARKER, module=module)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, cwd=REPO_ROOT,
+    )
+    try:
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, json.JSONDecodeError):
+        tail = proc.stderr.strip().splitlines()[-1:] or [f"exit {proc.returncode}"]
+        result = {"wall_ms": 0.0, "rss_mb": 0.0, "error": f"profiler child crashed: {tail[0]}"}
+    return proc.stderr, result
+
+
+def profile_function(
+    function: str, entry: dict[str, Any], env: dict[str, str], *, repeat: int = 3, memory: bool = False
+) -> Profile:
+    """Profile one entry point; the run with the median import time is reported."""
+    paths = [str(p if Path(p).is_absolute() else LAMBDA_ROOT / p) for p in entry["paths"]]
+    runs = []
+    for _ in range(max(1, repeat)):
+        stderr, result = run_child(entry["module"], paths, env)
+        runs.append(Profile(function, entry["module"], parse_importtime(stderr), result["wall_ms"], result["rss_mb"], result["error"]))
+        if result["error"]:
+            break
+    runs.sort(key=lambda p: p.total_ms)
+    profile = runs[len(runs) // 2]
+    profile.rss_mb = statistics.median(p.rss_mb for p in runs)
+    if memory and not profile.error:
+        _, result = run_child(entry["module"], paths, env, memory=True)
+        profile.memory_kb = result.get("memory_kb", {})
+    profile.failures = check_budget(profile, entry.get("budget", {}))
+    return profile
+
+
+def render_tree(roots: list[ImportNode], *, min_ms: float = 5.0, depth: int = 4) -> list[str]:
+    lines = [f"  {'cumul ms':>9} {'self ms':>8}  module"]
+
+    def visit(node: ImportNode, level: int) -> None:
+        if node.cumulative_ms < min_ms or level >= depth:
+            return
+        lines.append(f"  {node.cumulative_ms:9.1f} {node.self_ms:8.1f}  {'  ' * level}{node.name}")
+        for child in sorted(node.children, key=lambda n: -n.cumulative_ms):
+            visit(child, level + 1)
+
+    for root in sorted(roots, key=lambda n: -n.cumulative_ms):
+        visit(root, 0)
+    return lines
+
+
+def render(profile: Profile, budget: dict[str, Any], *, min_ms: float, depth: int) -> str:
+    status = "OK" if not profile.failures else "OVER BUDGET"
+    limits = ", ".join(f"{k} {v}" for k, v in budget.items() if k != "modules") or "none"
+    lines = [
+        f"{profile.function} ({profile.module}): {profile.total_ms:.1f} ms import, "
+        f"{profile.wall_ms:.1f} ms wall, {profile.rss_mb:.1f} MB peak RSS — budget: {limits} — {status}",
+        *render_tree(profile.roots, min_ms=min_ms, depth=depth),
+    ]
+    if profile.memory_kb:
+        lines.append(f"  {'KB':>9}  retained by module (tracemalloc)")
+        for name, kb in sorted(profile.memory_kb.items(), key=lambda kv: -kv[1])[:15]:
+            lines.append(f"  {kb:9.0f}  {name}")
+    lines.extend(f"  ✗ {failure}" for failure in profile.failures)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("functions", nargs="*", help="function names from the config (default: all)")
+    parser.add_argument("--config", type=Path, default=CONFIG_PATH)
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per function (median reported)")
+    parser.add_argument("--memory", action="store_true", help="extra run with per-module tracemalloc attribution")
+    parser.add_argument("--min-ms", type=float, default=5.0, help="hide tree nodes cheaper than this")
+    parser.add_argument("--depth", type=int, default=4, help="tree depth to print")
+    parser.add_argument("--json", action="store_true", help="machine-readable summary instead of trees")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE")
+    args = parser.parse_args(argv)
+
+    config = json.loads(args.config.read_text())
+    unknown = set(args.functions) - set(config)
+    if unknown:
+        parser.error(f"unknown function(s) {sorted(unknown)}; configured: {sorted(config)}")
+
+    env = {**PLACEHOLDER_ENV, **os.environ, **dict(kv.split("=", 1) for kv in args.env)}
+    env.pop("PYTHONPATH", None)  # only the configured paths, like the Lambda runtime
+
+    profiles = []
+    for function in args.functions or list(config):
+        entry = config[function]
+        profile = profile_function(function, entry, env, repeat=args.repeat, memory=args.memory)
+        profiles.append(profile)
+        if not args.json:
+            print(render(profile, entry.get("budget", {}), min_ms=args.min_ms, depth=args.depth) + "\n")
+
+    if args.json:
+        print(json.dumps([
+            {
+                "function": p.function, "module": p.module, "import_ms": round(p.total_ms, 1),
+                "wall_ms": round(p.wall_ms, 1), "rss_mb": round(p.rss_mb, 1), "error": p.error,
+                "failures": p.failures,
+                "top": [{"module": n.name, "ms": round(n.cumulative_ms, 1)} for n in sorted(p.roots, key=lambda n: -n.cumulative_ms)[:10]],
+            }
+            for p in profiles
+        ], indent=2))
+    return 1 if any(p.failures for p in profiles) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
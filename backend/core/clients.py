@@ -7,14 +7,34 @@ import; routes / services import the bound module-level name directly.
     from core.clients import shopify
     result = await shopify.orders_get(query="id:12345", first=1)
 
-Lifecycle: ``lifespan`` is the FastAPI startup/shutdown hook. It closes
-each client's connection pool gracefully on shutdown.
+Read-through caches for Shopify orders and products (keyed by GID) live
+here too, so services and the webhook ingestor that invalidates them share
+one instance per process. Each process keeps its own LRU and Shopify delivers
+a webhook to one instance only, so with several instances the others keep
+serving the old entry for up to ``CACHE__FRESH_TTL`` seconds — keep that short
+(or both TTLs at 0) when running more than one instance.
+
+Lifecycle: ``lifespan`` is the FastAPI startup/shutdown hook. On shutdown
+it finishes queued webhook jobs, then closes each client's connection pool.
+Routers with background work of their own add it to ``startup_hooks`` /
+``shutdown_hooks`` when imported.
 """
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
+from typing import Awaitable, Callable
 
-from core.config import shopify_config
+from core.config import cache_config, settings, shopify_config
 from lib.clients.shopify import ShopifyClient
+from lib.clients.shopify.generated.orders_get import OrdersGetOrdersNodes
+from lib.clients.shopify.generated.products_get import ProductsGetProductsNodes
+from lib.utils.read_through_cache import ReadThroughCache, RedisBackend
+from modules.controllers.webhooks import ShopifyWebhooksController
+from modules.integrations.shopify.client.shopify_security import ShopifySecurity
+from modules.services.webhooks.ingestion import WebhookIngestor, WebhookJob
+
+logger = logging.getLogger(__name__)
 
 # ── Singletons ────────────────────────────────────────────────────────────────
 
@@ -28,15 +48,90 @@ shopify = ShopifyClient(
 # slack = SlackClient(...)
 
 
+def _cache(name: str, model: type) -> ReadThroughCache:
+    return ReadThroughCache(
+        name,
+        model=model,
+        maxsize=cache_config.maxsize,
+        fresh_ttl=cache_config.fresh_ttl,
+        stale_ttl=cache_config.stale_ttl,
+        backend=RedisBackend(cache_config.redis_url) if cache_config.redis_url else None,
+    )
+
+
+orders_cache: ReadThroughCache[OrdersGetOrdersNodes] = _cache("orders", OrdersGetOrdersNodes)
+products_cache: ReadThroughCache[ProductsGetProductsNodes] = _cache("products", ProductsGetProductsNodes)
+# Order number -> order GIDs. Numbers never move between orders, so no webhook touches this.
+order_numbers_cache: ReadThroughCache[list[str]] = _cache("order-numbers", list[str])
+
+
+# ── Shopify webhooks ──────────────────────────────────────────────────────────
+# Routes verify a delivery and hand it to ``webhook_ingestor``, which dedupes
+# retries, coalesces products/update bursts and runs the handlers below on its
+# worker threads. Invalidation is scheduled back onto the app's event loop,
+# where the caches live.
+
+webhooks_controller = ShopifyWebhooksController(
+    security=ShopifySecurity(webhook_secret=shopify_config.webhook_secret, env=settings.environment),
+)
+
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _invalidate(cache: ReadThroughCache, resource: str, job: WebhookJob) -> bool:
+    gid = job.payload.get("admin_graphql_api_id") or f"gid://shopify/{resource}/{job.payload['id']}"
+    if _loop is None:
+        raise RuntimeError(f"cache={cache.name} key={gid}: app event loop not running")
+    return asyncio.run_coroutine_threadsafe(cache.invalidate(gid), _loop).result(timeout=30)
+
+
+def _order_updated(job: WebhookJob) -> bool:
+    return _invalidate(orders_cache, "Order", job)
+
+
+def _product_updated(job: WebhookJob) -> bool:
+    invalidated = _invalidate(products_cache, "Product", job)
+    webhooks_controller.process_product_update(job)
+    return invalidated
+
+
+webhook_ingestor = WebhookIngestor({"orders/updated": _order_updated, "products/update": _product_updated})
+
+
 # ── App lifespan ──────────────────────────────────────────────────────────────
 
+# Run in order; a failing hook is logged and doesn't stop the others.
+startup_hooks: list[Callable[[], Awaitable[None]]] = []
+shutdown_hooks: list[Callable[[], Awaitable[None]]] = []
+
+
+async def _run_hooks(hooks: list[Callable[[], Awaitable[None]]]) -> None:
+    for hook in hooks:
+        try:
+            await hook()
+        except Exception:
+            logger.exception(f"lifespan hook {getattr(hook, '__qualname__', hook)} failed")
+
+
 
 @asynccontextmanager
 async def lifespan(_app):
     """FastAPI startup/shutdown. Closes all client connection pools on exit."""
+    global _loop
+    _loop = asyncio.get_running_loop()
+    await _run_hooks(startup_hooks)
     try:
         yield
     finally:
+        await _run_hooks(shutdown_hooks)
+        # Off the loop: the jobs schedule their cache invalidations onto it.
+        try:
+            await asyncio.to_thread(webhook_ingestor.shutdown)
+        except TimeoutError:
+            logger.warning(f"webhook jobs still running at shutdown: {webhook_ingestor.stats}")
         await shopify.http_client.aclose()
+        await orders_cache.aclose()
+        await products_cache.aclose()
+        await order_numbers_cache.aclose()
         # await google.aclose()
         # await slack.aclose()
@@ -30,6 +30,8 @@ class Settings(BaseSettings):
     version:     str = Field(init=False)
     environment: str = Field(init=False)
     verbosity: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(init=False)
+    # Shared key for internal endpoints (``X-API-Key``); unset refuses every request to them.
+    api_key:   str | None = None
 
     @classmethod
     def settings_customise_sources(
@@ -60,5 +62,17 @@ class ShopifyConfig(BaseSettings):
     webhook_secret:  str = Field(init=False)
 
 
+class CacheConfig(BaseSettings):
+    # Read-through cache for Shopify orders/products (see lib/utils/read_through_cache.py).
+    # ``redis_url`` unset keeps the cache in-process only; both TTLs at 0 disable it.
+    model_config = SettingsConfigDict(**SHARED_CONFIG, env_prefix="CACHE__")
+
+    fresh_ttl: float       = 60.0
+    stale_ttl: float       = 900.0
+    maxsize:   int         = 1000
+    redis_url: str | None  = None
+
+
 settings = Settings()
 shopify_config = ShopifyConfig()
+cache_config = CacheConfig()
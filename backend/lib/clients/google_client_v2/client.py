@@ -4,7 +4,10 @@ import hashlib
 import json
 import logging
 import os
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from google.auth.exceptions import RefreshError
@@ -12,6 +15,7 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from .batching import DEFAULT_QUOTAS, QuotaBudget, backoff_delay, is_rate_limited, thread_http
 from .errors import handle_http_error, handle_refresh_error
 from .scopes import DirectoryScopes, DriveScopes, GmailScopes, SheetsScopes
 
@@ -20,6 +24,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+BATCH_MAX_REQUESTS = 50
+
 
 class GoogleClient:
     """Unified Google API client with service-specific namespaces.
@@ -29,6 +35,7 @@ class GoogleClient:
     - Service caching per (api, version, scopes, subject)
     - Service namespaces: client.drive.*, client.sheets.*, client.gmail.*, etc.
     - Flexible subject/scopes (default or per-call override)
+    - Concurrent, quota-paced batch execution; paginate prefetches the next page
 
     Usage:
         # Default subject from GOOGLE_DEFAULT_ADMIN_EMAIL env var
@@ -54,6 +61,9 @@ class GoogleClient:
         self,
         sa_info: dict | None = None,
         config: "Config | None" = None,
+        quotas: dict[str, float] | None = None,
+        max_concurrency: int = 4,
+        max_attempts: int = 5,
     ):
         """Initialize Google API client.
 
@@ -62,11 +72,19 @@ class GoogleClient:
         Args:
             sa_info: Service account credentials dict (optional)
             config: Config object with google.service_account (optional)
+            quotas: Requests/minute per API name, merged over DEFAULT_QUOTAS
+            max_concurrency: Batch chunks executed at once
+            max_attempts: Tries per sub-request when rate limited
 
         If neither sa_info nor config provided, loads from GOOGLE__SERVICE_ACCOUNT env var.
         """
         self._cred_cache: dict[str, service_account.Credentials] = {}
         self._service_cache: dict[str, Any] = {}
+        self._quotas = {**DEFAULT_QUOTAS, **(quotas or {})}
+        self._budgets: dict[str, QuotaBudget] = {}
+        self._budgets_lock = threading.Lock()
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
 
         if sa_info is not None:
             self._sa_info = dict(sa_info)
@@ -210,6 +228,62 @@ class GoogleClient:
         """Execute a prepared API request with error handling."""
         return self._handle_api_errors(request.execute, scopes)
 
+    def budget(self, api: str) -> QuotaBudget | None:
+        """Shared quota budget for an API name ("sheets", "admin", ...); None if unmetered."""
+        per_minute = self._quotas.get(api)
+        if not per_minute:
+            return None
+        with self._budgets_lock:
+            if api not in self._budgets:
+                self._budgets[api] = QuotaBudget(per_minute)
+            return self._budgets[api]
+
+    @staticmethod
+    def _api_name(service: Any) -> str:
+        return getattr(service, "_rootDesc", {}).get("name", "")
+
+    def iter_pages(
+        self,
+        api_method: Any,
+        result_key: str,
+        scopes: list[str] | None = None,
+        prefetch: bool = True,
+        **params: Any,
+    ) -> Iterator[list[Any]]:
+        """Yield each page's items, fetching the next page while the caller works on this one.
+
+        Args:
+            api_method: Bound method (e.g., service.files().list)
+            result_key: Key in response containing items (e.g., "files", "groups")
+            scopes: Scopes for error diagnostics (optional)
+            prefetch: Fetch page N+1 in the background while page N is consumed
+            **params: Parameters passed to api_method on each call
+        """
+        resource = getattr(api_method, "__self__", None)
+
+        def fetch(page_token: str | None) -> dict:
+            page_params = {**params, **({"pageToken": page_token} if page_token else {})}
+            http = thread_http(resource) if prefetch else None
+            return self._handle_api_errors(
+                lambda: api_method(**page_params).execute(**({"http": http} if http else {})), scopes
+            )
+
+        if not prefetch:
+            resp = fetch(None)
+            while True:
+                yield resp.get(result_key, [])
+                if not resp.get("nextPageToken"):
+                    return
+                resp = fetch(resp["nextPageToken"])
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="google-paginate") as pool:
+            pending = pool.submit(fetch, None)
+            while pending is not None:
+                resp = pending.result()
+                page_token = resp.get("nextPageToken")
+                pending = pool.submit(fetch, page_token) if page_token else None
+                yield resp.get(result_key, [])
+
     def paginate(
         self,
         api_method: Any,
@@ -229,22 +303,8 @@ class GoogleClient:
             Combined list of all items from all pages
         """
         items: list[Any] = []
-        page_token: str | None = None
-
-        while True:
-            if page_token:
-                params["pageToken"] = page_token
-
-            resp = self._handle_api_errors(
-                lambda: api_method(**params).execute(), scopes
-            )
-
-            items.extend(resp.get(result_key, []))
-            page_token = resp.get("nextPageToken")
-
-            if not page_token:
-                break
-
+        for page in self.iter_pages(api_method, result_key, scopes, **params):
+            items.extend(page)
         return items
 
     def batch(
@@ -252,45 +312,84 @@ class GoogleClient:
         service: Any,
         requests: list[Any],
         scopes: list[str] | None = None,
+        api: str | None = None,
     ) -> list[dict]:
-        """Execute batch requests, auto-chunking into groups of 50 with 1s delay.
+        """Execute requests as batch HTTP calls of 50, several chunks at once.
+
+        Chunks draw from the API's QuotaBudget rather than sleeping between
+        calls. Sub-requests that come back rate limited (429, 403
+        rateLimitExceeded) are retried on their own with backoff; any other
+        sub-request error is raised after the batch finishes.
 
         Args:
             service: Google API service Resource
             requests: List of prepared requests (any size)
             scopes: Scopes for error diagnostics (optional)
+            api: API name for quota pacing (default: read from the service)
 
         Returns:
-            All responses (callback execution order, may differ from input order)
+            All responses, in input order
         """
-        all_results: list[dict] = []
-
-        for batch_idx in range(0, len(requests), 50):
-            if batch_idx > 0:
-                time.sleep(1)
-
-            chunk = requests[batch_idx:batch_idx + 50]
-            chunk_results: list[dict] = []
-            chunk_errors: list[Exception] = []
-
-            batch_req = service.new_batch_http_request(
-                callback=lambda _id, resp, exc, r=chunk_results, e=chunk_errors: (
-                    e.append(exc) if exc else r.append(resp)
-                )
-            )
-            for req in chunk:
-                batch_req.add(req)
-
-            self._handle_api_errors(batch_req.execute, scopes)
-
-            if chunk_errors:
-                exc = chunk_errors[0]
-                if isinstance(exc, HttpError):
-                    handle_http_error(exc, scopes)
-                if isinstance(exc, RefreshError):
-                    handle_refresh_error(exc, scopes)
-                raise exc
-
-            all_results.extend(chunk_results)
-
-        return all_results
+        results: list[Any] = [None] * len(requests)
+        errors: dict[int, Exception] = {}
+        budget = self.budget(api or self._api_name(service))
+        chunks = [
+            list(range(start, min(start + BATCH_MAX_REQUESTS, len(requests))))
+            for start in range(0, len(requests), BATCH_MAX_REQUESTS)
+        ]
+
+        def run_chunk(indexes: list[int]) -> None:
+            for attempt in range(1, self.max_attempts + 1):
+                if budget:
+                    budget.acquire(len(indexes))
+                failed: dict[int, Exception] = {}
+
+                def callback(request_id: str, resp: Any, exc: Exception | None) -> None:
+                    if exc is not None:
+                        failed[int(request_id)] = exc
+                    else:
+                        results[int(request_id)] = resp
+
+                batch_req = service.new_batch_http_request(callback=callback)
+                for idx in indexes:
+                    batch_req.add(requests[idx], request_id=str(idx))
+                http = thread_http(service)
+                try:
+                    batch_req.execute(**({"http": http} if http else {}))
+                except RefreshError as e:
+                    handle_refresh_error(e, scopes)
+                except HttpError as e:
+                    if not is_rate_limited(e) or attempt == self.max_attempts:
+                        handle_http_error(e, scopes)
+                    failed = dict.fromkeys(indexes, e)
+
+                retry = [idx for idx, exc in failed.items() if is_rate_limited(exc)]
+                errors.update({idx: exc for idx, exc in failed.items() if idx not in retry})
+                if not retry:
+                    if budget:
+                        budget.recover()
+                    return
+                if attempt == self.max_attempts:
+                    errors.update({idx: failed[idx] for idx in retry})
+                    return
+                if budget:
+                    budget.throttle()
+                delay = backoff_delay(attempt)
+                logger.warning("%d of %d batch requests rate limited; retrying in %.1fs", len(retry), len(indexes), delay)
+                time.sleep(delay)
+                indexes = sorted(retry)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(chunks))), thread_name_prefix="google-batch") as pool:
+            for future in [pool.submit(run_chunk, chunk) for chunk in chunks]:
+                future.result()
+
+        if errors:
+            first = errors[min(errors)]
+
+            def reraise() -> None:
+                raise first
+
+            # Re-raise inside _handle_api_errors so the handlers see an active exception
+            self._handle_api_errors(reraise, scopes)
+
+        return results
@@ -0,0 +1,401 @@
+"""Indexed, TTL-refreshed cache of the Slack directory — users, channels, usergroups.
+
+Lookups used to page through ``users.list`` / ``conversations.list`` /
+``usergroups.list`` on every call. A ``SlackDirectory`` loads each section once,
+indexes it, and serves lookups from memory:
+
+    users             id, email, normalized last name
+    channels          id, name (public; private_channels loaded only on request)
+    groups            id, handle
+
+Each section reloads on its own once older than ``ttl``. Between reloads the
+cache is kept current in place: ``apply_event`` takes Slack Events API payloads
+(``user_change``, ``team_join``, ``channel_*``, ``group_*``, ``subteam_*``), and
+``UsergroupService`` writes its own changes through ``upsert_group``.
+
+Thread safety: a reload lists the section without holding the data lock, builds
+new indexes, and swaps them in under it. Events and writes update the indexes
+under the same lock, and every read copies what it returns under it, so a
+lookup never sees a half-built section.
+
+One directory is shared per bot token:
+
+    directory = directory_for(client)
+    directory.warm()                              # optional, e.g. at startup
+    directory.user_by_email("jane@bigapplerecsports.com")
+    directory.channel_by_name("#leadership")
+    directory.group_by_handle("dodgeball-monday")
+
+No backend dependencies — safe to use in Lambda and shared_utilities.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 15 * 60
+PAGE_LIMIT = 200
+
+USERS = "users"
+CHANNELS = "channels"
+PRIVATE_CHANNELS = "private_channels"
+GROUPS = "groups"
+SECTIONS = (USERS, CHANNELS, PRIVATE_CHANNELS, GROUPS)
+
+_CHANNEL_TYPES = {CHANNELS: "public_channel", PRIVATE_CHANNELS: "private_channel"}
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Lower-case a channel name / group handle and drop a leading ``#`` or ``@``."""
+    return (name or "").strip().lstrip("#@").lower()
+
+
+def user_real_name(user: Dict[str, Any]) -> str:
+    profile = user.get("profile") or {}
+    return (profile.get("real_name_normalized") or profile.get("real_name") or user.get("name") or "").lower()
+
+
+def _last_name(user: Dict[str, Any]) -> str:
+    parts = user_real_name(user).split()
+    return parts[-1] if parts else ""
+
+
+def _email(user: Dict[str, Any]) -> str:
+    return ((user.get("profile") or {}).get("email") or "").strip().lower()
+
+
+def _index_user(
+    user: Dict[str, Any], by_id: Dict[str, Dict[str, Any]], by_email: Dict[str, str], by_last_name: Dict[str, List[str]]
+) -> None:
+    user_id = user.get("id")
+    if not user_id:
+        return
+    previous = by_id.get(user_id)
+    if previous is not None:
+        if by_email.get(_email(previous)) == user_id:
+            del by_email[_email(previous)]
+        ids = by_last_name.get(_last_name(previous), [])
+        if user_id in ids:
+            ids.remove(user_id)
+    by_id[user_id] = user
+    if _email(user):
+        by_email[_email(user)] = user_id
+    by_last_name.setdefault(_last_name(user), []).append(user_id)
+
+
+def _index_channel(channel: Dict[str, Any], by_id: Dict[str, Dict[str, Any]], by_name: Dict[str, str]) -> None:
+    channel_id = channel.get("id")
+    if not channel_id:
+        return
+    _drop_channel(channel_id, by_id, by_name)
+    by_id[channel_id] = channel
+    if channel.get("name"):
+        by_name[normalize_name(channel["name"])] = channel_id
+
+
+def _drop_channel(channel_id: str, by_id: Dict[str, Dict[str, Any]], by_name: Dict[str, str]) -> None:
+    previous = by_id.pop(channel_id, None)
+    if previous is not None and by_name.get(normalize_name(previous.get("name"))) == channel_id:
+        del by_name[normalize_name(previous.get("name"))]
+
+
+def _index_group(group: Dict[str, Any], by_id: Dict[str, Dict[str, Any]], by_handle: Dict[str, str]) -> None:
+    group_id = group.get("id")
+    if not group_id:
+        return
+    previous = by_id.get(group_id)
+    if previous is not None and by_handle.get(normalize_name(previous.get("handle"))) == group_id:
+        del by_handle[normalize_name(previous.get("handle"))]
+    by_id[group_id] = group
+    if group.get("handle"):
+        by_handle[normalize_name(group["handle"])] = group_id
+
+
+class SlackDirectory:
+    """In-memory indexes over one workspace's users, channels and usergroups."""
+
+    def __init__(self, client: Any, ttl: float = DEFAULT_TTL, clock: Callable[[], float] = time.monotonic):
+        self.client = client
+        self.ttl = ttl
+        self._clock = clock
+        # _lock guards the indexes (held briefly); _reload_lock serializes reloads (held across Slack calls).
+        self._lock = threading.RLock()
+        self._reload_lock = threading.Lock()
+        self._loaded_at: Dict[str, float] = {}
+
+        self._users: Dict[str, Dict[str, Any]] = {}
+        self._users_by_email: Dict[str, str] = {}
+        self._users_by_last_name: Dict[str, List[str]] = defaultdict(list)
+        self._channels: Dict[str, Dict[str, Any]] = {}
+        self._channels_by_name: Dict[str, str] = {}
+        self._groups: Dict[str, Dict[str, Any]] = {}
+        self._groups_by_handle: Dict[str, str] = {}
+
+    # ── freshness ─────────────────────────────────────────────────────────
+
+    def is_fresh(self, section: str) -> bool:
+        loaded_at = self._loaded_at.get(section)
+        return loaded_at is not None and self._clock() - loaded_at < self.ttl
+
+    def warm(self, sections: Iterable[str] = (USERS, CHANNELS, GROUPS)) -> None:
+        """Load every given section that isn't already fresh."""
+        for section in sections:
+            self._ensure(section)
+
+    def invalidate(self, *sections: str) -> None:
+        """Mark sections (default: all) stale; they reload on next use. Cached entries stay until then."""
+        with self._reload_lock:
+            for section in sections or SECTIONS:
+                self._loaded_at.pop(section, None)
+
+    def _ensure(self, section: str, force: bool = False) -> None:
+        if not force and self.is_fresh(section):
+            return
+        with self._reload_lock:
+            if not force and self.is_fresh(section):
+                return
+            try:
+                self._reload(section)
+            except Exception as e:
+                # A forced reload backs a read-modify-write; a stale copy would undo outside changes.
+                if force or (section not in self._loaded_at and not self._has_entries(section)):
+                    raise
+                # Serve what we have for another TTL rather than re-listing on every lookup.
+                logger.warning("Slack directory: reloading %s failed, serving cached copy: %s", section, e)
+            self._loaded_at[section] = self._clock()
+
+    def _has_entries(self, section: str) -> bool:
+        with self._lock:
+            if section == USERS:
+                return bool(self._users)
+            if section == GROUPS:
+                return bool(self._groups)
+            return bool(self._channels)
+
+    # ── loading ───────────────────────────────────────────────────────────
+
+    def _paginate(self, method: Callable[..., Any], result_key: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            response = method(**kwargs, limit=PAGE_LIMIT, **({"cursor": cursor} if cursor else {}))
+            if not response.get("ok"):
+                raise RuntimeError(f"{result_key} listing failed: {response.get('error')!r}")
+            results.extend(response.get(result_key, []))
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                return results
+
+    def _reload(self, section: str) -> None:
+        """List ``section`` from Slack, build fresh indexes, and swap them in under ``_lock``."""
+        started = time.perf_counter()
+        if section == USERS:
+            users = self._paginate(self.client.users_list, "members")
+            by_id: Dict[str, Dict[str, Any]] = {}
+            by_email: Dict[str, str] = {}
+            by_last_name: Dict[str, List[str]] = defaultdict(list)
+            for user in users:
+                _index_user(user, by_id, by_email, by_last_name)
+            with self._lock:
+                self._users, self._users_by_email, self._users_by_last_name = by_id, by_email, by_last_name
+            count = len(users)
+        elif section in _CHANNEL_TYPES:
+            channels = self._paginate(self.client.conversations_list, "channels", types=_CHANNEL_TYPES[section])
+            private = section == PRIVATE_CHANNELS
+            with self._lock:
+                # The other privacy's channels are kept as they are.
+                kept = [c for c in self._channels.values() if bool(c.get("is_private")) != private]
+                by_id, by_name = {}, {}
+                for channel in kept + [{"is_private": private, **c} for c in channels]:
+                    _index_channel(channel, by_id, by_name)
+                self._channels, self._channels_by_name = by_id, by_name
+            count = len(channels)
+        elif section == GROUPS:
+            response = self.client.usergroups_list(include_count=True, include_disabled=True, include_users=True)
+            if not response.get("ok"):
+                raise RuntimeError(f"usergroups listing failed: {response.get('error')!r}")
+            groups: Dict[str, Dict[str, Any]] = {}
+            by_handle: Dict[str, str] = {}
+            for group in response.get("usergroups", []):
+                _index_group(group, groups, by_handle)
+            with self._lock:
+                self._groups, self._groups_by_handle = groups, by_handle
+            count = len(groups)
+        else:
+            raise ValueError(f"Unknown directory section: {section!r}")
+        logger.info("Slack directory: loaded %d %s in %.2fs", count, section, time.perf_counter() - started)
+
+    # ── indexes (callers hold _lock) ──────────────────────────────────────
+
+    def _index_user(self, user: Dict[str, Any]) -> None:
+        _index_user(user, self._users, self._users_by_email, self._users_by_last_name)
+
+    def _index_channel(self, channel: Dict[str, Any]) -> None:
+        _index_channel(channel, self._channels, self._channels_by_name)
+
+    def _drop_channel(self, channel_id: str) -> None:
+        _drop_channel(channel_id, self._channels, self._channels_by_name)
+
+    def _index_group(self, group: Dict[str, Any]) -> None:
+        _index_group(group, self._groups, self._groups_by_handle)
+
+    # ── users ─────────────────────────────────────────────────────────────
+
+    def user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        self._ensure(USERS)
+        with self._lock:
+            return self._users.get(user_id)
+
+    def user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        self._ensure(USERS)
+        with self._lock:
+            user_id = self._users_by_email.get((email or "").strip().lower())
+            return self._users.get(user_id) if user_id else None
+
+    def users_with_last_name(self, last_name: str) -> List[Dict[str, Any]]:
+        """Users whose real name ends in exactly ``last_name`` (case-insensitive)."""
+        self._ensure(USERS)
+        with self._lock:
+            user_ids = self._users_by_last_name.get((last_name or "").strip().lower(), [])
+            return [self._users[uid] for uid in user_ids if uid in self._users]
+
+    def search_users(self, fragment: str) -> List[Dict[str, Any]]:
+        """Users whose real name contains ``fragment`` (case-insensitive), in directory order."""
+        self._ensure(USERS)
+        needle = (fragment or "").strip().lower()
+        if not needle:
+            return []
+        return [u for u in self.list_users() if needle in user_real_name(u)]
+
+    def list_users(self) -> List[Dict[str, Any]]:
+        self._ensure(USERS)
+        with self._lock:
+            return list(self._users.values())
+
+    # ── channels ──────────────────────────────────────────────────────────
+
+    def channel(self, channel_id: str, include_private: bool = False) -> Optional[Dict[str, Any]]:
+        self._ensure_channels(include_private)
+        with self._lock:
+            channel = self._channels.get(channel_id)
+        return channel if channel and (include_private or not channel.get("is_private")) else None
+
+    def channel_by_name(
+        self, name: str, include_private: bool = False, include_archived: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        self._ensure_channels(include_private)
+        with self._lock:
+            channel_id = self._channels_by_name.get(normalize_name(name))
+        channel = self.channel(channel_id, include_private) if channel_id else None
+        return channel if channel and (include_archived or not channel.get("is_archived")) else None
+
+    def list_channels(self, include_private: bool = False, include_archived: bool = False) -> List[Dict[str, Any]]:
+        self._ensure_channels(include_private)
+        with self._lock:
+            channels = list(self._channels.values())
+        return [
+            c for c in channels
+            if (include_private or not c.get("is_private")) and (include_archived or not c.get("is_archived"))
+        ]
+
+    def _ensure_channels(self, include_private: bool) -> None:
+        self._ensure(CHANNELS)
+        if include_private:
+            self._ensure(PRIVATE_CHANNELS)
+
+    # ── usergroups ────────────────────────────────────────────────────────
+
+    def group(self, group_id: str, fresh: bool = False) -> Optional[Dict[str, Any]]:
+        """The cached group; ``fresh=True`` reloads the groups section first (raises if that fails)."""
+        self._ensure(GROUPS, force=fresh)
+        with self._lock:
+            return self._groups.get(group_id)
+
+    def group_by_handle(self, handle: str) -> Optional[Dict[str, Any]]:
+        self._ensure(GROUPS)
+        with self._lock:
+            group_id = self._groups_by_handle.get(normalize_name(handle))
+            return self._groups.get(group_id) if group_id else None
+
+    def list_groups(self, include_disabled: bool = False) -> List[Dict[str, Any]]:
+        self._ensure(GROUPS)
+        with self._lock:
+            groups = list(self._groups.values())
+        return [g for g in groups if include_disabled or not g.get("date_delete")]
+
+    def upsert_group(self, group_id: str, **fields: Any) -> None:
+        """Merge ``fields`` into a cached group (e.g. after a write) without reloading."""
+        with self._lock:
+            self._index_group({**self._groups.get(group_id, {}), **fields, "id": group_id})
+
+    # ── events ────────────────────────────────────────────────────────────
+
+    def apply_event(self, event: Dict[str, Any]) -> bool:
+        """Apply one Slack Events API ``event`` payload; returns False if it doesn't touch the directory."""
+        kind = event.get("type", "")
+        with self._lock:
+            if kind in ("user_change", "team_join"):
+                self._index_user(event.get("user") or {})
+            elif kind in ("channel_created", "channel_rename", "group_rename"):
+                channel = event.get("channel") or {}
+                previous = self._channels.get(channel.get("id"), {"is_private": kind == "group_rename"})
+                self._index_channel({**previous, **channel})
+            elif kind in ("channel_archive", "channel_unarchive", "group_archive", "group_unarchive"):
+                channel_id = event.get("channel")
+                if channel_id in self._channels:
+                    self._channels[channel_id]["is_archived"] = kind.endswith("_archive")
+            elif kind in ("channel_deleted", "group_deleted"):
+                self._drop_channel(event.get("channel", ""))
+            elif kind in ("subteam_created", "subteam_updated"):
+                subteam = event.get("subteam") or {}
+                if subteam.get("id"):
+                    self.upsert_group(subteam["id"], **subteam)
+            elif kind == "subteam_members_changed":
+                group_id = event.get("subteam_id", "")
+                if group_id in self._groups:
+                    removed = set(event.get("removed_users") or [])
+                    users = [u for u in self._groups[group_id].get("users", []) if u not in removed]
+                    users += [u for u in event.get("added_users") or [] if u not in users]
+                    self.upsert_group(group_id, users=users, user_count=len(users))
+            else:
+                return False
+        return True
+
+
+# ── shared instances ──────────────────────────────────────────────────────────
+
+_directories: Dict[str, SlackDirectory] = {}
+_directories_lock = threading.Lock()
+
+
+def directory_for(client: Any, ttl: float = DEFAULT_TTL) -> SlackDirectory:
+    """The shared directory for ``client``'s token, created on first use.
+
+    Clients are cheap and often built per request, so the directory follows the
+    most recent client handed in for the same token.
+    """
+    key = getattr(client, "token", None) or f"client-{id(client)}"
+    with _directories_lock:
+        directory = _directories.get(key)
+        if directory is None:
+            directory = _directories[key] = SlackDirectory(client, ttl=ttl)
+        else:
+            directory.client = client
+        return directory
+
+
+def apply_event(event: Dict[str, Any]) -> bool:
+    """Apply a Slack event to every shared directory (one per bot token in this process)."""
+    with _directories_lock:
+        directories = list(_directories.values())
+    return any([directory.apply_event(event) for directory in directories])
+
+
+def reset_directories() -> None:
+    """Drop every shared directory (tests, token rotation)."""
+    with _directories_lock:
+        _directories.clear()
@@ -0,0 +1,258 @@
+"""Read-through cache with stale-while-revalidate, single-flight loads and webhook invalidation.
+
+Entries are keyed by Shopify GID and live in an in-process LRU. Optionally, a
+shared backend (e.g. Redis) sits behind the LRU so several instances can share
+warm entries:
+
+    cache = ReadThroughCache("orders", model=Order, fresh_ttl=60, stale_ttl=900)
+    order = await cache.get(gid, lambda: fetch_order(gid))
+    await cache.invalidate(gid)          # from the orders/updated webhook
+
+An entry's age decides what ``get`` does:
+
+    age < fresh_ttl              hit — returned as is
+    fresh_ttl <= age < stale_ttl stale hit — returned as is, refreshed in the background
+    otherwise / absent           miss — loaded; concurrent misses share one load
+
+A load that was in flight when its key was invalidated still answers its
+waiters, but its result is not stored. Shared-backend errors are logged and
+treated as misses, because the cache must never be the reason a request fails.
+Other instances' LRUs are not notified of an invalidation, so they serve the
+old value for at most ``fresh_ttl`` seconds after the webhook.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Protocol, TypeVar
+
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Loader = Callable[[], Awaitable[T]]
+
+
+class CacheBackend(Protocol):
+    """Shared store behind the LRU. Values are opaque bytes; ``ttl`` is in seconds."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def aclose(self) -> None: ...
+
+
+class RedisBackend:
+    """``CacheBackend`` on ``redis.asyncio``. ``redis`` is an optional dependency."""
+
+    def __init__(self, url: str, *, prefix: str = "bars:cache:"):
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise ImportError("RedisBackend requires the 'redis' package (pip install redis)") from e
+        self.prefix = prefix
+        self._redis = aioredis.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._redis.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._redis.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(self.prefix + key)
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    stored_at: float
+
+
+class ReadThroughCache(Generic[T]):
+    """LRU of ``key -> value`` in front of an async loader, with an optional shared backend."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        model: Any = None,
+        maxsize: int = 1000,
+        fresh_ttl: float = 60.0,
+        stale_ttl: float = 900.0,
+        backend: CacheBackend | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if backend is not None and model is None:
+            raise ValueError(f"cache {name}: a shared backend needs a model to (de)serialize values")
+        self.name = name
+        self.maxsize = maxsize
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = max(stale_ttl, fresh_ttl)
+        self.backend = backend
+        self._adapter = TypeAdapter(model) if model is not None else None
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry[T]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.stats: dict[str, int] = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "shared_hits": 0, "loads": 0,
+            "load_errors": 0, "refreshes": 0, "invalidations": 0, "evictions": 0, "backend_errors": 0,
+        }
+
+    # ── Reads ──────────────────────────────────────────────────────────────
+
+    async def get(self, key: str, load: Loader[T]) -> T:
+        """Return the cached value for ``key``, calling ``load()`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry.stored_at
+            if age < self.fresh_ttl:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry.value
+            if age < self.stale_ttl:
+                self._entries.move_to_end(key)
+                self.stats["stale_hits"] += 1
+                if key not in self._inflight:
+                    self.stats["refreshes"] += 1
+                    self._start_load(key, load, background=True)
+                return entry.value
+            del self._entries[key]
+
+        self.stats["misses"] += 1
+        task = self._inflight.get(key) or self._start_load(key, load, background=False)
+        return await asyncio.shield(task)
+
+    def _start_load(self, key: str, load: Loader[T], *, background: bool) -> asyncio.Task:
+        task = asyncio.create_task(self._load(key, load, use_shared=not background), name=f"cache-{self.name}-{key}")
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._load_done(key, t, background))
+        return task
+
+    def _load_done(self, key: str, task: asyncio.Task, background: bool) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        error = None if task.cancelled() else task.exception()
+        if background and error is not None:
+            # Nobody awaits a refresh; keep serving the stale value until it ages out.
+            logger.warning(f"cache={self.name} key={key} refresh failed: {error!r}")
+
+    async def _load(self, key: str, load: Loader[T], *, use_shared: bool) -> T:
+        task = asyncio.current_task()
+        if use_shared and self.backend is not None:
+            shared = await self._shared_get(key)
+            if shared is not None:
+                self.stats["shared_hits"] += 1
+                if self._inflight.get(key) is task:
+                    self._store(key, shared.value, shared.stored_at)
+                return shared.value
+
+        self.stats["loads"] += 1
+        started = time.monotonic()
+        try:
+            value = await load()
+        except Exception:
+            self.stats["load_errors"] += 1
+            raise
+        logger.debug(f"cache={self.name} key={key} load_ms={(time.monotonic() - started) * 1000:.0f}")
+        if self._inflight.get(key) is task:  # not invalidated while loading
+            stored_at = self._clock()
+            self._store(key, value, stored_at)
+            await self._shared_set(key, value, stored_at)
+        return value
+
+    # ── Writes ─────────────────────────────────────────────────────────────
+
+    async def put(self, key: str, value: T) -> None:
+        """Store a value obtained elsewhere (e.g. a list query that returned whole nodes)."""
+        stored_at = self._clock()
+        self._store(key, value, stored_at)
+        await self._shared_set(key, value, stored_at)
+
+    async def invalidate(self, key: str) -> bool:
+        """Drop ``key`` here and in the shared backend; True if it was cached locally."""
+        self.stats["invalidations"] += 1
+        self._inflight.pop(key, None)  # an in-flight load must not store what it read
+        found = self._entries.pop(key, None) is not None
+        if self.backend is not None:
+            try:
+                await self.backend.delete(self._shared_key(key))
+            except Exception as e:
+                self.stats["backend_errors"] += 1
+                logger.warning(f"cache={self.name} key={key} shared delete failed: {e!r}")
+        logger.info(f"cache={self.name} key={key} invalidated local={found}")
+        return found
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+    def _store(self, key: str, value: T, stored_at: float) -> None:
+        self._entries[key] = _Entry(value, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    # ── Shared backend ─────────────────────────────────────────────────────
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    async def _shared_get(self, key: str) -> _Entry[T] | None:
+        assert self.backend is not None and self._adapter is not None
+        try:
+            raw = await self.backend.get(self._shared_key(key))
+            if raw is None:
+                return None
+            envelope = json.loads(raw)
+            if self._clock() - envelope["stored_at"] >= self.fresh_ttl:
+                return None  # let this instance load a fresh copy rather than adopt a stale one
+            return _Entry(self._adapter.validate_python(envelope["value"]), envelope["stored_at"])
+        except Exception as e:
+            self.stats["backend_errors"] += 1
+            logger.warning(f"cache={self.name} key={key} shared read failed: {e!r}")
+            return None
+
+    async def _shared_set(self, key: str, value: T, stored_at: float) -> None:
+        if self.backend is None:
+            return
+        assert self._adapter is not None
+        try:
+            payload = {"stored_at": stored_at, "value": self._adapter.dump_python(value, mode="json", by_alias=True)}
+            await self.backend.set(self._shared_key(key), json.dumps(payload).encode(), self.stale_ttl)
+        except Exception as e:
+            self.stats["backend_errors"] += 1
+            logger.warning(f"cache={self.name} key={key} shared write failed: {e!r}")
+
+    # ── Metrics ────────────────────────────────────────────────────────────
+
+    def snapshot(self) -> dict[str, Any]:
+        """Counters plus size and hit ratio (fresh + stale + shared hits over lookups)."""
+        served = self.stats["hits"] + self.stats["stale_hits"]
+        lookups = served + self.stats["misses"]
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_ratio": round((served + self.stats["shared_hits"]) / lookups, 3) if lookups else None,
+            **self.stats,
+        }
+
+    async def aclose(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self.backend is not None:
+            await self.backend.aclose()
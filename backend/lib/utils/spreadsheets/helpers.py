@@ -8,7 +8,7 @@ import re
 import sys
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, TextIO, cast
+from typing import Any, Iterable, Iterator, TextIO, cast
 
 from validator_collection import is_email
 
@@ -230,7 +230,7 @@ def normalize_value(value: str, column_name: str) -> str:
 
 def build_keyed_dict(
     headers: list[str],
-    rows: list[dict[str, str]],
+    rows: Iterable[dict[str, str]],
     key_column: str = "Order Number",
     header_normalization_map: dict[str, str] | None = None,
 ) -> tuple[dict[str, dict[str, str]], list[str]]:
@@ -277,30 +277,15 @@ def build_keyed_dict(
     return keyed_dict, missing_key_rows
 
 
-def compare_csvs(file1: str, file2: str) -> dict[str, Any]:
-    """Compare two CSV files by order ID and return detailed differences."""
-    headers1_raw, rows1 = read_csv_file(file1)
-    headers2_raw, rows2 = read_csv_file(file2)
-
-    headers1 = [h.strip() for h in headers1_raw]
-    headers2 = [h.strip() for h in headers2_raw]
-
-    stripped_to_orig1 = dict(zip(headers1, headers1_raw))
-    stripped_to_orig2 = dict(zip(headers2, headers2_raw))
-
-    normalized_headers1 = [normalize_header(h) for h in headers1]
-    normalized_headers2 = [normalize_header(h) for h in headers2]
+def header_differences(headers1_raw: list[str], headers2_raw: list[str]) -> list[dict[str, Any]]:
+    """Columns present (after normalization) in only one of two header rows."""
+    norm_to_orig1 = {normalize_header(h): h.strip() for h in headers1_raw}
+    norm_to_orig2 = {normalize_header(h): h.strip() for h in headers2_raw}
 
-    norm_to_orig1 = dict(zip(normalized_headers1, headers1))
-    norm_to_orig2 = dict(zip(normalized_headers2, headers2))
-
-    header_differences: list[dict[str, Any]] = []
-    normalized_headers1_set = set(normalized_headers1)
-    normalized_headers2_set = set(normalized_headers2)
-
-    for norm_header in sorted(normalized_headers1_set - normalized_headers2_set):
-        orig_header = norm_to_orig1.get(norm_header, norm_header)
-        header_differences.append(
+    differences: list[dict[str, Any]] = []
+    for norm_header in sorted(norm_to_orig1.keys() - norm_to_orig2.keys()):
+        orig_header = norm_to_orig1[norm_header]
+        differences.append(
             {
                 "type": "header",
                 "column_name": orig_header,
@@ -308,10 +293,9 @@ def compare_csvs(file1: str, file2: str) -> dict[str, Any]:
                 "file2_value": "<missing>",
             },
         )
-
-    for norm_header in sorted(normalized_headers2_set - normalized_headers1_set):
-        orig_header = norm_to_orig2.get(norm_header, norm_header)
-        header_differences.append(
+    for norm_header in sorted(norm_to_orig2.keys() - norm_to_orig1.keys()):
+        orig_header = norm_to_orig2[norm_header]
+        differences.append(
             {
                 "type": "header",
                 "column_name": orig_header,
@@ -319,54 +303,166 @@ def compare_csvs(file1: str, file2: str) -> dict[str, Any]:
                 "file2_value": orig_header,
             },
         )
+    return differences
 
-    try:
-        dict1, missing_keys1 = build_keyed_dict(
-            headers1_raw, rows1, key_column="Order Number",
-            header_normalization_map=stripped_to_orig1,
-        )
-        dict2, missing_keys2 = build_keyed_dict(
-            headers2_raw, rows2, key_column="Order Number",
-            header_normalization_map=stripped_to_orig2,
-        )
-    except ValueError as exc:
-        return {
-            "error": str(exc),
-            "file1": file1,
-            "file2": file2,
-            "total_differences": 0,
-            "header_differences": header_differences,
-            "row_breakdown": {},
-            "column_breakdown": {},
-            "differences": [],
-        }
 
-    all_ids = set(dict1.keys()) | set(dict2.keys())
-    differences: list[dict[str, Any]] = []
-    total_differences = 0
-    row_differences: dict[str, int] = defaultdict(int)
-    col_differences: dict[str, int] = defaultdict(int)
-    all_normalized_headers = sorted(normalized_headers1_set | normalized_headers2_set)
+def _key_index(headers: list[str], key_column: str) -> int:
+    normalized_key_column = normalize_header(key_column)
+    normalized = [normalize_header(h) for h in headers]
+    if normalized_key_column in normalized:
+        return normalized.index(normalized_key_column)
+    lowered = [h.lower() for h in normalized]
+    if normalized_key_column.lower() in lowered:
+        return lowered.index(normalized_key_column.lower())
+    raise ValueError(
+        f"Key column {key_column!r} (normalized: {normalized_key_column!r}) "
+        f"not found in headers: {headers}",
+    )
 
-    for order_id in sorted(all_ids):
-        row1 = dict1.get(order_id)
-        row2 = dict2.get(order_id)
 
-        if row1 is None:
-            differences.append(
+class KeyedCsvDiff:
+    """Diff CSV rows, fed one at a time, against a keyed ``target`` side.
+
+    Only the target is held (one normalized dict per order) plus the set of
+    keys seen so far, so the other side can be a file or a download of any
+    size. ``result()`` has the :func:`compare_csvs` shape — ``file1`` is the
+    target, ``file2`` the fed rows. When an order appears twice in the fed
+    rows the later row wins, as in :func:`build_keyed_dict`.
+
+        diff = KeyedCsvDiff(sheet_headers, sheet_rows)
+        diff.feed_header(next(rows))
+        for row in rows:
+            diff.feed(row)
+        report = format_differences(diff.result())
+    """
+
+    def __init__(
+        self,
+        target_headers: list[str],
+        target_rows: Iterable[dict[str, str]],
+        *,
+        key_column: str = "Order Number",
+        target_label: str = "target",
+        source_label: str = "upload",
+    ):
+        self.key_column = key_column
+        self.target_label = target_label
+        self.source_label = source_label
+        self.target_headers = target_headers
+        self.target_rows = 0
+
+        def _counted(rows: Iterable[dict[str, str]]) -> Iterator[dict[str, str]]:
+            for row in rows:
+                self.target_rows += 1
+                yield row
+
+        self.target, self.target_missing_keys = build_keyed_dict(
+            target_headers, _counted(target_rows), key_column=key_column,
+        )
+        self._target_norm_to_orig = {normalize_header(h): h.strip() for h in target_headers}
+
+        self.source_headers: list[str] = []
+        self.source_rows = 0
+        self.source_missing_keys: list[str] = []
+        self.seen: set[str] = set()
+        self.header_differences: list[dict[str, Any]] = []
+        self.differences: list[dict[str, Any]] = []
+        self.row_breakdown: dict[str, int] = defaultdict(int)
+        self.column_breakdown: dict[str, int] = defaultdict(int)
+        self._source_norm: list[str] = []
+        self._source_norm_to_orig: dict[str, str] = {}
+        self._columns: list[str] = []
+        self._key_idx = -1
+
+    def feed_header(self, headers: list[str]) -> None:
+        """Set the fed side's header row. Raises ``ValueError`` if it lacks the key column."""
+        self.source_headers = headers
+        self._source_norm = [normalize_header(h) for h in headers]
+        self._source_norm_to_orig = {normalize_header(h): h.strip() for h in headers}
+        self.header_differences = header_differences(self.target_headers, headers)
+        self._columns = sorted(set(self._target_norm_to_orig) | set(self._source_norm))
+        self._key_idx = _key_index(headers, self.key_column)
+
+    def feed(self, row: list[str]) -> None:
+        """Compare one data row (a ``csv.reader`` list) against the target."""
+        if not row:
+            return  # blank line — csv.DictReader skips these too
+        self.source_rows += 1
+        order_id = extract_order_id(get_cell(row, self._key_idx))
+        if not order_id:
+            self.source_missing_keys.append(f"Row {self.source_rows + 1}")
+            return
+        if order_id in self.seen:
+            self._forget(order_id)
+        self.seen.add(order_id)
+
+        target_row = self.target.get(order_id)
+        if target_row is None:
+            self._missing_order(order_id, in_target=False)
+            return
+
+        source_row = {
+            norm_header: get_cell(row, i) for i, norm_header in enumerate(self._source_norm)
+        }
+        for norm_header in self._columns:
+            if norm_header.lower() == "updated at":
+                continue
+            val1_raw = target_row.get(norm_header, "")
+            val2_raw = source_row.get(norm_header, "")
+            if normalize_value(val1_raw, norm_header) == normalize_value(val2_raw, norm_header):
+                continue
+            display_header = (
+                self._target_norm_to_orig.get(norm_header)
+                or self._source_norm_to_orig.get(norm_header)
+                or norm_header
+            )
+            self.differences.append(
                 {
-                    "type": "missing_order",
+                    "type": "cell",
                     "order_id": order_id,
-                    "column_name": None,
-                    "file1_value": "<missing>",
-                    "file2_value": f"Order #{order_id} present",
+                    "column_name": display_header,
+                    "file1_value": val1_raw,
+                    "file2_value": val2_raw,
                 },
             )
-            total_differences += 1
-            row_differences[order_id] = len(all_normalized_headers)
-            continue
+            self.row_breakdown[order_id] += 1
+            self.column_breakdown[display_header] += 1
 
-        if row2 is None:
+    def _missing_order(self, order_id: str, *, in_target: bool) -> None:
+        present, missing = f"Order #{order_id} present", "<missing>"
+        self.differences.append(
+            {
+                "type": "missing_order",
+                "order_id": order_id,
+                "column_name": None,
+                "file1_value": present if in_target else missing,
+                "file2_value": missing if in_target else present,
+            },
+        )
+        self.row_breakdown[order_id] = len(self._columns)
+
+    def _forget(self, order_id: str) -> None:
+        """Drop what an earlier row for ``order_id`` recorded (rare: duplicate order rows)."""
+        kept: list[dict[str, Any]] = []
+        for diff in self.differences:
+            if diff["order_id"] != order_id:
+                kept.append(diff)
+            elif diff["type"] == "cell":
+                self.column_breakdown[diff["column_name"]] -= 1
+                if not self.column_breakdown[diff["column_name"]]:
+                    del self.column_breakdown[diff["column_name"]]
+        self.differences = kept
+        self.row_breakdown.pop(order_id, None)
+
+    @property
+    def total_differences(self) -> int:
+        return len(self.differences)
+
+    def result(self) -> dict[str, Any]:
+        """Finish the diff: target orders never fed count as missing from the fed side."""
+        differences = list(self.differences)
+        row_breakdown = dict(self.row_breakdown)
+        for order_id in self.target.keys() - self.seen:
             differences.append(
                 {
                     "type": "missing_order",
@@ -376,57 +472,62 @@ def compare_csvs(file1: str, file2: str) -> dict[str, Any]:
                     "file2_value": "<missing>",
                 },
             )
-            total_differences += 1
-            row_differences[order_id] = len(all_normalized_headers)
-            continue
+            row_breakdown[order_id] = len(self._columns)
+        differences.sort(key=lambda d: d["order_id"])
 
-        row_diff_count = 0
-        for norm_header in all_normalized_headers:
-            if norm_header.lower() == "updated at":
-                continue
+        return {
+            "total_differences": len(differences),
+            "file1": self.target_label,
+            "file2": self.source_label,
+            "file1_rows": self.target_rows,
+            "file2_rows": self.source_rows,
+            "file1_orders": len(self.target),
+            "file2_orders": len(self.seen),
+            "file1_missing_keys": self.target_missing_keys,
+            "file2_missing_keys": self.source_missing_keys,
+            "header_differences": self.header_differences,
+            "row_breakdown": row_breakdown,
+            "column_breakdown": dict(self.column_breakdown),
+            "differences": differences,
+        }
+
+
+def iter_csv_rows(file_path: str) -> Iterator[list[str]]:
+    """Yield a CSV file's rows (header first) without reading the whole file."""
+    with _open_csv_file(file_path, "r") as f:
+        yield from csv.reader(f)
+
+
+def compare_csvs(file1: str, file2: str) -> dict[str, Any]:
+    """Compare two CSV files by order ID and return detailed differences.
+
+    ``file1`` is indexed in memory; ``file2`` is streamed through
+    :class:`KeyedCsvDiff`, so put the larger file second.
+    """
+    rows2 = iter_csv_rows(file2)
+    headers2_raw = next(rows2, [])
+    with _open_csv_file(file1, "r") as f:
+        reader = csv.DictReader(f)
+        headers1_raw = list(reader.fieldnames or [])
+        try:
+            diff = KeyedCsvDiff(headers1_raw, reader, target_label=file1, source_label=file2)
+            diff.feed_header(headers2_raw)
+        except ValueError as exc:
+            rows2.close()
+            return {
+                "error": str(exc),
+                "file1": file1,
+                "file2": file2,
+                "total_differences": 0,
+                "header_differences": header_differences(headers1_raw, headers2_raw),
+                "row_breakdown": {},
+                "column_breakdown": {},
+                "differences": [],
+            }
 
-            val1_raw = row1.get(norm_header, "")
-            val2_raw = row2.get(norm_header, "")
-            val1_normalized = normalize_value(val1_raw, norm_header)
-            val2_normalized = normalize_value(val2_raw, norm_header)
-
-            if val1_normalized != val2_normalized:
-                display_header = (
-                    norm_to_orig1.get(norm_header)
-                    or norm_to_orig2.get(norm_header)
-                    or norm_header
-                )
-                differences.append(
-                    {
-                        "type": "cell",
-                        "order_id": order_id,
-                        "column_name": display_header,
-                        "file1_value": val1_raw,
-                        "file2_value": val2_raw,
-                    },
-                )
-                total_differences += 1
-                row_diff_count += 1
-                col_differences[display_header] += 1
-
-        if row_diff_count > 0:
-            row_differences[order_id] = row_diff_count
-
-    return {
-        "total_differences": total_differences,
-        "file1": file1,
-        "file2": file2,
-        "file1_rows": len(rows1),
-        "file2_rows": len(rows2),
-        "file1_orders": len(dict1),
-        "file2_orders": len(dict2),
-        "file1_missing_keys": missing_keys1,
-        "file2_missing_keys": missing_keys2,
-        "header_differences": header_differences,
-        "row_breakdown": dict(row_differences),
-        "column_breakdown": dict(col_differences),
-        "differences": differences,
-    }
+    for row in rows2:
+        diff.feed(row)
+    return diff.result()
 
 
 def format_differences(result: dict[str, Any], json_output: bool = False) -> str:
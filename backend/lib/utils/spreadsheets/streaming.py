@@ -0,0 +1,173 @@
+"""Streaming CSV ingestion: download in chunks, parse rows as they arrive, diff by key.
+
+Nothing here holds an uploaded file whole. Bytes come off the socket in
+``DOWNLOAD_CHUNK`` pieces (optionally teed to disk), are decoded incrementally,
+and are cut into ``csv.reader`` rows at record boundaries — a newline inside a
+quoted cell is not a boundary. Diffs go through
+:class:`~lib.utils.spreadsheets.helpers.KeyedCsvDiff`, which keeps only the
+target side and the keys seen.
+
+    async with httpx.AsyncClient() as client:
+        rows = aiter_csv_rows(aiter_download(client, url, headers=auth))
+        result = await diff_csv_stream(rows, sheet_headers, sheet_rows)
+"""
+
+import codecs
+import csv
+import io
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Callable, Iterable, Optional
+
+import httpx
+from lib.utils.spreadsheets.helpers import KeyedCsvDiff
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_CHUNK = 64 * 1024
+PROGRESS_EVERY = 1000  # rows between on_progress calls
+
+
+@dataclass
+class IngestProgress:
+    bytes_read: int = 0
+    total_bytes: Optional[int] = None  # Content-Length, when the server sends one
+    rows: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    def __str__(self) -> str:
+        size = f"{self.bytes_read / 1e6:.1f} MB"
+        if self.total_bytes:
+            size += f" of {self.total_bytes / 1e6:.1f} MB"
+        return f"{self.rows:,} rows, {size} in {time.monotonic() - self.started:.1f}s"
+
+
+ProgressCallback = Callable[[IngestProgress], Any]
+
+
+async def aiter_download(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    headers: Optional[dict[str, str]] = None,
+    chunk_size: int = DOWNLOAD_CHUNK,
+    progress: Optional[IngestProgress] = None,
+    sink: Optional[BinaryIO] = None,
+) -> AsyncIterator[bytes]:
+    """Yield the body of ``GET url`` chunk by chunk, also writing each chunk to ``sink``.
+
+    Raises ``httpx.HTTPStatusError`` on a non-2xx response.
+    """
+    async with client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+        response.raise_for_status()
+        if progress is not None and response.headers.get("content-length", "").isdigit():
+            progress.total_bytes = int(response.headers["content-length"])
+        async for chunk in response.aiter_bytes(chunk_size):
+            if progress is not None:
+                progress.bytes_read += len(chunk)
+            if sink is not None:
+                sink.write(chunk)
+            yield chunk
+
+
+def _record_boundary(text: str) -> int:
+    """Index just past the last newline that ends a CSV record (0 if none)."""
+    end = len(text)
+    while True:
+        cut = text.rfind("\n", 0, end)
+        if cut < 0:
+            return 0
+        # Quotes pair up across complete records, so an even count means we're outside a cell.
+        if text.count('"', 0, cut) % 2 == 0:
+            return cut + 1
+        end = cut
+
+
+async def aiter_csv_rows(
+    chunks: AsyncIterable[bytes],
+    *,
+    encoding: str = "utf-8-sig",
+    progress: Optional[IngestProgress] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    every: int = PROGRESS_EVERY,
+) -> AsyncIterator[list[str]]:
+    """Parse ``chunks`` into ``csv.reader`` rows (header first) as the bytes arrive."""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    progress = progress if progress is not None else IngestProgress()
+    buffer = ""
+
+    def _rows(text: str) -> Iterable[list[str]]:
+        for row in csv.reader(io.StringIO(text)):
+            progress.rows += 1
+            if on_progress is not None and progress.rows % every == 0:
+                on_progress(progress)
+            yield row
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        cut = _record_boundary(buffer)
+        if cut:
+            for row in _rows(buffer[:cut]):
+                yield row
+            buffer = buffer[cut:]
+
+    buffer += decoder.decode(b"", final=True)
+    for row in _rows(buffer):
+        yield row
+    if on_progress is not None:
+        on_progress(progress)
+
+
+async def diff_csv_stream(
+    rows: AsyncIterable[list[str]],
+    target_headers: list[str],
+    target_rows: Iterable[dict[str, str]],
+    *,
+    key_column: str = "Order Number",
+    target_label: str = "target",
+    source_label: str = "upload",
+) -> dict[str, Any]:
+    """Keyed diff of streamed ``rows`` (header first) against the target sheet.
+
+    Returns the :func:`~lib.utils.spreadsheets.helpers.compare_csvs` result
+    shape, so ``format_differences`` renders it. Raises ``ValueError`` if either
+    side lacks ``key_column``.
+    """
+    diff = KeyedCsvDiff(
+        target_headers, target_rows,
+        key_column=key_column, target_label=target_label, source_label=source_label,
+    )
+    header_seen = False
+    async for row in rows:
+        if not header_seen:
+            diff.feed_header(row)
+            header_seen = True
+        else:
+            diff.feed(row)
+    if not header_seen:
+        diff.feed_header([])
+    return diff.result()
+
+
+async def spool_csv(
+    url: str,
+    sink: BinaryIO,
+    *,
+    headers: Optional[dict[str, str]] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> IngestProgress:
+    """Stream a CSV download into ``sink``, counting rows on the way. For consumers that need a file."""
+    progress = IngestProgress()
+    owns_client = client is None
+    client = client or httpx.AsyncClient(timeout=httpx.Timeout(30.0, read=60.0))
+    try:
+        chunks = aiter_download(client, url, headers=headers, progress=progress, sink=sink)
+        async for _ in aiter_csv_rows(chunks, progress=progress, on_progress=on_progress):
+            pass
+    finally:
+        if owns_client:
+            await client.aclose()
+    logger.info(f"csv_ingest url={url.split('?')[0]} {progress}")
+    return progress
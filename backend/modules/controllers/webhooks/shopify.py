@@ -2,6 +2,7 @@ import logging
 from fastapi import HTTPException
 
 from modules.integrations.shopify.client.shopify_security import ShopifySecurity
+from modules.services.webhooks.ingestion import WebhookJob
 
 
 logger = logging.getLogger(__name__)
@@ -12,26 +13,34 @@ class ShopifyWebhooksController:
         self._security = security or ShopifySecurity()
 
     def handle_webhook_order_create(self, *, body: bytes, headers: dict[str, str]) -> bool:
-        self._verify(body=body, headers=headers)
+        self.verify(body=body, headers=headers)
         return True
 
     def handle_webhook_refund_create(self, *, body: bytes, headers: dict[str, str]) -> bool:
-        self._verify(body=body, headers=headers)
+        self.verify(body=body, headers=headers)
         return True
 
     def handle_webhook_product_update(self, *, body: bytes, headers: dict[str, str]) -> bool:
-        self._verify(body=body, headers=headers)
+        self.verify(body=body, headers=headers)
         return True
 
     def handle_webhook_orders_update(self, *, body: bytes, headers: dict[str, str]) -> bool:
-        self._verify(body=body, headers=headers)
+        self.verify(body=body, headers=headers)
         return True
 
     def handle_webhook_orders_cancel(self, *, body: bytes, headers: dict[str, str]) -> bool:
-        self._verify(body=body, headers=headers)
+        self.verify(body=body, headers=headers)
         return True
 
-    def _verify(self, *, body: bytes, headers: dict[str, str]) -> None:
+    def process_product_update(self, job: WebhookJob) -> bool:
+        """Run one coalesced ``products/update`` job (``job.payload`` is the newest delivery).
+
+        Called from the ingestion pool once per product per burst, not once per
+        delivery — product-level work (inventory, image swaps) belongs here.
+        """
+        return True
+
+    def verify(self, *, body: bytes, headers: dict[str, str]) -> None:
         signature = headers.get("x-shopify-hmac-sha256", "")
         ok = self._security.verify_shopify_webhook(body, signature)
         if not ok:
@@ -273,6 +273,48 @@ def execute_batch_request(
     return ordered_responses
 
 
+BATCH_MAX_REQUESTS = 50
+
+
+def execute_batch_items(
+    service: Any,
+    requests: list[Any],
+    batch_size: int = BATCH_MAX_REQUESTS
+) -> list[tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Execute requests through batch HTTP, reporting each item's outcome instead of raising.
+    
+    Unlike execute_batch_request, a failed item doesn't fail the batch: every
+    request gets a ``(response, None)`` or ``(None, exception)`` pair, in request
+    order. Requests are split into batches of at most 50 (Google's limit).
+    
+    Args:
+        service: Google API service instance with new_batch_http_request method
+        requests: Prepared API request objects (e.g., service.members().insert(...))
+        batch_size: Requests per batch HTTP call (max 50)
+    
+    Returns:
+        list of (response, exception) tuples in the same order as requests
+    
+    Raises:
+        HttpError: If a batch HTTP call itself fails
+    """
+    batch_size = min(batch_size, BATCH_MAX_REQUESTS)
+    outcomes: list[tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [(None, None)] * len(requests)
+    
+    def batch_callback(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+        outcomes[int(request_id)] = (None, exception) if exception else (response, None)
+    
+    for start in range(0, len(requests), batch_size):
+        batch = service.new_batch_http_request(callback=batch_callback)
+        for idx in range(start, min(start + batch_size, len(requests))):
+            batch.add(requests[idx], request_id=str(idx))
+        batch.execute()
+    
+    logger.info(f"✅ Executed {len(requests)} requests in {-(-len(requests) // batch_size)} batch calls")
+    return outcomes
+
+
 def raise_for_status(error: HttpError, required_scopes: Optional[list[str]] = None) -> NoReturn:
     """
     Centralized error handling for Google API HTTP errors.
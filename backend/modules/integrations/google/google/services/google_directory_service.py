@@ -6,8 +6,8 @@ This service now uses the new GoogleApiClient for generic API execution.
 """
 
 import logging
-from typing import Optional, List, TYPE_CHECKING
-from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, List, TYPE_CHECKING
+from dataclasses import dataclass, field
 
 from googleapiclient.errors import HttpError
 
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
 from ..scopes import DirectoryScopes
 from ..models.requests import GetGroupsRequest
 from ._google_api_service_builder import build_google_api_service
-from ..base_methods import handle_http_errors, paginate_api_call
+from ..base_methods import execute_batch_items, handle_http_errors, paginate_api_call
 from ..models.google_directory_resources import (
     GroupResource, MemberResource, UserResource, GroupWithMembers
 )
@@ -37,6 +37,26 @@ class AddMemberResult:
         return self.warning is not None
 
 
+def _http_status(error: Exception) -> Optional[int]:
+    resp = getattr(error, 'resp', None)
+    return getattr(resp, 'status', None)
+
+
+@dataclass
+class GroupSyncResult:
+    """Outcome of reconciling one group's membership against a desired email set."""
+    group_email: str
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)  # email (or the group) -> error message
+    dry_run: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
 class GoogleDirectoryService():
     """
     Google Directory API service methods.
@@ -429,16 +449,12 @@ class GoogleDirectoryService():
 
             if is_duplicate:
                 # Member already exists - return as warning
-                # Try to get the existing member info
+                # Fetch just that member (not the whole member list)
                 try:
-                    members = self.list_group_members(group_email)
-                    user_email_lower = user_email.lower()
-                    existing_member = next((m for m in members if m.email.lower() == user_email_lower), None)
-
-                    if existing_member:
-                        warning_msg = f"{user_email} is already a member of {group_email}"
-                        logger.warning("Warning: %s", warning_msg)
-                        return AddMemberResult(member=existing_member, warning=warning_msg)
+                    existing_dict = self.members().get(groupKey=group_email, memberKey=user_email).execute()
+                    warning_msg = f"{user_email} is already a member of {group_email}"
+                    logger.warning("Warning: %s", warning_msg)
+                    return AddMemberResult(member=MemberResource(**existing_dict), warning=warning_msg)
                 except Exception:
                     pass
 
@@ -570,3 +586,117 @@ class GoogleDirectoryService():
                 return False
             # Re-raise other errors
             raise
+
+    @handle_http_errors
+    def load_group_member_roles(
+        self,
+        group_emails: Iterable[str]
+    ) -> Dict[str, Optional[Dict[str, str]]]:
+        """
+        Load the members of many groups, first pages in batch HTTP calls.
+
+        Args:
+            group_emails: Group email addresses
+
+        Returns:
+            Dict of {group_email: {lower-cased member email: role}}; None for groups
+            that don't exist (404)
+
+        Raises:
+            HttpError: For Google API errors other than 404
+        """
+        groups = list(dict.fromkeys(group_emails))
+        params = {'maxResults': 200}
+
+        requests = [self.members().list(groupKey=g, **params) for g in groups]
+        members: Dict[str, Optional[Dict[str, str]]] = {}
+        for group_email, (response, error) in zip(groups, execute_batch_items(self.service, requests)):
+            if error is not None:
+                if _http_status(error) == 404:
+                    members[group_email] = None
+                    continue
+                raise error
+            page = response.get('members', [])
+            if response.get('nextPageToken'):
+                page = page + paginate_api_call(
+                    self.members().list, result_key='members',
+                    groupKey=group_email, pageToken=response['nextPageToken'], **params
+                )
+            members[group_email] = {m['email'].lower(): m.get('role', 'MEMBER') for m in page if m.get('email')}
+
+        logger.info("Loaded members for %d groups", len(groups))
+        return members
+
+    def sync_group_members(
+        self,
+        desired: Dict[str, Iterable[str]],
+        role: str = 'MEMBER',
+        remove_missing: bool = True,
+        dry_run: bool = False
+    ) -> Dict[str, GroupSyncResult]:
+        """
+        Reconcile group memberships to desired email sets with batched inserts/deletes.
+
+        Each group's members are loaded once; only the difference is written, as
+        members.insert / members.delete requests in batch HTTP calls (50 per call).
+        A 409 on insert (already a member) and a 404 on delete (already gone)
+        count as success. Removals only touch members with ``role`` — owners and
+        managers are never removed when syncing plain members.
+
+        Args:
+            desired: Dict of {group_email: [member emails]}
+            role: Role for inserted members, and the role whose extras are removed
+            remove_missing: If True, delete ``role`` members not in the desired set
+            dry_run: If True, compute the diff without writing
+
+        Returns:
+            Dict of {group_email: GroupSyncResult}
+
+        Example:
+            >>> service = GoogleDirectoryService()
+            >>> results = service.sync_group_members({"dodgeball-monday@bigapplerecsports.com": emails})
+            >>> failed = {g: r.errors for g, r in results.items() if not r.ok}
+        """
+        wanted = {g: {e.strip().lower() for e in emails if e and e.strip()} for g, emails in desired.items()}
+        current = self.load_group_member_roles(wanted)
+
+        results: Dict[str, GroupSyncResult] = {}
+        writes: List[tuple] = []  # (group_email, email, action, request)
+        for group_email, emails in wanted.items():
+            result = results[group_email] = GroupSyncResult(group_email, dry_run=dry_run)
+            existing = current.get(group_email)
+            if existing is None:
+                result.errors[group_email] = "group not found"
+                continue
+            to_add = sorted(emails - existing.keys())
+            to_remove = sorted(e for e, r in existing.items() if r == role and e not in emails) if remove_missing else []
+            result.unchanged = len(emails & existing.keys())
+            if dry_run:
+                result.added, result.removed = to_add, to_remove
+                continue
+            writes += [
+                (group_email, email, 'add',
+                 self.members().insert(groupKey=group_email, body={'email': email, 'role': role}))
+                for email in to_add
+            ]
+            writes += [
+                (group_email, email, 'remove', self.members().delete(groupKey=group_email, memberKey=email))
+                for email in to_remove
+            ]
+
+        outcomes = execute_batch_items(self.service, [w[3] for w in writes]) if writes else []
+        for (group_email, email, action, _), (_, error) in zip(writes, outcomes):
+            result = results[group_email]
+            status = _http_status(error) if error is not None else None
+            if error is None or (action == 'add' and status == 409) or (action == 'remove' and status == 404):
+                (result.added if action == 'add' else result.removed).append(email)
+            else:
+                result.errors[email] = f"{action} failed ({status}): {error}"
+                logger.error("Failed to %s %s in %s: %s", action, email, group_email, error)
+
+        for result in results.values():
+            logger.info(
+                "%sSynced %s: +%d -%d =%d, %d errors", "[DRY-RUN] " if dry_run else "",
+                result.group_email, len(result.added), len(result.removed), result.unchanged, len(result.errors)
+            )
+        return results
@@ -0,0 +1,102 @@
+"""Tests for GoogleDirectoryService.sync_group_members (batched group reconciliation)."""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from googleapiclient.errors import HttpError
+from modules.integrations.google.services.google_directory_service import GoogleDirectoryService
+
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(SimpleNamespace(status=status, reason="error"), b"{}")
+
+
+class _FakeDirectory:
+    """Just enough of the admin/directory_v1 discovery client for members + batch HTTP."""
+
+    def __init__(self, groups: Dict[str, Dict[str, str]], insert_errors=None, delete_errors=None):
+        self.groups = groups
+        self.insert_errors = insert_errors or {}
+        self.delete_errors = delete_errors or {}
+        self.batch_calls: List[int] = []
+
+    def members(self):
+        return self
+
+    def list(self, groupKey: str, **params: Any):  # noqa: N803
+        if groupKey not in self.groups:
+            return ("error", _http_error(404))
+        members = [{"email": e, "role": r} for e, r in self.groups[groupKey].items()]
+        return ("ok", {"members": members})
+
+    def insert(self, groupKey: str, body: Dict[str, str]):  # noqa: N803
+        if body["email"] in self.insert_errors:
+            return ("error", _http_error(self.insert_errors[body["email"]]))
+        return ("ok", {"email": body["email"], "role": body["role"]})
+
+    def delete(self, groupKey: str, memberKey: str):  # noqa: N803
+        if memberKey in self.delete_errors:
+            return ("error", _http_error(self.delete_errors[memberKey]))
+        return ("ok", "")
+
+    def new_batch_http_request(self, callback):
+        fake = self
+        added: List[Any] = []
+
+        class _Batch:
+            def add(self, request, request_id):
+                added.append((request_id, request))
+
+            def execute(self):
+                fake.batch_calls.append(len(added))
+                for request_id, (kind, payload) in reversed(added):  # arrival order isn't request order
+                    callback(request_id, None if kind == "error" else payload, payload if kind == "error" else None)
+
+        return _Batch()
+
+
+def _service(fake: _FakeDirectory) -> GoogleDirectoryService:
+    service = GoogleDirectoryService.__new__(GoogleDirectoryService)
+    service.service = fake
+    service.members = fake.members
+    service.required_scopes = []
+    return service
+
+
+def test_diff_applied_in_batches():
+    fake = _FakeDirectory({
+        "dodgeball@bars.com": {"a@x.com": "MEMBER", "b@x.com": "MEMBER", "owner@x.com": "OWNER"},
+        "kickball@bars.com": {"c@x.com": "MEMBER"},
+    })
+    results = _service(fake).sync_group_members({
+        "dodgeball@bars.com": ["A@x.com", "d@x.com"],
+        "kickball@bars.com": ["c@x.com"],
+    })
+
+    dodgeball = results["dodgeball@bars.com"]
+    assert (dodgeball.added, dodgeball.removed, dodgeball.unchanged) == (["d@x.com"], ["b@x.com"], 1)
+    assert results["kickball@bars.com"].added == [] and results["kickball@bars.com"].unchanged == 1
+    assert fake.batch_calls == [2, 2]  # one batch to load both groups, one for both writes
+
+
+def test_conflicts_count_as_success_and_errors_are_per_item():
+    fake = _FakeDirectory(
+        {"g@bars.com": {"gone@x.com": "MEMBER"}},
+        insert_errors={"dup@x.com": 409, "bad@x.com": 400},
+        delete_errors={"gone@x.com": 404},
+    )
+    result = _service(fake).sync_group_members({"g@bars.com": ["dup@x.com", "bad@x.com", "new@x.com"]})["g@bars.com"]
+
+    assert result.added == ["dup@x.com", "new@x.com"]
+    assert result.removed == ["gone@x.com"]
+    assert list(result.errors) == ["bad@x.com"]
+    assert not result.ok
+
+
+def test_missing_group_and_dry_run():
+    fake = _FakeDirectory({"g@bars.com": {"old@x.com": "MEMBER"}})
+    results = _service(fake).sync_group_members({"g@bars.com": ["new@x.com"], "nope@bars.com": ["a@x.com"]}, dry_run=True)
+
+    assert results["nope@bars.com"].errors == {"nope@bars.com": "group not found"}
+    assert (results["g@bars.com"].added, results["g@bars.com"].removed) == (["new@x.com"], ["old@x.com"])
+    assert fake.batch_calls == [2]  # load only, nothing written
@@ -27,6 +27,7 @@ from modules.integrations.shopify.client.shopify_sgqlc_client import ShopifySGQL
 from modules.integrations.shopify.models.sgqlc_models.sgqlc_query import Query
 from sgqlc.operation import Operation
 from config import config
+from modules.integrations.shopify.services.order_properties_loader import OrderPropertiesLoader
 from modules.integrations.shopify.services.shopify_normalizers import (
     normalize_order_identifier,
     normalize_order_number,
@@ -65,6 +66,7 @@ class ShopifyService:
         logger.debug("ShopifyService.__init__: Creating ShopifySGQLCClient")
         self.client = ShopifySGQLCClient(environment=environment)
         self.environment = environment
+        self.order_properties = OrderPropertiesLoader(self.client)
         print(f"[DEBUG] ShopifyService.__init__: Client created: {type(self.client)}", file=sys.stderr)
         logger.debug(f"ShopifyService.__init__: Client created: {type(self.client)}")
     
@@ -352,64 +354,32 @@ class ShopifyService:
         """
         Get line item custom attributes for an order.
         
+        Served by the batch loader, so repeat lookups for the same order are free.
+        
         Args:
             order_id: Order ID (gid://shopify/Order/... or numeric ID)
             
         Returns:
             List of custom attribute dictionaries with 'key' and 'value' keys
+            
+        Raises:
+            OrderPropertiesLoadError: If the order could not be fetched
         """
-        # Normalize order ID to extract numeric ID for search query
-        normalized = normalize_order_identifier(order_id)
-        if not normalized:
-            logger.error(f"Invalid order ID format: {order_id}")
-            return []
-        
-        # Use numeric ID for search query (Shopify search doesn't accept full GID format)
-        numeric_id = normalized["digits_only"]
-        orders = self.get_order_by_identifier(
-            {"query": f"id:{numeric_id}", "first": 1},
-            line_items_first=5
-        )
-        
-        if not orders:
-            return []
-        
-        order = orders[0]
-        properties = []
-        
-        # Get line items
-        line_items_conn = getattr(order, 'lineItems', None)
-        if not line_items_conn:
-            return []
-        
-        nodes = getattr(line_items_conn, 'nodes', None)
-        if not nodes:
-            return []
-        
-        # Extract custom attributes from each line item
-        for line_item in nodes:
-            custom_attrs = getattr(line_item, 'customAttributes', None)
-            if custom_attrs:
-                for attr in custom_attrs:
-                    key = getattr(attr, 'key', '')
-                    value = getattr(attr, 'value', '')
-                    if key and value:
-                        properties.append({"key": key, "value": value})
-        
-        return properties
+        return self.order_properties.load(order_id)
     
     def get_customer_birthdays_from_orders(self, order_ids: List[str]) -> List[Tuple[str, str, str]]:
         """
-        Fetch birthdays with associated names from multiple orders concurrently.
+        Fetch birthdays with associated names from multiple orders in batched nodes(ids:) queries.
         
         Args:
             order_ids: List of order IDs (gid://shopify/Order/...)
             
         Returns:
             List of (birthday, first_name, last_name) tuples
+            
+        Raises:
+            OrderPropertiesLoadError: If any order's properties could not be fetched
         """
-        import concurrent.futures
-        
         def extract_birthday_with_name(properties):
             """Extract birthdays with associated names from properties."""
             birthday = None
@@ -426,36 +396,26 @@ class ShopifyService:
                     last_name = value
             return [(birthday, first_name, last_name)] if birthday else []
         
-        birthday_records = []
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_order = {
-                executor.submit(self.get_order_line_item_properties, order_id): order_id
-                for order_id in order_ids
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_order):
-                try:
-                    properties = future.result()
-                    records = extract_birthday_with_name(properties)
-                    birthday_records.extend(records)
-                except Exception as e:
-                    logger.error(f"Error fetching order: {e}")
+        properties_by_order = self.order_properties.load_many(order_ids)
         
+        birthday_records = []
+        for properties in properties_by_order.values():
+            birthday_records.extend(extract_birthday_with_name(properties))
         return birthday_records
     
     def get_customer_pronouns_from_orders(self, orders_with_dates: List[Tuple[str, str]]) -> List[Tuple[str, str, str, str]]:
         """
-        Fetch pronouns with associated names and dates from multiple orders concurrently.
+        Fetch pronouns with associated names and dates from multiple orders in batched nodes(ids:) queries.
         
         Args:
             orders_with_dates: List of (order_id, created_at) tuples
             
         Returns:
             List of (pronouns, first_name, last_name, created_at) tuples
+            
+        Raises:
+            OrderPropertiesLoadError: If any order's properties could not be fetched
         """
-        import concurrent.futures
-        
         def extract_pronouns_with_name(properties):
             """Extract pronouns with associated names from properties."""
             pronouns = None
@@ -472,24 +432,18 @@ class ShopifyService:
                     last_name = value
             return [(pronouns, first_name, last_name)] if pronouns else []
         
-        pronouns_records = []
+        properties_by_order = self.order_properties.load_many(order_id for order_id, _ in orders_with_dates)
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_order = {
-                executor.submit(self.get_order_line_item_properties, order_id): (order_id, created_at)
-                for order_id, created_at in orders_with_dates
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_order):
-                order_id, created_at = future_to_order[future]
-                try:
-                    properties = future.result()
-                    records = extract_pronouns_with_name(properties)
-                    # Add created_at to each record
-                    for pronouns, first_name, last_name in records:
-                        pronouns_records.append((pronouns, first_name, last_name, created_at))
-                except Exception as e:
-                    logger.error(f"Error fetching order {order_id}: {e}")
+        pronouns_records = []
+        seen = set()
+        for order_id, created_at in orders_with_dates:
+            gid = self.order_properties.to_gid(order_id)
+            if gid not in properties_by_order or gid in seen:
+                continue
+            seen.add(gid)
+            # Add created_at to each record
+            for pronouns, first_name, last_name in extract_pronouns_with_name(properties_by_order[gid]):
+                pronouns_records.append((pronouns, first_name, last_name, created_at))
         
         return pronouns_records
     
@@ -500,7 +454,7 @@ class ShopifyService:
         High-level convenience method that:
         1. Gets customer with orders
         2. Extracts order IDs
-        3. Fetches birthdays from orders concurrently
+        3. Fetches birthdays from orders in batched nodes(ids:) queries
         4. Returns sorted results
         
         Args:
@@ -535,7 +489,7 @@ class ShopifyService:
         High-level convenience method that:
         1. Gets customer with orders
         2. Extracts order IDs with dates
-        3. Fetches pronouns from orders concurrently
+        3. Fetches pronouns from orders in batched nodes(ids:) queries
         4. Returns sorted results (most recent first)
         
         Args:
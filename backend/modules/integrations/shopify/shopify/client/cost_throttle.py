@@ -0,0 +1,185 @@
+"""Shopify GraphQL query-cost throttle — a client-side mirror of the store's leaky bucket.
+
+Why
+───
+Shopify rate-limits the Admin GraphQL API per store with a leaky bucket of
+cost points: each query deducts its ``requestedQueryCost`` up front (refunded
+down to ``actualQueryCost`` afterwards) and the bucket refills at
+``restoreRate`` points/second. Backing off only after a THROTTLED / 429 wastes
+the round-trip and then sleeps blind; running below the limit wastes the plan.
+
+What
+────
+Every response carries the bucket's state:
+
+    "extensions": {"cost": {"requestedQueryCost": 52, "actualQueryCost": 12,
+                            "throttleStatus": {"maximumAvailable": 2000.0,
+                                              "currentlyAvailable": 1988,
+                                              "restoreRate": 100.0}}}
+
+``CostThrottle`` tracks that state, refills it locally between responses,
+remembers the requested cost per operation (``cost_key`` — the operation's
+shape, not its argument values), and paces callers
+so each request is sent only once the bucket can cover its predicted cost.
+
+    reserved = throttle.acquire(key)          # blocks (or ``await aacquire``)
+    try:
+        response = send()
+    finally:
+        throttle.settle(key, reserved, response.get("extensions"))
+
+Reservations are taken under one lock and the wait happens outside it, so
+concurrent threads and asyncio tasks queue in arrival order without ever
+holding the lock across I/O. Use ``CostThrottle.for_store(...)`` — the bucket
+is per store, so every client talking to a store must share one instance.
+
+Stdlib only: this file ships in the shopify-client Lambda layer and is
+mirrored into the backend's Shopify client package.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any, ClassVar
+
+# Standard-plan bucket; replaced by the store's real numbers on the first response.
+DEFAULT_MAXIMUM_AVAILABLE = 1000.0
+DEFAULT_RESTORE_RATE = 50.0
+# Predicted cost for an operation we have not seen a response for yet.
+DEFAULT_QUERY_COST = 50.0
+# Learned costs kept per throttle; the least recently settled key is dropped past this.
+MAX_COST_KEYS = 512
+
+
+def throttle_status(extensions: dict[str, Any] | None) -> dict[str, Any] | None:
+    """``extensions.cost`` from a GraphQL response, or None when absent."""
+    cost = (extensions or {}).get("cost")
+    return cost if isinstance(cost, dict) and isinstance(cost.get("throttleStatus"), dict) else None
+
+
+def is_throttled(errors: Any) -> bool:
+    """True when a GraphQL ``errors`` list carries Shopify's THROTTLED code."""
+    return any(
+        isinstance(error, dict) and (error.get("extensions") or {}).get("code") == "THROTTLED"
+        for error in errors or []
+    )
+
+
+class CostThrottle:
+    """Leaky-bucket pacer for one Shopify store. Thread- and asyncio-safe."""
+
+    _stores: ClassVar[dict[str, "CostThrottle"]] = {}
+    _stores_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def for_store(cls, store: str) -> "CostThrottle":
+        """The process-wide throttle for ``store`` (store id or ``*.myshopify.com`` host)."""
+        key = store.lower().removesuffix(".myshopify.com")
+        with cls._stores_lock:
+            if key not in cls._stores:
+                cls._stores[key] = cls()
+            return cls._stores[key]
+
+    def __init__(
+        self,
+        *,
+        maximum_available: float = DEFAULT_MAXIMUM_AVAILABLE,
+        restore_rate: float = DEFAULT_RESTORE_RATE,
+        default_cost: float = DEFAULT_QUERY_COST,
+        max_cost_keys: int = MAX_COST_KEYS,
+    ):
+        self.maximum_available = maximum_available
+        self.restore_rate = restore_rate
+        self.default_cost = default_cost
+        self.max_cost_keys = max_cost_keys
+        # Local estimate of the bucket, net of every outstanding reservation.
+        self.available = maximum_available
+        self.in_flight = 0.0
+        self.waited_seconds = 0.0
+        self.throttled = 0
+        self._costs: dict[Hashable, float] = {}
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    # ── pacing ──────────────────────────────────────────────────────────────
+
+    def predict(self, cost_key: Hashable) -> float:
+        """Last ``requestedQueryCost`` seen for ``cost_key`` (capped at the bucket size)."""
+        return min(self._costs.get(cost_key, self.default_cost), self.maximum_available)
+
+    def reserve(self, cost_key: Hashable) -> tuple[float, float]:
+        """Deduct the predicted cost now; return ``(reserved cost, seconds to wait before sending)``."""
+        with self._lock:
+            self._refill(time.monotonic())
+            cost = self.predict(cost_key)
+            self.available -= cost
+            self.in_flight += cost
+            delay = max(0.0, -self.available / self.restore_rate)
+            self.waited_seconds += delay
+            return cost, delay
+
+    def acquire(self, cost_key: Hashable) -> float:
+        """Block until the bucket can cover ``cost_key``; return the reservation for ``settle``."""
+        cost, delay = self.reserve(cost_key)
+        if delay:
+            time.sleep(delay)
+        return cost
+
+    async def aacquire(self, cost_key: Hashable) -> float:
+        """Async ``acquire`` — waits on the event loop instead of the thread."""
+        cost, delay = self.reserve(cost_key)
+        if delay:
+            await asyncio.sleep(delay)
+        return cost
+
+    def settle(self, cost_key: Hashable, reserved: float, extensions: dict[str, Any] | None) -> None:
+        """Release a reservation and, when the response reported cost, resync to the store's bucket.
+
+        Without cost info (network error, 5xx) the reservation is just dropped
+        from ``in_flight`` and the local estimate stands.
+        """
+        cost = throttle_status(extensions)
+        with self._lock:
+            now = time.monotonic()
+            self.in_flight = max(0.0, self.in_flight - reserved)
+            if cost is None:
+                self._refill(now)
+                return
+            status = cost["throttleStatus"]
+            self.maximum_available = float(status.get("maximumAvailable", self.maximum_available))
+            self.restore_rate = float(status.get("restoreRate", self.restore_rate)) or self.restore_rate
+            if cost.get("requestedQueryCost") is not None:
+                # Re-insert so dict order is settle order; evict the stalest key past the cap.
+                self._costs.pop(cost_key, None)
+                self._costs[cost_key] = float(cost["requestedQueryCost"])
+                if len(self._costs) > self.max_cost_keys:
+                    del self._costs[next(iter(self._costs))]
+            if "currentlyAvailable" in status:
+                # Server's figure already reflects this request; keep others still outstanding deducted.
+                self.available = float(status["currentlyAvailable"]) - self.in_flight
+                self._updated = now
+            else:
+                self._refill(now)
+
+    def record_throttled(self) -> None:
+        self.throttled += 1
+
+    def _refill(self, now: float) -> None:
+        self.available = min(
+            self.maximum_available - self.in_flight,
+            self.available + (now - self._updated) * self.restore_rate,
+        )
+        self._updated = now
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "available": self.available,
+                "in_flight": self.in_flight,
+                "maximum_available": self.maximum_available,
+                "restore_rate": self.restore_rate,
+                "waited_seconds": self.waited_seconds,
+                "throttled": self.throttled,
+            }
@@ -11,15 +11,19 @@ import base64
 import logging
 from typing import Optional
 
-from config import config
-
 logger = logging.getLogger(__name__)
 
 
 class ShopifySecurity:
-    def __init__(self):
-        self.webhook_secret = config['SHOPIFY']['WEBHOOK']['SECRET']
-        self.env = config['ENVIRONMENT']
+    def __init__(self, webhook_secret: Optional[str] = None, env: Optional[str] = None):
+        """Secret and environment default to the legacy ``config`` module when not passed."""
+        if webhook_secret is None or env is None:
+            from config import config
+
+            webhook_secret = config['SHOPIFY']['WEBHOOK']['SECRET'] if webhook_secret is None else webhook_secret
+            env = config['ENVIRONMENT'] if env is None else env
+        self.webhook_secret = webhook_secret
+        self.env = env
 
     def verify_shopify_webhook(self, body: bytes, signature: str) -> bool:
         """Verify Shopify webhook using base64(HMAC-SHA256(body, secret)).
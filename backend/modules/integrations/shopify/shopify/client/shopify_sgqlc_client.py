@@ -7,10 +7,25 @@ against the Shopify Admin API using sgqlc operations.
 
 from typing import Dict, Any, Optional
 import urllib.error
+from urllib.parse import urlparse
 from sgqlc.operation import Operation
 from sgqlc.endpoint.http import HTTPEndpoint
 
 from config import config as global_config
+from modules.integrations.shopify.client.cost_throttle import CostThrottle, is_throttled
+
+
+class QueryCostExceededError(RuntimeError):
+    """Shopify rejected an operation with MAX_COST_EXCEEDED (single-query cost cap)."""
+
+
+def operation_cost_key(operation: Operation) -> tuple:
+    """Throttle key for an operation: its root field names, in order.
+
+    sgqlc inlines argument values into the query text, so ``str(operation)``
+    differs per call and the throttle would never reuse a learned cost.
+    """
+    return tuple(selection.__field__.graphql_name for selection in operation)
 
 
 class ShopifySGQLCClient:
@@ -115,6 +130,10 @@ class ShopifySGQLCClient:
         
         self.config = config
         self.environment = environment
+        # One query-cost bucket per store, shared with every other client of that store
+        self.throttle = CostThrottle.for_store(
+            config.get("store_id") or urlparse(config["graphql_url"]).hostname or config["graphql_url"]
+        )
         
         print("[DEBUG] ShopifySGQLCClient.__init__: Creating HTTPEndpoint with timeout=30", file=sys.stderr)
         logger.debug("ShopifySGQLCClient.__init__: Creating HTTPEndpoint with timeout=30")
@@ -126,15 +145,22 @@ class ShopifySGQLCClient:
         print(f"[DEBUG] ShopifySGQLCClient.__init__: HTTPEndpoint created successfully", file=sys.stderr)
         logger.debug("ShopifySGQLCClient.__init__: HTTPEndpoint created successfully")
     
-    def execute(self, operation: Operation) -> Dict[str, Any]:
+    def execute(self, operation: Operation, max_throttled_retries: int = 3) -> Dict[str, Any]:
         """Execute a GraphQL operation and return the GraphQL response body.
         
         This method is generic and works with any sgqlc Operation.
         It returns the GraphQL response (data, errors, extensions) excluding HTTP metadata.
         Only raises exceptions for HTTP/network errors.
         
+        Requests are paced by the store's CostThrottle: each one waits until
+        Shopify's query-cost bucket can cover its predicted cost, and the
+        bucket is resynced from the response's ``extensions.cost``. A THROTTLED
+        response is retried (after the wait the resynced bucket implies) up to
+        ``max_throttled_retries`` times.
+        
         Args:
             operation: The sgqlc Operation object to execute
+            max_throttled_retries: Retries for THROTTLED responses before returning them
         
         Returns:
             GraphQL response dict with structure:
@@ -148,7 +174,8 @@ class ShopifySGQLCClient:
         
         Raises:
             RuntimeError: If the HTTP request fails (non-200 status, network errors, timeouts)
-                OR if GraphQL query cost limit is exceeded (MAX_COST_EXCEEDED).
+                OR if GraphQL query cost limit is exceeded (MAX_COST_EXCEEDED,
+                raised as the QueryCostExceededError subclass).
                 Other GraphQL errors are returned in the response, not raised.
         """
         import sys
@@ -167,7 +194,18 @@ class ShopifySGQLCClient:
             logger.debug("ShopifySGQLCClient.execute: Calling endpoint(operation) - this is the HTTP request")
             import time
             start_time = time.time()
-            response_data = self.endpoint(operation)
+            cost_key = operation_cost_key(operation)
+            for attempt in range(max_throttled_retries + 1):
+                reserved = self.throttle.acquire(cost_key)
+                response_data = None
+                try:
+                    response_data = self.endpoint(operation)
+                finally:
+                    self.throttle.settle(cost_key, reserved, (response_data or {}).get('extensions'))
+                if attempt >= max_throttled_retries or not is_throttled(response_data.get('errors')):
+                    break
+                self.throttle.record_throttled()
+                logger.debug(f"ShopifySGQLCClient.execute: THROTTLED, retry {attempt + 1}/{max_throttled_retries}")
             elapsed = time.time() - start_time
             print(f"[DEBUG] ShopifySGQLCClient.execute: HTTP request completed in {elapsed:.2f}s, response type: {type(response_data)}", file=sys.stderr)
             logger.debug(f"ShopifySGQLCClient.execute: HTTP request completed in {elapsed:.2f}s, response type: {type(response_data)}")
@@ -206,7 +244,7 @@ class ShopifySGQLCClient:
                     cost = extensions.get('cost', 'unknown')
                     max_cost = extensions.get('maxCost', 'unknown')
                     message = error.get('message', 'Query cost exceeded limit')
-                    raise RuntimeError(
+                    raise QueryCostExceededError(
                         f"Shopify GraphQL query cost limit exceeded: {message}\n"
                         f"Query cost: {cost} (limit: {max_cost})\n"
                         f"See https://shopify.dev/docs/api/usage/rate-limits for more information.\n"
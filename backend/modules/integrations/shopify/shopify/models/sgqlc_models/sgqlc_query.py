@@ -6,7 +6,7 @@ customer and order-specific fields and helpers.
 """
 
 from typing import Optional
-from sgqlc.types import Type, Field, String, ID, Int
+from sgqlc.types import Type, Field, String, ID, Int, list_of
 from sgqlc.types.relay import connection_args
 from sgqlc.operation import Operation
 
@@ -411,6 +411,9 @@ class Query(BaseQuery):
     # Node query for fetching any node by ID (used for CalculatedOrder, etc.)
     node = Field('Node', args={'id': ID})
     
+    # Batched node lookup (up to 250 IDs per request)
+    nodes = Field(list_of('Node'), args={'ids': list_of(ID)})
+    
     # Files field (for file queries)
     files = Field(FileConnection, args=connection_args(query=String))
     
@@ -731,3 +734,25 @@ class Query(BaseQuery):
         
         return op
 
+    
+    @classmethod
+    def build_order_properties_nodes_query(cls, order_gids: list, line_items_first: int = 5) -> Operation:
+        """Build a single nodes(ids:) query for line item custom attributes of many orders.
+        
+        Args:
+            order_gids: Order GIDs (gid://shopify/Order/...), at most 250
+            line_items_first: Number of line items to fetch per order (default: 5)
+        
+        Returns:
+            Configured sgqlc Operation ready for execution
+        """
+        op = Operation(cls)
+        nodes_sel = op.nodes(ids=order_gids)
+        # __as__ adds __typename to the selection; nodes the cast doesn't match come back empty
+        order = nodes_sel.__as__(sgqlc_models.Order)  # type: ignore[attr-defined]
+        order.id()  # type: ignore[attr-defined]
+        line_items = order.lineItems(first=line_items_first)  # type: ignore[attr-defined]
+        custom_attributes = line_items.nodes.customAttributes()  # type: ignore[attr-defined]
+        custom_attributes.key()  # type: ignore[attr-defined]
+        custom_attributes.value()  # type: ignore[attr-defined]
+        return op
@@ -0,0 +1,168 @@
+"""
+Batch loader for order line item custom attributes.
+
+Replaces one ``orders(query: "id:...")`` request per order with one
+``nodes(ids: [...])`` request per batch. Batches are sized to Shopify's
+single-query cost cap (1000 points; each order costs about
+``3 + line_items_first``), so ~125 orders at the default 5 line items; a batch
+Shopify still rejects with MAX_COST_EXCEEDED is split in half and retried.
+Order IDs are normalized to GIDs, de-duplicated, and cached for the life of the
+loader, so a ShopifyService instance (one per request) never fetches the same
+order twice.
+
+Failures stay per order: a batch whose request fails leaves its orders out
+(and uncached, so a later call retries them); GraphQL errors that point at one
+node only drop that order. Once every batch has run, ``load_many`` raises
+``OrderPropertiesLoadError`` if any order failed, carrying what did load.
+
+    loader = OrderPropertiesLoader(client)
+    properties_by_gid = loader.load_many(order_ids)
+"""
+import json
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+
+from modules.integrations.shopify.client.shopify_sgqlc_client import QueryCostExceededError
+from modules.integrations.shopify.models.sgqlc_models.sgqlc_query import Query
+from modules.integrations.shopify.services.shopify_normalizers import normalize_order_identifier
+
+logger = logging.getLogger(__name__)
+
+# Shopify's cap on ids per nodes(ids:) query
+NODES_MAX_IDS = 250
+# Shopify's cap on the requested cost of a single query
+QUERY_COST_LIMIT = 1000
+
+Properties = List[Dict[str, str]]
+
+
+def batch_size_for(line_items_first: int) -> int:
+    """Orders per nodes(ids:) query that stay under QUERY_COST_LIMIT.
+
+    Per order: the node, the lineItems connection, and one point per line item
+    plus its customAttributes list.
+    """
+    return max(1, min(NODES_MAX_IDS, QUERY_COST_LIMIT // (3 + line_items_first)))
+
+
+class OrderPropertiesLoadError(ValueError):
+    """Some orders could not be fetched; ``properties`` holds the ones that were."""
+
+    def __init__(self, properties: Dict[str, "Properties"], failed: Dict[str, str]):
+        super().__init__(f"Could not fetch properties for {len(failed)} orders: {sorted(failed)[:5]}")
+        self.properties = properties
+        self.failed = failed
+
+
+class OrderPropertiesLoader:
+    """Batched, cached lookup of ``[{"key", "value"}]`` custom attributes per order."""
+
+    def __init__(self, client, line_items_first: int = 5, batch_size: Optional[int] = None):
+        self.client = client
+        self.line_items_first = line_items_first
+        max_batch = batch_size_for(line_items_first)
+        self.batch_size = min(batch_size, max_batch) if batch_size else max_batch
+        self._cache: Dict[str, Properties] = {}
+
+    @staticmethod
+    def to_gid(order_id: str) -> Optional[str]:
+        normalized = normalize_order_identifier(order_id)
+        return normalized.get("gid") if normalized else None
+
+    def load(self, order_id: str) -> Properties:
+        """Properties for one order ([] if the ID is invalid or the order is missing).
+
+        Raises:
+            OrderPropertiesLoadError: If the order could not be fetched
+        """
+        gid = self.to_gid(order_id)
+        if not gid:
+            logger.error(f"Invalid order ID format: {order_id}")
+            return []
+        return self.load_many([gid]).get(gid, [])
+
+    def load_many(self, order_ids: Iterable[str]) -> Dict[str, Properties]:
+        """Map order GID → properties for every valid ID, fetching only uncached orders.
+
+        Raises:
+            OrderPropertiesLoadError: If any order could not be fetched (after
+                every batch has run; the fetched orders are on the error)
+        """
+        gids: List[str] = []
+        for order_id in order_ids:
+            gid = self.to_gid(order_id)
+            if gid:
+                gids.append(gid)
+            else:
+                logger.error(f"Invalid order ID format: {order_id}")
+        gids = list(dict.fromkeys(gids))
+
+        pending = [gid for gid in gids if gid not in self._cache]
+        batches = [pending[start:start + self.batch_size] for start in range(0, len(pending), self.batch_size)]
+        failed: Dict[str, str] = {}
+        while batches:
+            batch = batches.pop(0)
+            try:
+                failed.update(self._fetch(batch))
+            except QueryCostExceededError as e:
+                if len(batch) == 1:
+                    failed[batch[0]] = str(e)
+                    continue
+                logger.warning(f"Splitting a {len(batch)}-order batch: {e}")
+                middle = len(batch) // 2
+                batches[:0] = [batch[:middle], batch[middle:]]
+            except Exception as e:
+                logger.error(f"Error fetching properties for {len(batch)} orders: {e}")
+                failed.update({gid: str(e) for gid in batch})
+
+        properties = {gid: self._cache[gid] for gid in gids if gid in self._cache}
+        if failed:
+            raise OrderPropertiesLoadError(properties, failed)
+        return properties
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _fetch(self, gids: List[str]) -> Dict[str, str]:
+        """Fetch and cache one batch; returns ``{gid: error}`` for orders a node-level error dropped."""
+        op = Query.build_order_properties_nodes_query(gids, line_items_first=self.line_items_first)
+        response = self.client.execute(op)
+        errors = response.get('errors') or []
+        if any((error.get('extensions') or {}).get('code') == 'MAX_COST_EXCEEDED' for error in errors):
+            raise QueryCostExceededError(f"nodes query for {len(gids)} orders exceeds the cost limit: {json.dumps(errors)}")
+        failed = self._failed_indexes(errors, len(gids))
+        if failed is None or not response.get('data'):
+            raise ValueError(f"nodes query failed for {len(gids)} orders: {json.dumps(errors)}")
+        for index in sorted(failed):
+            logger.error(f"Error fetching order {gids[index]}: {json.dumps(errors)}")
+
+        # nodes() returns one entry per requested id, in order, null for unknown ids
+        nodes = getattr(op + response, 'nodes', None) or []
+        for index, gid in enumerate(gids):
+            if index in failed:
+                continue
+            self._cache[gid] = self._extract_properties(nodes[index] if index < len(nodes) else None)
+        return {gids[index]: json.dumps(errors) for index in failed}
+
+    @staticmethod
+    def _failed_indexes(errors: list, count: int) -> Optional[Set[int]]:
+        """Node indexes the GraphQL ``errors`` point at, or None if any error isn't tied to one node."""
+        failed: Set[int] = set()
+        for error in errors:
+            path = error.get('path') or []
+            if len(path) < 2 or path[0] != 'nodes' or not isinstance(path[1], int) or path[1] >= count:
+                return None
+            failed.add(path[1])
+        return failed
+
+    @staticmethod
+    def _extract_properties(order) -> Properties:
+        properties: Properties = []
+        line_items_conn = getattr(order, 'lineItems', None) if order else None
+        for line_item in (getattr(line_items_conn, 'nodes', None) or []):
+            for attr in (getattr(line_item, 'customAttributes', None) or []):
+                key = getattr(attr, 'key', '')
+                value = getattr(attr, 'value', '')
+                if key and value:
+                    properties.append({"key": key, "value": value})
+        return properties
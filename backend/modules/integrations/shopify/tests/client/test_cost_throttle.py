@@ -0,0 +1,83 @@
+import threading
+import time
+
+from modules.integrations.shopify.client.cost_throttle import CostThrottle, is_throttled
+
+
+def _ext(requested: float, available: float, maximum: float = 100.0, rate: float = 50.0) -> dict:
+    return {
+        "cost": {
+            "requestedQueryCost": requested,
+            "actualQueryCost": requested,
+            "throttleStatus": {"maximumAvailable": maximum, "currentlyAvailable": available, "restoreRate": rate},
+        }
+    }
+
+
+def test_for_store_shares_one_instance_per_store():
+    a = CostThrottle.for_store("bars-test")
+    assert CostThrottle.for_store("BARS-TEST.myshopify.com") is a
+    assert CostThrottle.for_store("bars-other") is not a
+
+
+def test_no_wait_while_bucket_covers_cost():
+    t = CostThrottle(maximum_available=100, restore_rate=50, default_cost=10)
+    assert t.reserve("q") == (10, 0.0)
+
+
+def test_settle_learns_cost_and_bucket_state():
+    t = CostThrottle(maximum_available=1000, restore_rate=50)
+    reserved = t.acquire("orders")
+    t.settle("orders", reserved, _ext(requested=80, available=20, maximum=200, rate=100))
+    assert t.predict("orders") == 80
+    assert t.maximum_available == 200 and t.restore_rate == 100
+    # 20 left, 80 needed → wait for 60 points at 100/s
+    _, delay = t.reserve("orders")
+    assert 0.55 < delay <= 0.6
+
+
+def test_learned_costs_are_capped_to_recently_settled_keys():
+    t = CostThrottle(maximum_available=1000, restore_rate=50, default_cost=10, max_cost_keys=2)
+    for key, requested in (("a", 1), ("b", 2), ("a", 3), ("c", 4)):
+        t.settle(key, 0, _ext(requested=requested, available=1000, maximum=1000))
+    assert (t.predict("a"), t.predict("b"), t.predict("c")) == (3, 10, 4)
+
+
+def test_waits_stack_for_concurrent_callers():
+    t = CostThrottle(maximum_available=100, restore_rate=1000, default_cost=100)
+    delays = [t.reserve("q")[1] for _ in range(3)]
+    assert delays[0] == 0.0
+    assert delays[1] < delays[2]
+
+
+def test_settle_without_cost_only_releases_reservation():
+    t = CostThrottle(maximum_available=100, restore_rate=50, default_cost=30)
+    reserved = t.acquire("q")
+    t.settle("q", reserved, None)
+    assert t.in_flight == 0
+    assert t.predict("q") == 30
+
+
+def test_threads_are_paced_to_restore_rate():
+    t = CostThrottle(maximum_available=10, restore_rate=200, default_cost=10)
+    start = time.monotonic()
+
+    def worker():
+        for _ in range(3):
+            reserved = t.acquire("q")
+            t.settle("q", reserved, None)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    # 12 requests × 10 points, 10 up front, the rest refilled at 200/s ≈ 0.55s
+    assert time.monotonic() - start >= 0.5
+    assert t.stats()["in_flight"] == 0
+
+
+def test_is_throttled():
+    assert is_throttled([{"message": "Throttled", "extensions": {"code": "THROTTLED"}}])
+    assert not is_throttled([{"message": "bad", "extensions": {"code": "BAD_REQUEST"}}])
+    assert not is_throttled(None)
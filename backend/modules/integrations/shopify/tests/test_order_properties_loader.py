@@ -0,0 +1,199 @@
+"""Tests for OrderPropertiesLoader (batched nodes(ids:) lookups of order custom attributes)."""
+
+import importlib
+import importlib.util
+import re
+import sys
+import types
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("sgqlc")
+
+SHOPIFY_DIR = Path(__file__).resolve().parents[1]
+
+
+def _import_loader():
+    """Import the loader module by path, without the shopify package ``__init__``s.
+
+    Those pull in the whole service layer (legacy ``config``, ``shared_utilities``);
+    the loader itself only needs the sgqlc client and models and the identifier
+    normalizers.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name, path in [
+            ("modules.integrations.shopify", SHOPIFY_DIR),
+            ("modules.integrations.shopify.client", SHOPIFY_DIR / "client"),
+            ("modules.integrations.shopify.models", SHOPIFY_DIR / "models"),
+            ("modules.integrations.shopify.services", SHOPIFY_DIR / "services"),
+        ]:
+            if name not in sys.modules:
+                package = types.ModuleType(name)
+                package.__path__ = [str(path)]
+                mp.setitem(sys.modules, name, package)
+        if importlib.util.find_spec("config") is None:
+            config = types.ModuleType("config")
+            config.config = types.SimpleNamespace(shopify=None)
+            mp.setitem(sys.modules, "config", config)
+        return importlib.import_module("modules.integrations.shopify.services.order_properties_loader")
+
+
+loader_module = _import_loader()
+OrderPropertiesLoader = loader_module.OrderPropertiesLoader
+OrderPropertiesLoadError = loader_module.OrderPropertiesLoadError
+QueryCostExceededError = loader_module.QueryCostExceededError
+Query = loader_module.Query
+
+
+def _order(n: int, email: str = "a@b.c"):
+    return {
+        "__typename": "Order",
+        "id": _gid(n),
+        "lineItems": {"nodes": [{"customAttributes": [{"key": "Email", "value": f"{n}-{email}"}]}]},
+    }
+
+
+BASE = 5885712466000  # order ids must look like real ones (10-15 digits)
+
+
+def _id(n: int) -> str:
+    return str(BASE + n)
+
+
+def _gid(n: int) -> str:
+    return f"gid://shopify/Order/{BASE + n}"
+
+
+def _gids(op) -> list:
+    """The order GIDs a built nodes(ids:) operation asks for, in order."""
+    return re.findall(r"gid://shopify/Order/\d+", str(op))
+
+
+def test_builds_nodes_query_cast_to_order():
+    op = Query.build_order_properties_nodes_query([_gid(1), _gid(2)], line_items_first=3)
+
+    assert re.sub(r"\s+", " ", str(op)).strip() == (
+        f'query {{ nodes(ids: ["{_gid(1)}", "{_gid(2)}"]) {{ __typename ... on Order {{ id '
+        "lineItems(first: 3) { nodes { customAttributes { key value } } } } } }"
+    )
+
+
+def _client(respond):
+    client = Mock()
+    client.execute.side_effect = lambda op: respond(_gids(op))
+    return client
+
+
+def _ok(gids):
+    return {"data": {"nodes": [_order(int(g.rsplit("/", 1)[-1]) - BASE) for g in gids]}}
+
+
+def test_batches_at_batch_size_and_dedupes():
+    client = _client(_ok)
+    loader = OrderPropertiesLoader(client, batch_size=2)
+
+    result = loader.load_many([_id(1), _id(2), _gid(2), _id(3), "not-an-id"])
+
+    assert [len(_gids(call.args[0])) for call in client.execute.call_args_list] == [2, 1]
+    assert list(result) == [_gid(1), _gid(2), _gid(3)]
+    assert result[_gid(3)] == [{"key": "Email", "value": "3-a@b.c"}]
+
+
+def test_cached_orders_are_not_refetched():
+    client = _client(_ok)
+    loader = OrderPropertiesLoader(client)
+    loader.load_many([_id(1), _id(2)])
+
+    assert loader.load(_id(2)) == [{"key": "Email", "value": "2-a@b.c"}]
+    loader.load_many([_id(1), _id(2), _id(3)])
+
+    assert [_gids(call.args[0]) for call in client.execute.call_args_list] == [[_gid(1), _gid(2)], [_gid(3)]]
+
+
+def test_null_nodes_map_to_empty_properties():
+    loader = OrderPropertiesLoader(_client(lambda gids: {"data": {"nodes": [_order(1), None]}}))
+
+    assert loader.load_many([_id(1), _id(2)]) == {_gid(1): [{"key": "Email", "value": "1-a@b.c"}], _gid(2): []}
+
+
+def test_default_batch_fits_the_query_cost_limit():
+    assert OrderPropertiesLoader(Mock()).batch_size == 1000 // (3 + 5)
+    assert OrderPropertiesLoader(Mock(), line_items_first=10).batch_size == 1000 // 13
+    assert OrderPropertiesLoader(Mock(), batch_size=250).batch_size == 125
+
+
+def test_batch_over_the_cost_limit_is_split():
+    def respond(gids):
+        if len(gids) > 2:
+            return {"errors": [{"message": "Query cost is 2000", "extensions": {"code": "MAX_COST_EXCEEDED"}}]}
+        return _ok(gids)
+
+    client = _client(respond)
+    loader = OrderPropertiesLoader(client, batch_size=5)
+
+    assert list(loader.load_many([_id(n) for n in range(1, 6)])) == [_gid(n) for n in range(1, 6)]
+    assert [len(_gids(call.args[0])) for call in client.execute.call_args_list] == [5, 2, 3, 1, 2]
+
+
+def test_batch_the_client_rejects_as_too_costly_is_split():
+    # ShopifySGQLCClient raises on MAX_COST_EXCEEDED instead of returning the errors
+    def respond(gids):
+        if len(gids) > 2:
+            raise QueryCostExceededError("Shopify GraphQL query cost limit exceeded")
+        return _ok(gids)
+
+    client = _client(respond)
+    loader = OrderPropertiesLoader(client, batch_size=5)
+
+    assert list(loader.load_many([_id(n) for n in range(1, 6)])) == [_gid(n) for n in range(1, 6)]
+    assert [len(_gids(call.args[0])) for call in client.execute.call_args_list] == [5, 2, 3, 1, 2]
+
+
+def test_failed_batch_raises_with_the_other_batches_kept():
+    def respond(gids):
+        if _gid(3) in gids:
+            return {"errors": [{"message": "Throttled"}], "data": None}
+        return _ok(gids)
+
+    client = _client(respond)
+    loader = OrderPropertiesLoader(client, batch_size=2)
+
+    with pytest.raises(OrderPropertiesLoadError) as raised:
+        loader.load_many([_id(1), _id(2), _id(3), _id(4)])
+    assert list(raised.value.properties) == [_gid(1), _gid(2)]
+    assert sorted(raised.value.failed) == [_gid(3), _gid(4)]
+    # Failed orders aren't cached, so the next call retries only them.
+    client.execute.side_effect = lambda op: _ok(_gids(op))
+    assert list(loader.load_many([_id(1), _id(2), _id(3), _id(4)])) == [_gid(1), _gid(2), _gid(3), _gid(4)]
+    assert _gids(client.execute.call_args_list[-1].args[0]) == [_gid(3), _gid(4)]
+
+
+def test_error_on_one_node_only_fails_that_order():
+    loader = OrderPropertiesLoader(_client(lambda gids: {
+        "data": {"nodes": [_order(1), None, _order(3)]},
+        "errors": [{"message": "Access denied", "path": ["nodes", 1, "lineItems"]}],
+    }))
+
+    with pytest.raises(OrderPropertiesLoadError) as raised:
+        loader.load_many([_id(1), _id(2), _id(3)])
+    assert list(raised.value.properties) == [_gid(1), _gid(3)]
+    assert list(raised.value.failed) == [_gid(2)]
+
+
+def test_request_exception_is_contained_per_batch():
+    calls = iter([ConnectionError("reset"), _ok([_gid(2)])])
+
+    def respond(gids):
+        result = next(calls)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    loader = OrderPropertiesLoader(_client(respond), batch_size=1)
+
+    with pytest.raises(OrderPropertiesLoadError) as raised:
+        loader.load_many([_id(1), _id(2)])
+    assert list(raised.value.properties) == [_gid(2)]
+    assert raised.value.failed == {_gid(1): "reset"}
@@ -5,14 +5,139 @@ Handles bulk usergroup synchronization operations for leadership transitions.
 Preserves smart aggregation logic from leadership_slack_sync_cli.py.
 """
 import re
-from typing import Dict, List, Tuple, Set, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Literal, Tuple, Set, Optional, TypeVar
 import logging
 
+from slack_sdk.errors import SlackApiError
+
 from .usergroup_service import UsergroupService
 from modules.leadership.domain.models import LeadershipHierarchy
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Slack Web API rate tiers (calls per minute) for the methods a sync writes with.
+# Both are Tier 2; see https://api.slack.com/docs/rate-limits
+SLACK_WRITE_TIERS: Dict[str, int] = {
+    'usergroups.create': 20,
+    'usergroups.users.update': 20,
+}
+
+ChangeAction = Literal['create', 'update', 'noop', 'skip']
+
+
+@dataclass
+class GroupChange:
+    """Desired-vs-actual diff for one usergroup, and what happened when it was applied."""
+    handle: str
+    action: ChangeAction
+    group_id: Optional[str] = None
+    members: List[str] = field(default_factory=list)
+    additions: List[str] = field(default_factory=list)
+    removals: List[str] = field(default_factory=list)
+    reason: str = ""
+    applied: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class SyncReport:
+    """Outcome of UsergroupProvisioner.sync_groups."""
+    changes: List[GroupChange]
+    dry_run: bool
+    errors: List[str] = field(default_factory=list)
+    
+    def __post_init__(self):
+        self.errors = self.errors + [f"{c.handle}: {c.error}" for c in self.changes if c.error]
+    
+    def by_action(self, action: ChangeAction) -> List[GroupChange]:
+        return [c for c in self.changes if c.action == action and not c.error]
+    
+    @property
+    def created(self) -> List[GroupChange]:
+        return self.by_action('create')
+    
+    @property
+    def updated(self) -> List[GroupChange]:
+        return self.by_action('update')
+    
+    @property
+    def unchanged(self) -> List[GroupChange]:
+        return self.by_action('noop')
+    
+    @property
+    def skipped(self) -> List[GroupChange]:
+        return self.by_action('skip')
+    
+    def counts(self) -> Tuple[int, int, int, List[str]]:
+        """(created_count, updated_count, skipped_count, errors) — unchanged groups count as skipped."""
+        return len(self.created), len(self.updated), len(self.skipped) + len(self.unchanged), self.errors
+    
+    def summary(self) -> str:
+        prefix = "[DRY-RUN] " if self.dry_run else ""
+        return (
+            f"{prefix}{len(self.created)} created, {len(self.updated)} updated, "
+            f"{len(self.unchanged)} unchanged, {len(self.skipped)} skipped, {len(self.errors)} errors"
+        )
+
+
+class SlackRateLimiter:
+    """
+    Token bucket per Slack API method.
+    
+    Each method may burst up to its per-minute allowance, then is paced to it.
+    A 429 (ratelimited) response is retried after Slack's Retry-After.
+    """
+    
+    def __init__(
+        self,
+        per_minute: Dict[str, int],
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.per_minute = per_minute
+        self.max_retries = max_retries
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # method -> (tokens, last refill)
+    
+    def acquire(self, method: str) -> None:
+        rate = self.per_minute.get(method)
+        if not rate:
+            return
+        while True:
+            with self._lock:
+                now = self._clock()
+                tokens, last = self._buckets.get(method, (float(rate), now))
+                tokens = min(float(rate), tokens + (now - last) * rate / 60.0)
+                if tokens >= 1:
+                    self._buckets[method] = (tokens - 1, now)
+                    return
+                self._buckets[method] = (tokens, now)
+                wait = (1 - tokens) * 60.0 / rate
+            self._sleep(wait)
+    
+    def call(self, method: str, fn: Callable[[], T]) -> T:
+        for attempt in range(self.max_retries + 1):
+            self.acquire(method)
+            try:
+                return fn()
+            except SlackApiError as e:
+                response = e.response
+                if attempt == self.max_retries or getattr(response, 'status_code', None) != 429:
+                    raise
+                retry_after = float(response.headers.get('Retry-After', 1)) if response.headers else 1.0
+                logger.warning(f"{method} rate limited, retrying in {retry_after:.0f}s")
+                self._sleep(retry_after)
+        raise AssertionError("unreachable")
+
 
 def normalize_handle(text: str) -> str:
     """
@@ -39,7 +164,8 @@ class UsergroupProvisioner:
     Handles:
     - Building group plans from leadership hierarchy
     - Smart aggregation (sport-night-division → sport-night)
-    - Create vs. Update detection
+    - Create vs. Update vs. no-op detection (one usergroups.list per sync)
+    - Concurrent, rate-tier-paced writes
     - Dry-run mode
     - Diff reporting
     """
@@ -187,107 +313,144 @@ class UsergroupProvisioner:
         logger.info(f"Built plans for {len(plans)} usergroups")
         return plans
     
+    def plan_changes(
+        self,
+        plans: Dict[str, List[str]],
+        create_missing: bool = True
+    ) -> List[GroupChange]:
+        """
+        Diff membership plans against current Slack state (one usergroups.list call).
+        
+        Args:
+            plans: Dict of {handle: [user_ids]}
+            create_missing: If False, groups that don't exist are reported as 'skip'
+            
+        Returns:
+            One GroupChange per plan, in plan order
+            
+        Raises:
+            SlackApiError: If listing usergroups fails
+        """
+        existing = {g['handle']: g for g in self.service.list_groups(include_disabled=False)}
+        logger.info(f"Found {len(existing)} existing usergroups")
+        
+        changes = []
+        for handle, user_ids in plans.items():
+            members = sorted(set(user_ids))
+            group = existing.get(handle)
+            if not members:
+                changes.append(GroupChange(handle, 'skip', group_id=group and group['id'], reason='empty plan'))
+            elif group is None:
+                if create_missing:
+                    changes.append(GroupChange(handle, 'create', members=members, additions=members))
+                else:
+                    changes.append(GroupChange(handle, 'skip', members=members, reason='group does not exist'))
+            else:
+                current = set(group.get('users') or [])
+                additions = sorted(set(members) - current)
+                removals = sorted(current - set(members))
+                action = 'update' if additions or removals else 'noop'
+                changes.append(GroupChange(
+                    handle, action, group_id=group['id'], members=members,
+                    additions=additions, removals=removals
+                ))
+        return changes
+    
+    def apply_changes(
+        self,
+        changes: List[GroupChange],
+        max_workers: int = 4,
+        rate_limiter: Optional[SlackRateLimiter] = None
+    ) -> List[GroupChange]:
+        """
+        Execute 'create' and 'update' changes concurrently; marks each applied or sets its error.
+        
+        Calls are paced per Slack method by rate_limiter (default: SLACK_WRITE_TIERS).
+        """
+        limiter = rate_limiter or SlackRateLimiter(SLACK_WRITE_TIERS)
+        pending = [c for c in changes if c.action in ('create', 'update')]
+        if not pending:
+            return changes
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._apply_change, change, limiter): change for change in pending}
+            for future in as_completed(futures):
+                change = futures[future]
+                try:
+                    future.result()
+                    change.applied = True
+                    logger.info(f"{change.action.title()}d {change.handle}: +{len(change.additions)} -{len(change.removals)}")
+                except Exception as e:
+                    change.error = str(e)
+                    logger.error(f"Error processing {change.handle}: {e}")
+        return changes
+    
+    def _apply_change(self, change: GroupChange, limiter: SlackRateLimiter) -> None:
+        if change.action == 'create':
+            name = change.handle.replace('-', ' ').title()
+            group_id = limiter.call(
+                'usergroups.create',
+                lambda: self.service.create_group(
+                    name=name,
+                    handle=change.handle,
+                    description="Auto-managed by BARS Leadership System"
+                )
+            )
+            if not group_id:
+                raise RuntimeError(f"Failed to create {change.handle}")
+            change.group_id = group_id
+        
+        if not limiter.call(
+            'usergroups.users.update',
+            lambda: self.service.update_group_members(change.group_id, change.members)
+        ):
+            raise RuntimeError(f"Failed to update {change.handle}")
+    
     def sync_groups(
         self,
         plans: Dict[str, List[str]],
         dry_run: bool = False,
-        create_missing: bool = True
-    ) -> Tuple[int, int, int, List[str]]:
+        create_missing: bool = True,
+        max_workers: int = 4
+    ) -> SyncReport:
         """
         Sync usergroups based on membership plans.
         
+        Fetches current state once, diffs each group, skips groups whose
+        membership already matches, and applies the rest concurrently.
+        
         Args:
             plans: Dict of {handle: [user_ids]}
             dry_run: If True, only report what would be done
             create_missing: If True, create groups that don't exist
+            max_workers: Concurrent Slack write calls (still paced by rate tier)
             
         Returns:
-            Tuple of (created_count, updated_count, skipped_count, errors)
+            SyncReport with one GroupChange per plan
         """
-        created = 0
-        updated = 0
-        skipped = 0
-        errors = []
-        
-        # Get existing groups
         try:
-            existing_groups = {
-                g['handle']: g['id']
-                for g in self.service.list_groups(include_disabled=False)
-            }
-            logger.info(f"Found {len(existing_groups)} existing usergroups")
+            changes = self.plan_changes(plans, create_missing=create_missing)
         except Exception as e:
-            errors.append(f"Failed to list existing groups: {e}")
-            return 0, 0, 0, errors
+            return SyncReport(changes=[], dry_run=dry_run, errors=[f"Failed to list existing groups: {e}"])
         
-        for handle, user_ids in plans.items():
-            if not user_ids:
-                logger.info(f"Skipping empty group: {handle}")
-                skipped += 1
-                continue
-            
-            try:
-                if handle in existing_groups:
-                    # Update existing group
-                    group_id = existing_groups[handle]
-                    
-                    if dry_run:
-                        current_members = self.service.get_group_members(group_id)
-                        additions = set(user_ids) - set(current_members)
-                        removals = set(current_members) - set(user_ids)
-                        logger.info(
-                            f"[DRY-RUN] Would update {handle}: "
-                            f"+{len(additions)} -{len(removals)} (total: {len(user_ids)})"
-                        )
-                    else:
-                        success = self.service.update_group_members(group_id, user_ids)
-                        if success:
-                            logger.info(f"Updated {handle} with {len(user_ids)} members")
-                        else:
-                            errors.append(f"Failed to update {handle}")
-                            continue
-                    
-                    updated += 1
-                else:
-                    # Create new group
-                    if not create_missing:
-                        logger.info(f"Skipping non-existent group: {handle}")
-                        skipped += 1
-                        continue
-                    
-                    if dry_run:
-                        logger.info(
-                            f"[DRY-RUN] Would create {handle} with {len(user_ids)} members"
-                        )
-                    else:
-                        name = handle.replace('-', ' ').title()
-                        group_id = self.service.create_group(
-                            name=name,
-                            handle=handle,
-                            description="Auto-managed by BARS Leadership System"
-                        )
-                        
-                        if group_id:
-                            # Add members to new group
-                            self.service.update_group_members(group_id, user_ids)
-                            logger.info(f"Created {handle} with {len(user_ids)} members")
-                        else:
-                            errors.append(f"Failed to create {handle}")
-                            continue
-                    
-                    created += 1
-                    
-            except Exception as e:
-                error_msg = f"{handle}: {str(e)}"
-                errors.append(error_msg)
-                logger.error(f"Error processing {handle}: {e}", exc_info=True)
+        if dry_run:
+            for change in changes:
+                if change.action in ('create', 'update'):
+                    logger.info(
+                        f"[DRY-RUN] Would {change.action} {change.handle}: "
+                        f"+{len(change.additions)} -{len(change.removals)} (total: {len(change.members)})"
+                    )
+        else:
+            self.apply_changes(changes, max_workers=max_workers)
         
-        return created, updated, skipped, errors
+        report = SyncReport(changes=changes, dry_run=dry_run)
+        logger.info(f"Usergroup sync: {report.summary()}")
+        return report
     
     def generate_diff_report(
         self,
         plans: Dict[str, List[str]]
-    ) -> Dict[str, Dict[str, any]]:
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Generate a diff report comparing plans to current state.
         
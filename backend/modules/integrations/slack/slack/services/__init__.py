@@ -5,11 +5,23 @@ Provides high-level Slack operations for usergroups, channels, and users.
 """
 
 from .usergroup_service import UsergroupService
-from .usergroup_provisioner import UsergroupProvisioner, normalize_handle
+from .usergroup_provisioner import (
+    GroupChange,
+    SlackRateLimiter,
+    SyncReport,
+    UsergroupProvisioner,
+    normalize_handle,
+)
+from .slack_jobs import SlackJob, SlackJobQueue
 
 __all__ = [
     "UsergroupService",
     "UsergroupProvisioner",
+    "GroupChange",
+    "SyncReport",
+    "SlackRateLimiter",
     "normalize_handle",
+    "SlackJob",
+    "SlackJobQueue",
 ]
 
@@ -0,0 +1,155 @@
+"""
+Ack-then-process for Slack slash commands, interactions and events.
+
+Slack expects an HTTP response within 3 seconds. Routes verify and parse the
+request, call ``SlackJobQueue.submit`` with a coroutine factory, and return
+their ack immediately. A fixed set of asyncio workers runs the jobs; blocking
+work (downloads, CLI entry points) belongs in ``asyncio.to_thread`` inside the
+job. A job's return value — a string or a Slack message dict — is posted back
+to the interaction's ``response_url``; an exception posts an ephemeral error.
+
+Slack retries event deliveries and users double-click buttons, so each job
+carries a per-user fingerprint (event id, action + message ts, command text…).
+A fingerprint accepted in the last ``dedupe_ttl`` seconds is ignored.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Literal, Optional, Union
+
+from slack_sdk.webhook import WebhookClient
+
+logger = logging.getLogger(__name__)
+
+JobResult = Union[str, dict, None]
+SubmitStatus = Literal["queued", "duplicate", "rejected"]
+
+
+@dataclass
+class SlackJob:
+    name: str
+    user_id: str
+    fingerprint: str
+    run: Callable[[], Awaitable[JobResult]]
+    response_url: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+def post_to_response_url(response_url: str, message: dict[str, Any]) -> None:
+    """POST ``message`` to a Slack ``response_url`` (blocking — call via ``asyncio.to_thread``)."""
+    response = WebhookClient(response_url, timeout=10).send_dict(message)
+    if response.status_code != 200:
+        logger.error(f"response_url post failed: {response.status_code} {response.body}")
+
+
+class SlackJobQueue:
+    """Bounded asyncio worker pool with per-user de-duplication."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 4,
+        max_queue: int = 100,
+        dedupe_ttl: float = 300.0,
+        responder: Callable[[str, dict[str, Any]], None] = post_to_response_url,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.dedupe_ttl = dedupe_ttl
+        self.responder = responder
+        self._clock = clock
+        self._seen: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: list[asyncio.Task] = []
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        """Start the workers on the running loop the first time a job arrives on it."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._workers = [
+                asyncio.create_task(self._worker(i), name=f"slack-job-{i}") for i in range(self.max_workers)
+            ]
+        return self._queue
+
+    def _is_duplicate(self, user_id: str, fingerprint: str) -> bool:
+        now = self._clock()
+        while self._seen and next(iter(self._seen.values())) < now - self.dedupe_ttl:
+            self._seen.popitem(last=False)
+        return (user_id, fingerprint) in self._seen
+
+    def submit(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[JobResult]],
+        *,
+        user_id: str,
+        fingerprint: str,
+        response_url: Optional[str] = None,
+    ) -> SubmitStatus:
+        """Queue ``run()`` unless it's a repeat for this user or the queue is full. Never blocks."""
+        queue = self._ensure_workers()
+        if self._is_duplicate(user_id, fingerprint):
+            logger.info(f"slack_job {name} user={user_id} duplicate")
+            return "duplicate"
+        try:
+            queue.put_nowait(SlackJob(name, user_id, fingerprint, run, response_url))
+        except asyncio.QueueFull:
+            logger.warning(f"slack_job {name} user={user_id} rejected: queue full")
+            return "rejected"
+        self._seen[(user_id, fingerprint)] = self._clock()
+        return "queued"
+
+    async def _worker(self, index: int) -> None:
+        assert self._queue is not None
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job: SlackJob) -> None:
+        started = time.monotonic()
+        try:
+            result = await job.run()
+            message = {"response_type": "ephemeral", "text": result} if isinstance(result, str) else result
+            outcome = "ok"
+        except Exception as e:
+            logger.exception(f"slack_job {job.name} user={job.user_id} failed")
+            message = {"response_type": "ephemeral", "text": f"Error: {e}"}
+            outcome = "error"
+        logger.info(
+            f"slack_job {job.name} user={job.user_id} {outcome} "
+            f"wait_ms={(started - job.enqueued_at) * 1000:.0f} run_ms={(time.monotonic() - started) * 1000:.0f}"
+        )
+        if job.response_url and message:
+            try:
+                await asyncio.to_thread(self.responder, job.response_url, message)
+            except Exception:
+                logger.exception(f"slack_job {job.name} response_url post failed")
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def shutdown(self, timeout: float = 30.0) -> None:
+        """Let queued jobs finish (up to ``timeout`` seconds), then stop the workers."""
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"slack_job shutdown: {self._queue.qsize() if self._queue else 0} job(s) abandoned")
+        await self.stop()
+
+    async def stop(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._queue, self._loop, self._workers = None, None, []
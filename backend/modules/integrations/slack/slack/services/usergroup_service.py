@@ -6,10 +6,13 @@ Replaces the old usergroup_client.py with modern slack_sdk integration.
 """
 from typing import List, Dict, Optional, Any
 import logging
+import time
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+from shared_utilities.clients.slack.directory import SlackDirectory, directory_for
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,16 +22,22 @@ class UsergroupService:
     
     Provides individual usergroup operations (list, get, create, update).
     For bulk operations, see UsergroupProvisioner.
+    
+    Lookups (get_group_by_id / get_group_by_handle) are served from the shared
+    SlackDirectory; writes update it in place. get_group_members reloads the
+    groups first, since add/remove write the full member list back.
     """
     
-    def __init__(self, client: WebClient):
+    def __init__(self, client: WebClient, directory: Optional[SlackDirectory] = None):
         """
         Initialize with slack_sdk WebClient.
         
         Args:
             client: Initialized WebClient with valid bot token
+            directory: Directory cache to read groups from (default: shared one for the token)
         """
         self.client = client
+        self.directory = directory or directory_for(client)
     
     def list_groups(self, include_disabled: bool = False) -> List[Dict[str, Any]]:
         """
@@ -73,8 +82,7 @@ class UsergroupService:
         Raises:
             SlackApiError: If API call fails (except not_found)
         """
-        groups = self.list_groups(include_disabled=True)
-        return next((g for g in groups if g.get('id') == group_id), None)
+        return self.directory.group(group_id)
     
     def get_group_by_handle(self, handle: str) -> Optional[Dict[str, Any]]:
         """
@@ -86,8 +94,7 @@ class UsergroupService:
         Returns:
             Usergroup dict or None if not found
         """
-        groups = self.list_groups(include_disabled=True)
-        return next((g for g in groups if g.get('handle') == handle), None)
+        return self.directory.group_by_handle(handle)
     
     def create_group(
         self,
@@ -129,6 +136,7 @@ class UsergroupService:
                 usergroup = response.get('usergroup')
                 if usergroup:
                     group_id = usergroup['id']
+                    self.directory.upsert_group(group_id, **usergroup)
                     logger.info(f"Created usergroup '{name}' with ID {group_id}")
                     return group_id
             
@@ -167,6 +175,7 @@ class UsergroupService:
             )
             
             if response['ok']:
+                self.directory.upsert_group(group_id, users=list(user_ids), user_count=len(user_ids))
                 logger.info(f"Updated usergroup {group_id} with {len(user_ids)} members")
                 return True
             
@@ -181,13 +190,19 @@ class UsergroupService:
         """
         Get current member IDs for a usergroup.
         
+        Always reads fresh from Slack (not the cached directory): callers write
+        the full list back, which would undo changes made since the last reload.
+        
         Args:
             group_id: Usergroup ID
             
         Returns:
             List of Slack user IDs (empty list if not found)
+            
+        Raises:
+            SlackApiError: If API call fails
         """
-        group = self.get_group_by_id(group_id)
+        group = self.directory.group(group_id, fresh=True)
         return group.get('users', []) if group else []
     
     def add_user_to_group(self, group_id: str, user_id: str) -> bool:
@@ -247,6 +262,7 @@ class UsergroupService:
             response = self.client.usergroups_disable(usergroup=group_id)
             
             if response['ok']:
+                self.directory.upsert_group(group_id, date_delete=int(time.time()))
                 logger.info(f"Disabled usergroup {group_id}")
                 return True
             
@@ -274,6 +290,7 @@ class UsergroupService:
             response = self.client.usergroups_enable(usergroup=group_id)
             
             if response['ok']:
+                self.directory.upsert_group(group_id, date_delete=0)
                 logger.info(f"Enabled usergroup {group_id}")
                 return True
             
@@ -0,0 +1,129 @@
+"""
+Unit tests for SlackJobQueue (ack-then-process for Slack routes).
+
+Covers:
+- submit returns at once; results and errors posted to response_url
+- per-user de-duplication within the TTL
+- bounded workers, so one slow job doesn't hold up the others
+- a full queue rejects instead of blocking
+- shutdown lets queued jobs finish before stopping the workers
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+from modules.integrations.slack.services.slack_jobs import SlackJobQueue
+
+
+def _queue(**kwargs) -> Tuple[SlackJobQueue, List[Tuple[str, Dict[str, Any]]]]:
+    posts: List[Tuple[str, Dict[str, Any]]] = []
+    return SlackJobQueue(responder=lambda url, message: posts.append((url, message)), **kwargs), posts
+
+
+def test_results_and_errors_posted_to_response_url():
+    async def main():
+        jobs, posts = _queue()
+
+        async def ok():
+            return "CSV sync completed"
+
+        async def boom():
+            raise RuntimeError("download failed")
+
+        assert jobs.submit("sync", ok, user_id="U1", fingerprint="a", response_url="https://hooks/1") == "queued"
+        jobs.submit("sync", boom, user_id="U1", fingerprint="b", response_url="https://hooks/2")
+        await jobs.join()
+        await jobs.stop()
+        return posts
+
+    posts = dict(asyncio.run(main()))
+    assert posts["https://hooks/1"] == {"response_type": "ephemeral", "text": "CSV sync completed"}
+    assert posts["https://hooks/2"]["text"] == "Error: download failed"
+
+
+def test_duplicates_are_per_user_and_expire():
+    now = [0.0]
+
+    async def main():
+        jobs, _ = _queue(dedupe_ttl=60, clock=lambda: now[0])
+
+        async def work():
+            return None
+
+        statuses = [
+            jobs.submit("cmd", work, user_id="U1", fingerprint="/sync x"),
+            jobs.submit("cmd", work, user_id="U1", fingerprint="/sync x"),  # retried delivery
+            jobs.submit("cmd", work, user_id="U2", fingerprint="/sync x"),  # someone else
+        ]
+        now[0] = 61
+        statuses.append(jobs.submit("cmd", work, user_id="U1", fingerprint="/sync x"))
+        await jobs.join()
+        await jobs.stop()
+        return statuses
+
+    assert asyncio.run(main()) == ["queued", "duplicate", "queued", "queued"]
+
+
+def test_slow_job_does_not_block_others():
+    async def main():
+        jobs, posts = _queue(max_workers=2)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        jobs.submit("slow", slow, user_id="U1", fingerprint="1", response_url="slow")
+        jobs.submit("fast", fast, user_id="U2", fingerprint="2", response_url="fast")
+        for _ in range(50):
+            if posts:
+                break
+            await asyncio.sleep(0.01)
+        first = [url for url, _ in posts]
+        release.set()
+        await jobs.join()
+        await jobs.stop()
+        return first
+
+    assert asyncio.run(main()) == ["fast"]
+
+
+def test_full_queue_rejects():
+    async def main():
+        jobs, _ = _queue(max_workers=1, max_queue=1)
+
+        async def work():
+            await asyncio.sleep(0)
+
+        started = time.monotonic()
+        statuses = [jobs.submit("x", work, user_id="U1", fingerprint=str(i)) for i in range(3)]
+        elapsed = time.monotonic() - started
+        await jobs.join()
+        await jobs.stop()
+        return statuses, elapsed
+
+    statuses, elapsed = asyncio.run(main())
+    assert statuses == ["queued", "rejected", "rejected"]
+    assert elapsed < 0.1
+
+
+def test_shutdown_finishes_queued_jobs_then_stops():
+    async def main():
+        jobs, posts = _queue(max_workers=1)
+
+        async def work():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        for i in range(3):
+            jobs.submit("x", work, user_id="U1", fingerprint=str(i), response_url=f"https://hooks/{i}")
+        await jobs.shutdown(timeout=5)
+        return posts, jobs._workers
+
+    posts, workers = asyncio.run(main())
+    assert [url for url, _ in posts] == ["https://hooks/0", "https://hooks/1", "https://hooks/2"]
+    assert workers == []
@@ -0,0 +1,99 @@
+"""
+Unit tests for UsergroupProvisioner.sync_groups.
+
+Covers:
+- one usergroups.list per sync, no-op groups never written
+- create / update / skip classification and dry-run
+- per-group errors reported without aborting the run
+- SlackRateLimiter pacing per method
+"""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+from modules.integrations.slack.services.usergroup_provisioner import SlackRateLimiter, UsergroupProvisioner
+
+
+class _FakeService:
+    def __init__(self, groups: List[Dict[str, Any]], fail_handles=()):
+        self.groups = groups
+        self.fail_handles = set(fail_handles)
+        self.list_calls = 0
+        self.updates: Dict[str, List[str]] = {}
+        self.created: List[str] = []
+
+    def list_groups(self, include_disabled: bool = False) -> List[Dict[str, Any]]:
+        self.list_calls += 1
+        return self.groups
+
+    def create_group(self, name: str, handle: str, description: str = "", channels=None) -> Optional[str]:
+        self.created.append(handle)
+        return f"S-{handle}"
+
+    def update_group_members(self, group_id: str, user_ids: List[str]) -> bool:
+        if group_id in {g["id"] for g in self.groups if g["handle"] in self.fail_handles}:
+            return False
+        self.updates[group_id] = list(user_ids)
+        return True
+
+
+@pytest.fixture
+def service():
+    return _FakeService([
+        {"id": "S1", "handle": "dodgeball", "users": ["U1", "U2"]},
+        {"id": "S2", "handle": "bowling", "users": ["U3"]},
+        {"id": "S3", "handle": "kickball", "users": ["U4"]},
+    ])
+
+
+PLANS = {
+    "dodgeball": ["U2", "U1"],         # unchanged (order doesn't matter)
+    "bowling": ["U3", "U5"],           # +U5
+    "pickleball": ["U6"],              # new
+    "kickball": [],                    # empty plan
+}
+
+
+def test_sync_skips_noops_and_lists_once(service):
+    report = UsergroupProvisioner(service).sync_groups(PLANS)
+
+    assert service.list_calls == 1
+    assert service.updates == {"S2": ["U3", "U5"], "S-pickleball": ["U6"]}
+    assert service.created == ["pickleball"]
+    assert [c.handle for c in report.unchanged] == ["dodgeball"]
+    assert [c.handle for c in report.skipped] == ["kickball"]
+    assert report.updated[0].additions == ["U5"] and report.updated[0].removals == []
+    assert report.counts() == (1, 1, 2, [])
+
+
+def test_dry_run_writes_nothing(service):
+    report = UsergroupProvisioner(service).sync_groups(PLANS, dry_run=True, create_missing=False)
+
+    assert service.updates == {} and service.created == []
+    assert [c.handle for c in report.updated] == ["bowling"]
+    assert {c.handle: c.reason for c in report.skipped} == {"pickleball": "group does not exist", "kickball": "empty plan"}
+    assert not any(c.applied for c in report.changes)
+
+
+def test_failed_group_is_reported(service):
+    service.fail_handles = {"bowling"}
+    report = UsergroupProvisioner(service).sync_groups(PLANS)
+
+    assert report.errors == ["bowling: Failed to update bowling"]
+    assert [c.handle for c in report.created] == ["pickleball"]
+
+
+def test_rate_limiter_paces_per_method():
+    now = [0.0]
+    sleeps: List[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = SlackRateLimiter({"usergroups.users.update": 2}, clock=lambda: now[0], sleep=sleep)
+    for _ in range(3):
+        limiter.acquire("usergroups.users.update")
+    limiter.acquire("usergroups.list")  # untiered methods aren't paced
+
+    assert sleeps == [pytest.approx(30.0)]
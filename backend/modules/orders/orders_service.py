@@ -1,10 +1,16 @@
-"""Orders domain service. Flat module-level async functions, no class."""
+"""Orders domain service. Flat module-level async functions, no class.
+
+Reads go through ``orders_cache`` (keyed by order GID, invalidated by the
+``orders/updated`` webhook and by our own mutations). Pass ``fresh=True`` where
+a decision depends on the order's current state (refund eligibility): it reads
+from Shopify and stores the result for later cached reads.
+"""
 
 import logging
 
 from pydantic import BaseModel
 
-from core.clients import shopify
+from core.clients import order_numbers_cache, orders_cache, shopify
 from lib.clients.shopify.generated.enums import OrderCancelReason
 from lib.clients.shopify.generated.fragments import Order
 from lib.clients.shopify.generated.order_cancel import OrderCancel
@@ -13,8 +19,20 @@ from lib.clients.shopify.generated.orders_get import OrdersGetOrdersNodes
 logger = logging.getLogger(__name__)
 
 
-async def get_order(order_id: int) -> Order:
+def order_gid(order_id: int | str) -> str:
+    return f"gid://shopify/Order/{order_id}"
+
+
+async def get_order(order_id: int, fresh: bool = False) -> Order:
     """Fetch a single order by numeric ID. Raises if not found."""
+    if fresh:
+        order = await _fetch_order(order_id)
+        await orders_cache.put(order_gid(order_id), order)
+        return order
+    return await orders_cache.get(order_gid(order_id), lambda: _fetch_order(order_id))
+
+
+async def _fetch_order(order_id: int | str) -> OrdersGetOrdersNodes:
     result = await shopify.orders_get(query=f"id:{order_id}", first=1)
     if not result.orders.nodes:
         raise ValueError(f"Order not found: {order_id}")
@@ -23,22 +41,45 @@ async def get_order(order_id: int) -> Order:
     return result.orders.nodes[0]
 
 
-async def find_orders(order_number: int | str | None) -> list[OrdersGetOrdersNodes]:
-    result = await shopify.orders_get(query=f"name:#{order_number}", first=10)
-    return result.orders.nodes
+async def find_orders(order_number: int | str | None, fresh: bool = False) -> list[OrdersGetOrdersNodes]:
+    """Orders named ``#<order_number>``. Seeds ``orders_cache`` with every node the search returns."""
+    found: dict[str, OrdersGetOrdersNodes] = {}
+
+    async def search() -> list[str]:
+        result = await shopify.orders_get(query=f"name:#{order_number}", first=10)
+        for node in result.orders.nodes:
+            await orders_cache.put(node.id, node)
+            found[node.id] = node
+        return [node.id for node in result.orders.nodes]
+
+    if fresh:
+        gids = await search()
+        if gids:
+            await order_numbers_cache.put(str(order_number), gids)
+        return [found[gid] for gid in gids]
+
+    gids = await order_numbers_cache.get(str(order_number), search)
+    if not gids:
+        await order_numbers_cache.invalidate(str(order_number))  # the order may not exist *yet*
+    return [
+        await orders_cache.get(gid, lambda gid=gid: _fetch_order(gid.rsplit("/", 1)[-1]))
+        for gid in gids
+    ]
 
 
 async def cancel_order(
     order_id: int,
     cancel_details: "CancelOrderRequest",
 ) -> OrderCancel:
-    return await shopify.order_cancel(
-        order_id=f"gid://shopify/Order/{order_id}",
+    result = await shopify.order_cancel(
+        order_id=order_gid(order_id),
         reason=cancel_details.reason,
         restock=cancel_details.restock,
         notify_customer=cancel_details.notify,
         staff_note=f"{cancel_details.cancelled_by} + {cancel_details.notes}",
     )
+    await orders_cache.invalidate(order_gid(order_id))
+    return result
 
 
 def strip_order_number_prefix(order_number: str | None) -> str:
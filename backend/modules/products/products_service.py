@@ -1,11 +1,23 @@
-"""Products domain service. Flat module-level async functions, no class."""
+"""Products domain service. Flat module-level async functions, no class.
 
-from core.clients import shopify
+``get_product`` reads through ``products_cache`` (keyed by product GID,
+invalidated by the ``products/update`` webhook).
+"""
+
+from core.clients import products_cache, shopify
 from lib.clients.shopify.generated.products_get import ProductsGetProductsNodes
 
 
+def product_gid(product_id: int | str) -> str:
+    return f"gid://shopify/Product/{product_id}"
+
+
 async def get_product(product_id: int) -> ProductsGetProductsNodes:
     """Fetch a single product by numeric ID. Raises if not found."""
+    return await products_cache.get(product_gid(product_id), lambda: _fetch_product(product_id))
+
+
+async def _fetch_product(product_id: int) -> ProductsGetProductsNodes:
     result = await shopify.products_get(query=f"id:{product_id}", first=1)
     if not result.products.nodes:
         raise ValueError(f"Product not found: {product_id}")
@@ -6,7 +6,7 @@ from typing import ClassVar, Self
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
-from core.clients import shopify
+from core.clients import orders_cache, shopify
 from lib.clients.shopify.generated.enums import OrderTransactionKind, OrderTransactionStatus
 from lib.clients.shopify.generated.fragments import Order, OrderRefunds
 from lib.clients.shopify.generated.input_types import (
@@ -19,6 +19,8 @@ from lib.clients.shopify.generated.input_types import (
 from lib.clients.shopify.generated.products_get import ProductsGetProductsNodes
 from lib.clients.shopify.generated.refund_create import RefundCreate
 from lib.clients.shopify.exceptions import ShopifyUserError
+from modules.orders.orders_service import order_gid
+from modules.products.products_service import get_product
 from modules.refunds.refunds_models import (
     RefundApproval,
     RefundBaseModel,
@@ -87,7 +89,7 @@ async def evaluate_refund_request(
         raise ValueError("invalid")
 
     product_id = int(order.line_items.nodes[0].product.id.split("/")[-1])
-    product = (await shopify.products_get(query=f"id:{product_id}", first=1)).products.nodes[0]
+    product = await get_product(product_id)
     return RefundBreakdown.estimate(order, request_details, product)
 
 
@@ -119,6 +121,7 @@ async def refund_order(
     )
 
     result = await shopify.refund_create(input=refund_input, idempotency_key=str(uuid4()))
+    await orders_cache.invalidate(order_gid(order_id))
     user_errors = result.refund_create.user_errors if result.refund_create else []
     if user_errors:
         raise ShopifyUserError(
@@ -1,22 +1,25 @@
 """
 Shopify Webhooks Router
 
-Handles incoming Shopify webhooks for product changes (especially inventory updates)
+Handles incoming Shopify webhooks for product changes (especially inventory updates).
+Deliveries are verified, then handed to ``WebhookIngestor`` and acked at once;
+the work runs on its worker pool (see ``modules/services/webhooks/ingestion.py``).
+
+main.py serves these paths from ``routes.py``; both share the one controller
+and ingestor in ``core/clients.py``, which ``lifespan`` drains on shutdown.
 """
 
-import json
 import logging
 
 from fastapi import APIRouter, Request, HTTPException
 
-from controllers.webhooks import ShopifyWebhooksController
+from core.clients import webhook_ingestor as _ingestor
+from core.clients import webhooks_controller as _controller
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/webhooks/shopify", tags=["shopify-webhooks"])
 
-_controller = ShopifyWebhooksController()
-
 # =============================================================================
 # SHOPIFY WEBHOOKS (BEGIN)
 # =============================================================================
@@ -35,27 +38,17 @@ def _require_topic(*, actual: str, expected: str, kind: str) -> None:
         raise HTTPException(status_code=409, detail=f"Unexpected x-shopify-topic for {kind}: {actual}")
 
 
-def _log_webhook_request(headers: dict[str, str], body: bytes, *, kind: str) -> None:
-    try:
-        parsed_body = json.loads(body.decode("utf-8"))
-        request = {"kind": kind, "headers": headers, "body": parsed_body}
-
-        logger.info("SHOPIFY WEBHOOK RECEIVED")
-        logger.info(json.dumps(request, indent=2, ensure_ascii=False))
-    except Exception:
-        logger.info("SHOPIFY_WEBHOOK kind=%s headers=%s", kind, json.dumps(headers, indent=2, ensure_ascii=False, sort_keys=True))
-        logger.info("SHOPIFY_WEBHOOK body_raw=%s", body.decode("utf-8", errors="replace"))
-
-
 @router.post("/products-update")
 async def handle_products_update(request: Request):
     headers = dict(request.headers)
     topic = _get_shopify_topic(headers)
     _require_topic(actual=topic, expected="products/update", kind="products-update")
     body = await request.body()
-    _log_webhook_request(headers, body, kind="products-update")
-    ok = _controller.handle_webhook_product_update(body=body, headers=headers)
-    return {"ok": ok}
+    _controller.verify(body=body, headers=headers)
+    status = _ingestor.submit(topic, headers, body)
+    if status == "rejected":
+        raise HTTPException(status_code=503, detail="Webhook queue is full")
+    return {"ok": True, "status": status}
 
 
 # =============================================================================
@@ -0,0 +1,208 @@
+"""
+Shopify webhook ingestion: ack fast, dedupe, coalesce, process on a bounded pool.
+
+Shopify retries any delivery that isn't acked within a few seconds and fires
+``products/update`` for every inventory change, so a registration opening turns
+into a burst of near-identical deliveries for the same few products. The
+router verifies the HMAC and hands the body to ``WebhookIngestor.submit``, which
+returns immediately:
+
+    duplicate   ``X-Shopify-Webhook-Id`` already accepted (a Shopify retry)
+    coalesced   folded into a pending job for the same product — the job keeps
+                the newest payload (by ``updated_at``) and runs once
+    queued      new job; coalescable topics wait ``coalesce_window`` seconds
+                first, everything else goes straight to the pool
+    rejected    more than ``max_pending`` jobs waiting — answer 503 so Shopify
+                retries later (the webhook id is not marked as seen)
+
+Jobs for the same key never run concurrently: a job that comes due while its
+predecessor is still running waits for it.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal
+
+logger = logging.getLogger(__name__)
+
+COALESCE_TOPICS = frozenset({"products/update"})
+
+SubmitStatus = Literal["queued", "coalesced", "duplicate", "rejected"]
+
+
+@dataclass
+class WebhookJob:
+    topic: str
+    key: str
+    payload: dict[str, Any]
+    webhook_ids: list[str] = field(default_factory=list)
+    received_at: float = 0.0
+
+    @property
+    def deliveries(self) -> int:
+        return len(self.webhook_ids)
+
+    def absorb(self, payload: dict[str, Any], webhook_id: str) -> None:
+        """Fold a later delivery in, keeping whichever payload Shopify updated last."""
+        self.webhook_ids.append(webhook_id)
+        if str(payload.get("updated_at") or "") >= str(self.payload.get("updated_at") or ""):
+            self.payload = payload
+
+
+class WebhookDeduper:
+    """Webhook ids seen in the last ``ttl`` seconds, capped at ``maxsize`` entries."""
+
+    def __init__(self, ttl: float = 3600.0, maxsize: int = 50_000, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._seen: OrderedDict[str, float] = OrderedDict()
+
+    def _expire(self) -> None:
+        cutoff = self._clock() - self.ttl
+        while self._seen and (next(iter(self._seen.values())) < cutoff or len(self._seen) > self.maxsize):
+            self._seen.popitem(last=False)
+
+    def seen(self, webhook_id: str) -> bool:
+        self._expire()
+        return webhook_id in self._seen
+
+    def add(self, webhook_id: str) -> None:
+        self._seen[webhook_id] = self._clock()
+        self._seen.move_to_end(webhook_id)
+
+
+def _coalesce_key(topic: str, headers: dict[str, str], payload: dict[str, Any]) -> str | None:
+    product_id = headers.get("x-shopify-product-id") or payload.get("id")
+    return f"{topic}:{product_id}" if product_id else None
+
+
+class WebhookIngestor:
+    """Accepts verified webhook deliveries and runs one handler call per job."""
+
+    def __init__(
+        self,
+        handlers: dict[str, Callable[[WebhookJob], Any]],
+        *,
+        max_workers: int = 4,
+        coalesce_window: float = 2.0,
+        coalesce_topics: frozenset[str] = COALESCE_TOPICS,
+        max_pending: int = 1000,
+        deduper: WebhookDeduper | None = None,
+    ):
+        self.handlers = handlers
+        self.coalesce_window = coalesce_window
+        self.coalesce_topics = coalesce_topics
+        self.max_pending = max_pending
+        self.deduper = deduper or WebhookDeduper()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="shopify-webhook")
+        self._lock = threading.Lock()
+        self._pending: dict[str, WebhookJob] = {}  # waiting out the coalesce window, or for their key
+        self._timers: dict[str, threading.Timer] = {}
+        self._running: set[str] = set()
+        self._futures: set[Future] = set()
+        self.stats: dict[str, int] = {
+            "received": 0, "duplicate": 0, "coalesced": 0, "rejected": 0, "processed": 0, "failed": 0,
+        }
+
+    def submit(self, topic: str, headers: dict[str, str], body: bytes) -> SubmitStatus:
+        headers = {k.lower(): v for k, v in headers.items()}
+        webhook_id = headers.get("x-shopify-webhook-id") or headers.get("x-shopify-event-id") or ""
+        payload = json.loads(body or b"{}")
+        key = _coalesce_key(topic, headers, payload) if topic in self.coalesce_topics else None
+
+        with self._lock:
+            self.stats["received"] += 1
+            if webhook_id and self.deduper.seen(webhook_id):
+                status: SubmitStatus = "duplicate"
+            elif key is not None and key in self._pending:
+                self._pending[key].absorb(payload, webhook_id)
+                status = "coalesced"
+            elif len(self._pending) + len(self._running) >= self.max_pending:
+                status = "rejected"
+            else:
+                job = WebhookJob(
+                    topic=topic, key=key or webhook_id or f"{topic}:{time.monotonic_ns()}", payload=payload,
+                    webhook_ids=[webhook_id], received_at=time.monotonic(),
+                )
+                if key is None:
+                    self._start(job)
+                else:
+                    self._pending[key] = job
+                    self._schedule(key, self.coalesce_window)
+                status = "queued"
+            if webhook_id and status in ("queued", "coalesced"):
+                self.deduper.add(webhook_id)
+            if status != "queued":
+                self.stats[status] += 1
+
+        logger.info("SHOPIFY_WEBHOOK topic=%s id=%s key=%s status=%s", topic, webhook_id, key, status)
+        return status
+
+    def _schedule(self, key: str, delay: float) -> None:
+        timer = threading.Timer(delay, self._due, args=(key,))
+        timer.daemon = True
+        self._timers[key] = timer
+        timer.start()
+
+    def _due(self, key: str) -> None:
+        with self._lock:
+            self._timers.pop(key, None)
+            if key in self._running or key not in self._pending:
+                return  # _run starts it when the running job for this key finishes
+            self._start(self._pending.pop(key))
+
+    def _start(self, job: WebhookJob) -> None:
+        """Hand ``job`` to the pool. Caller holds the lock."""
+        self._running.add(job.key)
+        future = self._executor.submit(self._run, job)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+
+    def _run(self, job: WebhookJob) -> None:
+        started = time.monotonic()
+        handler = self.handlers.get(job.topic)
+        try:
+            if handler is not None:
+                handler(job)
+            outcome = "processed"
+        except Exception:  # noqa: BLE001 — one bad job shouldn't stop the pool
+            logger.exception("SHOPIFY_WEBHOOK topic=%s key=%s job_failed", job.topic, job.key)
+            outcome = "failed"
+        logger.info(
+            "SHOPIFY_WEBHOOK topic=%s key=%s deliveries=%d wait_ms=%d run_ms=%d %s",
+            job.topic, job.key, job.deliveries,
+            (started - job.received_at) * 1000, (time.monotonic() - started) * 1000, outcome,
+        )
+        with self._lock:
+            self.stats[outcome] += 1
+            self._running.discard(job.key)
+            if job.key in self._pending and job.key not in self._timers:
+                self._start(self._pending.pop(job.key))
+
+    def drain(self, timeout: float = 30.0) -> None:
+        """Start every pending job now and wait for the pool to go idle."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                for key, timer in list(self._timers.items()):
+                    timer.cancel()
+                    self._timers.pop(key)
+                    if key not in self._running:
+                        self._start(self._pending.pop(key))
+                futures = list(self._futures)
+                idle = not futures and not self._pending
+            if idle:
+                return
+            for future in futures:
+                future.exception(timeout=max(0.0, deadline - time.monotonic()))
+        raise TimeoutError("webhook jobs still running")
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        self.drain(timeout)
+        self._executor.shutdown(wait=True)
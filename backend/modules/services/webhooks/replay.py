@@ -0,0 +1,99 @@
+"""
+Replay benchmark for ``WebhookIngestor`` driven by the repo's sample webhooks.
+
+Simulates a registration-opening burst: every ``sample_shopify_webhook_*.json``
+at the repo root is delivered ``copies`` times. ``products/update`` copies get
+fresh webhook ids (one delivery per inventory change); other topics reuse
+theirs (Shopify retries). The handler sleeps ``handler_ms`` to stand in for
+image-swap / inventory work.
+
+    cd backend && python -m modules.services.webhooks.replay --copies 50 --window 0.5 --handler-ms 50
+
+Reports ack latency (what Shopify waits on) and handler calls vs deliveries.
+"""
+
+import argparse
+import json
+import statistics
+import time
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from modules.services.webhooks.ingestion import WebhookIngestor, WebhookJob
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+
+def load_samples(root: Path = REPO_ROOT) -> list[tuple[str, dict[str, str], bytes]]:
+    """(topic, headers, raw body) for each sample file, sorted by file name."""
+    samples = []
+    for path in sorted(root.glob("sample_shopify_webhook_*.json")):
+        data = json.loads(path.read_text())
+        headers = {k.lower(): str(v) for k, v in data["headers"].items()}
+        samples.append((headers["x-shopify-topic"], headers, json.dumps(data["body"]).encode()))
+    return samples
+
+
+def burst(samples: list[tuple[str, dict[str, str], bytes]], copies: int) -> Iterator[tuple[str, dict[str, str], bytes]]:
+    """Interleave ``copies`` deliveries of every sample, as a burst arrives."""
+    for _ in range(copies):
+        for topic, headers, body in samples:
+            if topic in ("products/update",):
+                headers = {**headers, "x-shopify-webhook-id": str(uuid.uuid4())}
+            yield topic, headers, body
+
+
+def replay(
+    samples: list[tuple[str, dict[str, str], bytes]],
+    *,
+    copies: int = 20,
+    window: float = 0.5,
+    handler_ms: float = 0.0,
+    max_workers: int = 4,
+) -> dict[str, Any]:
+    calls: list[WebhookJob] = []
+
+    def handler(job: WebhookJob) -> None:
+        calls.append(job)
+        time.sleep(handler_ms / 1000)
+
+    topics = {topic for topic, _, _ in samples}
+    ingestor = WebhookIngestor(
+        {topic: handler for topic in topics}, coalesce_window=window, max_workers=max_workers
+    )
+    acks: list[float] = []
+    started = time.perf_counter()
+    for topic, headers, body in burst(samples, copies):
+        t0 = time.perf_counter()
+        ingestor.submit(topic, headers, body)
+        acks.append((time.perf_counter() - t0) * 1000)
+    ingestor.shutdown()
+    acks.sort()
+    return {
+        **ingestor.stats,
+        "deliveries": len(acks),
+        "handler_calls": len(calls),
+        "ack_p50_ms": round(statistics.median(acks), 3),
+        "ack_p99_ms": round(acks[int(len(acks) * 0.99) - 1], 3),
+        "elapsed_s": round(time.perf_counter() - started, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--copies", type=int, default=20)
+    parser.add_argument("--window", type=float, default=0.5)
+    parser.add_argument("--handler-ms", type=float, default=50.0)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+    result = replay(
+        load_samples(), copies=args.copies, window=args.window,
+        handler_ms=args.handler_ms, max_workers=args.workers,
+    )
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
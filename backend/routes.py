@@ -6,9 +6,13 @@ exception handler in ``main.py`` (see ``core/api_errors.py``).
 """
 
 
+import hmac
 from typing import Annotated
 
-from fastapi import APIRouter, Response, Path, Body, Query, Depends, HTTPException
+from fastapi import APIRouter, Response, Path, Body, Query, Depends, HTTPException, Header, Request
+
+from core.clients import order_numbers_cache, orders_cache, products_cache, webhook_ingestor, webhooks_controller
+from core.config import settings
 
 from modules.orders import (
     CancelOrderRequest,
@@ -66,9 +70,11 @@ router_main = APIRouter()
 async def existing_order(order_number: int) -> Order:
     """Resolve an Order by its customer-facing order number.
 
+    Reads from Shopify, not the cache: refund validation checks the order's
+    refunds and ``cancelled_at``, which may have changed since it was cached.
     Raises 404 unless the lookup returns exactly one order.
     """
-    orders = await find_orders(order_number)
+    orders = await find_orders(order_number, fresh=True)
     if len(orders) != 1:
         raise HTTPException(
             status_code=404,
@@ -151,6 +157,51 @@ async def approve_refund_request(
 #     return Response(status_code=204)
 
 
+# ── Shopify webhooks ─────────────────────────────────────────────────────────
+# Verified, then acked at once: ``webhook_ingestor`` (core/clients.py) dedupes
+# retries, coalesces products/update bursts and invalidates the cached
+# order/product on its worker pool.
+
+async def ingest_webhook(request: Request, topic: str) -> dict[str, str | bool]:
+    """Verify the HMAC (401 on mismatch) and queue the delivery; 503 when the queue is full."""
+    body = await request.body()
+    headers = dict(request.headers)
+    webhooks_controller.verify(body=body, headers=headers)
+    status = webhook_ingestor.submit(topic, headers, body)
+    if status == "rejected":
+        raise HTTPException(status_code=503, detail="Webhook queue is full")
+    return {"ok": True, "status": status}
+
+
+webhooks = APIRouter(prefix="/webhooks/shopify", tags=["webhooks"])
+
+
+@webhooks.post("/orders-update")
+async def orders_updated(request: Request):
+    return await ingest_webhook(request, "orders/updated")
+
+
+@webhooks.post("/products-update")
+async def products_updated(request: Request):
+    return await ingest_webhook(request, "products/update")
+
+
+# ── Cache ────────────────────────────────────────────────────────────────────
+
+async def require_api_key(x_api_key: Annotated[str, Header()] = "") -> None:
+    """Internal endpoints only. Raises PermissionError (403) unless ``X-API-Key`` matches ``APP__API_KEY``."""
+    if not settings.api_key or not hmac.compare_digest(x_api_key, settings.api_key):
+        raise PermissionError("Invalid API key")
+
+
+cache = APIRouter(prefix="/cache", tags=["cache"], dependencies=[Depends(require_api_key)])
+
+
+@cache.get("/stats")
+async def cache_stats():
+    return [c.snapshot() for c in (orders_cache, products_cache, order_numbers_cache)]
+
+
 # ── Waitlists ────────────────────────────────────────────────────────────────
 
 # waitlists = APIRouter(prefix="/waitlists", tags=["waitlists"])
@@ -181,4 +232,6 @@ async def approve_refund_request(
 # router_main.include_router(products)
 router_main.include_router(orders)
 router_main.include_router(refunds)
+router_main.include_router(webhooks)
+router_main.include_router(cache)
 # router_main.include_router(waitlists)
@@ -0,0 +1,96 @@
+"""Tests for lib.utils.spreadsheets.streaming and the keyed diff behind compare_csvs."""
+
+import asyncio
+import csv
+import io
+
+import httpx
+import pytest
+from lib.utils.spreadsheets.helpers import compare_csvs
+from lib.utils.spreadsheets.streaming import (
+    aiter_csv_rows,
+    aiter_download,
+    diff_csv_stream,
+    spool_csv,
+)
+
+SHEET_HEADERS = ["Order Number", "Name", "Total Price"]
+SHEET_ROWS = [
+    {"Order Number": "1001", "Name": "Ada", "Total Price": "$100"},
+    {"Order Number": "1002", "Name": "Grace", "Total Price": "50"},
+    {"Order Number": "1003", "Name": "Linus", "Total Price": "25.00"},
+]
+UPLOAD = (
+    'Order Number,Name,Total Price\r\n'
+    '1001,Ada,100.00\r\n'
+    '1002,"Hopper, Grace\nMultiline",50\r\n'
+    '1004,Ken,10\r\n'
+).encode("utf-8-sig")
+
+
+async def _chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def _collect(aiter):
+    return [item async for item in aiter]
+
+
+def _rows_of(data: bytes):
+    return aiter_csv_rows(_chunked(data, 5))
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 4096])
+def test_rows_survive_any_chunking(size):
+    rows = asyncio.run(_collect(aiter_csv_rows(_chunked(UPLOAD, size))))
+    assert rows == list(csv.reader(io.StringIO(UPLOAD.decode("utf-8-sig"))))
+    assert rows[2][1] == "Hopper, Grace\nMultiline"
+
+
+def test_diff_stream_against_target_sheet():
+    result = asyncio.run(diff_csv_stream(_rows_of(UPLOAD), SHEET_HEADERS, SHEET_ROWS))
+
+    assert result["file2_rows"] == 3
+    assert result["row_breakdown"] == {"1002": 1, "1003": 3, "1004": 3}
+    missing = {d["order_id"]: d for d in result["differences"] if d["type"] == "missing_order"}
+    assert missing["1003"]["file2_value"] == "<missing>"
+    assert missing["1004"]["file1_value"] == "<missing>"
+
+
+def test_compare_csvs_streams_second_file(tmp_path):
+    a, b = tmp_path / "a.csv", tmp_path / "b.csv"
+    a.write_text("Order Number,Name\n1,Ada\n2,Grace\n")
+    b.write_text("Order Number,Name\n1,Ada\n\n2,Hopper\n2,Grace\n,nobody\n")
+
+    result = compare_csvs(str(a), str(b))
+
+    assert result["total_differences"] == 0  # the later duplicate row for #2 wins
+    assert result["file2_rows"] == 4
+    assert result["file2_missing_keys"] == ["Row 5"]
+
+
+def test_spool_writes_file_and_reports_progress(tmp_path):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=UPLOAD))
+    seen = []
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            with open(tmp_path / "up.csv", "wb") as sink:
+                return await spool_csv("https://files.slack.test/up.csv", sink, client=client, on_progress=seen.append)
+
+    progress = asyncio.run(run())
+    assert (tmp_path / "up.csv").read_bytes() == UPLOAD
+    assert progress.rows == 4 and progress.bytes_read == len(UPLOAD)
+    assert seen and seen[-1].rows == 4
+
+
+def test_download_raises_on_error_status():
+    transport = httpx.MockTransport(lambda request: httpx.Response(403))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            await _collect(aiter_download(client, "https://files.slack.test/x.csv"))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
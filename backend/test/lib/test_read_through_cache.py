@@ -0,0 +1,152 @@
+"""Tests for lib.utils.read_through_cache.
+
+Covers:
+- fresh hits, LRU eviction and hit/miss counters
+- concurrent misses share one load; failed loads aren't cached
+- stale-while-revalidate serves the old value and refreshes once in the background
+- invalidation during an in-flight load keeps the load's result out of the cache
+- a shared backend round-trips pydantic models between instances
+"""
+
+import asyncio
+
+import pytest
+from lib.utils.read_through_cache import ReadThroughCache
+from pydantic import BaseModel, Field
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Loader:
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"v{self.calls}"
+
+
+class MemoryBackend:
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def aclose(self):
+        pass
+
+
+def _cache(**kwargs) -> tuple[ReadThroughCache, Clock]:
+    clock = Clock()
+    return ReadThroughCache("t", fresh_ttl=10, stale_ttl=100, clock=clock, **kwargs), clock
+
+
+def test_hits_evictions_and_counters():
+    async def run():
+        cache, _ = _cache(maxsize=2)
+        load = Loader()
+        assert await cache.get("a", load) == "v1"
+        assert await cache.get("a", load) == "v1"
+        await cache.get("b", load)
+        await cache.get("c", load)  # evicts "a"
+        assert await cache.get("a", load) == "v4"
+        return cache.snapshot()
+
+    stats = asyncio.run(run())
+    assert stats["hits"] == 1 and stats["misses"] == 4 and stats["loads"] == 4
+    assert stats["evictions"] == 2 and stats["size"] == 2
+    assert stats["hit_ratio"] == 0.2
+
+
+def test_concurrent_misses_share_one_load_and_errors_are_not_cached():
+    async def run():
+        cache, _ = _cache()
+        load = Loader(delay=0.01)
+        results = await asyncio.gather(*(cache.get("a", load) for _ in range(5)))
+
+        async def boom():
+            raise ValueError("Order not found")
+
+        with pytest.raises(ValueError):
+            await cache.get("missing", boom)
+        assert await cache.get("missing", Loader()) == "v1"
+        return results, load.calls, cache.stats["load_errors"]
+
+    results, calls, errors = asyncio.run(run())
+    assert results == ["v1"] * 5 and calls == 1 and errors == 1
+
+
+def test_stale_while_revalidate():
+    async def run():
+        cache, clock = _cache()
+        load = Loader(delay=0.01)
+        await cache.get("a", load)
+        clock.now += 50  # stale, within stale_ttl
+        stale = [await cache.get("a", load), await cache.get("a", load)]
+        await asyncio.sleep(0.05)  # background refresh lands
+        fresh = await cache.get("a", load)
+        clock.now += 500  # past stale_ttl: a plain miss
+        expired = await cache.get("a", load)
+        return stale, fresh, expired, cache.stats
+
+    stale, fresh, expired, stats = asyncio.run(run())
+    assert stale == ["v1", "v1"] and fresh == "v2" and expired == "v3"
+    assert stats["stale_hits"] == 2 and stats["refreshes"] == 1
+
+
+def test_invalidation_during_load_is_not_overwritten():
+    async def run():
+        cache, _ = _cache()
+        load = Loader(delay=0.02)
+        pending = asyncio.create_task(cache.get("a", load))
+        await asyncio.sleep(0.005)
+        assert await cache.invalidate("a") is False
+        assert await pending == "v1"  # the waiter still gets its answer
+        return await cache.get("a", load)
+
+    assert asyncio.run(run()) == "v2"
+
+
+class Product(BaseModel):
+    id: str
+    title: str
+    important_dates: str | None = Field(default=None, alias="importantDates")
+
+
+def test_shared_backend_round_trips_models():
+    async def run():
+        backend = MemoryBackend()
+        clock = Clock()
+        first = ReadThroughCache("products", model=Product, backend=backend, clock=clock)
+        second = ReadThroughCache("products", model=Product, backend=backend, clock=clock)
+        product = Product(id="gid://shopify/Product/1", title="Kickball", importantDates="x")
+
+        async def load():
+            return product
+
+        async def unreachable():
+            raise AssertionError("should come from the shared backend")
+
+        await first.get(product.id, load)
+        from_shared = await second.get(product.id, unreachable)
+        await first.invalidate(product.id)
+        return from_shared, backend.data, second.stats["shared_hits"]
+
+    from_shared, data, shared_hits = asyncio.run(run())
+    assert from_shared.important_dates == "x" and shared_hits == 1
+    assert data == {}
@@ -30,6 +30,7 @@ from shared_utilities.clients.slack.client import (
     SlackApiSuccessResponse,
     SlackApiErrorResponse,
 )
+from shared_utilities.clients.slack.directory import reset_directories
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
@@ -49,6 +50,14 @@ def mock_env(monkeypatch):
     monkeypatch.setenv("SLACK__LEADERSHIP_BOT__CHANNEL_ID", "C11111")
 
 
+@pytest.fixture(autouse=True)
+def fresh_directories():
+    """Directory caches are shared per token — don't leak them between tests."""
+    reset_directories()
+    yield
+    reset_directories()
+
+
 @pytest.fixture
 def slack_client():
     """Create a SlackClient with mocked WebClient methods."""
@@ -678,12 +687,26 @@ class TestSlackBot:
             {"id": "C12345", "name": "general", "is_archived": False},
             {"id": "C67890", "name": "random", "is_archived": False},
         ]
+        mock_response = {"ok": True, "channels": mock_channels, "response_metadata": {"next_cursor": ""}}
 
-        with patch.object(bot, "_list_all_channels", return_value=mock_channels):
+        with patch.object(bot.client, "conversations_list", return_value=mock_response) as mock_list:
             result = bot.lookup_channel("#general")
+            again = bot.lookup_channel("random")
 
             assert result["id"] == "C12345"
             assert result["name"] == "general"
+            assert again["id"] == "C67890"
+            # Second lookup is served from the directory cache
+            assert mock_list.call_count == 1
+
+    def test_slackbot_lookup_channel_skips_archived(self, mock_env):
+        """Test SlackBot.lookup_channel() doesn't resolve a name to an archived channel."""
+        bot = SlackBot(Bots.Web)
+        mock_channels = [{"id": "C12345", "name": "old-league", "is_archived": True}]
+        mock_response = {"ok": True, "channels": mock_channels, "response_metadata": {"next_cursor": ""}}
+
+        with patch.object(bot.client, "conversations_list", return_value=mock_response):
+            assert bot.lookup_channel("#old-league") is None
 
     def test_slackbot_lookup_group_by_id(self, mock_env):
         """Test SlackBot.lookup_group() with usergroup ID."""
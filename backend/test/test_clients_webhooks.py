@@ -0,0 +1,95 @@
+"""
+Tests for the Shopify webhook wiring and lifespan hooks in core/clients.py.
+
+Covers:
+- a products/update delivery runs through ``webhook_ingestor`` and invalidates
+  the cached product on the app's event loop
+- a retried delivery is deduped and doesn't invalidate again
+- lifespan shutdown runs jobs still waiting out the coalesce window
+- the controller verifies with the configured webhook secret
+- startup/shutdown hooks run in order, and a failing hook doesn't stop the rest
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+
+import pytest
+from fastapi import HTTPException
+
+for _key, _value in {
+    "APP__ENVIRONMENT": "test",
+    "APP__VERBOSITY": "INFO",
+    "SHOPIFY__API_VERSION": "2026-07",
+    "SHOPIFY__STORE_ID": "test-store",
+    "SHOPIFY__LOCATION_ID": "1",
+    "SHOPIFY__SHOP_ID": "1",
+    "SHOPIFY__ADMIN_TOKEN": "test",
+    "SHOPIFY__LOCKSMITH_TOKEN": "test",
+    "SHOPIFY__WEBHOOK_SECRET": "test-secret",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+from core import clients  # noqa: E402
+from core.config import shopify_config  # noqa: E402
+
+GID = "gid://shopify/Product/7461773082718"
+
+
+def _delivery(webhook_id: str) -> tuple[dict[str, str], bytes]:
+    body = json.dumps({"id": 7461773082718, "admin_graphql_api_id": GID}).encode()
+    return {"X-Shopify-Webhook-Id": webhook_id, "X-Shopify-Product-Id": "7461773082718"}, body
+
+
+def test_product_update_invalidates_through_the_ingestor_and_lifespan_drains_it(monkeypatch):
+    processed = []
+    monkeypatch.setattr(clients.webhooks_controller, "process_product_update", processed.append)
+
+    async def run():
+        async with clients.lifespan(None):
+            await clients.products_cache.put(GID, "cached")  # type: ignore[arg-type]
+            statuses = [
+                clients.webhook_ingestor.submit("products/update", *_delivery("w-1")),
+                clients.webhook_ingestor.submit("products/update", *_delivery("w-1")),  # Shopify retry
+            ]
+        # Shutdown ran the job still waiting out its coalesce window.
+        return statuses, clients.products_cache.snapshot()
+
+    statuses, stats = asyncio.run(run())
+    assert statuses == ["queued", "duplicate"]
+    assert stats["invalidations"] == 1 and stats["size"] == 0
+    assert [job.payload["admin_graphql_api_id"] for job in processed] == [GID]
+    assert clients.webhook_ingestor.stats["processed"] == 1
+
+
+def test_controller_verifies_with_configured_secret():
+    headers, body = _delivery("w-2")
+    signature = base64.b64encode(hmac.new(shopify_config.webhook_secret.encode(), body, hashlib.sha256).digest()).decode()
+
+    clients.webhooks_controller.verify(body=body, headers={"x-shopify-hmac-sha256": signature})
+    with pytest.raises(HTTPException) as exc:
+        clients.webhooks_controller.verify(body=body, headers={"x-shopify-hmac-sha256": "bad"})
+    assert exc.value.status_code == 401
+
+
+def test_lifespan_runs_hooks_and_logs_failures(monkeypatch):
+    calls = []
+
+    async def hook(name):
+        calls.append(name)
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(clients, "startup_hooks", [broken, lambda: hook("warm")])
+    monkeypatch.setattr(clients, "shutdown_hooks", [lambda: hook("stop"), broken])
+
+    async def run():
+        async with clients.lifespan(None):
+            calls.append("serving")
+
+    asyncio.run(run())
+    assert calls == ["warm", "serving", "stop"]
@@ -0,0 +1,119 @@
+"""Quota pacing and rate-limit classification for concurrent Google API calls.
+
+``GoogleClient.batch`` runs several 50-request batch chunks at once. Google
+counts every sub-request of a batch against the API's per-user quota, so chunks
+draw from a ``QuotaBudget`` — a token bucket per API sized in requests per
+minute — instead of sleeping a fixed second between chunks. A rate-limit
+response (429, or 403 ``rateLimitExceeded`` / ``userRateLimitExceeded``) halves
+the budget's rate; successful chunks grow it back.
+
+httplib2 connections are not thread-safe, so each worker thread executes with
+its own authorized ``Http`` (``thread_http``) built from the service's
+credentials.
+"""
+
+import json
+import random
+import threading
+import time
+from typing import Any, Callable
+
+import google_auth_httplib2
+import httplib2
+from googleapiclient.errors import HttpError
+
+# Conservative per-user requests/minute; override with GoogleClient(quotas=...).
+DEFAULT_QUOTAS: dict[str, float] = {
+    "sheets": 60,
+    "admin": 1500,
+    "drive": 1000,
+    "gmail": 250,
+}
+
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded", "quotaExceeded"})
+
+
+def is_rate_limited(error: BaseException | None) -> bool:
+    """429, or a 403 whose reason is one of Google's rate-limit reasons."""
+    if not isinstance(error, HttpError):
+        return False
+    status = getattr(error.resp, "status", None)
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    try:
+        details = json.loads(error.content.decode("utf-8")).get("error", {})
+    except (ValueError, AttributeError):
+        return False
+    reasons = {e.get("reason") for e in details.get("errors", [])}
+    return bool(reasons & RATE_LIMIT_REASONS)
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 32.0) -> float:
+    """Full-jitter exponential backoff for retry ``attempt`` (1-based)."""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class QuotaBudget:
+    """Token bucket in requests/minute, shared by every thread calling one API."""
+
+    def __init__(
+        self,
+        per_minute: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_rate = float(per_minute)
+        self.rate = self.max_rate
+        self._tokens = self.max_rate
+        self._last = clock()
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def acquire(self, n: int = 1) -> None:
+        """Block until ``n`` requests fit (a request larger than the bucket waits for a full one)."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate / 60.0)
+                self._last = now
+                need = min(float(n), self.rate)
+                if self._tokens >= need:
+                    self._tokens -= need
+                    return
+                wait = (need - self._tokens) * 60.0 / self.rate
+            self._sleep(wait)
+
+    def throttle(self) -> None:
+        """Rate-limited: halve the rate (never below 1/minute) and drop banked tokens."""
+        with self._lock:
+            self.rate = max(1.0, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def recover(self) -> None:
+        """A chunk went through cleanly: step back toward the configured rate."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+_local = threading.local()
+
+
+def thread_http(service: Any) -> Any:
+    """An authorized Http private to the calling thread, for ``service``'s credentials.
+
+    Returns None for services without credentials-backed transports (e.g. mocks),
+    meaning "use the service's own http".
+    """
+    credentials = getattr(getattr(service, "_http", None), "credentials", None)
+    if credentials is None:
+        return None
+    cache = getattr(_local, "http", None)
+    if cache is None:
+        cache = _local.http = {}
+    key = id(credentials)
+    if key not in cache:
+        cache[key] = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http(timeout=60))
+    return cache[key]
@@ -5,13 +5,14 @@ import logging
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from functools import cached_property
+from itertools import count
 from typing import Any, ClassVar
 
 import httpx as HX
 from anyio import CapacityLimiter
 from httpx_retries import Retry, RetryTransport
 
-from infrastructure.batch_run import BatchResults, BatchRun
+from infrastructure.batch_run import AdaptiveConcurrency, BatchResults, BatchRun, ConcurrencyControl, retry_after
 from infrastructure.clients.http.client_auth import BasicAuth, BearerAuth
 from infrastructure.clients.http.http_response import HttpResponse
 from infrastructure.base_types.http_methods import HttpMethod
@@ -70,6 +71,8 @@ class HttpClient:
     _http2: ClassVar[bool] = True
     _limits: ClassVar[HX.Limits] = HX.Limits(max_connections=250, max_keepalive_connections=250, keepalive_expiry=30)
     _retry: ClassVar[Retry] = Retry(total=5, backoff_factor=0.5)
+    # Adaptive batches must *see* 429/503 to steer the limit, so the transport leaves them alone.
+    _retry_adaptive: ClassVar[Retry] = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 504])
 
     base_url: str = field(default="", kw_only=True)
     auth: BasicAuth | BearerAuth | str | None = field(default=None, kw_only=True)
@@ -151,13 +154,20 @@ class HttpClient:
         *,
         max_concurrent: int = 20,
         is_fatal: Callable[[object], bool] = is_auth_failure,
+        concurrency: ConcurrencyControl | None = None,
     ) -> BatchResults:
         """Run ``method`` against ``url`` concurrently for every item, capped at ``max_concurrent``.
 
         Each ``BatchItemRequest`` carries per-item ``params``, ``body``, and ``auth`` overrides.
+        ``items`` is consumed lazily — pass a generator to keep large jobs out of memory.
         A shared ``AsyncClient`` is scoped to the batch duration for connection reuse.
         Returns bucketed ``BatchResults``; a 401/403 cancels all siblings by default.
+
+        Pass ``concurrency=AdaptiveConcurrency()`` instead of hand-tuning ``max_concurrent``:
+        the limit then tracks upstream latency and 429/503s, and overloaded requests are
+        retried by the batch (after any ``Retry-After``) rather than by the transport.
         """
+        adaptive = isinstance(concurrency, AdaptiveConcurrency)
         op = HttpBatchRun(
             method=method,
             url=url,
@@ -165,13 +175,15 @@ class HttpClient:
             timeout_s=self.timeout_s,
             transport=RetryTransport(
                 HX.AsyncHTTPTransport(http2=self._http2, limits=self._limits),
-                retry=self._retry,
+                retry=self._retry_adaptive if adaptive else self._retry,
             ),
             base_url=self.base_url,
             http2=self._http2,
             max_concurrent=max_concurrent,
-            pending=list(items),
+            items=items,
             results=BatchResults(is_fatal=is_fatal),
+            concurrency=concurrency,
+            overload_retries=self._retry.total if adaptive else 0,
         )
         asyncio.run(op.batch_and_run())
         return op.results
@@ -181,8 +193,10 @@ class HttpClient:
 class HttpBatchRun(BatchRun):
     """``BatchRun`` for HTTP batch calls. Scopes one ``AsyncClient`` across all items for connection reuse.
 
-    ``dispatch_task_group`` opens the client before the base schedules tasks.
-    ``process`` owns execution under the concurrency cap, capture, classification, and recording.
+    ``batch_and_run`` opens the client before the base starts feeding items.
+    ``process`` owns one request under the concurrency cap and returns the response (or the
+    exception); the base classifies and records it. With ``AdaptiveConcurrency``, a 429/503
+    is reported to the limiter and retried up to ``overload_retries`` times.
     """
 
     method: HttpMethod | str
@@ -192,6 +206,7 @@ class HttpBatchRun(BatchRun):
     transport: RetryTransport
     base_url: str
     http2: bool
+    overload_retries: int = field(default=0, kw_only=True)
     _ac: HX.AsyncClient | None = field(default=None, init=False, repr=False)
 
     async def batch_and_run(self) -> None:
@@ -200,25 +215,33 @@ class HttpBatchRun(BatchRun):
             self._ac = ac
             await super().batch_and_run()  # → build()
 
-    async def process(self, item: BatchItemRequest, limiter: CapacityLimiter, abort: Callable[[], None]) -> None:
+    async def process(self, item: BatchItemRequest, limiter: CapacityLimiter) -> HttpResponse | Exception:
         auth = item.auth if item.auth is not None else self.default_auth
         if isinstance(auth, str):
             auth = BearerAuth(auth)
         async with limiter:
-            try:
-                res = await self._ac.request(  # type: ignore[union-attr]
-                    self.method,
-                    self.url,
-                    auth=auth.convert() if auth else None,
-                    params=item.params,
-                    json=item.body,
-                    timeout=float(self.timeout_s or 7),
-                )
-                result: HttpResponse | Exception = HttpResponse(raw=res)
-            except Exception as exc:
-                result = exc
-        fatal = self.results.is_fatal(result)
-        self.pending.remove(item)
-        self.results.record(item, result, fatal=fatal)
-        if fatal:
-            abort()
+            for attempt in count():
+                try:
+                    res = await self._ac.request(  # type: ignore[union-attr]
+                        self.method,
+                        self.url,
+                        auth=auth.convert() if auth else None,
+                        params=item.params,
+                        json=item.body,
+                        timeout=float(self.timeout_s or 7),
+                    )
+                except Exception as exc:
+                    return exc
+                result = HttpResponse(raw=res)
+                control = self.concurrency
+                if (
+                    attempt >= self.overload_retries
+                    or not isinstance(control, AdaptiveConcurrency)
+                    or not control.is_overload(result)
+                ):
+                    return result
+                control.overload(result)
+                if retry_after(result) is None:
+                    await asyncio.sleep(0.5 * 2**attempt)
+                await control.paused()
+        raise RuntimeError("unreachable")
@@ -23,7 +23,8 @@ from pathlib import Path
 
 import dotenv
 
-from shop_client import ShopifyClient, schema
+from customer_tags import apply_tags, plan_tags
+from shop_client import ShopifyClient
 
 # shop_client does no I/O at import — consumer reads env + constructs client.
 dotenv.load_dotenv()
@@ -416,20 +417,10 @@ def main(dry_run: bool | None = None) -> None:
     print(f"🏷️  Tag to add: '{tag_to_add}'\n")
 
     print("🔍 Searching for customers in Shopify...")
-    found: list[dict] = []
-    not_found: list[str] = []
-    for email in unique_emails:
-        # connection search `email:foo@bar` can return near-matches; filter exact.
-        matches = client.run(
-            schema.customers.queries.by_email,
-            email=email,
-            returns=["id", "email", "tags"],
-        )
-        exact = next((m for m in matches if (m.email or "").lower() == email.lower()), None)
-        if exact:
-            found.append(exact)
-        else:
-            not_found.append(email)
+    # OR-joined email searches + aliased tagsAdd documents (customer_tags.py).
+    outcomes = plan_tags(client, unique_emails, tag_to_add)
+    found = [o for o in outcomes if o.status != "not_found"]
+    not_found = [o.email for o in outcomes if o.status == "not_found"]
 
     print(f"\n✅ Found {len(found)} customers in Shopify")
 
@@ -445,33 +436,24 @@ def main(dry_run: bool | None = None) -> None:
         print("\n❌ No customers found. Exiting.")
         sys.exit(0)
 
-    updates = []
-    for customer in found:
-        current_tags = list(customer.tags or [])
-        if tag_to_add in current_tags:
-            print(f"  ⏭️  {customer.email}: already has tag '{tag_to_add}'")
-            continue
-
-        new_tags = current_tags + [tag_to_add]
-        updates.append({
-            "id": customer.id,
-            "email": customer.email,
-            "tags": new_tags,
-        })
+    for o in found:
+        if o.status == "already_tagged":
+            print(f"  ⏭️  {o.email}: already has tag '{tag_to_add}'")
+    updates = [o for o in found if o.status == "would_tag"]
 
     if not updates:
         print("\n✅ All customers already have the tag. Nothing to update.")
         if _is_veteran_tag(tag_to_add):
-            all_emails = [c.email for c in found]
+            all_emails = [o.email for o in found]
             _prompt_send_veteran_emails(tag_to_add, all_emails, leadership_email)
         sys.exit(0)
 
     if dry_run:
         print(f"\n[DRY RUN] Would add tag '{tag_to_add}' to {len(updates)} customer(s):")
         for update in updates:
-            print(f"  - {update['email']}")
+            print(f"  - {update.email}")
         if _is_veteran_tag(tag_to_add):
-            would_email = [u["email"] for u in updates]
+            would_email = [u.email for u in updates]
             print(f"\n[DRY RUN] Would prompt to send veteran eligibility emails to {len(would_email)} recipient(s).")
             print(f"[DRY RUN] Leadership email: {leadership_email}")
             params = _parse_veteran_tag(tag_to_add)
@@ -485,35 +467,22 @@ def main(dry_run: bool | None = None) -> None:
         return
 
     print(f"\n🔄 Updating {len(updates)} customers...")
-    updated: list[str] = []
-    errors: list[str] = []
-    for u in updates:
-        try:
-            payload = client.run(
-                schema.customers.mutations.update,
-                id=u["id"],
-                tags=u["tags"],
-                returns=["customer.id", "customer.email"],
-            )
-            if payload.user_errors:
-                print(f"  ❌ {u['email']}: {list(payload.user_errors)}")
-                errors.append(u["email"])
-            else:
-                updated.append(u["email"])
-        except Exception as e:  # noqa: BLE001
-            print(f"  ❌ {u['email']}: {e}")
-            errors.append(u["email"])
+    apply_tags(client, outcomes, tag_to_add)
+    updated = [o.email for o in updates if o.status == "tagged"]
+    errors = [o for o in updates if o.status == "error"]
+    for o in errors:
+        print(f"  ❌ {o.email}: {o.detail}")
 
     print(f"\n✅ Successfully updated {len(updated)} customers")
     if errors:
         print(f"❌ Failed to update {len(errors)} customers:")
-        for email in errors:
-            print(f"  - {email}")
+        for o in errors:
+            print(f"  - {o.email}")
 
     if updated and _is_veteran_tag(tag_to_add):
         _prompt_send_veteran_emails(
             tag_to_add,
-            [c.email for c in found],
+            [o.email for o in found],
             leadership_email,
         )
 
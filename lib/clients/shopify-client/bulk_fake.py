@@ -0,0 +1,101 @@
+"""Local fake of Shopify's bulk endpoint, for exercising bulk_ops without a store.
+
+``FakeBulkShop`` stands in for ``ShopifyClient`` on the submit → poll path
+(``run`` answers the ``schema.bulk_operations`` ops) and serves the result
+JSONL from a throwaway HTTP server on 127.0.0.1, in small chunks, so
+``iter_jsonl`` streams it exactly as it would the real signed URL.
+
+    with FakeBulkShop(lines, polls_until_done=2) as shop:
+        records = list(bulk_ops.run(shop, BulkQuery(query, children), sleep=lambda _: None))
+        shop.submitted  # → [query]
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from shop_client import ShopifyClient, schema
+
+
+class FakeBulkShop:
+    """In-process bulk operation: CREATED → RUNNING × ``polls_until_done`` → ``final_status``."""
+
+    def __init__(
+        self,
+        lines: list[dict[str, Any]],
+        *,
+        polls_until_done: int = 1,
+        final_status: str = "COMPLETED",
+        error_code: str | None = None,
+        user_errors: list[dict[str, Any]] | None = None,
+        chunk_size: int = 64,
+    ):
+        self.body = "".join(json.dumps(line) + "\n" for line in lines).encode()
+        self.polls_until_done = polls_until_done
+        self.final_status = final_status
+        self.error_code = error_code
+        self.user_errors = user_errors or []
+        self.chunk_size = chunk_size
+        self.submitted: list[str] = []
+        self.polls = 0
+        self._server: ThreadingHTTPServer | None = None
+
+    # ── result file server ────────────────────────────────────────────────
+
+    def __enter__(self) -> "FakeBulkShop":
+        body, chunk_size = self.body, self.chunk_size
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 — http.server API
+                self.send_response(200)
+                self.send_header("Content-Type", "application/jsonl")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                for start in range(0, len(body), chunk_size):
+                    self.wfile.write(body[start : start + chunk_size])
+                    self.wfile.flush()
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("FakeBulkShop is not running — use it as a context manager")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/bulk-result.jsonl"
+
+    # ── ShopifyClient.run stand-in ────────────────────────────────────────
+
+    def _operation(self, status: str) -> dict[str, Any]:
+        done = status == "COMPLETED"
+        return {
+            "id": "gid://shopify/BulkOperation/1",
+            "status": status,
+            "errorCode": self.error_code if status in ("FAILED", "CANCELED", "EXPIRED") else None,
+            "url": self.url if done and self.body else None,
+            "objectCount": str(self.body.count(b"\n")) if done else "0",
+        }
+
+    def run(self, op: Any, **kwargs: Any) -> Any:
+        if op is schema.bulk_operations.mutations.run_query:
+            self.submitted.append(kwargs["query"])
+            if self.user_errors:
+                return ShopifyClient.boxify({"bulkOperation": None, "userErrors": self.user_errors})
+            return ShopifyClient.boxify({"bulkOperation": self._operation("CREATED"), "userErrors": []})
+        if op is schema.bulk_operations.queries.by_id:
+            self.polls += 1
+            status = "RUNNING" if self.polls <= self.polls_until_done else self.final_status
+            return ShopifyClient.boxify(self._operation(status))
+        raise NotImplementedError(f"FakeBulkShop does not answer {getattr(op, 'field', op)!r}")
@@ -0,0 +1,127 @@
+"""Bulk customer tagging: resolve many emails, add one tag, report per email.
+
+Two request shapes replace one-request-per-email:
+
+    lookup   ``customers`` search with OR-joined emails —
+             ``(email:"a@x.com" OR email:"b@y.com" OR …)`` — ``lookup_chunk``
+             emails per search, the searches streamed concurrently
+             (``ShopifyClient.stream`` ranges).
+    tagging  ``tagsAdd`` for every customer missing the tag, as aliased fields
+             of ``run_batch`` documents sized to the store's query-cost bucket.
+
+A season of ~2,000 veterans is ~40 searches plus ~40 mutation documents.
+
+    outcomes = tag_customers(client, emails, "2026-spring-dodgeball-monday-opendiv-veteran")
+    [o for o in outcomes if o.status == "not_found"]
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from shop_client import ShopifyClient, schema
+
+# Shopify charges 10 points per mutation field; aliased documents spend at most
+# this share of the bucket, leaving headroom for other clients of the store.
+MUTATION_FIELD_COST = 10
+BUDGET_SHARE = 0.5
+
+Status = Literal["tagged", "already_tagged", "not_found", "error", "would_tag"]
+
+
+@dataclass
+class TagOutcome:
+    email: str
+    status: Status
+    customer_id: str | None = None
+    detail: str = ""
+
+
+def _quote(value: str) -> str:
+    """A double-quoted search value; ``\\`` and ``"`` escaped so one address can't break the clause."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _email_clause(emails: list[str]) -> str:
+    return "(" + " OR ".join(f"email:{_quote(email)}" for email in emails) + ")"
+
+
+def find_customers(
+    client: ShopifyClient, emails: Iterable[str], *, lookup_chunk: int = 50, max_workers: int = 4
+) -> dict[str, Any]:
+    """Map lower-cased email → customer Box (``id``, ``email``, ``tags``) for every exact match.
+
+    Email search can return near-matches, so only exact (case-insensitive)
+    hits are kept; emails with no exact match are absent from the result.
+    """
+    wanted = list(dict.fromkeys(email.strip().lower() for email in emails if email.strip()))
+    if not wanted:
+        return {}
+    ranges = [_email_clause(wanted[i : i + lookup_chunk]) for i in range(0, len(wanted), lookup_chunk)]
+    targets = set(wanted)
+    found: dict[str, Any] = {}
+    for customer in client.stream(
+        schema.customers.queries.by_email,
+        ranges=ranges,
+        returns=["id", "email", "tags"],
+        page_size=250,
+        max_workers=max_workers,
+    ):
+        email = (customer.email or "").lower()
+        if email in targets:
+            found.setdefault(email, customer)
+    return found
+
+
+def mutation_chunk(client: ShopifyClient) -> int:
+    """Aliased mutation fields per document for this store's bucket size."""
+    return max(1, int(client.throttle.maximum_available * BUDGET_SHARE // MUTATION_FIELD_COST))
+
+
+def plan_tags(client: ShopifyClient, emails: Iterable[str], tag: str, *, lookup_chunk: int = 50) -> list[TagOutcome]:
+    """Look every email up and classify it; one outcome per distinct email, in input order.
+
+    Nothing is written: customers missing ``tag`` come back as ``would_tag``.
+    """
+    unique: dict[str, str] = {}  # lower-cased → first spelling seen
+    for email in emails:
+        if email.strip():
+            unique.setdefault(email.strip().lower(), email.strip())
+    found = find_customers(client, unique, lookup_chunk=lookup_chunk)
+    outcomes: list[TagOutcome] = []
+    for key, email in unique.items():
+        customer = found.get(key)
+        if customer is None:
+            outcomes.append(TagOutcome(email, "not_found"))
+        elif tag in (customer.tags or []):
+            outcomes.append(TagOutcome(email, "already_tagged", customer.id))
+        else:
+            outcomes.append(TagOutcome(email, "would_tag", customer.id))
+    return outcomes
+
+
+def apply_tags(client: ShopifyClient, outcomes: list[TagOutcome], tag: str) -> list[TagOutcome]:
+    """Add ``tag`` for every ``would_tag`` outcome, updating each to ``tagged`` or ``error`` in place."""
+    pending = [o for o in outcomes if o.status == "would_tag"]
+    chunk = mutation_chunk(client)
+    for start in range(0, len(pending), chunk):
+        batch = pending[start : start + chunk]
+        calls = [(schema.customers.mutations.add_tags, {"id": o.customer_id, "tags": [tag]}) for o in batch]
+        try:
+            payloads = client.run_batch(calls, chunk_size=chunk)
+        except Exception as e:  # noqa: BLE001 — one failed document shouldn't sink the rest
+            for outcome in batch:
+                outcome.status, outcome.detail = "error", str(e)
+            continue
+        for outcome, payload in zip(batch, payloads):
+            errors = [e.message for e in (payload.user_errors or [])] if payload else ["no payload returned"]
+            outcome.status, outcome.detail = ("error", "; ".join(errors)) if errors else ("tagged", "")
+    return outcomes
+
+
+def tag_customers(
+    client: ShopifyClient, emails: Iterable[str], tag: str, *, dry_run: bool = False, lookup_chunk: int = 50
+) -> list[TagOutcome]:
+    """``plan_tags`` then, unless ``dry_run``, ``apply_tags``."""
+    outcomes = plan_tags(client, emails, tag, lookup_chunk=lookup_chunk)
+    return outcomes if dry_run else apply_tags(client, outcomes, tag)
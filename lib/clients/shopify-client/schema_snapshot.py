@@ -0,0 +1,423 @@
+"""Pruned, JSON-serialized admin schema for fast cold starts.
+
+Why
+───
+``ShopifyClient`` used to unpickle the full ``2026-07.graphql.pickle`` admin
+schema (every type Shopify exposes) on first construction. Our ops touch a
+small corner of it, and the pickle is tied to graphql-core's internal AST
+classes (see the pin in pyproject.toml).
+
+What
+────
+    build  — prune the full schema to what the registered ``schema`` ops can
+             reach, serialize to ``2026-07.snapshot.json``
+    load   — rebuild a ``GraphQLSchema`` from the snapshot
+
+Pruning keeps:
+    · root types (QueryRoot / Mutation) with ONLY the fields some registered
+      op roots at
+    · every type reachable from those fields — return types, argument input
+      types, interfaces, union members — with all of its fields
+    · minus ``exclude_types`` from ``schema_filter_config.json``; fields,
+      union members and input fields that depend on an excluded type are
+      dropped with it (to a fixpoint, so the result is always a valid schema)
+    · except types a registered op selects (its node / payload type and every
+      type along its ``fields`` paths) — those are never excluded
+
+Snapshot format (compact JSON, no descriptions):
+    {"query": "QueryRoot", "mutation": "Mutation",
+     "directives": [[name, [locations], [[arg, type, default?], ...]], ...],
+     "types": {"Order": ["O", [[field, "Type!", [[arg, type, default?], ...]], ...], [interfaces]],
+               "OrderSortKeys": ["E", [values]], "Money": ["S"],
+               "Media": ["I", fields, interfaces], "SearchResult": ["U", [members]],
+               "RefundInput": ["N", [[field, type, default?], ...]]}}
+
+Type references are SDL strings (``"[Order!]!"``). Field maps are thunks and
+type references resolve through one shared cache, so loading is a single
+``json.loads`` plus one object per kept type/field.
+
+CLI:
+    python schema_snapshot.py build [--pickle PATH] [--out PATH]
+    python schema_snapshot.py bench [--pickle PATH] [--snapshot PATH]
+"""
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from graphql import (
+    DirectiveLocation,
+    GraphQLArgument,
+    GraphQLDirective,
+    GraphQLEnumType,
+    GraphQLEnumValue,
+    GraphQLField,
+    GraphQLInputField,
+    GraphQLInputObjectType,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLUnionType,
+    Undefined,
+    get_named_type,
+    is_enum_type,
+    is_input_object_type,
+    is_interface_type,
+    is_object_type,
+    is_scalar_type,
+    is_specified_directive,
+    is_specified_scalar_type,
+    is_union_type,
+    specified_directives,
+    specified_scalar_types,
+)
+
+SNAPSHOT_PATH = Path(__file__).parent / "2026-07.snapshot.json"
+FILTER_CONFIG_PATH = Path(__file__).parent / "schema_filter_config.json"
+
+# Default values survive the round-trip only when JSON can carry them as-is.
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def load_exclude_types(path: Path = FILTER_CONFIG_PATH) -> set[str]:
+    """Type names ``schema_filter_config.json`` lists under ``exclude_types``."""
+    if not path.exists():
+        return set()
+    return set(json.loads(path.read_text()).get("exclude_types", []))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Build: full GraphQLSchema + registry → pruned snapshot dict.
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def root_fields(gql_schema: GraphQLSchema, registry: Any) -> dict[str, set[str]]:
+    """``{root type name: {field names}}`` for every op in the ``schema`` registry."""
+    from gql.dsl import DSLSchema
+
+    ds = DSLSchema(gql_schema)
+    roots: dict[str, set[str]] = {}
+    for resource in registry.values():
+        for op in [*resource.queries.values(), *resource.mutations.values()]:
+            dsl_field = op.root(ds)
+            roots.setdefault(dsl_field.parent_type.name, set()).add(dsl_field.ast_field.name.value)
+    return roots
+
+
+def selected_types(gql_schema: GraphQLSchema, registry: Any) -> set[str]:
+    """Names of the types every registered op's default selection passes through."""
+    from gql.dsl import DSLSchema
+    from gql.utils import to_camel_case
+
+    ds = DSLSchema(gql_schema)
+    names: set[str] = set()
+    for resource in registry.values():
+        for op in [*resource.queries.values(), *resource.mutations.values()]:
+            start = op.payload(ds) if hasattr(op, "payload") else op.dsl_type(ds)
+            names.update((get_named_type(op.root(ds).field.type).name, start._type.name))
+            for path in op.fields:
+                parent: Any = start._type
+                for part in path.split("."):
+                    field = getattr(parent, "fields", {}).get(to_camel_case(part))
+                    if field is None:
+                        break
+                    parent = get_named_type(field.type)
+                    names.add(parent.name)
+    return names
+
+
+def _field_types(field: Any) -> Iterable[GraphQLNamedType]:
+    yield get_named_type(field.type)
+    for arg in getattr(field, "args", {}).values():
+        yield get_named_type(arg.type)
+
+
+def _edges(named: GraphQLNamedType, keep_fields: set[str] | None = None) -> Iterable[GraphQLNamedType]:
+    """Named types ``named`` refers to (restricted to ``keep_fields`` for root types)."""
+    if is_union_type(named):
+        yield from named.types
+    if is_object_type(named) or is_interface_type(named):
+        yield from named.interfaces
+    if is_object_type(named) or is_interface_type(named) or is_input_object_type(named):
+        for name, field in named.fields.items():
+            if keep_fields is None or name in keep_fields:
+                yield from _field_types(field)
+
+
+def reachable_types(gql_schema: GraphQLSchema, roots: dict[str, set[str]], exclude: set[str]) -> set[str]:
+    """Names of every type reachable from the kept root fields, never entering ``exclude``."""
+    seen: set[str] = set()
+    stack: list[GraphQLNamedType] = []
+    for root_name, fields in roots.items():
+        seen.add(root_name)
+        stack.extend(_edges(gql_schema.type_map[root_name], fields))
+    while stack:
+        named = stack.pop()
+        if named.name in seen or named.name in exclude:
+            continue
+        seen.add(named.name)
+        stack.extend(_edges(named))
+    return seen
+
+
+def _type_ref(type_: Any) -> str:
+    return str(type_)
+
+
+def _args(args: dict[str, Any]) -> list[list[Any]]:
+    out = []
+    for name, arg in args.items():
+        entry = [name, _type_ref(arg.type)]
+        if arg.default_value is not Undefined and isinstance(arg.default_value, _JSON_SCALARS + (list, dict)):
+            entry.append(arg.default_value)
+        out.append(entry)
+    return out
+
+
+def _requires(type_ref_obj: Any) -> bool:
+    return isinstance(type_ref_obj, GraphQLNonNull)
+
+
+def prune(gql_schema: GraphQLSchema, registry: Any, exclude: set[str] | None = None) -> dict[str, Any]:
+    """Prune ``gql_schema`` to the registry's reach and return the snapshot dict.
+
+    Fields whose return type, or whose *required* argument type, was pruned
+    are dropped; so are union members and optional input fields. An input
+    type losing a required field, or an object/interface/union left empty, is
+    pruned in turn — repeated until nothing changes. Types a registered op
+    selects stay even when ``exclude`` lists them.
+    """
+    exclude = (load_exclude_types() if exclude is None else exclude) - selected_types(gql_schema, registry)
+    roots = root_fields(gql_schema, registry)
+    kept = reachable_types(gql_schema, roots, exclude)
+
+    while True:
+        snapshot = _serialize(gql_schema, roots, kept)
+        empty = {
+            name
+            for name, spec in snapshot.items()
+            if spec[0] in "OIUN" and not spec[1] and name not in roots
+        }
+        broken_inputs = {
+            name
+            for name in kept
+            if is_input_object_type(named := gql_schema.type_map[name])
+            and any(_requires(f.type) and get_named_type(f.type).name not in kept for f in named.fields.values())
+        }
+        dropped = empty | broken_inputs
+        if not dropped:
+            break
+        kept -= dropped
+
+    directives = [
+        [d.name, [loc.name for loc in d.locations], _args(d.args)]
+        for d in gql_schema.directives
+        if not is_specified_directive(d)
+        and all(get_named_type(a.type).name in kept for a in d.args.values())
+    ]
+    return {
+        "query": gql_schema.query_type.name if gql_schema.query_type else None,
+        "mutation": gql_schema.mutation_type.name if gql_schema.mutation_type else None,
+        "directives": directives,
+        "types": {
+            name: spec for name, spec in snapshot.items() if not is_specified_scalar_type(gql_schema.type_map[name])
+        },
+    }
+
+
+def _serialize(gql_schema: GraphQLSchema, roots: dict[str, set[str]], kept: set[str]) -> dict[str, list[Any]]:
+    """One pass of ``prune``: serialize every kept type against the current ``kept`` set."""
+
+    def usable(field: Any) -> bool:
+        if get_named_type(field.type).name not in kept:
+            return False
+        return all(
+            get_named_type(a.type).name in kept or not (_requires(a.type) and a.default_value is Undefined)
+            for a in getattr(field, "args", {}).values()
+        )
+
+    def kept_args(field: Any) -> dict[str, Any]:
+        return {n: a for n, a in field.args.items() if get_named_type(a.type).name in kept}
+
+    out: dict[str, list[Any]] = {}
+    for name in sorted(kept):
+        named = gql_schema.type_map[name]
+        if is_object_type(named) or is_interface_type(named):
+            only = roots.get(name)
+            fields = [
+                [fname, _type_ref(f.type), _args(kept_args(f))]
+                for fname, f in named.fields.items()
+                if (only is None or fname in only) and usable(f)
+            ]
+            interfaces = [i.name for i in named.interfaces if i.name in kept]
+            out[name] = ["O" if is_object_type(named) else "I", fields, interfaces]
+        elif is_union_type(named):
+            out[name] = ["U", [m.name for m in named.types if m.name in kept]]
+        elif is_input_object_type(named):
+            fields = []
+            for fname, f in named.fields.items():
+                if get_named_type(f.type).name not in kept:
+                    continue
+                entry = [fname, _type_ref(f.type)]
+                if f.default_value is not Undefined and isinstance(f.default_value, _JSON_SCALARS + (list, dict)):
+                    entry.append(f.default_value)
+                fields.append(entry)
+            out[name] = ["N", fields]
+        elif is_enum_type(named):
+            out[name] = ["E", list(named.values)]
+        elif is_scalar_type(named):
+            out[name] = ["S"]
+    return out
+
+
+def build_snapshot(gql_schema: GraphQLSchema, registry: Any, out: Path = SNAPSHOT_PATH) -> dict[str, Any]:
+    """Prune, write ``out`` (compact JSON), and return the snapshot dict."""
+    snapshot = prune(gql_schema, registry)
+    out.write_text(json.dumps(snapshot, separators=(",", ":"), sort_keys=True))
+    return snapshot
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Load: snapshot → GraphQLSchema.
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def materialize(snapshot: dict[str, Any]) -> GraphQLSchema:
+    """Rebuild a ``GraphQLSchema`` from a snapshot dict (see module docstring for the shape)."""
+    named: dict[str, GraphQLNamedType] = dict(specified_scalar_types)
+    refs: dict[str, Any] = {}
+
+    def ref(sdl: str) -> Any:
+        if sdl not in refs:
+            if sdl.endswith("!"):
+                refs[sdl] = GraphQLNonNull(ref(sdl[:-1]))
+            elif sdl.startswith("["):
+                refs[sdl] = GraphQLList(ref(sdl[1:-1]))
+            else:
+                refs[sdl] = named[sdl]
+        return refs[sdl]
+
+    def args(specs: list[list[Any]]) -> dict[str, GraphQLArgument]:
+        return {
+            s[0]: GraphQLArgument(ref(s[1]), default_value=s[2] if len(s) > 2 else Undefined) for s in specs
+        }
+
+    def output_fields(specs: list[list[Any]]) -> Any:
+        return lambda: {s[0]: GraphQLField(ref(s[1]), args(s[2])) for s in specs}
+
+    def input_fields(specs: list[list[Any]]) -> Any:
+        return lambda: {
+            s[0]: GraphQLInputField(ref(s[1]), default_value=s[2] if len(s) > 2 else Undefined) for s in specs
+        }
+
+    def interfaces(names: list[str]) -> Any:
+        return lambda: [named[n] for n in names]
+
+    for name, spec in snapshot["types"].items():
+        kind = spec[0]
+        if kind == "O":
+            named[name] = GraphQLObjectType(name, output_fields(spec[1]), interfaces(spec[2]))
+        elif kind == "I":
+            named[name] = GraphQLInterfaceType(name, output_fields(spec[1]), interfaces(spec[2]))
+        elif kind == "U":
+            named[name] = GraphQLUnionType(name, (lambda members: lambda: [named[m] for m in members])(spec[1]))
+        elif kind == "N":
+            named[name] = GraphQLInputObjectType(name, input_fields(spec[1]))
+        elif kind == "E":
+            named[name] = GraphQLEnumType(name, {v: GraphQLEnumValue(v) for v in spec[1]})
+        elif kind == "S":
+            named[name] = GraphQLScalarType(name)
+
+    directives = [
+        GraphQLDirective(d[0], [DirectiveLocation[loc] for loc in d[1]], args(d[2])) for d in snapshot["directives"]
+    ]
+    return GraphQLSchema(
+        query=named.get(snapshot["query"]) if snapshot["query"] else None,  # type: ignore[arg-type]
+        mutation=named.get(snapshot["mutation"]) if snapshot["mutation"] else None,  # type: ignore[arg-type]
+        types=list(named.values()),
+        directives=[*specified_directives, *directives],
+    )
+
+
+def load_snapshot(path: Path = SNAPSHOT_PATH) -> GraphQLSchema:
+    return materialize(json.loads(path.read_bytes()))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CLI — build the snapshot, or benchmark pickle vs snapshot cold starts.
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Each measurement runs in a fresh interpreter: time covers import + load +
+# DSLSchema, RSS is the process high-water mark (KiB on Linux).
+_BENCH_SCRIPT = """
+import json, resource, sys, time
+t0 = time.perf_counter()
+from gql.dsl import DSLSchema
+if sys.argv[1] == "pickle":
+    from shop_client import parse_pickle as load
+else:
+    from schema_snapshot import load_snapshot as load
+from pathlib import Path
+ds = DSLSchema(load(Path(sys.argv[2])))
+elapsed = time.perf_counter() - t0
+print(json.dumps({"ms": elapsed * 1000, "rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                  "types": len(ds._schema.type_map)}))
+"""
+
+
+def bench(pickle_path: Path, snapshot_path: Path, runs: int = 5) -> dict[str, dict[str, float]]:
+    """Median cold-start time / peak RSS / type count for pickle vs snapshot."""
+    import statistics
+    import subprocess
+    import sys
+
+    report: dict[str, dict[str, float]] = {}
+    for label, path in (("pickle", pickle_path), ("snapshot", snapshot_path)):
+        samples = [
+            json.loads(
+                subprocess.run(
+                    [sys.executable, "-c", _BENCH_SCRIPT, label, str(path)],
+                    cwd=Path(__file__).parent,
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout
+            )
+            for _ in range(runs)
+        ]
+        report[label] = {
+            "ms": statistics.median(s["ms"] for s in samples),
+            "rss_kib": statistics.median(s["rss_kib"] for s in samples),
+            "types": samples[0]["types"],
+        }
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("command", choices=["build", "bench"])
+    parser.add_argument("--pickle", type=Path, default=None, help="full schema pickle (default: shop_client.PICKLE_PATH)")
+    parser.add_argument("--out", "--snapshot", dest="snapshot", type=Path, default=SNAPSHOT_PATH)
+    parser.add_argument("--runs", type=int, default=5)
+    cli = parser.parse_args()
+
+    from shop_client import PICKLE_PATH, parse_pickle, schema
+
+    pickle_path = cli.pickle or PICKLE_PATH
+    if cli.command == "build":
+        full = parse_pickle(pickle_path)
+        snap = build_snapshot(full, schema, cli.snapshot)
+        print(
+            f"{len(full.type_map)} → {len(snap['types'])} types · "
+            f"{pickle_path.stat().st_size / 1024:.0f} KiB pickle → {cli.snapshot.stat().st_size / 1024:.0f} KiB snapshot"
+        )
+    else:
+        for label, row in bench(pickle_path, cli.snapshot, cli.runs).items():
+            print(f"{label:<9} {row['ms']:8.1f} ms   {row['rss_kib'] / 1024:7.1f} MiB RSS   {row['types']:>5} types")
@@ -22,37 +22,79 @@ Architecture
         └── ShopifyClient.run(op, **kwargs)
                 │
                 ├── stage 1: TYPES      — op.field/return_type/payload_type/connection_type
-                │                         resolved against self.ds (DSLSchema from pickle)
+                │                         resolved against self.ds (DSLSchema from snapshot/pickle)
                 │
                 ├── stage 2: FIELDS     — op.fields (or caller `returns=[...]`)
                 │                         → build_selections(parent_type, paths)
+                │                         connections get first: 250 unless the
+                │                         path sets it: "media[10].nodes.id"
                 │
                 └── stage 3: VARIABLES  — op.variables (dict[name, Var])
                                           → DSLVariableDefinitions (auto-typed by gql)
                                           → variable_values dict (split, NEVER inlined)
 
+        Stages 1–3 run once per (op, returns, variable-name set): the finished,
+        validated GraphQLRequest is kept in ShopifyClient.op_cache and every
+        later call only swaps variable_values (``op_cache.stats()`` for hits).
+
+        ShopifyClient.open() / open_sync()  — pooled session mode: one
+                long-lived async gql session over an httpx pool (HTTP/2 when
+                ``h2`` is installed). ``arun``/``aexecute`` are the async API;
+                sync ``run``/``execute``/``stream`` reuse the same pool.
+                Without it, each call opens and closes its own connection.
+
+        Every request goes through the store's CostThrottle (cost_throttle.py):
+        paced against Shopify's query-cost bucket, resynced from each
+        response's ``extensions.cost`` — shared by all clients of the store.
+
+        ShopifyClient.stream(op, ranges=search_ranges(...), **kwargs)
+                │
+                └── connection ops only — yields nodes as pages arrive; one
+                    producer thread per disjoint search range prefetches
+                    ahead, results merged back in range order. ``astream``
+                    is the async-iterator twin.
+
+        ShopifyClient.run_batch([(op, kwargs), ...])
+                │
+                └── non-connection ops as aliased fields (``op0: productUpdate``)
+                    of as few documents as possible — one round trip per chunk,
+                    each chunk kept under Shopify's single-query cost cap.
+
 Variables are ALWAYS split from the document. The on-wire payload is:
     {"query": "mutation ($productId: ID!, $variants: [...!]!) { ... }",
      "variables": {"productId": "...", "variants": [...]}}
 Never:
     {"query": "mutation { productVariantsBulkUpdate(productId: \"...\", ...) }"}
 
-No I/O at import. The pickle loads on first ShopifyClient(...) construction.
+No I/O at import. The schema loads on a client's first run(), not at
+ShopifyClient(...) construction — from the pruned snapshot when one has been
+built (``python schema_snapshot.py build``), else from the full pickle.
 """
 
+import asyncio
 import hashlib
+import importlib.util
 import json
 import pickle
+import queue
 import random
 import re
+import threading
 import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy
 from dataclasses import dataclass
 from dataclasses import field as dc_field
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Callable
 
+import httpx
 from box import Box
+from cost_throttle import CostThrottle, is_throttled
 from gql import Client, GraphQLRequest
+from gql.client import AsyncClientSession
 from gql.dsl import (
     DSLField,
     DSLMutation,
@@ -65,22 +107,47 @@ from gql.dsl import (
 from gql.transport.exceptions import (
     TransportConnectionFailed,
     TransportError,
+    TransportQueryError,
     TransportServerError,
 )
-from gql.transport.httpx import HTTPXTransport
+from gql.transport.httpx import HTTPXAsyncTransport, HTTPXTransport
 from gql.utils import to_camel_case
-from graphql import GraphQLSchema, get_named_type, print_ast
+from graphql import GraphQLSchema, get_named_type, is_leaf_type, print_ast, validate
 from graphql.language.ast import (
     ArgumentNode,
     DirectiveNode,
+    DocumentNode,
     NameNode,
     OperationDefinitionNode,
     OperationType,
     StringValueNode,
 )
+from schema_snapshot import SNAPSHOT_PATH, load_snapshot
 
 PICKLE_PATH = Path(__file__).parent / "2026-07.graphql.pickle"
 
+# Shopify rejects any single query whose requested cost exceeds this.
+MAX_QUERY_COST = 1000
+# Flat cost Shopify charges per mutation field.
+MUTATION_COST = 10
+# ``first`` for a connection in a returns path that doesn't set its own.
+DEFAULT_CONNECTION_FIRST = 250
+
+_PATH_HEAD = re.compile(r"^(\w+?)(?:\[(\d+)\])?$")
+
+
+def split_path(path: str) -> tuple[str, int | None, str]:
+    """``"line_items[10].nodes.name"`` → ``("lineItems", 10, "nodes.name")``.
+
+    A ``[n]`` suffix sets ``first`` on a connection; without one it's None.
+    """
+    head, _, tail = path.partition(".")
+    match = _PATH_HEAD.match(head)
+    if match is None:
+        raise ValueError(f"Bad returns path segment: {head!r}")
+    name, first = match.groups()
+    return to_camel_case(name), int(first) if first else None, tail
+
 
 def to_pascal(snake: str) -> str:
     """Convert snake_case to PascalCase."""
@@ -115,6 +182,30 @@ class ResourceId:
         return cls(digits=d, gid=f"gid://shopify/{to_pascal(resource_type)}/{d}")
 
 
+def search_ranges(field: str, bounds: Sequence[str | int]) -> list[str]:
+    """Split a search into disjoint, ordered ``field`` ranges cut at ``bounds``.
+
+    ``search_ranges("created_at", ["2026-01-01", "2026-04-01"])`` →
+    ``["created_at:<'2026-01-01'",
+       "created_at:>='2026-01-01' AND created_at:<'2026-04-01'",
+       "created_at:>='2026-04-01'"]``
+
+    ``bounds`` must be ascending. Pass the result as ``ranges=`` to
+    ``ShopifyClient.stream`` — every node lands in exactly one range.
+    """
+    quoted = [f"'{b}'" if isinstance(b, str) else str(b) for b in bounds]
+    lows: list[str | None] = [None, *quoted]
+    highs: list[str | None] = [*quoted, None]
+    return [
+        " AND ".join(
+            clause
+            for clause in (f"{field}:>={lo}" if lo else None, f"{field}:<{hi}" if hi else None)
+            if clause
+        )
+        for lo, hi in zip(lows, highs)
+    ]
+
+
 def parse_pickle(path: Path) -> GraphQLSchema:
     with open(path, "rb") as f:
         return pickle.load(f)
@@ -263,6 +354,15 @@ class MutationOp:
         inner = {to_camel_case(n): v.coerce(kwargs[n]) for n, v in self.variables.items() if kwargs.get(n) is not None}
         return {to_camel_case(self.wrap_into): inner} if self.wrap_into else inner
 
+    def document(self, ds: DSLSchema, variable_values: dict[str, Any], selections: list[DSLField]) -> GraphQLRequest:
+        """Build the bare mutation request — no idempotency directive, safe to cache and reuse."""
+        var_defs = DSLVariableDefinitions()
+        m = DSLMutation(
+            self.root(ds).args(**{k: getattr(var_defs, k) for k in variable_values}).select(*selections)
+        )
+        m.variable_definitions = var_defs
+        return dsl_gql(m)
+
     def build(
         self,
         ds: DSLSchema,
@@ -272,24 +372,39 @@ class MutationOp:
         idempotency_key: str | None = None,
     ) -> GraphQLRequest:
         """Build the signed mutation request, attaching an idempotency directive when required."""
-        var_defs = DSLVariableDefinitions()
-        m = DSLMutation(
-            self.root(ds).args(**{k: getattr(var_defs, k) for k in variable_values}).select(*selections)
-        )
-        m.variable_definitions = var_defs
-        request = dsl_gql(m)
-        if self.idempotent or idempotency_key:
-            key_payload = {"op": self.field, "vars": variable_values}
-            key = idempotency_key or hashlib.sha256(
-                json.dumps(key_payload, sort_keys=True, default=str).encode()
-            ).hexdigest()
-            key_arg = ArgumentNode(name=NameNode(value="key"), value=StringValueNode(value=key))
-            directive = DirectiveNode(name=NameNode(value="idempotent"), arguments=(key_arg,))
-            for defn in request.document.definitions:
-                if isinstance(defn, OperationDefinitionNode) and defn.operation is OperationType.MUTATION:
-                    for f in defn.selection_set.selections:
-                        f.directives = (directive,)
-        return request
+        return self.sign(self.document(ds, variable_values, selections), variable_values, idempotency_key)
+
+    def sign(
+        self, request: GraphQLRequest, variable_values: dict[str, Any], idempotency_key: str | None = None
+    ) -> GraphQLRequest:
+        """Return *request* with ``@idempotent(key: …)`` on the mutation field when required.
+
+        The key is a literal in the document, so the directive goes on a shallow
+        copy of the operation — *request* itself (possibly a cached document) is
+        never mutated.
+        """
+        if not (self.idempotent or idempotency_key):
+            return request
+        key_payload = {"op": self.field, "vars": variable_values}
+        key = idempotency_key or hashlib.sha256(
+            json.dumps(key_payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        key_arg = ArgumentNode(name=NameNode(value="key"), value=StringValueNode(value=key))
+        directive = DirectiveNode(name=NameNode(value="idempotent"), arguments=(key_arg,))
+        definitions = []
+        for defn in request.document.definitions:
+            if isinstance(defn, OperationDefinitionNode) and defn.operation is OperationType.MUTATION:
+                fields = tuple(copy(f) for f in defn.selection_set.selections)
+                for f in fields:
+                    f.directives = (directive,)
+                selection_set = copy(defn.selection_set)
+                selection_set.selections = fields
+                defn = copy(defn)
+                defn.selection_set = selection_set
+            definitions.append(defn)
+        document = copy(request.document)
+        document.definitions = tuple(definitions)
+        return GraphQLRequest(document)
 
 
 @dataclass
@@ -404,6 +519,53 @@ variants = Resource(
 )
 
 
+# Library files (Content > Files). Attaching/detaching a file to a product via
+# references keeps the source file in the library, unlike productDeleteMedia.
+files = Resource(
+    type_name="file",
+    fields=["id", "alt", "file_status"],
+    mutations={
+        "update": MutationOp(
+            field="file_update",
+            root=lambda ds: ds.Mutation.fileUpdate,
+            payload=lambda ds: ds.FileUpdatePayload,
+            errors=lambda ds, p: p.userErrors.select(
+                ds.FilesUserError.field, ds.FilesUserError.message, ds.FilesUserError.code
+            ),
+            fields=["files.id"],
+            # [{"id": <file gid>, "referencesToAdd": [...], "referencesToRemove": [...]}, ...]
+            variables={"files": Var(sdl_type="[FileUpdateInput!]!")},
+        ),
+    },
+)
+
+
+inventory = Resource(
+    type_name="inventory_adjustment_group",
+    fields=["id", "reason", "created_at"],
+    mutations={
+        "adjust": MutationOp(
+            field="inventory_adjust_quantities",
+            root=lambda ds: ds.Mutation.inventoryAdjustQuantities,
+            payload=lambda ds: ds.InventoryAdjustQuantitiesPayload,
+            errors=lambda ds, p: p.userErrors.select(
+                ds.InventoryAdjustQuantitiesUserError.field,
+                ds.InventoryAdjustQuantitiesUserError.message,
+                ds.InventoryAdjustQuantitiesUserError.code,
+            ),
+            fields=["inventory_adjustment_group.id", "inventory_adjustment_group.reason"],
+            variables={
+                "reason": Var(sdl_type="String!"),
+                "name": Var(sdl_type="String!"),
+                # [{"delta": int, "inventoryItemId": gid, "locationId": gid}, ...]
+                "changes": Var(sdl_type="[InventoryChangeInput!]!"),
+            },
+            wrap_into="input",
+            wrap_into_type="InventoryAdjustQuantitiesInput!",
+        ),
+    },
+)
+
 customers = Resource(
     type_name="customer",
     fields=[
@@ -452,6 +614,19 @@ customers = Resource(
             wrap_into="input",
             wrap_into_type="CustomerInput!",
         ),
+        # Additive — no read-modify-write of the full tag list, so concurrent
+        # taggers can't clobber each other. Works on any taggable node.
+        "add_tags": MutationOp(
+            field="tags_add",
+            root=lambda ds: ds.Mutation.tagsAdd,
+            payload=lambda ds: ds.TagsAddPayload,
+            errors=lambda ds, p: p.userErrors.select(ds.UserError.field, ds.UserError.message),
+            fields=["node.id"],
+            variables={
+                "id": Var(sdl_type="ID!", gid="customer"),
+                "tags": Var(sdl_type="[String!]!"),
+            },
+        ),
     },
 )
 
@@ -634,6 +809,49 @@ refunds = Resource(
 )
 
 
+# Bulk query jobs — driven by bulk_ops.py (submit → poll → stream JSONL).
+BULK_OPERATION_FIELDS = [
+    "id", "status", "error_code", "created_at", "completed_at",
+    "object_count", "root_object_count", "file_size", "url", "partial_data_url",
+]
+
+bulk_operations = Resource(
+    type_name="bulk_operation",
+    fields=BULK_OPERATION_FIELDS,
+    queries={
+        "by_id": QueryOp(
+            field="bulk_operation",
+            root=lambda ds: ds.QueryRoot.bulkOperation,
+            dsl_type=lambda ds: ds.BulkOperation,
+            fields=BULK_OPERATION_FIELDS,
+            variables={"id": Var(sdl_type="ID!", gid="bulk_operation")},
+        ),
+    },
+    mutations={
+        "run_query": MutationOp(
+            field="bulk_operation_run_query",
+            root=lambda ds: ds.Mutation.bulkOperationRunQuery,
+            payload=lambda ds: ds.BulkOperationRunQueryPayload,
+            errors=lambda ds, p: p.userErrors.select(
+                ds.BulkOperationUserError.field,
+                ds.BulkOperationUserError.message,
+                ds.BulkOperationUserError.code,
+            ),
+            fields=["bulk_operation.id", "bulk_operation.status"],
+            variables={"query": Var(sdl_type="String!")},
+        ),
+        "cancel": MutationOp(
+            field="bulk_operation_cancel",
+            root=lambda ds: ds.Mutation.bulkOperationCancel,
+            payload=lambda ds: ds.BulkOperationCancelPayload,
+            errors=lambda ds, p: p.userErrors.select(ds.UserError.field, ds.UserError.message),
+            fields=["bulk_operation.id", "bulk_operation.status"],
+            variables={"id": Var(sdl_type="ID!", gid="bulk_operation")},
+        ),
+    },
+)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # The single keyable schema registry. Resource is the central concept.
 # ─────────────────────────────────────────────────────────────────────────────
@@ -649,15 +867,182 @@ schema = Box(
     {
         "products": products,
         "variants": variants,
+        "files": files,
+        "inventory": inventory,
         "customers": customers,
         "orders": orders,
         "refunds": refunds,
+        "bulk_operations": bulk_operations,
     },
     box_dots=False,
     default_box=False,
 )
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Compiled-operation cache — a finished, validated GraphQLRequest per
+# (op, schema, API version, returns, variable-name set). Only variable_values
+# change between calls.
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class CompiledOpCache:
+    """Finished ``GraphQLRequest`` documents keyed by what shapes the document.
+
+    The key is ``(id(op), id(schema), api_version, returns, variable names)``
+    — variable *values* are split from the document, so they never enter the
+    key, while a client on another schema or API version never shares an
+    entry. A hit skips ``build_selections``, DSL construction, ``dsl_gql`` and
+    local validation; ``PrevalidatedClient`` then skips gql's per-execute
+    re-validation too, but only against the schema the document was checked on.
+
+    Entries hold strong references to the op and the schema, and hits compare
+    both by identity, so their ``id()``s can't be recycled while the entry lives.
+    """
+
+    entries: dict[tuple, tuple[Any, GraphQLSchema, GraphQLRequest]] = dc_field(default_factory=dict)
+    validated: dict[int, GraphQLSchema] = dc_field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    lock: threading.Lock = dc_field(default_factory=threading.Lock, repr=False)
+
+    @staticmethod
+    def key(
+        op: Any, returns: list[str] | None, variable_names: Any, gql_schema: GraphQLSchema, api_version: str
+    ) -> tuple:
+        return id(op), id(gql_schema), api_version, tuple(returns) if returns else None, frozenset(variable_names)
+
+    def get_or_build(self, op: Any, key: tuple, build: Callable[[], GraphQLRequest], gql_schema: GraphQLSchema) -> GraphQLRequest:
+        """Return the cached request for ``key``, building + validating it once on a miss."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] is op and entry[1] is gql_schema:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            if entry is not None:
+                self.validated.pop(id(entry[2].document), None)
+            request = build()
+            errors = validate(gql_schema, request.document)
+            if errors:
+                raise errors[0]
+            self.entries[key] = (op, gql_schema, request)
+            self.validated[id(request.document)] = gql_schema
+            return request
+
+    def is_validated(self, document: DocumentNode, gql_schema: GraphQLSchema | None) -> bool:
+        """True for documents this cache validated against ``gql_schema`` (ids stay unique while held)."""
+        return gql_schema is not None and self.validated.get(id(document)) is gql_schema
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.validated.clear()
+            self.hits = self.misses = 0
+
+
+class PrevalidatedClient(Client):
+    """gql ``Client`` that skips local validation for documents ``op_cache`` already validated."""
+
+    def __init__(self, *, op_cache: CompiledOpCache, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.op_cache = op_cache
+
+    def validate(self, request: GraphQLRequest) -> None:
+        if not self.op_cache.is_validated(request.document, self.schema):
+            super().validate(request)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pooled session — one long-lived async gql session per client, over an httpx
+# pool (HTTP/2 when ``h2`` is installed), so warm calls reuse open connections.
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SessionPool:
+    """A connected ``PrevalidatedClient`` session bound to one event loop.
+
+    ``open`` binds it to the running loop (FastAPI startup). ``start_thread``
+    runs it on a private loop on a daemon thread instead, so sync callers on
+    any thread (Lambda handlers, ``stream`` producers) share the one pool.
+    Extra keyword arguments go to ``httpx.AsyncClient``.
+    """
+
+    def __init__(
+        self,
+        shop: "ShopifyClient",
+        *,
+        http2: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 120.0,
+        timeout: float = 30.0,
+        **httpx_kwargs: Any,
+    ):
+        self.shop = shop
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self.httpx_kwargs = httpx_kwargs
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.session: AsyncClientSession | None = None
+        self._client: PrevalidatedClient | None = None
+        self._thread: threading.Thread | None = None
+
+    async def open(self) -> None:
+        if self.session is not None:
+            return
+        transport = HTTPXAsyncTransport(
+            url=self.shop.url, headers=self.shop.headers, http2=self.http2, limits=self.limits, timeout=self.timeout,
+            **self.httpx_kwargs,
+        )
+        self._client = PrevalidatedClient(op_cache=self.shop.op_cache, schema=self.shop.gql_schema, transport=transport)
+        self.session = await self._client.connect_async()
+        self.loop = asyncio.get_running_loop()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close_async()
+        self.session = self._client = None
+
+    def start_thread(self) -> None:
+        """Run the pool on its own loop thread and open it there."""
+        loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=loop.run_forever, name="shop-client-pool", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.open(), loop).result()
+
+    def stop_thread(self) -> None:
+        if self._thread is None or self.loop is None:
+            return
+        loop = self.loop
+        asyncio.run_coroutine_threadsafe(self.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+        self._thread = self.loop = None
+
+    def call(self, coro: Any) -> Any:
+        """Run ``coro`` on the pool's loop from another thread and wait for its result."""
+        assert self.loop is not None
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            coro.close()
+            raise RuntimeError("sync ShopifyClient call on the pool's own event loop — await the a* method instead")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # ShopifyClient — transport + execution. Owns the gql schema; the registry
 # above describes WHAT to call, this class describes HOW.
@@ -666,38 +1051,120 @@ schema = Box(
 
 class ShopifyClient:
     schema_cache: GraphQLSchema | None = None
+    # Shared by every instance; keys carry the schema and API version a document was built for.
+    op_cache: CompiledOpCache = CompiledOpCache()
 
     @classmethod
     def load_schema(cls) -> GraphQLSchema:
+        """Pruned snapshot when built, else the full pickle. Rebuild the snapshot after adding ops."""
         if cls.schema_cache is None:
-            cls.schema_cache = parse_pickle(PICKLE_PATH)
+            cls.schema_cache = load_snapshot(SNAPSHOT_PATH) if SNAPSHOT_PATH.exists() else parse_pickle(PICKLE_PATH)
         return cls.schema_cache
 
     def __init__(self, *, store_id: str, api_version: str, token: str):
-        self.gql_schema = self.load_schema()
-        self.ds = DSLSchema(self.gql_schema)
-        transport = HTTPXTransport(
-            url=f"https://{store_id}.myshopify.com/admin/api/{api_version}/graphql.json",
-            headers={"X-Shopify-Access-Token": token},
-        )
-        self.gql_client = Client(schema=self.gql_schema, transport=transport)
+        self.api_version = api_version
+        self.url = f"https://{store_id}.myshopify.com/admin/api/{api_version}/graphql.json"
+        self.headers = {"X-Shopify-Access-Token": token}
+        self._local = threading.local()
+        # Shared with every other client (any thread, any instance) hitting this store.
+        self.throttle = CostThrottle.for_store(store_id)
+        # Set by open()/open_sync(); None means a short-lived session per call.
+        self.pool: SessionPool | None = None
+
+    @cached_property
+    def gql_schema(self) -> GraphQLSchema:
+        return self.load_schema()
+
+    @cached_property
+    def ds(self) -> DSLSchema:
+        return DSLSchema(self.gql_schema)
+
+    @property
+    def gql_client(self) -> Client:
+        """Per-thread gql ``Client``.
+
+        A gql session holds its transport connection on the Client object, so a
+        Client can't be entered from two threads at once. ``stream`` fetches
+        ranges on worker threads; each gets its own Client + transport.
+        """
+        client = getattr(self._local, "client", None)
+        if client is None:
+            transport = HTTPXTransport(url=self.url, headers=self.headers)
+            client = self._local.client = PrevalidatedClient(
+                op_cache=self.op_cache, schema=self.gql_schema, transport=transport
+            )
+        return client
+
+    # ── pooled-session lifecycle ────────────────────────────────────────────
+    #
+    #   FastAPI:  await shop.open() on startup, await shop.aclose() on shutdown
+    #             (or ``async with shop:``) — arun/aexecute on the app loop.
+    #   Lambda / scripts:  shop.open_sync() once at module scope; the pool
+    #             lives on a daemon loop thread and survives warm invocations.
+    #
+    # While a pool is open, sync run/execute/stream go through it too.
+
+    async def open(self, **pool_kwargs: Any) -> "ShopifyClient":
+        """Open a pooled session on the running loop (``SessionPool`` kwargs: ``http2``, limits, ``timeout``)."""
+        if self.pool is None:
+            pool = SessionPool(self, **pool_kwargs)
+            await pool.open()
+            self.pool = pool
+        return self
+
+    async def aclose(self) -> None:
+        pool, self.pool = self.pool, None
+        if pool is not None:
+            if pool._thread is not None:
+                await asyncio.to_thread(pool.stop_thread)
+            else:
+                await pool.close()
+
+    async def __aenter__(self) -> "ShopifyClient":
+        return await self.open()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def open_sync(self, **pool_kwargs: Any) -> "ShopifyClient":
+        """Open a pooled session on a private loop thread, for sync callers."""
+        if self.pool is None:
+            pool = SessionPool(self, **pool_kwargs)
+            pool.start_thread()
+            self.pool = pool
+        return self
+
+    def close(self) -> None:
+        pool, self.pool = self.pool, None
+        if pool is not None:
+            if pool._thread is None:
+                raise RuntimeError("pool was opened on an event loop — use await aclose()")
+            pool.stop_thread()
+
+    def compile(
+        self, op: QueryOp | MutationOp, returns: list[str] | None, variable_values: dict[str, Any], build: Callable[[], GraphQLRequest]
+    ) -> GraphQLRequest:
+        """Return the cached request for ``(op, returns, variable names)`` on this schema + API version.
+
+        ``build`` runs on a miss only.
+        """
+        key = self.op_cache.key(op, returns, variable_values, self.gql_schema, self.api_version)
+        return self.op_cache.get_or_build(op, key, build, self.gql_schema)
 
     def build_selections(self, parent_type: DSLType, paths: list[str]) -> list[DSLField]:
         """Merge dot-paths sharing a parent into one DSL selection per parent.
 
         ``['refund.id', 'refund.note', 'order.id']`` →
         ``refund { id note } order { id }``
-        """
-        groups: dict[str, list[str]] = {}
-        for path in paths:
-            head, _, tail = path.partition(".")
-            groups.setdefault(to_camel_case(head), []).append(tail)
 
+        Connections get ``first: 250`` unless a path sets it (``media[10].nodes.id``).
+        """
+        groups, firsts = self._group_paths(paths)
         selections: list[DSLField] = []
         for head, tails in groups.items():
             dsl_field = getattr(parent_type, head)
             if get_named_type(dsl_field.field.type).name.endswith("Connection"):
-                dsl_field = dsl_field.args(first=250)
+                dsl_field = dsl_field.args(first=firsts.get(head, DEFAULT_CONNECTION_FIRST))
             sub_paths = [t for t in tails if t]
             if sub_paths:
                 nested_type = getattr(self.ds, get_named_type(dsl_field.field.type).name)
@@ -705,37 +1172,179 @@ class ShopifyClient:
             selections.append(dsl_field)
         return selections
 
+    @staticmethod
+    def _group_paths(paths: list[str]) -> tuple[dict[str, list[str]], dict[str, int]]:
+        """Sub-paths per camelCased head, and the largest ``first`` any path set per head."""
+        groups: dict[str, list[str]] = {}
+        firsts: dict[str, int] = {}
+        for path in paths:
+            head, first, tail = split_path(path)
+            groups.setdefault(head, []).append(tail)
+            if first is not None:
+                firsts[head] = max(first, firsts.get(head, 0))
+        return groups, firsts
+
+    def selection_cost(self, parent_type: DSLType, paths: list[str]) -> int:
+        """Shopify's requested cost for ``paths`` under ``parent_type``, as ``build_selections`` would select them.
+
+        Same rules as Shopify's static analysis: scalars and enums are free,
+        objects cost 1, and a connection costs 2 plus ``first`` times its contents.
+        """
+        groups, firsts = self._group_paths(paths)
+        cost = 0
+        for head, tails in groups.items():
+            named = get_named_type(getattr(parent_type, head).field.type)
+            if is_leaf_type(named):
+                continue
+            sub_paths = [t for t in tails if t]
+            nested = self.selection_cost(getattr(self.ds, named.name), sub_paths) if sub_paths else 0
+            if named.name.endswith("Connection"):
+                cost += 2 + firsts.get(head, DEFAULT_CONNECTION_FIRST) * nested
+            else:
+                cost += 1 + nested
+        return cost
+
+    def call_cost(self, op: QueryOp | MutationOp, kwargs: dict[str, Any]) -> int:
+        """Estimated cost of one ``run_batch`` call (a non-connection query or a mutation)."""
+        if isinstance(op, MutationOp):
+            return MUTATION_COST
+        return 1 + self.selection_cost(op.dsl_type(self.ds), kwargs.get("returns") or op.fields)
+
+    def _batch_chunks(
+        self, calls: Sequence[tuple[QueryOp | MutationOp, dict[str, Any]]], chunk_size: int, max_cost: int
+    ) -> Iterator[Sequence[tuple[QueryOp | MutationOp, dict[str, Any]]]]:
+        """Consecutive runs of ``calls`` with at most ``chunk_size`` calls and ``max_cost`` estimated cost.
+
+        A call that alone exceeds ``max_cost`` still goes out, by itself.
+        """
+        start, cost = 0, 0
+        for index, (op, kwargs) in enumerate(calls):
+            call_cost = self.call_cost(op, kwargs)
+            if index > start and (index - start >= chunk_size or cost + call_cost > max_cost):
+                yield calls[start:index]
+                start, cost = index, 0
+            cost += call_cost
+        if start < len(calls):
+            yield calls[start:]
+
     def execute(
         self,
         operation: GraphQLRequest,
         variable_values: dict[str, Any],
         *,
         dry_run: bool = False,
+        cost_key: Any = None,
         max_retries: int = 3,
         backoff_base: float = 0.5,
         backoff_cap: float = 8.0,
     ) -> dict[str, Any]:
+        """Send one request, paced by the store's ``CostThrottle``.
+
+        ``cost_key`` groups requests whose cost is alike (``run`` passes the op
+        field) so the throttle can predict this one from the last response.
+        A THROTTLED response resyncs the bucket and retries after the wait it
+        implies; 429/5xx/connection failures still back off exponentially.
+        """
         if dry_run:
-            print("--- GraphQL operation ---")
-            print(print_ast(operation.document))
-            print("--- variables ---")
-            print(json.dumps(variable_values, indent=2, default=str))
+            self._print_dry_run(operation, variable_values)
             return {}
+        retry = {"max_retries": max_retries, "backoff_base": backoff_base, "backoff_cap": backoff_cap}
+        if self.pool is not None:
+            return self.pool.call(self.aexecute(operation, variable_values, cost_key=cost_key, **retry))
+        cost_key = id(operation.document) if cost_key is None else cost_key
         for attempt in range(max_retries + 1):
+            reserved = self.throttle.acquire(cost_key)
+            extensions = None
             try:
                 with self.gql_client as session:
-                    return session.execute(operation, variable_values=variable_values)
+                    result = session.execute(operation, variable_values=variable_values, get_execution_result=True)
+                extensions = result.extensions
+                return result.data
             except TransportError as e:
-                transient = isinstance(e, TransportConnectionFailed) or (
-                    isinstance(e, TransportServerError)
-                    and (e.code is None or e.code in {408, 425, 429, 500, 502, 503, 504})
+                extensions = getattr(e, "extensions", None)
+                delay = self._retry_delay(e, attempt, **retry)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            finally:
+                self.throttle.settle(cost_key, reserved, extensions)
+        raise RuntimeError("unreachable")
+
+    async def aexecute(
+        self,
+        operation: GraphQLRequest,
+        variable_values: dict[str, Any],
+        *,
+        dry_run: bool = False,
+        cost_key: Any = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 8.0,
+    ) -> dict[str, Any]:
+        """Async ``execute`` over the pooled session, which opens on first use."""
+        if dry_run:
+            self._print_dry_run(operation, variable_values)
+            return {}
+        retry = {"max_retries": max_retries, "backoff_base": backoff_base, "backoff_cap": backoff_cap}
+        if self.pool is None:
+            await self.open()
+        assert self.pool is not None
+        if self.pool.loop is not asyncio.get_running_loop():
+            # Pool lives on another loop (open_sync's thread) — hop over without blocking this one.
+            coro = self.aexecute(operation, variable_values, cost_key=cost_key, **retry)
+            return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.pool.loop))
+        cost_key = id(operation.document) if cost_key is None else cost_key
+        for attempt in range(max_retries + 1):
+            reserved = await self.throttle.aacquire(cost_key)
+            extensions = None
+            try:
+                assert self.pool.session is not None
+                result = await self.pool.session.execute(
+                    operation, variable_values=variable_values, get_execution_result=True
                 )
-                if attempt >= max_retries or not transient:
+                extensions = result.extensions
+                return result.data
+            except TransportError as e:
+                extensions = getattr(e, "extensions", None)
+                delay = self._retry_delay(e, attempt, **retry)
+                if delay is None:
                     raise
-                delay = min(backoff_cap, backoff_base * (2**attempt))
-                time.sleep(delay + random.uniform(0, delay * 0.25))
+                await asyncio.sleep(delay)
+            finally:
+                self.throttle.settle(cost_key, reserved, extensions)
         raise RuntimeError("unreachable")
 
+    def _retry_delay(
+        self, error: TransportError, attempt: int, *, max_retries: int, backoff_base: float, backoff_cap: float
+    ) -> float | None:
+        """Seconds to wait before retrying after ``error``, or None to give up.
+
+        THROTTLED retries immediately — the throttle, resynced by ``settle``,
+        does the waiting. 429/5xx/connection failures back off exponentially.
+        """
+        if attempt >= max_retries:
+            return None
+        if isinstance(error, TransportQueryError):
+            if not is_throttled(error.errors):
+                return None
+            self.throttle.record_throttled()
+            return 0.0
+        transient = isinstance(error, TransportConnectionFailed) or (
+            isinstance(error, TransportServerError)
+            and (error.code is None or error.code in {408, 425, 429, 500, 502, 503, 504})
+        )
+        if not transient:
+            return None
+        delay = min(backoff_cap, backoff_base * (2**attempt))
+        return delay + random.uniform(0, delay * 0.25)
+
+    @staticmethod
+    def _print_dry_run(operation: GraphQLRequest, variable_values: dict[str, Any]) -> None:
+        print("--- GraphQL operation ---")
+        print(print_ast(operation.document))
+        print("--- variables ---")
+        print(json.dumps(variable_values, indent=2, default=str))
+
     @staticmethod
     def boxify(data: Any) -> Any:
         """Wrap response dicts/lists in Box with camel→snake translation on access."""
@@ -764,43 +1373,317 @@ class ShopifyClient:
             QueryOp connection:     list[Box] of node Boxes (paginated).
             MutationOp:             payload Box (with ``.user_errors`` etc.).
         """
-        if isinstance(op, MutationOp):
-            variable_values = op.variable_values(kwargs)
-            payload_type = op.payload(self.ds)
-            selections = [*self.build_selections(payload_type, returns or op.fields), op.errors(self.ds, payload_type)]
-            request = op.build(self.ds, variable_values, selections, idempotency_key=idempotency_key)
-            result = self.execute(request, variable_values, dry_run=dry_run)
-            return self.boxify(result.get(to_camel_case(op.field), {}) if result else {})
-
-        if not isinstance(op, QueryOp):
+        if not isinstance(op, (QueryOp, MutationOp)):
             raise TypeError(f"unknown op type: {type(op).__name__}")
 
-        selections = self.build_selections(op.dsl_type(self.ds), returns or op.fields)
-
-        if op.connection is None:
-            variable_values = op.variable_values(kwargs)
-            result = self.execute(dsl_gql(op.build(self.ds, variable_values, selections)), variable_values, dry_run=dry_run)
-            return self.boxify(result.get(to_camel_case(op.field)) if result else None)
+        if isinstance(op, MutationOp) or op.connection is None:
+            request, variable_values = self.single_request(op, returns, kwargs, idempotency_key)
+            result = self.execute(request, variable_values, dry_run=dry_run, cost_key=op.field)
+            return self.unwrap(op, result)
 
         # Connection (paginated).
-        # build_page() constructs a fresh DSLQuery each call — DSLField.args() mutates
-        # ast_field.arguments in-place, so reusing a field across pages accumulates duplicates.
-        base_values: dict[str, Any] = {"query": op.search_string(kwargs)} if op.is_search else op.variable_values(kwargs)
+        base_values = self.connection_values(op, kwargs)
+        all_nodes: list[dict[str, Any]] = []
+        for nodes in self.walk_pages(op, returns, base_values, page_size, dry_run=dry_run):
+            all_nodes.extend(nodes)
+        return self.boxify(all_nodes)
+
+    async def arun(
+        self,
+        op: QueryOp | MutationOp,
+        *,
+        returns: list[str] | None = None,
+        dry_run: bool = False,
+        page_size: int = 100,
+        idempotency_key: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Async ``run`` over the pooled session. Same arguments and results."""
+        if not isinstance(op, (QueryOp, MutationOp)):
+            raise TypeError(f"unknown op type: {type(op).__name__}")
+
+        if isinstance(op, MutationOp) or op.connection is None:
+            request, variable_values = self.single_request(op, returns, kwargs, idempotency_key)
+            result = await self.aexecute(request, variable_values, dry_run=dry_run, cost_key=op.field)
+            return self.unwrap(op, result)
+
+        base_values = self.connection_values(op, kwargs)
         all_nodes: list[dict[str, Any]] = []
         cursor: str | None = None
         while True:
-            page_values = {**base_values, "first": page_size, **({"after": cursor} if cursor else {})}
-            result = self.execute(dsl_gql(op.build_page(self.ds, page_values, selections)), page_values, dry_run=dry_run)
+            request, page_values = self.page_request(op, returns, base_values, page_size, cursor)
+            result = await self.aexecute(request, page_values, dry_run=dry_run, cost_key=op.field)
             if dry_run:
-                return []
-            page = result.get(to_camel_case(op.field), {}) or {}
-            all_nodes.extend(page.get("nodes", []))
-            page_info = page.get("pageInfo", {}) or {}
-            if not page_info.get("hasNextPage"):
                 break
-            cursor = page_info.get("endCursor")
+            nodes, cursor = self.page_nodes(op, result)
+            all_nodes.extend(nodes)
+            if cursor is None:
+                break
         return self.boxify(all_nodes)
 
+    def single_request(
+        self,
+        op: QueryOp | MutationOp,
+        returns: list[str] | None,
+        kwargs: dict[str, Any],
+        idempotency_key: str | None = None,
+    ) -> tuple[GraphQLRequest, dict[str, Any]]:
+        """``(request, variable_values)`` for a mutation or a non-connection query."""
+        variable_values = op.variable_values(kwargs)
+        if isinstance(op, MutationOp):
+            request = op.sign(self.compile_mutation(op, returns, variable_values), variable_values, idempotency_key)
+            return request, variable_values
+        request = self.compile(
+            op, returns, variable_values,
+            lambda: dsl_gql(op.build(self.ds, variable_values, self.node_selections(op, returns))),
+        )
+        return request, variable_values
+
+    def unwrap(self, op: QueryOp | MutationOp, result: dict[str, Any] | None) -> Any:
+        """Box the op's field out of a response, as ``run`` returns it."""
+        if isinstance(op, MutationOp):
+            return self.boxify(result.get(to_camel_case(op.field), {}) if result else {})
+        return self.boxify(result.get(to_camel_case(op.field)) if result else None)
+
+    def run_batch(
+        self,
+        calls: Sequence[tuple[QueryOp | MutationOp, dict[str, Any]]],
+        *,
+        chunk_size: int = 25,
+        max_cost: int = MAX_QUERY_COST,
+        dry_run: bool = False,
+    ) -> list[Any]:
+        """Execute many non-connection ops as aliased fields of as few documents as possible.
+
+        ``calls`` is ``[(op, kwargs), ...]`` — the same kwargs ``run`` takes,
+        ``returns=`` included. Queries and mutations can't share a document, so
+        each call list must be one or the other. Each document carries up to
+        ``chunk_size`` fields aliased ``op0``…, and no more than ``max_cost``
+        estimated cost (``call_cost``); variables are prefixed per alias
+        (``$op3_product``). Mutations run in list order, as Shopify executes
+        sibling mutation fields serially.
+
+        Returns one result per call, in order, shaped as ``run`` would return it.
+        Batched documents vary with the call mix, so they bypass ``op_cache``.
+        """
+        kinds = {type(op) for op, _ in calls}
+        if not kinds <= {QueryOp, MutationOp} or len(kinds) > 1:
+            raise TypeError("run_batch: calls must be all QueryOps or all MutationOps")
+        for op, _ in calls:
+            if isinstance(op, QueryOp) and op.connection is not None:
+                raise TypeError(f"run_batch: connection query {op.field} must go through run/stream")
+            if isinstance(op, MutationOp) and op.idempotent:
+                raise TypeError(f"run_batch: {op.field} needs a per-call idempotency key — use run")
+
+        results: list[Any] = []
+        for chunk in self._batch_chunks(calls, chunk_size, max_cost):
+            var_defs = DSLVariableDefinitions()
+            dsl_fields: list[DSLField] = []
+            variable_values: dict[str, Any] = {}
+            for index, (op, kwargs) in enumerate(chunk):
+                alias = f"op{index}"
+                kwargs = dict(kwargs)
+                returns = kwargs.pop("returns", None)
+                args = {}
+                for name, value in op.variable_values(kwargs).items():
+                    variable_values[f"{alias}_{name}"] = value
+                    args[name] = getattr(var_defs, f"{alias}_{name}")
+                if isinstance(op, MutationOp):
+                    payload_type = op.payload(self.ds)
+                    selections = [*self.build_selections(payload_type, returns or op.fields), op.errors(self.ds, payload_type)]
+                else:
+                    selections = self.node_selections(op, returns)
+                dsl_fields.append(op.root(self.ds).args(**args).select(*selections).alias(alias))
+            operation = DSLMutation(*dsl_fields) if kinds == {MutationOp} else DSLQuery(*dsl_fields)
+            operation.variable_definitions = var_defs
+            cost_key = ("batch", tuple(sorted({op.field for op, _ in chunk})), len(chunk))
+            data = self.execute(dsl_gql(operation), variable_values, dry_run=dry_run, cost_key=cost_key) or {}
+            for index, (op, _) in enumerate(chunk):
+                value = data.get(f"op{index}")
+                results.append(self.boxify(value if value is not None or isinstance(op, QueryOp) else {}))
+        return results
+
+    def node_selections(self, op: QueryOp, returns: list[str] | None) -> list[DSLField]:
+        return self.build_selections(op.dsl_type(self.ds), returns or op.fields)
+
+    def compile_mutation(self, op: MutationOp, returns: list[str] | None, variable_values: dict[str, Any]) -> GraphQLRequest:
+        """Cached bare mutation document (``op.sign`` adds the idempotency directive per call)."""
+
+        def build() -> GraphQLRequest:
+            payload_type = op.payload(self.ds)
+            selections = [*self.build_selections(payload_type, returns or op.fields), op.errors(self.ds, payload_type)]
+            return op.document(self.ds, variable_values, selections)
+
+        return self.compile(op, returns, variable_values, build)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Connection pagination — serial cursor walk + streaming/ranged fetch.
+    # ─────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def connection_values(
+        op: QueryOp, kwargs: dict[str, Any], *, segment: str = "", sort_key: str | None = None
+    ) -> dict[str, Any]:
+        """Base variables for a connection query: search string (+ range clause) or typed vars."""
+        if op.is_search:
+            base: dict[str, Any] = {"query": " AND ".join(s for s in (op.search_string(kwargs), segment) if s)}
+        elif segment:
+            raise ValueError(f"query {op.field}: ranges= requires a search connection (is_search=True)")
+        else:
+            base = op.variable_values(kwargs)
+        return {**base, "sortKey": sort_key} if sort_key else base
+
+    def walk_pages(
+        self,
+        op: QueryOp,
+        returns: list[str] | None,
+        base_values: dict[str, Any],
+        page_size: int,
+        *,
+        dry_run: bool = False,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield each page's raw ``nodes`` list, following ``endCursor`` until exhausted.
+
+        The first page and every ``after:`` page are two cache entries; every
+        later page (and every later call) reuses them. A miss builds through
+        build_page(), which constructs a fresh DSLQuery each call — DSLField.args()
+        mutates ast_field.arguments in-place, so reusing a field accumulates duplicates.
+        """
+        cursor: str | None = None
+        while True:
+            request, page_values = self.page_request(op, returns, base_values, page_size, cursor)
+            result = self.execute(request, page_values, dry_run=dry_run, cost_key=op.field)
+            if dry_run:
+                return
+            nodes, cursor = self.page_nodes(op, result)
+            yield nodes
+            if cursor is None:
+                return
+
+    def page_request(
+        self, op: QueryOp, returns: list[str] | None, base_values: dict[str, Any], page_size: int, cursor: str | None
+    ) -> tuple[GraphQLRequest, dict[str, Any]]:
+        """``(request, page_values)`` for one page of a connection, after ``cursor`` when given."""
+        page_values = {**base_values, "first": page_size, **({"after": cursor} if cursor else {})}
+        request = self.compile(
+            op, returns, page_values,
+            lambda: dsl_gql(op.build_page(self.ds, page_values, self.node_selections(op, returns))),
+        )
+        return request, page_values
+
+    @staticmethod
+    def page_nodes(op: QueryOp, result: dict[str, Any] | None) -> tuple[list[dict[str, Any]], str | None]:
+        """A page response's raw ``nodes`` and the cursor for the next page (None on the last)."""
+        page = (result or {}).get(to_camel_case(op.field), {}) or {}
+        page_info = page.get("pageInfo", {}) or {}
+        return page.get("nodes", []), page_info.get("endCursor") if page_info.get("hasNextPage") else None
+
+    def stream_pages(
+        self,
+        op: QueryOp,
+        *,
+        returns: list[str] | None = None,
+        page_size: int = 100,
+        ranges: Sequence[str] | None = None,
+        sort_key: str | None = None,
+        prefetch: int = 2,
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield raw node pages as they arrive, fetching ahead on worker threads.
+
+        Each range (one per ``ranges`` clause, or a single unbounded range) is
+        walked by its own producer thread into a queue holding at most
+        ``prefetch`` pages, so the next request is in flight while the caller
+        processes the current page. Ranges run ``max_workers`` at a time and are
+        yielded strictly in ``ranges`` order — pass ordered, disjoint clauses
+        (see ``search_ranges``) plus a matching ``sort_key`` for a globally
+        ordered stream. Closing the generator early stops every producer.
+        """
+        if not isinstance(op, QueryOp) or op.connection is None:
+            raise TypeError(f"stream requires a connection QueryOp, got {getattr(op, 'field', op)!r}")
+        segments = [
+            self.connection_values(op, kwargs, segment=segment, sort_key=sort_key) for segment in (ranges or [""])
+        ]
+        stop = threading.Event()
+        queues: list[queue.Queue] = [queue.Queue(maxsize=max(1, prefetch)) for _ in segments]
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(segments))))
+        try:
+            for base_values, out in zip(segments, queues):
+                executor.submit(self._produce_pages, op, returns, base_values, page_size, out, stop)
+            for out in queues:
+                while (item := out.get()) is not _END_OF_RANGE:
+                    if isinstance(item, BaseException):
+                        raise item
+                    yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _produce_pages(
+        self,
+        op: QueryOp,
+        returns: list[str] | None,
+        base_values: dict[str, Any],
+        page_size: int,
+        out: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """Producer body for ``stream_pages``: walk one range into ``out``, then a terminator."""
+        try:
+            for nodes in self.walk_pages(op, returns, base_values, page_size):
+                if not _offer(out, nodes, stop):
+                    return
+        except Exception as exc:  # noqa: BLE001 — re-raised on the consumer side
+            _offer(out, exc, stop)
+            return
+        _offer(out, _END_OF_RANGE, stop)
+
+    def stream(self, op: QueryOp, **kwargs: Any) -> Iterator[Any]:
+        """Yield Box-wrapped nodes one at a time. Same arguments as ``stream_pages``."""
+        for nodes in self.stream_pages(op, **kwargs):
+            yield from self.boxify(nodes)
+
+    async def astream(self, op: QueryOp, **kwargs: Any) -> AsyncIterator[Any]:
+        """Async ``stream``: page hand-offs run on a worker thread, so the event loop never blocks.
+
+        The page generator is only ever touched from one dedicated thread: a
+        ``next()`` still running when the consumer stops (``break`` or task
+        cancellation) finishes before ``close()`` runs after it on that thread.
+        """
+        pages = self.stream_pages(op, **kwargs)
+        loop = asyncio.get_running_loop()
+        driver = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shopify-astream")
+        step: Future | None = None
+        try:
+            while True:
+                step = driver.submit(next, pages, _END_OF_RANGE)
+                nodes = await asyncio.wrap_future(step, loop=loop)
+                if nodes is _END_OF_RANGE:
+                    break
+                for node in self.boxify(nodes):
+                    yield node
+        finally:
+            closing = driver.submit(pages.close)  # queued behind any in-flight next()
+            driver.shutdown(wait=False)
+            if step is None or step.done():
+                await asyncio.wrap_future(closing, loop=loop)
+
+
+# Terminator a range producer enqueues after its last page.
+_END_OF_RANGE = object()
+
+
+def _offer(out: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Put ``item`` on a bounded queue, giving up once ``stop`` is set. Returns False if abandoned."""
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CLI demo — dry-run a few ops. Reads env vars EXPLICITLY here, not in the
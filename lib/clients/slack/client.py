@@ -11,7 +11,7 @@ SlackBot     — lightweight wrapper (NOT Bolt) that pairs a BotConfig with a
 
 import logging
 import os
-from typing import Any, Callable, Dict, List, Literal, Optional, TypedDict, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, TypedDict, TypeVar, Union
 
 from pydantic import BaseModel, ConfigDict, field_serializer
 from slack_sdk import WebClient
@@ -28,6 +28,9 @@ from shared_utilities.pydantic_config import DEFAULT_CONFIG_DICT
 
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from shared_utilities.clients.slack.directory import SlackDirectory
+
 T = TypeVar("T")
 
 
@@ -453,6 +456,12 @@ class SlackBot:
     def signing_secret(self) -> str:
         return self.bot_config.signing_secret
 
+    @property
+    def directory(self) -> "SlackDirectory":
+        """Cached users / channels / usergroups shared by every bot on this token."""
+        from shared_utilities.clients.slack.directory import directory_for
+        return directory_for(self.client)
+
     def send_message(
         self,
         message_type: Literal["to_user", "to_channel", "reply", "ephemeral"],
@@ -527,15 +536,17 @@ class SlackBot:
         scope_label = "public + private" if include_private else "public"
         print(f"🔍 Looking up channel by name: '{channel_name}' ({scope_label})")
 
-        channels = self._list_all_channels(include_private=include_private)
-        print(f"   Found {len(channels)} accessible channels ({scope_label})")
-
-        result = next((c for c in channels if c.get("name", "").lower() == channel_name), None)
+        try:
+            result = self.directory.channel_by_name(channel_name, include_private=include_private)
+        except Exception as e:
+            print(f"   ⚠️ conversations.list failed: {type(e).__name__}: {e}")
+            return None
 
         if result:
             print(f"   ✅ Found: {result.get('name')} ({result.get('id')})")
         else:
             # Debug: show similar channel names
+            channels = self.directory.list_channels(include_private=include_private)
             similar = [c.get("name") for c in channels if channel_name in c.get("name", "").lower()][:5]
             if similar:
                 print(f"   ⚠️ Not found. Similar channels: {similar}")
@@ -550,37 +561,3 @@ class SlackBot:
         if identifier.startswith("S") and len(identifier) == 11 and identifier.isalnum():
             return svc.get_group_by_id(identifier)
         return svc.get_group_by_handle(identifier.lstrip("@"))
-
-    def _list_all_channels(self, include_archived: bool = False, include_private: bool = True) -> List[Dict[str, Any]]:
-        """List all channels the bot has access to.
-
-        Args:
-            include_archived: Include archived channels (default: False)
-            include_private: Include private channels (default: True)
-
-        Returns:
-            List of channel dictionaries
-        """
-        channels: List[Dict[str, Any]] = []
-        cursor = None
-
-        # Types to fetch: public channels + private channels (if enabled)
-        types = "public_channel,private_channel" if include_private else "public_channel"
-
-        while True:
-            try:
-                resp = self.client.conversations_list(types=types, cursor=cursor, limit=200)
-                if resp.get("ok"):
-                    channels.extend(resp.get("channels", []))
-                    cursor = resp.get("response_metadata", {}).get("next_cursor")
-                    if not cursor:
-                        break
-                else:
-                    print(f"   ⚠️ conversations.list returned not-ok: {resp.get('error')!r}")
-                    break
-            except Exception as e:
-                print(f"   ⚠️ conversations.list failed: {type(e).__name__}: {e}")
-                break
-        if not include_archived:
-            channels = [c for c in channels if not c.get("is_archived")]
-        return channels
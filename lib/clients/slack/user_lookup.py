@@ -12,6 +12,7 @@ from pydantic import BaseModel
 from slack_sdk import WebClient
 
 from shared_utilities.clients.slack.client import SlackUserIdentifier, UserLookupByEmailPayload
+from shared_utilities.clients.slack.directory import directory_for
 from shared_utilities.clients.slack.models.slack_user import SlackUser
 
 logger = logging.getLogger(__name__)
@@ -95,16 +96,17 @@ def find_candidates_by_last_name(client: WebClient, last_name: str) -> List[Slac
     lname = (last_name or "").strip().lower()
     if not lname:
         return []
+    try:
+        directory = directory_for(client)
+        # Exact last-name hits come straight from the index; the substring scan is only a fallback.
+        matches = directory.users_with_last_name(lname) or directory.search_users(lname)
+    except Exception as e:
+        logger.error("Error listing users for last name %r: %s", lname, e)
+        return []
     candidates: List[SlackUser] = []
-    for user_dict in list_all_users(client):
+    for user_dict in matches:
         try:
-            user = SlackUser(**user_dict)
-            profile = user_dict.get("profile", {})
-            real_name = (
-                profile.get("real_name_normalized") or profile.get("real_name") or user_dict.get("name") or ""
-            ).lower()
-            if real_name.endswith(" " + lname) or real_name.split()[-1] == lname or lname in real_name:
-                candidates.append(user)
+            candidates.append(SlackUser(**user_dict))
         except Exception as e:
             logger.debug("Could not parse user %s: %s", user_dict.get("id"), e)
     return candidates
@@ -120,6 +122,11 @@ def lookup_user(client: WebClient, identifier: SlackUserIdentifier) -> Optional[
 
 def lookup_user_by_email(client: WebClient, email: str) -> Optional[Dict[str, Any]]:
     normalized = normalize_email(email)
+    directory = directory_for(client)
+    if directory.is_fresh("users"):
+        cached = directory.user_by_email(normalized)
+        if cached:
+            return cached
     try:
         payload = UserLookupByEmailPayload(email=normalized)
         response = _call_slack_api(client, client.users_lookupByEmail, payload, f"Lookup user by email: {normalized}")
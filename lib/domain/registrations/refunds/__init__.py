@@ -8,6 +8,11 @@ Public API:
     - RefundTier: A single tier (percentage, penalty) in the ladder.
     - WeekSchedule: Tier-cutoff datetimes for a season.
     - timing_label: Human-readable label for a tier index.
+    - season_dates_for: ``SeasonDates.from_html`` memoized by (product id, updatedAt).
+
+Season cache (season_cache.py):
+    - SeasonDatesCache: in-process LRU over an optional persistent SeasonStore.
+    - FileSeasonStore / DynamoSeasonStore: persistent tiers (local JSON / DynamoDB).
 
 Tier ladders:
     - REFUND_TIERS: 95 / 90 / 80 / 70 / 60 / 50 (refund to original payment).
@@ -36,3 +41,11 @@ from lib.domain.registrations.refunds.refund_calculator import (
     strip_html,
     timing_label,
 )
+from lib.domain.registrations.refunds.season_cache import (
+    DynamoSeasonStore,
+    FileSeasonStore,
+    SeasonDatesCache,
+    SeasonStore,
+    season_cache,
+    season_dates_for,
+)
@@ -1,13 +1,27 @@
 """Stage 2 (scripts venv): enrich refund rows with Shopify order + product data
 and the canonical refund estimate.
 
+Rows are looked up ``LOOKUP_CHUNK`` at a time — one OR-joined ``orders`` search
+per chunk (``name:#1001 OR name:#1002 …``), chunks in flight ``MAX_WORKERS`` at
+once — and season dates are parsed once per product, not once per row. Each
+finished record is appended to ``<out_path>.partial.jsonl`` as it completes; a
+rerun skips every row already there, so an interrupted audit resumes where it
+stopped. Rows whose lookup failed are not checkpointed and are retried on the
+next run; the checkpoint is removed once a run finishes with none.
+
+Outputs: ``out_path`` (JSON, ordered by row) and ``out_path`` with a ``.csv``
+suffix (``json_to_csv.COLUMNS``, written row by row as records complete).
+
 Run: uv run --project lib python lib/domain/registrations/refunds/analyze_refunds.py [in_path] [out_path]
 """
 
+import csv
 import json
 import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -24,14 +38,15 @@ from lib.domain.registrations.refunds import (
     strip_html,
 )
 from lib.domain.registrations.refunds.refund_calculator import _norm_date
+from lib.tooling.json_to_csv import COLUMNS
 
-# shop_client does no I/O at import — consumer reads env + constructs client.
-dotenv.load_dotenv()
-client = ShopifyClient(
-    store_id=os.environ["SHOPIFY__STORE_ID"],
-    api_version=os.environ["SHOPIFY__API_VERSION"],
-    token=os.environ["SHOPIFY__TOKEN__ADMIN"],
-)
+# Order names per search. Also the page size: with line items capped at
+# LINE_ITEMS_FIRST an order costs ~28 points, so a page is ~700 of the 1000-point
+# query-cost cap. Unbounded, ``lineItems`` is ``first: 250``: ~500 points per order.
+LOOKUP_CHUNK = 25
+# Registration orders carry one or two line items; the refund estimate only needs the product.
+LINE_ITEMS_FIRST = 10
+MAX_WORKERS = 4
 
 ET = ZoneInfo("America/New_York")
 UTC = ZoneInfo("UTC")
@@ -47,12 +62,12 @@ ORDER_FIELDS = [
     "refunds.id",
     "refunds.created_at",
     "refunds.total_refunded_set.shop_money.amount",
-    "line_items.nodes.id",
-    "line_items.nodes.title",
-    "line_items.nodes.product.id",
-    "line_items.nodes.product.title",
-    "line_items.nodes.product.handle",
-    "line_items.nodes.product.description_html",
+    f"line_items[{LINE_ITEMS_FIRST}].nodes.id",
+    f"line_items[{LINE_ITEMS_FIRST}].nodes.title",
+    f"line_items[{LINE_ITEMS_FIRST}].nodes.product.id",
+    f"line_items[{LINE_ITEMS_FIRST}].nodes.product.title",
+    f"line_items[{LINE_ITEMS_FIRST}].nodes.product.handle",
+    f"line_items[{LINE_ITEMS_FIRST}].nodes.product.description_html",
 ]
 
 
@@ -125,99 +140,207 @@ def money(node: Any) -> float:
         return 0.0
 
 
+def make_client() -> ShopifyClient:
+    # shop_client does no I/O at import — consumer reads env + constructs client.
+    dotenv.load_dotenv()
+    return ShopifyClient(
+        store_id=os.environ["SHOPIFY__STORE_ID"],
+        api_version=os.environ["SHOPIFY__API_VERSION"],
+        token=os.environ["SHOPIFY__TOKEN__ADMIN"],
+    )
+
+
+def order_name(row: dict) -> str:
+    """Shopify order search needs the `#` prefix for exact-name match."""
+    return f"#{str(row['order_number']).lstrip('#').strip()}"
+
+
+def lookup_orders(client: ShopifyClient, names: Iterable[str], *, page_size: int = LOOKUP_CHUNK) -> dict[str, Any]:
+    """Map order name → order Box for every exact match, in one OR-joined search."""
+    wanted = list(dict.fromkeys(names))
+    if not wanted:
+        return {}
+    op = schema.orders.queries.by_name
+    clause = "(" + " OR ".join(f"name:{name}" for name in wanted) + ")"
+    base_values = client.connection_values(op, {}, segment=clause)
+    targets = set(wanted)
+    found: dict[str, Any] = {}
+    for nodes in client.walk_pages(op, ORDER_FIELDS, base_values, page_size):
+        for order in client.boxify(nodes):
+            if order.name in targets:
+                found.setdefault(order.name, order)
+    return found
+
+
+def base_record(row: dict) -> dict:
+    rec: dict = {
+        "row": row["row"],
+        "timestamp": row["timestamp"],
+        "order_number": row["order_number"],
+        "refund_to": row["refund_to"],
+        "processed": row["processed"],
+        "requester": f"{row['first_name']} {row['last_name']}".strip(),
+        "email": row["email"],
+        "note": row["note"],
+    }
+    ts_utc = parse_ts(row["timestamp"])
+    rec["submitted_at_utc"] = ts_utc.isoformat() if ts_utc else None
+    return rec
+
+
+def build_record(row: dict, order: Any, season_cache: dict[str, tuple[SeasonDates, str]]) -> dict:
+    """Full analysis record for one row; ``season_cache`` is keyed by product id."""
+    rec = base_record(row)
+    if order is None:
+        rec["error"] = "order not found"
+        return rec
+
+    rec["order_name"] = order.name
+    rec["order_email"] = order.email
+    rec["financial_status"] = order.display_financial_status
+    rec["cancelled_at"] = order.cancelled_at
+
+    order_total = money(order.total_price_set)
+    refund_nodes = order.refunds or []
+    total_refunded = sum(money(r.total_refunded_set) for r in refund_nodes)
+    refundable = max(0.0, order_total - total_refunded)
+    rec["amount_paid"] = round(order_total, 2)
+    rec["already_refunded"] = round(total_refunded, 2)
+    rec["refundable_balance"] = round(refundable, 2)
+    rec["existing_refunds"] = [
+        {
+            "id": r.id,
+            "created_at": r.created_at,
+            "amount": round(money(r.total_refunded_set), 2),
+        }
+        for r in refund_nodes
+    ]
+
+    product = None
+    for li in (order.line_items.nodes if order.line_items else []) or []:
+        if li.product:
+            product = li.product
+            break
+    if product is not None:
+        rec["product_title"] = product.title
+        rec["product_handle"] = product.handle
+        key = product.id or product.handle
+        if key not in season_cache:
+            season_cache[key] = parse_season(product.description_html or "")
+        season, parser_used = season_cache[key]
+        rec["season_start"] = season.start_date
+        rec["season_weeks"] = season.total_weeks
+        rec["season_off_dates"] = season.off_dates
+        rec["season_parser"] = parser_used
+    else:
+        season = SeasonDates()
+        rec["product_title"] = None
+        rec["season_start"] = None
+        rec["season_parser"] = "no_product"
+
+    # Estimate (on refundable balance, matching the Lambda path)
+    tier_kind = (
+        EstimateTierKind.REFUND_TO_ORIGINAL
+        if row["refund_to"] == "original_method"
+        else EstimateTierKind.STORE_CREDIT
+    )
+    est = estimate_refund_due(season, refundable, tier_kind, parse_ts(row["timestamp"]))
+    rec["estimate_success"] = est.success
+    rec["estimate_amount"] = round(est.amount, 2)
+    rec["estimate_pct"] = est.percentage
+    rec["estimate_timing"] = est.timing
+    rec["estimate_message"] = est.message
+    return rec
+
+
+def analyze_rows(
+    client: ShopifyClient,
+    rows: list[dict],
+    *,
+    chunk: int = LOOKUP_CHUNK,
+    max_workers: int = MAX_WORKERS,
+    season_cache: dict[str, tuple[SeasonDates, str]] | None = None,
+) -> Iterator[dict]:
+    """Yield one record per row, chunk by chunk in completion order.
+
+    A failed search marks only its own chunk's rows ``lookup failed``.
+    """
+    cache: dict[str, tuple[SeasonDates, str]] = {} if season_cache is None else season_cache
+    chunks = [rows[i : i + chunk] for i in range(0, len(rows), chunk)]
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        futures = {
+            executor.submit(lookup_orders, client, [order_name(r) for r in part], page_size=chunk): part
+            for part in chunks
+        }
+        for future in as_completed(futures):
+            try:
+                found, error = future.result(), None
+            except Exception as e:  # noqa: BLE001
+                found, error = {}, e
+            for row in futures[future]:
+                if error is not None:
+                    rec = base_record(row)
+                    rec["error"] = f"lookup failed: {error}"
+                    yield rec
+                else:
+                    yield build_record(row, found.get(order_name(row)), cache)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class Checkpoint:
+    """Append-only JSON Lines log of finished records, keyed by sheet row."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.done: dict[Any, dict] = {}
+        if path.exists():
+            for line in path.read_text().splitlines():
+                if line.strip():
+                    rec = json.loads(line)
+                    self.done[rec["row"]] = rec
+
+    def pending(self, rows: list[dict]) -> list[dict]:
+        return [row for row in rows if row["row"] not in self.done]
+
+    def append(self, rec: dict) -> None:
+        """Record ``rec`` as finished — unless its lookup failed, so a rerun retries it."""
+        if str(rec.get("error", "")).startswith("lookup failed"):
+            return
+        self.done[rec["row"]] = rec
+        with self.path.open("a") as f:
+            f.write(json.dumps(rec, default=str) + "\n")
+
+
 def main() -> None:
     in_path = sys.argv[1] if len(sys.argv) > 1 else "/tmp/refund_rows.json"
     out_path = sys.argv[2] if len(sys.argv) > 2 else "/tmp/refund_analysis.json"
+    csv_path = Path(out_path).with_suffix(".csv")
 
     rows = json.loads(Path(in_path).read_text())
-
-    results = []
-    for row in rows:
-        rec: dict = {
-            "row": row["row"],
-            "timestamp": row["timestamp"],
-            "order_number": row["order_number"],
-            "refund_to": row["refund_to"],
-            "processed": row["processed"],
-            "requester": f"{row['first_name']} {row['last_name']}".strip(),
-            "email": row["email"],
-            "note": row["note"],
-        }
-        ts_utc = parse_ts(row["timestamp"])
-        rec["submitted_at_utc"] = ts_utc.isoformat() if ts_utc else None
-
-        try:
-            # Shopify order search needs the `#` prefix for exact-name match.
-            matches = client.run(
-                schema.orders.queries.by_name,
-                name=f"#{row['order_number']}",
-                returns=ORDER_FIELDS,
-            )
-        except Exception as e:  # noqa: BLE001
-            rec["error"] = f"lookup failed: {e}"
-            results.append(rec)
-            continue
-        order = next(iter(matches or []), None)
-        if order is None:
-            rec["error"] = "order not found"
+    checkpoint = Checkpoint(Path(f"{out_path}.partial.jsonl"))
+    pending = checkpoint.pending(rows)
+    if checkpoint.done:
+        print(f"Resuming: {len(checkpoint.done)} rows checkpointed, {len(pending)} to go")
+
+    results = list(checkpoint.done.values())
+    with csv_path.open("w", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=COLUMNS, extrasaction="ignore")
+        w.writeheader()
+        for r in results:
+            w.writerow({k: r.get(k, "") for k in COLUMNS})
+        for rec in analyze_rows(make_client(), pending):
+            checkpoint.append(rec)
             results.append(rec)
-            continue
-
-        rec["order_name"] = order.name
-        rec["order_email"] = order.email
-        rec["financial_status"] = order.display_financial_status
-        rec["cancelled_at"] = order.cancelled_at
-
-        order_total = money(order.total_price_set)
-        refund_nodes = order.refunds or []
-        total_refunded = sum(money(r.total_refunded_set) for r in refund_nodes)
-        refundable = max(0.0, order_total - total_refunded)
-        rec["amount_paid"] = round(order_total, 2)
-        rec["already_refunded"] = round(total_refunded, 2)
-        rec["refundable_balance"] = round(refundable, 2)
-        rec["existing_refunds"] = [
-            {
-                "id": r.id,
-                "created_at": r.created_at,
-                "amount": round(money(r.total_refunded_set), 2),
-            }
-            for r in refund_nodes
-        ]
-
-        product = None
-        for li in (order.line_items.nodes if order.line_items else []) or []:
-            if li.product:
-                product = li.product
-                break
-        if product is not None:
-            rec["product_title"] = product.title
-            rec["product_handle"] = product.handle
-            season, parser_used = parse_season(product.description_html or "")
-            rec["season_start"] = season.start_date
-            rec["season_weeks"] = season.total_weeks
-            rec["season_off_dates"] = season.off_dates
-            rec["season_parser"] = parser_used
-        else:
-            season = SeasonDates()
-            rec["product_title"] = None
-            rec["season_start"] = None
-            rec["season_parser"] = "no_product"
-
-        # Estimate (on refundable balance, matching the Lambda path)
-        tier_kind = (
-            EstimateTierKind.REFUND_TO_ORIGINAL
-            if row["refund_to"] == "original_method"
-            else EstimateTierKind.STORE_CREDIT
-        )
-        est = estimate_refund_due(season, refundable, tier_kind, ts_utc)
-        rec["estimate_success"] = est.success
-        rec["estimate_amount"] = round(est.amount, 2)
-        rec["estimate_pct"] = est.percentage
-        rec["estimate_timing"] = est.timing
-        rec["estimate_message"] = est.message
-        results.append(rec)
+            w.writerow({k: rec.get(k, "") for k in COLUMNS})
+            f.flush()
 
+    results.sort(key=lambda r: r["row"])
     Path(out_path).write_text(json.dumps(results, indent=2, default=str))
+    failed = sum(1 for r in results if str(r.get("error", "")).startswith("lookup failed"))
+    if not failed:
+        checkpoint.path.unlink(missing_ok=True)
 
     # Console table
     hdr = (f"{'row':>3} {'order':>8} {'type':>10} {'paid':>8} {'refunded':>9} "
@@ -238,7 +361,9 @@ def main() -> None:
               f"{str(r.get('season_weeks') or ''):>3} {est:>8} "
               f"{pct}  {status}"
               f"{'  [PROCESSED]' if r['processed'] == 'TRUE' else ''}")
-    print(f"\nWrote {len(results)} records to {out_path}")
+    print(f"\nWrote {len(results)} records to {out_path} and {csv_path}")
+    if failed:
+        print(f"{failed} lookups failed — rerun to retry them (checkpoint: {checkpoint.path})")
 
 
 if __name__ == "__main__":
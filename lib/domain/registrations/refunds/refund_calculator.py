@@ -24,8 +24,9 @@ from __future__ import annotations
 import re
 from datetime import datetime, timedelta, timezone
 from enum import StrEnum
+from functools import lru_cache
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 # ── Small helpers ───────────────────────────────────────────────────────────
@@ -58,11 +59,15 @@ def parse_csv_dates(csv: str | None) -> list[datetime]:
     return sorted(out)
 
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def strip_html(html: str) -> str:
     """Strip tags, decode the two entities we actually see, collapse whitespace."""
-    text = re.sub(r"<[^>]+>", "", html)
+    text = _TAG_RE.sub("", html)
     text = text.replace("&nbsp;", " ").replace("&amp;", "&")
-    return re.sub(r"\s+", " ", text).strip()
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
 
 def ensure_utc(dt: datetime | None) -> datetime:
@@ -184,6 +189,7 @@ class WeekSchedule(BaseModel):
 #   numeric  -> 6/14/26  or  6/14/2026
 #   longform -> June 14, 2026  (the comma is optional)
 _DATE_TOKEN = r"\d{1,2}/\d{1,2}/\d{2,4}|[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4}"
+_DATE_TOKEN_RE = re.compile(_DATE_TOKEN)
 
 _LONGFORM_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%B %d %Y", "%b %d %Y")
 
@@ -209,24 +215,30 @@ def _norm_date(dt: datetime) -> str:
     return f"{dt.month}/{dt.day}/{dt.year}"
 
 
-SEASON_DATES_PATTERN = re.compile(
+_SEASON_RANGE = (
     r"Season Dates[^:\d]*[:\s]*?"
-    rf"({_DATE_TOKEN})\s*[–—-]\s*"
-    rf"({_DATE_TOKEN})"
-    r"(?:\s*\((\d+)\s+weeks(?:,\s*off\s+([^)]+))?\))?",
-    re.IGNORECASE,
+    rf"(?P<start>{_DATE_TOKEN})\s*[–—-]\s*"
+    rf"(?P<end>{_DATE_TOKEN})"
+    r"(?:\s*\((?P<weeks>\d+)\s+weeks(?:,\s*off\s+(?P<inline_off>[^)]+))?\))?"
 )
 
 # Off weeks are sometimes listed on their own line (e.g. "Off Dates: June 28,
 # 2026") instead of inline in the "(N weeks, off …)" parenthetical. Capture the
 # run of date tokens immediately after the label.
-OFF_DATES_PATTERN = re.compile(
-    rf"Off Dates[^:\d]*[:\s]+((?:(?:{_DATE_TOKEN})\s*,?\s*)+)",
-    re.IGNORECASE,
-)
+_OFF_LINE = rf"Off Dates[^:\d]*[:\s]+(?P<off_line>(?:(?:{_DATE_TOKEN})\s*,?\s*)+)"
+
+SEASON_DATES_PATTERN = re.compile(_SEASON_RANGE, re.IGNORECASE)
+OFF_DATES_PATTERN = re.compile(_OFF_LINE, re.IGNORECASE)
+
+# Both labels in one alternation, so ``from_html`` scans the description once
+# and stops as soon as it has the first of each.
+SEASON_FIELDS_PATTERN = re.compile(f"{_SEASON_RANGE}|{_OFF_LINE}", re.IGNORECASE)
 
 
 class SeasonDates(BaseModel):
+    # Frozen: parsed instances are shared through ``season_cache``.
+    model_config = ConfigDict(frozen=True)
+
     start_date: str | None = None
     off_dates: str | None = None
     total_weeks: int | None = None
@@ -243,41 +255,52 @@ class SeasonDates(BaseModel):
         """
         if not html:
             return cls()
-        text = strip_html(html)
-        match = SEASON_DATES_PATTERN.search(text)
+        match = line_match = None
+        for m in SEASON_FIELDS_PATTERN.finditer(strip_html(html)):
+            if m["start"] is not None:
+                match = match or m
+            else:
+                line_match = line_match or m
+            if match and line_match:
+                break
         if not match:
             return cls()
-        start = parse_season_date(match.group(1))
+        start = parse_season_date(match["start"])
         if start is None:
             return cls()
 
         # Off dates: inline parenthetical and/or the standalone "Off Dates:" line.
-        off_sources = [match.group(4) or ""]
-        line_match = OFF_DATES_PATTERN.search(text)
+        off_sources = [match["inline_off"] or ""]
         if line_match:
-            off_sources.append(line_match.group(1))
+            off_sources.append(line_match["off_line"])
         off_dates = [
             dt
             for src in off_sources
-            for tok in re.findall(_DATE_TOKEN, src)
+            for tok in _DATE_TOKEN_RE.findall(src)
             if (dt := parse_season_date(tok))
         ]
 
         return cls(
             start_date=_norm_date(start),
             off_dates=", ".join(_norm_date(dt) for dt in off_dates) or None,
-            total_weeks=int(match.group(3)) if match.group(3) else None,
+            total_weeks=int(match["weeks"]) if match["weeks"] else None,
         )
 
     def to_schedule(self) -> WeekSchedule:
         assert self.start_date is not None, "start_date required to build schedule"
-        return WeekSchedule.build(parse_date_mdy(self.start_date), parse_csv_dates(self.off_dates))
+        return _build_schedule(self.start_date, self.off_dates)
 
     @property
     def is_short(self) -> bool:
         return self.total_weeks is not None and self.total_weeks <= 7
 
 
+@lru_cache(maxsize=256)
+def _build_schedule(start_date: str, off_dates: str | None) -> WeekSchedule:
+    """One schedule per distinct season — a refund evaluation asks for it up to three times."""
+    return WeekSchedule.build(parse_date_mdy(start_date), parse_csv_dates(off_dates))
+
+
 # ── Result + entry point ────────────────────────────────────────────────────
 
 
@@ -0,0 +1,152 @@
+"""Memoized ``SeasonDates.from_html`` for the synchronous refund path.
+
+Entries are keyed by ``(product id, updatedAt)`` when the caller has both — a
+product's description can't change without bumping ``updatedAt`` — and by a
+SHA-256 of the HTML otherwise. The first tier is an in-process LRU, which a warm
+Lambda keeps across invocations. An optional ``SeasonStore`` adds a persistent
+second tier shared by cold starts and scripts: ``FileSeasonStore`` (local JSON)
+or ``DynamoSeasonStore`` (any table with a string partition key).
+
+Store failures never fail an estimate — the HTML is parsed as if the store
+were absent.
+
+    season = season_dates_for(product.description_html, product_id=product.id, updated_at=product.updated_at)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+from lib.domain.registrations.refunds.refund_calculator import SeasonDates
+
+logger = logging.getLogger(__name__)
+
+
+class SeasonStore(Protocol):
+    """Persistent tier: ``SeasonDates.model_dump()`` dicts by cache key."""
+
+    def get(self, key: str) -> dict[str, Any] | None: ...
+
+    def put(self, key: str, value: dict[str, Any]) -> None: ...
+
+
+class FileSeasonStore:
+    """JSON object on disk, loaded on first use and rewritten atomically on put."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = json.loads(self.path.read_text()) if self.path.exists() else {}
+        return self._entries
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            return self._load().get(key)
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[key] = value
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(entries))
+            os.replace(tmp, self.path)
+
+
+class DynamoSeasonStore:
+    """A DynamoDB table (boto3 ``Table`` resource) with a string partition key."""
+
+    def __init__(self, table: Any, *, key_attr: str = "cache_key"):
+        self.table = table
+        self.key_attr = key_attr
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        item = self.table.get_item(Key={self.key_attr: key}).get("Item")
+        return item.get("season") if item else None
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        self.table.put_item(Item={self.key_attr: key, "season": value})
+
+
+class SeasonDatesCache:
+    """Thread-safe LRU of parsed ``SeasonDates`` over an optional ``SeasonStore``."""
+
+    def __init__(self, maxsize: int = 512, store: SeasonStore | None = None):
+        self.maxsize = maxsize
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, SeasonDates] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(html: str, product_id: str | None = None, updated_at: str | None = None) -> str:
+        if product_id and updated_at:
+            return f"{product_id}@{updated_at}"
+        return "sha256:" + hashlib.sha256(html.encode()).hexdigest()
+
+    def get(self, html: str | None, *, product_id: str | None = None, updated_at: str | None = None) -> SeasonDates:
+        html = html or ""
+        key = self.key(html, product_id, updated_at)
+        with self._lock:
+            season = self._entries.get(key)
+            if season is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return season
+            self.misses += 1
+
+        season = self._from_store(key)
+        if season is None:
+            season = SeasonDates.from_html(html)
+            self._to_store(key, season)
+
+        with self._lock:
+            self._entries[key] = season
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return season
+
+    def _from_store(self, key: str) -> SeasonDates | None:
+        if self.store is None:
+            return None
+        try:
+            data = self.store.get(key)
+            return SeasonDates.model_validate(data) if data is not None else None
+        except Exception:  # noqa: BLE001 — fall back to parsing
+            logger.warning("season_cache.store_get_failed", extra={"key": key}, exc_info=True)
+            return None
+
+    def _to_store(self, key: str, season: SeasonDates) -> None:
+        if self.store is None:
+            return
+        try:
+            self.store.put(key, season.model_dump())
+        except Exception:  # noqa: BLE001 — the LRU still has it
+            logger.warning("season_cache.store_put_failed", extra={"key": key}, exc_info=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+season_cache = SeasonDatesCache()
+
+
+def season_dates_for(
+    html: str | None, *, product_id: str | None = None, updated_at: str | None = None
+) -> SeasonDates:
+    """``SeasonDates.from_html(html)`` through the process-wide ``season_cache``."""
+    return season_cache.get(html, product_id=product_id, updated_at=updated_at)
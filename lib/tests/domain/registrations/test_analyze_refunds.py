@@ -0,0 +1,129 @@
+"""Tests for the refund-analysis pipeline (``analyze_refunds.py``).
+
+Covers:
+  - order names looked up in OR-joined chunks, exact matches only
+  - season dates parsed once per product
+  - a failed chunk marks only its own rows, and is not checkpointed
+  - the JSON Lines checkpoint skips finished rows on a rerun
+  - a full lookup page stays under Shopify's single-query cost cap
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "clients" / "shopify-client"))
+
+from graphql import build_schema  # noqa: E402
+from shop_client import MAX_QUERY_COST, ShopifyClient  # noqa: E402
+
+from lib.domain.registrations.refunds import analyze_refunds  # noqa: E402
+from lib.domain.registrations.refunds.analyze_refunds import (  # noqa: E402
+    Checkpoint,
+    analyze_rows,
+    lookup_orders,
+)
+
+SEASON_HTML = "Season Dates 1/15/2025 – 3/15/2025"
+
+ORDER_SDL = """
+type Query { orders(first: Int, after: String, query: String): OrderConnection! }
+type OrderConnection { nodes: [Order!]! }
+type Order {
+  id: ID! name: String! email: String displayFinancialStatus: String cancelledAt: String
+  totalPriceSet: MoneyBag! refunds(first: Int): [Refund!]! lineItems(first: Int): LineItemConnection!
+}
+type MoneyBag { shopMoney: MoneyV2! }
+type MoneyV2 { amount: String! currencyCode: String! }
+type Refund { id: ID! createdAt: String totalRefundedSet: MoneyBag! }
+type LineItemConnection { nodes: [LineItem!]! }
+type LineItem { id: ID! title: String! product: Product }
+type Product { id: ID! title: String! handle: String! descriptionHtml: String }
+"""
+
+
+def _order(number: int, product_id: str = "gid://shopify/Product/1") -> dict:
+    return {
+        "id": f"gid://shopify/Order/{number}",
+        "name": f"#{number}",
+        "email": "a@x.com",
+        "displayFinancialStatus": "PAID",
+        "cancelledAt": None,
+        "totalPriceSet": {"shopMoney": {"amount": "100.00"}},
+        "refunds": [],
+        "lineItems": {"nodes": [
+            {"product": {"id": product_id, "title": "Dodgeball", "handle": "dodgeball", "descriptionHtml": SEASON_HTML}},
+        ]},
+    }
+
+
+def _row(row: int, number: int) -> dict:
+    return {
+        "row": row, "timestamp": "01/01/2025 12:00:00", "order_number": str(number),
+        "refund_to": "original_method", "processed": "FALSE",
+        "first_name": "A", "last_name": "B", "email": "a@x.com", "note": "",
+    }
+
+
+class _FakeShop:
+    connection_values = staticmethod(ShopifyClient.connection_values)
+    boxify = staticmethod(ShopifyClient.boxify)
+
+    def __init__(self, orders: list[dict], fail_on: str = ""):
+        self.orders = orders
+        self.fail_on = fail_on
+        self.queries: list[str] = []
+        self.lock = threading.Lock()
+
+    def walk_pages(self, op, returns, base_values, page_size):
+        query = base_values["query"]
+        with self.lock:
+            self.queries.append(query)
+        if self.fail_on and self.fail_on in query:
+            raise RuntimeError("throttled")
+        # Name search is a prefix match — #10 also matches #100.
+        yield [o for o in self.orders if any(f"name:{o['name'][:3]}" in part for part in query.split(" OR "))]
+
+
+def test_lookup_is_one_search_per_chunk_exact_matches_only():
+    shop = _FakeShop([_order(100), _order(101)])
+    found = lookup_orders(shop, ["#100", "#100", "#101", "#102"])
+    assert shop.queries == ["(name:#100 OR name:#101 OR name:#102)"]
+    assert sorted(found) == ["#100", "#101"]
+
+
+def test_rows_chunked_and_season_parsed_once_per_product(monkeypatch):
+    calls = []
+    parse = analyze_refunds.parse_season
+    monkeypatch.setattr(analyze_refunds, "parse_season", lambda html: calls.append(html) or parse(html))
+
+    shop = _FakeShop([_order(n) for n in range(100, 110)])
+    rows = [_row(i, 100 + i) for i in range(10)] + [_row(10, 999)]
+    records = list(analyze_rows(shop, rows, chunk=4, max_workers=2))
+
+    assert len(shop.queries) == 3
+    assert sorted(r["row"] for r in records) == list(range(11))
+    assert len(calls) == 1
+    by_row = {r["row"]: r for r in records}
+    assert by_row[0]["season_start"] == "1/15/2025" and by_row[0]["estimate_success"]
+    assert by_row[10]["error"] == "order not found"
+
+
+def test_failed_chunk_is_isolated_and_retried(tmp_path):
+    shop = _FakeShop([_order(n) for n in range(100, 104)], fail_on="#102")
+    rows = [_row(i, 100 + i) for i in range(4)]
+    checkpoint = Checkpoint(tmp_path / "out.json.partial.jsonl")
+    for rec in analyze_rows(shop, rows, chunk=2):
+        checkpoint.append(rec)
+
+    assert sorted(checkpoint.done) == [0, 1]
+    resumed = Checkpoint(checkpoint.path)
+    assert [r["row"] for r in resumed.pending(rows)] == [2, 3]
+
+
+def test_lookup_page_stays_under_the_query_cost_cap():
+    client = ShopifyClient(store_id="test-store", api_version="2026-07", token="x")
+    client.__dict__["gql_schema"] = build_schema(ORDER_SDL)
+
+    per_order = 1 + client.selection_cost(client.ds.Order, analyze_refunds.ORDER_FIELDS)
+    assert 2 + analyze_refunds.LOOKUP_CHUNK * per_order <= MAX_QUERY_COST
@@ -0,0 +1,56 @@
+"""Tests for the memoized season parse (``season_cache.py``).
+
+Covers:
+  - (product id, updatedAt) keys, HTML-hash fallback, LRU eviction
+  - the persistent tier: read-through, write-back, failures ignored
+"""
+
+from lib.domain.registrations.refunds import (
+    FileSeasonStore,
+    SeasonDates,
+    SeasonDatesCache,
+)
+
+SEASON_HTML = "Season Dates 1/15/2025 – 3/15/2025 (5 weeks, off 1/29/2025)"
+OTHER_HTML = "<p><strong>Season Dates</strong>: June 14, 2026 – August 23, 2026 (8 weeks)</p>"
+
+
+def test_keyed_by_product_and_updated_at():
+    cache = SeasonDatesCache()
+    first = cache.get(SEASON_HTML, product_id="gid://shopify/Product/1", updated_at="2026-01-01T00:00:00Z")
+    again = cache.get(SEASON_HTML, product_id="gid://shopify/Product/1", updated_at="2026-01-01T00:00:00Z")
+    edited = cache.get(OTHER_HTML, product_id="gid://shopify/Product/1", updated_at="2026-02-01T00:00:00Z")
+
+    assert again is first
+    assert first == SeasonDates.from_html(SEASON_HTML)
+    assert edited.start_date == "6/14/2026"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_html_hash_fallback_and_eviction():
+    cache = SeasonDatesCache(maxsize=1)
+    assert cache.get(SEASON_HTML) is cache.get(SEASON_HTML)
+    cache.get(OTHER_HTML)
+    cache.get(SEASON_HTML)
+    assert cache.misses == 3
+
+
+def test_file_store_survives_a_new_process(tmp_path):
+    path = tmp_path / "seasons.json"
+    SeasonDatesCache(store=FileSeasonStore(path)).get(SEASON_HTML, product_id="p1", updated_at="t1")
+
+    cold = SeasonDatesCache(store=FileSeasonStore(path))
+    season = cold.get("", product_id="p1", updated_at="t1")  # served from disk, HTML not needed
+    assert season.off_dates == "1/29/2025"
+
+
+def test_store_failures_fall_back_to_parsing():
+    class _Broken:
+        def get(self, key):
+            raise ConnectionError("dynamo down")
+
+        def put(self, key, value):
+            raise ConnectionError("dynamo down")
+
+    season = SeasonDatesCache(store=_Broken()).get(SEASON_HTML, product_id="p1", updated_at="t1")
+    assert season.start_date == "1/15/2025"
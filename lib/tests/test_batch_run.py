@@ -0,0 +1,152 @@
+"""
+Unit tests for BatchRun.
+
+Covers:
+- bounded producer over a lazy iterable (never more than max_concurrent in flight)
+- duplicate / unhashable items
+- fatal abort leaves the unconsumed rest of the iterable untouched
+- stream() yields (item, result) in completion order and can be abandoned early
+- AdaptiveConcurrency: additive growth on stable latency, multiplicative cut on 429/Retry-After
+"""
+
+import asyncio
+import types
+
+from lib.tooling.batch_run import AdaptiveConcurrency, BatchRun, retry_after
+
+
+class _Probe:
+    def __init__(self, delay: float = 0.005):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, item):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if item == "boom":
+                raise ValueError(item)
+            return item
+        finally:
+            self.in_flight -= 1
+
+
+def test_lazy_items_are_admitted_only_as_slots_free_up():
+    probe = _Probe()
+
+    def items():
+        for i in range(50):
+            assert probe.in_flight < 4  # next item is pulled only after a slot frees
+            yield i
+
+    run = BatchRun.create(probe, items(), max_concurrent=4)
+    results = run.run_sync()
+    assert probe.peak == 4
+    assert len(results.successes) == 50
+    assert run.pending == {}
+
+
+def test_duplicate_and_unhashable_items():
+    results = BatchRun.create(_Probe(), [{"a": 1}, {"a": 1}, ["x"], "boom"], max_concurrent=2).run_sync()
+    assert [item for item, _ in results.successes].count({"a": 1}) == 2
+    assert [item for item, _ in results.failures] == ["boom"]
+
+
+def test_fatal_outcome_stops_consuming_items():
+    pulled = []
+
+    def items():
+        for item in ["ok", "boom", *["ok"] * 100]:
+            pulled.append(item)
+            yield item
+
+    run = BatchRun.create(_Probe(), items(), max_concurrent=2, is_fatal=lambda o: isinstance(o, ValueError))
+    results = run.run_sync()
+    assert results.fatal is not None and results.fatal[0] == "boom"
+    assert len(pulled) < 10
+
+
+def test_stream_yields_each_outcome():
+    async def main():
+        run = BatchRun.create(_Probe(), range(20), max_concurrent=5)
+        return [pair async for pair in run.stream()], run
+
+    outcomes, run = asyncio.run(main())
+    assert sorted(item for item, _ in outcomes) == list(range(20))
+    assert all(item == result for item, result in outcomes)
+    assert len(run.results.successes) == 20
+
+
+def test_stream_can_be_abandoned_early():
+    async def main():
+        run = BatchRun.create(_Probe(), range(1000), max_concurrent=5)
+        seen = 0
+        async for _ in run.stream():
+            seen += 1
+            if seen == 3:
+                break
+        await asyncio.sleep(0.05)
+        return run
+
+    run = asyncio.run(main())
+    assert len(run.results.successes) < 20
+
+
+def _response(status: int, **headers: str):
+    return types.SimpleNamespace(status_code=status, headers=headers, ok=status < 400)
+
+
+def test_adaptive_grows_while_latency_is_stable():
+    async def ok(_):
+        await asyncio.sleep(0.002)
+        return _response(200)
+
+    control = AdaptiveConcurrency(initial=2, max_limit=10, window=5)
+    BatchRun.create(ok, range(200), concurrency=control).run_sync()
+    assert control.limit == 10
+    assert control.raises >= 8 and control.cuts == 0
+    assert control.in_flight == 0
+
+
+def test_adaptive_cuts_on_overload_and_honours_retry_after():
+    control = AdaptiveConcurrency(initial=16, window=5)
+    control.overload(_response(429, **{"retry-after": "0.2"}))
+    assert control.limit == 8 and control.cuts == 1
+    # A second 429 from the same round-trip doesn't cut again.
+    control.overload(_response(503))
+    assert control.limit == 8
+
+    async def admitted_after():
+        start = asyncio.get_running_loop().time()
+        token = await control.acquire()
+        control.release(token)
+        return asyncio.get_running_loop().time() - start
+
+    assert asyncio.run(admitted_after()) >= 0.15
+
+
+def test_adaptive_converges_below_upstream_capacity():
+    active = 0
+
+    async def upstream(_):
+        nonlocal active
+        active += 1
+        try:
+            await asyncio.sleep(0.002)
+            return _response(429 if active > 12 else 200)
+        finally:
+            active -= 1
+
+    control = AdaptiveConcurrency(initial=4, max_limit=100, window=5)
+    results = BatchRun.create(upstream, range(1500), concurrency=control).run_sync()
+    assert control.cuts > 0
+    assert control.limit <= 24
+    assert len(results.successes) > len(results.failures)
+
+
+def test_retry_after_parses_seconds_and_http_dates():
+    assert retry_after(_response(429, **{"retry-after": "3"})) == 3.0
+    assert retry_after(_response(429, **{"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert retry_after(_response(200)) is None
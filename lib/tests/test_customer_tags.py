@@ -0,0 +1,90 @@
+"""
+Unit tests for bulk customer tagging (shopify-client/customer_tags.py).
+
+Covers:
+- emails resolved through OR-joined search ranges, exact matches only
+- per-email outcomes: not_found / already_tagged / tagged / error
+- tagsAdd calls chunked to the store's cost budget
+- quotes and backslashes in an address are escaped in the search clause
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "clients" / "shopify-client"))
+
+from cost_throttle import CostThrottle  # noqa: E402
+from customer_tags import _email_clause, apply_tags, plan_tags, tag_customers  # noqa: E402
+from shop_client import ShopifyClient, schema  # noqa: E402
+
+
+class _FakeShop:
+    def __init__(self, customers, *, bucket: float = 1000.0, fail_ids=()):
+        self.customers = customers
+        self.throttle = CostThrottle(maximum_available=bucket)
+        self.fail_ids = set(fail_ids)
+        self.searches: list[str] = []
+        self.documents: list[int] = []
+
+    def stream(self, op, *, ranges, **kwargs):
+        assert op is schema.customers.queries.by_email
+        self.searches.extend(ranges)
+        for clause in ranges:
+            for c in self.customers:
+                # Shopify's email search is fuzzy — return near-matches too.
+                if c["email"].split("@")[0] in clause:
+                    yield ShopifyClient.boxify(c)
+
+    def run_batch(self, calls, *, chunk_size):
+        self.documents.append(len(calls))
+        return [
+            ShopifyClient.boxify({"node": {"id": kw["id"]}, "userErrors": [{"field": ["id"], "message": "locked"}] if kw["id"] in self.fail_ids else []})
+            for _, kw in calls
+        ]
+
+
+def _customers(n):
+    return [{"id": f"gid://shopify/Customer/{i}", "email": f"player{i}@bars.com", "tags": []} for i in range(n)]
+
+
+def test_outcomes_per_email():
+    shop = _FakeShop([
+        {"id": "c1", "email": "a@bars.com", "tags": []},
+        {"id": "c2", "email": "b@bars.com", "tags": ["vet"]},
+        {"id": "c3", "email": "c@bars.com", "tags": []},
+        {"id": "cx", "email": "a@bars.com.au", "tags": []},
+    ], fail_ids={"c3"})
+    outcomes = tag_customers(shop, ["A@bars.com", "b@bars.com", "c@bars.com", "nobody@bars.com", "a@bars.com"], "vet")
+
+    assert [(o.email, o.status) for o in outcomes] == [
+        ("A@bars.com", "tagged"),
+        ("b@bars.com", "already_tagged"),
+        ("c@bars.com", "error"),
+        ("nobody@bars.com", "not_found"),
+    ]
+    assert outcomes[0].customer_id == "c1"
+    assert outcomes[2].detail == "locked"
+
+
+def test_lookups_and_mutations_are_chunked():
+    shop = _FakeShop(_customers(230), bucket=400.0)  # 400 * 0.5 / 10 → 20 fields per document
+    outcomes = plan_tags(shop, [f"player{i}@bars.com" for i in range(230)], "vet", lookup_chunk=50)
+    assert len(shop.searches) == 5
+    assert shop.searches[0].startswith('(email:"player0@bars.com" OR email:"player1@bars.com"')
+
+    apply_tags(shop, outcomes, "vet")
+    assert shop.documents == [20] * 11 + [10]
+    assert {o.status for o in outcomes} == {"tagged"}
+
+
+def test_dry_run_writes_nothing():
+    shop = _FakeShop(_customers(3))
+    outcomes = tag_customers(shop, [f"player{i}@bars.com" for i in range(3)], "vet", dry_run=True)
+    assert shop.documents == []
+    assert {o.status for o in outcomes} == {"would_tag"}
+
+
+def test_email_clause_escapes_quotes_and_backslashes():
+    assert _email_clause(['"odd"@bars.com', "back\\slash@bars.com", "a@bars.com"]) == (
+        '(email:"\\"odd\\"@bars.com" OR email:"back\\\\slash@bars.com" OR email:"a@bars.com")'
+    )
@@ -0,0 +1,133 @@
+"""
+Unit tests for GoogleClient.batch / paginate (google_client_v2/client.py).
+
+Covers:
+- results returned in input order across concurrent chunks
+- only rate-limited sub-requests are retried; other errors raise
+- QuotaBudget pacing and throttling
+- paginate prefetching the next page
+
+No network calls — the discovery service is a fake with new_batch_http_request.
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from googleapiclient.errors import HttpError
+from shared_utilities.clients.google_client_v2.batching import QuotaBudget, is_rate_limited
+from shared_utilities.clients.google_client_v2.client import GoogleClient
+
+
+def _error(status: int, reason: str = "") -> HttpError:
+    content = json.dumps({"error": {"errors": [{"reason": reason}]}}).encode()
+    return HttpError(SimpleNamespace(status=status, reason=reason), content)
+
+
+class _FakeService:
+    _rootDesc = {"name": "sheets"}  # noqa: N815
+
+    def __init__(self, flaky: dict[int, int] | None = None, broken: set[int] | None = None):
+        self.flaky = dict(flaky or {})  # request value -> rate-limited responses left
+        self.broken = broken or set()
+        self.batch_sizes: list[int] = []
+        self.lock = threading.Lock()
+
+    def new_batch_http_request(self, callback):
+        service = self
+        added: list[tuple[str, int]] = []
+
+        class _Batch:
+            def add(self, request, request_id):
+                added.append((request_id, request))
+
+            def execute(self):
+                with service.lock:
+                    service.batch_sizes.append(len(added))
+                for request_id, value in reversed(added):
+                    if service.flaky.get(value, 0) > 0:
+                        service.flaky[value] -= 1
+                        callback(request_id, None, _error(403, "userRateLimitExceeded"))
+                    elif value in service.broken:
+                        callback(request_id, None, _error(400, "badRequest"))
+                    else:
+                        callback(request_id, {"value": value}, None)
+
+        return _Batch()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("GOOGLE_DEFAULT_ADMIN_EMAIL", "admin@example.com")
+    monkeypatch.setattr("shared_utilities.clients.google_client_v2.client.backoff_delay", lambda attempt: 0.0)
+    return GoogleClient(sa_info={}, quotas={"sheets": 100_000})
+
+
+def test_batch_preserves_order_across_chunks(client):
+    service = _FakeService()
+    results = client.batch(service, list(range(120)))
+    assert [r["value"] for r in results] == list(range(120))
+    assert sorted(service.batch_sizes) == [20, 50, 50]
+
+
+def test_only_rate_limited_requests_are_retried(client):
+    service = _FakeService(flaky={3: 1, 7: 2})
+    results = client.batch(service, list(range(10)))
+    assert [r["value"] for r in results] == list(range(10))
+    assert service.batch_sizes == [10, 2, 1]
+    assert client.budget("sheets").rate < 100_000  # throttled by the 403s
+
+
+def test_other_errors_raise(client):
+    with pytest.raises(HttpError):
+        client.batch(_FakeService(broken={4}), list(range(10)))
+
+
+def test_is_rate_limited():
+    assert is_rate_limited(_error(429))
+    assert is_rate_limited(_error(403, "rateLimitExceeded"))
+    assert not is_rate_limited(_error(403, "forbidden"))
+    assert not is_rate_limited(ValueError())
+
+
+def test_quota_budget_paces_and_recovers():
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    budget = QuotaBudget(60, clock=lambda: now[0], sleep=sleep)
+    budget.acquire(60)
+    budget.acquire(30)
+    assert now[0] == pytest.approx(30.0)
+
+    budget.throttle()
+    assert budget.rate == 30
+    budget.recover()
+    assert budget.rate == 36
+
+
+def test_paginate_prefetches_next_page(client):
+    fetched: list[str | None] = []
+    release = threading.Event()
+
+    class _Request:
+        def __init__(self, token):
+            self.token = token
+
+        def execute(self, **kwargs):
+            fetched.append(self.token)
+            if self.token == "p2":
+                release.set()
+            nxt = {None: "p2", "p2": "p3", "p3": None}[self.token]
+            return {"items": [self.token or "p1"], **({"nextPageToken": nxt} if nxt else {})}
+
+    def list_method(pageToken=None, **params: Any):  # noqa: N803
+        return _Request(pageToken)
+
+    pages = client.iter_pages(list_method, "items")
+    assert next(pages) == ["p1"]
+    assert release.wait(1)  # page 2 requested before the caller asked for it
+    assert client.paginate(list_method, "items") == ["p1", "p2", "p3"]
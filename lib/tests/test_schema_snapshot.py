@@ -0,0 +1,90 @@
+"""
+Round-trip tests for schema_snapshot (shopify-client/schema_snapshot.py).
+
+Prunes the full admin schema to the ``schema`` registry's reach, serializes it
+to JSON, materializes it back, and checks every registered op builds and
+validates against the pruned schema exactly as it does against the full one.
+
+The full schema is the local admin pickle when present, otherwise the admin
+SDL checked in under backend/lib/clients/shopify_client_old. That SDL predates
+2026-07, so an op that doesn't build against it is skipped rather than failed.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from graphql import build_schema, validate
+
+_CLIENT_DIR = Path(__file__).resolve().parents[1] / "clients" / "shopify-client"
+sys.path.insert(0, str(_CLIENT_DIR))
+
+from schema_snapshot import load_exclude_types, materialize, prune  # noqa: E402
+from shop_client import PICKLE_PATH, QueryOp, ShopifyClient, parse_pickle, schema  # noqa: E402
+
+ADMIN_SDL = Path(__file__).resolve().parents[2] / "backend" / "lib" / "clients" / "shopify_client_old" / "shopify" / "schema.graphql"
+
+OPS = [
+    pytest.param(op, id=f"{resource}.{kind}.{name}")
+    for resource, entry in schema.items()
+    for kind in ("queries", "mutations")
+    for name, op in entry[kind].items()
+]
+
+
+@pytest.fixture(scope="module")
+def full_schema():
+    if PICKLE_PATH.exists():
+        return parse_pickle(PICKLE_PATH)
+    if not ADMIN_SDL.exists():
+        pytest.skip("no full admin schema available")
+    return build_schema(ADMIN_SDL.read_text())
+
+
+@pytest.fixture(scope="module")
+def snapshot(full_schema):
+    return json.loads(json.dumps(prune(full_schema, schema), separators=(",", ":")))
+
+
+@pytest.fixture(scope="module")
+def pruned_schema(snapshot):
+    return materialize(snapshot)
+
+
+def _client(gql_schema) -> ShopifyClient:
+    client = ShopifyClient(store_id="test-store", api_version="2026-07", token="x")
+    client.__dict__["gql_schema"] = gql_schema
+    return client
+
+
+def _request(client: ShopifyClient, op):
+    """The document ``run`` would send for ``op`` (first page for connections)."""
+    kwargs = {name: "1" for name in op.variables}
+    if isinstance(op, QueryOp) and op.connection is not None:
+        return client.page_request(op, None, client.connection_values(op, kwargs), 10, None)[0]
+    return client.single_request(op, None, kwargs, None)[0]
+
+
+def test_snapshot_is_a_strict_subset(full_schema, snapshot, pruned_schema):
+    assert set(snapshot["types"]) < set(full_schema.type_map)
+    assert set(pruned_schema.query_type.fields) < set(full_schema.query_type.fields)
+    assert set(pruned_schema.mutation_type.fields) < set(full_schema.mutation_type.fields)
+
+
+def test_types_ops_select_survive_exclude_types(snapshot):
+    assert "BulkOperation" in load_exclude_types()  # schema_filter_config.json lists it
+    assert "BulkOperation" in snapshot["types"]  # …but bulk_operations ops select it
+
+
+@pytest.mark.parametrize("op", OPS)
+def test_registered_op_validates_against_pruned_schema(op, full_schema, pruned_schema):
+    try:
+        _request(_client(full_schema), op)
+    except AttributeError as e:
+        pytest.skip(f"not in this admin schema version: {e}")
+
+    request = _request(_client(pruned_schema), op)
+
+    assert validate(pruned_schema, request.document) == []
+    assert validate(full_schema, request.document) == []
@@ -0,0 +1,99 @@
+"""
+Unit tests for ShopifyClient.run_batch (shopify-client/shop_client.py).
+
+Covers:
+- aliased fields + per-alias variables in one validated document
+- chunking, and results mapped back to calls in order
+- documents split by estimated query cost, and ``[n]`` bounding a connection
+- rejecting mixed query/mutation batches
+
+Runs against a tiny SDL schema — execute() is replaced, so no network.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from graphql import build_schema, print_ast, validate
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "clients" / "shopify-client"))
+
+from shop_client import ShopifyClient, schema  # noqa: E402
+
+SDL = """
+schema { query: QueryRoot mutation: Mutation }
+type QueryRoot { productVariant(id: ID!): ProductVariant product(id: ID!): Product }
+type ProductVariant { id: ID! title: String! sku: String price: String! inventoryQuantity: Int inventoryItem: InventoryItem! }
+type InventoryItem { id: ID! }
+type Product { id: ID! title: String! handle: String! status: String! media(first: Int): MediaConnection! }
+interface Media { id: ID! }
+type MediaImage implements Media { id: ID! }
+type MediaConnection { nodes: [Media!]! }
+input ProductUpdateInput { id: ID title: String tags: [String!] }
+type ProductUpdatePayload { product: Product userErrors: [UserError!]! }
+type UserError { field: [String!] message: String! }
+type Mutation { productUpdate(product: ProductUpdateInput): ProductUpdatePayload }
+"""
+
+
+@pytest.fixture
+def client():
+    client = ShopifyClient(store_id="test-store", api_version="2026-07", token="x")
+    client.__dict__["gql_schema"] = build_schema(SDL)
+    client.sent = []
+
+    def execute(request, variable_values, **kwargs):
+        assert validate(client.gql_schema, request.document) == []
+        client.sent.append((print_ast(request.document), variable_values))
+        aliases = sorted({key.split("_")[0] for key in variable_values})
+        return {
+            alias: {"product": {"id": variable_values[f"{alias}_product"]["id"]}, "userErrors": []}
+            if f"{alias}_product" in variable_values
+            else {"id": variable_values[f"{alias}_id"]}
+            for alias in aliases
+        }
+
+    client.execute = execute
+    return client
+
+
+def test_mutations_share_one_aliased_document(client):
+    calls = [(schema.products.mutations["update"], {"id": n, "title": f"Title {n}", "tags": ["a"]}) for n in (1, 2, 3)]
+    results = client.run_batch(calls)
+
+    assert len(client.sent) == 1
+    document, variables = client.sent[0]
+    assert "op0: productUpdate(product: $op0_product)" in document
+    assert "op2: productUpdate(product: $op2_product)" in document
+    assert variables["op1_product"] == {"id": "gid://shopify/Product/2", "title": "Title 2", "tags": ["a"]}
+    assert [r.product.id for r in results] == [f"gid://shopify/Product/{n}" for n in (1, 2, 3)]
+
+
+def test_chunks_and_keeps_call_order(client):
+    calls = [(schema.products.mutations["update"], {"id": n, "title": "t"}) for n in range(1, 6)]
+    results = client.run_batch(calls, chunk_size=2)
+    assert len(client.sent) == 3
+    assert [r.product.id.rsplit("/", 1)[1] for r in results] == ["1", "2", "3", "4", "5"]
+
+
+def test_chunks_by_estimated_cost(client):
+    lookup = schema.products.queries.by_id
+    assert client.call_cost(lookup, {"returns": ["id", "media.nodes.id"]}) == 1 + 2 + 250
+    assert client.call_cost(lookup, {"returns": ["id", "media[10].nodes.id"]}) == 1 + 2 + 10
+    assert client.call_cost(schema.products.mutations["update"], {}) == 10
+
+    results = client.run_batch([(lookup, {"id": n, "returns": ["id", "media.nodes.id"]}) for n in range(1, 9)])
+    assert [document.count("media(first: 250)") for document, _ in client.sent] == [3, 3, 2]
+    assert [r.id.rsplit("/", 1)[1] for r in results] == [str(n) for n in range(1, 9)]
+
+    client.sent.clear()
+    client.run_batch([(lookup, {"id": n, "returns": ["id", "media[10].nodes.id"]}) for n in range(1, 9)])
+    assert len(client.sent) == 1 and client.sent[0][0].count("media(first: 10)") == 8
+
+
+def test_rejects_mixed_batches(client):
+    with pytest.raises(TypeError, match="all QueryOps or all MutationOps"):
+        client.run_batch([
+            (schema.variants.queries.by_id, {"id": 1}),
+            (schema.products.mutations["update"], {"id": 1}),
+        ])
@@ -0,0 +1,105 @@
+"""
+Unit tests for ShopifyClient.op_cache (shopify-client/shop_client.py).
+
+Covers:
+- a repeat call is a hit and reuses the validated document
+- returns, schema and API version each get their own entry
+- PrevalidatedClient only skips validation on the schema the document was checked on
+- ``MutationOp.sign`` returns a copy: the cached document keeps no directive,
+  and the signed copy is validated like any other document
+
+Runs against a tiny SDL schema — nothing is executed.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from graphql import GraphQLError, build_schema, print_ast
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "clients" / "shopify-client"))
+
+from shop_client import CompiledOpCache, PrevalidatedClient, ShopifyClient, schema  # noqa: E402
+
+SDL = """
+schema { query: QueryRoot mutation: Mutation }
+type QueryRoot { productVariant(id: ID!): ProductVariant }
+type ProductVariant { id: ID! title: String! sku: String price: String! inventoryQuantity: Int inventoryItem: InventoryItem! }
+type InventoryItem { id: ID! }
+type Product { id: ID! title: String! handle: String! status: String! }
+input ProductUpdateInput { id: ID title: String tags: [String!] }
+type ProductUpdatePayload { product: Product userErrors: [UserError!]! }
+type UserError { field: [String!] message: String! }
+type Mutation { productUpdate(product: ProductUpdateInput): ProductUpdatePayload }
+"""
+
+UPDATE = schema.products.mutations["update"]
+
+
+def _client(gql_schema, api_version: str = "2026-07") -> ShopifyClient:
+    client = ShopifyClient(store_id="test-store", api_version=api_version, token="x")
+    client.__dict__["gql_schema"] = gql_schema
+    return client
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = CompiledOpCache()
+    monkeypatch.setattr(ShopifyClient, "op_cache", cache)
+    return cache
+
+
+def _compile(client: ShopifyClient, returns=None, variables=None):
+    values = UPDATE.variable_values(variables or {"id": 1, "title": "T"})
+    return client.compile_mutation(UPDATE, returns, values)
+
+
+def test_repeat_call_is_a_hit(cache):
+    client = _client(build_schema(SDL))
+
+    first = _compile(client)
+    second = _compile(client, variables={"id": 2, "title": "Other"})
+
+    assert second is first
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_shape_schema_and_version_each_miss(cache):
+    gql_schema = build_schema(SDL)
+    client = _client(gql_schema)
+    base = _compile(client)
+
+    assert _compile(client, returns=["product.id"]) is not base
+    assert _compile(client, variables={"id": 1}) is base  # same variable names: values don't matter
+    assert _compile(_client(gql_schema, api_version="2026-10")) is not base
+    assert _compile(_client(build_schema(SDL))) is not base
+    assert _compile(_client(gql_schema)) is base  # another client on the same schema + version shares it
+    assert cache.stats() == {"hits": 2, "misses": 4, "size": 4}
+
+
+def test_prevalidated_only_on_the_validating_schema(cache):
+    gql_schema = build_schema(SDL)
+    request = _compile(_client(gql_schema))
+
+    assert cache.is_validated(request.document, gql_schema)
+    assert not cache.is_validated(request.document, build_schema(SDL))
+    assert not cache.is_validated(request.document, None)
+
+
+def test_sign_copies_the_cached_document(cache):
+    gql_schema = build_schema(SDL)  # no @idempotent directive declared
+    client = _client(gql_schema)
+    values = UPDATE.variable_values({"id": 1, "title": "T"})
+    cached = client.compile_mutation(UPDATE, None, values)
+
+    signed = UPDATE.sign(cached, values, idempotency_key="k-1")
+
+    assert signed is not cached
+    assert "@idempotent(key: \"k-1\")" in print_ast(signed.document)
+    assert "@idempotent" not in print_ast(cached.document)
+    assert client.compile_mutation(UPDATE, None, values) is cached
+
+    gql = PrevalidatedClient(op_cache=cache, schema=gql_schema)
+    gql.validate(cached)  # skipped: already validated here
+    with pytest.raises(GraphQLError, match="idempotent"):
+        gql.validate(signed)  # the copy isn't in the cache, so gql validates it
@@ -0,0 +1,110 @@
+"""
+Unit tests for ShopifyClient's pooled session (shopify-client/shop_client.py).
+
+Covers:
+- arun/aexecute reuse one httpx client across calls (``async with`` lifecycle)
+- open_sync: sync run from several threads goes through the same pool
+- a sync call on the pool's own loop is refused instead of deadlocking
+- THROTTLED responses retry through the pooled path
+
+Runs against a tiny SDL schema and an httpx.MockTransport — no network.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+from graphql import build_schema
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "clients" / "shopify-client"))
+
+from shop_client import ShopifyClient, schema  # noqa: E402
+
+SDL = """
+schema { query: QueryRoot }
+type QueryRoot { productVariant(id: ID!): ProductVariant }
+type ProductVariant { id: ID! title: String! sku: String price: String! inventoryQuantity: Int inventoryItem: InventoryItem! }
+type InventoryItem { id: ID! }
+"""
+
+
+class _Shopify:
+    """MockTransport handler: echoes the variant id, optionally THROTTLED first."""
+
+    def __init__(self, throttle_first: int = 0):
+        self.requests = 0
+        self.throttle_first = throttle_first
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests += 1
+            throttled = self.requests <= self.throttle_first
+        if throttled:
+            return httpx.Response(200, json={"errors": [{"message": "Throttled", "extensions": {"code": "THROTTLED"}}]})
+        variant_id = json.loads(request.content)["variables"]["id"]
+        variant = {"id": variant_id, "title": "Open", "sku": None, "price": "25.00",
+                   "inventoryQuantity": 3, "inventoryItem": {"id": "gid://shopify/InventoryItem/1"}}
+        return httpx.Response(200, json={"data": {"productVariant": variant}})
+
+
+@pytest.fixture
+def shop():
+    client = ShopifyClient(store_id="pool-test-store", api_version="2026-07", token="x")
+    client.__dict__["gql_schema"] = build_schema(SDL)
+    return client
+
+
+def test_async_calls_share_one_http_client(shop):
+    handler = _Shopify()
+
+    async def main():
+        async with await shop.open(transport=httpx.MockTransport(handler)):
+            http = shop.pool.session.transport.client
+            variants = await asyncio.gather(*(shop.arun(schema.variants.queries.by_id, id=n) for n in range(1, 6)))
+            assert shop.pool.session.transport.client is http
+            return variants
+
+    variants = asyncio.run(main())
+    assert [v.id for v in variants] == [f"gid://shopify/ProductVariant/{n}" for n in range(1, 6)]
+    assert handler.requests == 5
+    assert shop.pool is None
+
+
+def test_sync_facade_reuses_the_pool_across_threads(shop):
+    handler = _Shopify()
+    shop.open_sync(transport=httpx.MockTransport(handler))
+    try:
+        http = shop.pool.session.transport.client
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            variants = list(pool.map(lambda n: shop.run(schema.variants.queries.by_id, id=n), range(1, 9)))
+        assert shop.pool.session.transport.client is http
+    finally:
+        shop.close()
+    assert [v.price for v in variants] == ["25.00"] * 8
+    assert handler.requests == 8
+
+
+def test_sync_call_on_the_pool_loop_is_refused(shop):
+    async def main():
+        async with await shop.open(transport=httpx.MockTransport(_Shopify())):
+            with pytest.raises(RuntimeError, match="await the a"):
+                shop.run(schema.variants.queries.by_id, id=1)
+
+    asyncio.run(main())
+
+
+def test_throttled_response_retries_through_the_pool(shop):
+    handler = _Shopify(throttle_first=1)
+    shop.open_sync(transport=httpx.MockTransport(handler))
+    try:
+        variant = shop.run(schema.variants.queries.by_id, id=7)
+    finally:
+        shop.close()
+    assert variant.id == "gid://shopify/ProductVariant/7"
+    assert handler.requests == 2
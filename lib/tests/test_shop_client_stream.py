@@ -0,0 +1,153 @@
+"""
+Unit tests for ShopifyClient's streaming reads (shopify-client/shop_client.py).
+
+Covers:
+- search_ranges: disjoint, ordered range clauses
+- stream_pages: one producer per range, pages yielded in ranges order,
+  producer errors re-raised, early close stops the producers
+- stream / astream: Box-wrapped nodes
+- astream: breaking or cancelling mid-fetch closes the page generator
+  without "generator already executing"
+
+walk_pages is replaced, so no schema or network is needed.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "clients" / "shopify-client"))
+
+from shop_client import ShopifyClient, schema, search_ranges  # noqa: E402
+
+OP = schema.orders.queries.by_email
+
+
+class _Pages:
+    """Fake ``walk_pages``: ``pages`` pages of two nodes per range, tagged with the range's query."""
+
+    def __init__(self, pages: int = 3, delay: float = 0.0, fail_on: str | None = None):
+        self.pages = pages
+        self.delay = delay
+        self.fail_on = fail_on
+        self.started: list[str] = []
+        self.stopped = threading.Event()
+
+    def __call__(self, op, returns, base_values, page_size, **kwargs):
+        query = base_values["query"]
+        self.started.append(query)
+        try:
+            for n in range(self.pages):
+                time.sleep(self.delay)
+                if self.fail_on and self.fail_on in query and n == 1:
+                    raise RuntimeError(f"boom in {query}")
+                yield [{"id": f"{query}|{n}|{i}", "displayFinancialStatus": "PAID"} for i in range(2)]
+        finally:
+            self.stopped.set()
+
+
+@pytest.fixture
+def client():
+    return ShopifyClient(store_id="test-store", api_version="2026-07", token="x")
+
+
+def _install(client, pages: _Pages) -> _Pages:
+    client.walk_pages = pages
+    return pages
+
+
+def test_search_ranges_are_disjoint_and_ordered():
+    assert search_ranges("created_at", ["2026-01-01", "2026-04-01"]) == [
+        "created_at:<'2026-01-01'",
+        "created_at:>='2026-01-01' AND created_at:<'2026-04-01'",
+        "created_at:>='2026-04-01'",
+    ]
+    assert search_ranges("order_number", [100]) == ["order_number:<100", "order_number:>=100"]
+    assert search_ranges("created_at", []) == [""]
+
+
+def test_stream_pages_yields_ranges_in_order(client):
+    pages = _install(client, _Pages(pages=2))
+    ranges = search_ranges("created_at", ["2026-01-01"])
+
+    ids = [node["id"] for page in client.stream_pages(OP, email="a@b.c", ranges=ranges, max_workers=2) for node in page]
+
+    queries = [f"email:a@b.c AND {clause}" for clause in ranges]
+    assert ids == [f"{q}|{n}|{i}" for q in queries for n in range(2) for i in range(2)]
+    assert sorted(pages.started) == sorted(queries)
+
+
+def test_stream_pages_reraises_producer_errors(client):
+    _install(client, _Pages(fail_on="created_at:>="))
+    ranges = search_ranges("created_at", ["2026-01-01"])
+
+    seen = []
+    with pytest.raises(RuntimeError, match="boom"):
+        for page in client.stream_pages(OP, email="a@b.c", ranges=ranges):
+            seen.extend(page)
+    assert len(seen) == 6 + 2  # the whole first range, then the second's first page
+
+
+def test_stream_pages_close_stops_producers(client):
+    pages = _install(client, _Pages(pages=1000))
+    stream = client.stream_pages(OP, email="a@b.c", prefetch=1)
+    next(stream)
+    stream.close()
+
+    assert pages.stopped.wait(2)
+
+
+def test_stream_boxifies_nodes(client):
+    _install(client, _Pages(pages=1))
+
+    nodes = list(client.stream(OP, email="a@b.c"))
+
+    assert [n.display_financial_status for n in nodes] == ["PAID", "PAID"]
+
+
+def test_astream_yields_every_node(client):
+    _install(client, _Pages(pages=3))
+
+    async def run():
+        return [node.id async for node in client.astream(OP, email="a@b.c")]
+
+    assert len(asyncio.run(run())) == 6
+
+
+def test_astream_break_closes_the_generator(client):
+    pages = _install(client, _Pages(pages=1000, delay=0.001))
+
+    async def run():
+        stream = client.astream(OP, email="a@b.c", prefetch=1)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+    asyncio.run(run())
+    assert pages.stopped.wait(2)
+
+
+def test_astream_cancelled_mid_fetch_closes_after_the_fetch(client):
+    pages = _install(client, _Pages(pages=2, delay=0.2))
+    errors = []
+
+    async def consume():
+        async for _ in client.astream(OP, email="a@b.c"):
+            pass
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)  # the first next() is blocked on the producer
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert pages.stopped.wait(2)
+    assert errors == []
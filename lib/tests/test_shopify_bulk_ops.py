@@ -0,0 +1,78 @@
+"""
+Unit tests for the Shopify bulk-export pipeline (shopify-client/bulk_ops.py).
+
+Covers:
+- __parentId reassembly, including grandchildren and the open-record window
+- submit → poll → stream against FakeBulkShop's local HTTP endpoint
+- failed / rejected operations
+
+No network calls beyond 127.0.0.1 — FakeBulkShop serves the JSONL.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "clients" / "shopify-client"))
+
+from bulk_fake import FakeBulkShop  # noqa: E402
+from bulk_ops import BulkOperationError, BulkQuery, reassemble, run  # noqa: E402
+
+CHILDREN = {
+    "LineItem": (None, ("lineItems",)),
+    "ProductVariant": ("LineItem", ("product", "variants")),
+}
+
+LINES = [
+    {"id": "gid://shopify/Order/1", "name": "#1001"},
+    {"__typename": "LineItem", "id": "gid://shopify/LineItem/11", "product": {"id": "p"}, "__parentId": "gid://shopify/Order/1"},
+    {"__typename": "ProductVariant", "id": "gid://shopify/ProductVariant/7", "__parentId": "gid://shopify/LineItem/11"},
+    {"id": "gid://shopify/Order/2", "name": "#1002"},
+    {"__typename": "LineItem", "id": "gid://shopify/LineItem/12", "product": None, "__parentId": "gid://shopify/Order/1"},
+]
+
+
+def _copy(lines):
+    return [dict(line) for line in lines]
+
+
+def test_reassemble_folds_children_into_parents():
+    first, second = reassemble(_copy(LINES), CHILDREN)
+    assert first["name"] == "#1001"
+    assert [li["id"] for li in first["lineItems"]["nodes"]] == ["gid://shopify/LineItem/11", "gid://shopify/LineItem/12"]
+    assert first["lineItems"]["nodes"][0]["product"]["variants"]["nodes"] == [{"id": "gid://shopify/ProductVariant/7"}]
+    assert "__parentId" not in first["lineItems"]["nodes"][0]
+    assert second["lineItems"] == {"nodes": []}
+
+
+def test_reassemble_rejects_child_outside_window():
+    with pytest.raises(BulkOperationError, match="not an open record"):
+        list(reassemble(_copy(LINES), CHILDREN, window=1))
+
+
+def test_run_streams_completed_operation():
+    with FakeBulkShop(_copy(LINES), polls_until_done=2, chunk_size=16) as shop:
+        slept: list[float] = []
+        records = list(run(shop, BulkQuery("{ orders { edges { node { id } } } }", CHILDREN), sleep=slept.append))
+    assert [r["name"] for r in records] == ["#1001", "#1002"]
+    assert shop.submitted == ["{ orders { edges { node { id } } } }"]
+    assert len(slept) == 2 and slept[1] > slept[0]
+
+
+def test_run_with_no_results_yields_nothing():
+    with FakeBulkShop([]) as shop:
+        assert list(run(shop, BulkQuery("{}"), sleep=lambda _: None)) == []
+
+
+def test_run_raises_on_failed_operation():
+    with FakeBulkShop(_copy(LINES), final_status="FAILED", error_code="TIMEOUT") as shop:
+        with pytest.raises(BulkOperationError, match="FAILED \\(TIMEOUT\\)"):
+            list(run(shop, BulkQuery("{}"), sleep=lambda _: None))
+
+
+def test_run_raises_on_rejected_query():
+    errors = [{"field": ["query"], "message": "A bulk query operation is already in progress", "code": "OPERATION_IN_PROGRESS"}]
+    with FakeBulkShop([], user_errors=errors) as shop:
+        with pytest.raises(BulkOperationError, match="OPERATION_IN_PROGRESS"):
+            list(run(shop, BulkQuery("{}")))
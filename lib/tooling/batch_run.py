@@ -1,11 +1,16 @@
 """Async batch execution infrastructure: concurrency primitives and operation contract."""
 
 import asyncio
-from collections.abc import Awaitable, Callable, Iterable
+import statistics
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
-from typing import Any, Self
+from email.utils import parsedate_to_datetime
+from itertools import count
+from typing import Any, Protocol, Self
 
-from anyio import CapacityLimiter, create_task_group
+from anyio import CapacityLimiter, Event, Semaphore, create_memory_object_stream, create_task_group, sleep
+from anyio.streams.memory import MemoryObjectSendStream
 
 # @TODO: add two generic hooks for callers that need structured fatal handling:
 #   - evaluate_fatal(outcome, is_fatal) -> bool  — pure predicate, no side effects; lets
@@ -37,6 +42,189 @@ class BatchResults:
             (self.successes if succeeded else self.failures).append((item, result))
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Concurrency controls — how many items BatchRun admits at once.
+# ─────────────────────────────────────────────────────────────────────────────
+
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+
+def retry_after(outcome: object) -> float | None:
+    """Seconds from an outcome's ``Retry-After`` header (delta or HTTP-date), if it has one."""
+    headers = getattr(outcome, "headers", None) or getattr(getattr(outcome, "raw", None), "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+def is_overload(outcome: object) -> bool:
+    """Upstream is shedding load: 429/503, or any response asking us to come back later."""
+    return getattr(outcome, "status_code", None) in OVERLOAD_STATUSES or retry_after(outcome) is not None
+
+
+class ConcurrencyControl(Protocol):
+    """Admission gate for ``BatchRun``: ``acquire`` before an item starts, ``observe`` its
+    outcome as soon as it has one, ``release`` once the item is fully done."""
+
+    ceiling: int
+
+    async def acquire(self) -> float: ...
+
+    def observe(self, token: float, outcome: object) -> None: ...
+
+    def release(self, token: float) -> None: ...
+
+
+@dataclass
+class FixedConcurrency:
+    """The default control: a constant cap of ``limit`` items in flight."""
+
+    limit: int
+    in_flight: int = field(default=0, init=False)
+    _slots: Semaphore | None = field(default=None, init=False, repr=False)
+
+    @property
+    def ceiling(self) -> int:
+        return self.limit
+
+    async def acquire(self) -> float:
+        if self._slots is None:
+            self._slots = Semaphore(self.limit)
+        await self._slots.acquire()
+        self.in_flight += 1
+        return time.monotonic()
+
+    def observe(self, token: float, outcome: object) -> None:
+        pass
+
+    def release(self, token: float) -> None:
+        self.in_flight -= 1
+        self._slots.release()  # type: ignore[union-attr]
+
+
+@dataclass
+class AdaptiveConcurrency:
+    """AIMD limit: grow while latency holds, halve when the upstream pushes back.
+
+    Every ``window`` successful outcomes, the window's p50 latency is compared
+    with ``baseline`` (the best p50 seen, drifting toward sustained levels).
+    Within ``tolerance`` × baseline the limit grows by ``step``; above it the
+    limit holds. An overload outcome (``is_overload``: 429/503/``Retry-After``)
+    multiplies the limit by ``backoff`` — at most once per p50 round-trip, since
+    requests already in flight report the same congestion — and a
+    ``Retry-After`` pauses all admissions until it passes.
+
+    ``limit``/``in_flight``/``stats()`` are live, for progress logs and tuning.
+    """
+
+    initial: int = 8
+    min_limit: int = 1
+    max_limit: int = 100
+    step: int = 1
+    backoff: float = 0.5
+    window: int = 20
+    tolerance: float = 1.5
+    is_overload: Callable[[object], bool] = is_overload
+    limit: float = field(default=0.0, init=False)
+    in_flight: int = field(default=0, init=False)
+    p50: float | None = field(default=None, init=False)
+    baseline: float | None = field(default=None, init=False)
+    raises: int = field(default=0, init=False)
+    cuts: int = field(default=0, init=False)
+    _samples: list[float] = field(default_factory=list, init=False, repr=False)
+    _last_cut: float = field(default=float("-inf"), init=False, repr=False)
+    _resume_at: float = field(default=0.0, init=False, repr=False)
+    _changed: Event | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.limit = float(max(self.min_limit, min(self.initial, self.max_limit)))
+
+    @property
+    def ceiling(self) -> int:
+        return self.max_limit
+
+    async def acquire(self) -> float:
+        while True:
+            wait = self._resume_at - time.monotonic()
+            if wait > 0:
+                await sleep(wait)
+            elif self.in_flight < int(self.limit):
+                break
+            else:
+                if self._changed is None:
+                    self._changed = Event()
+                await self._changed.wait()
+        self.in_flight += 1
+        return time.monotonic()
+
+    def observe(self, token: float, outcome: object) -> None:
+        if self.is_overload(outcome):
+            self.overload(outcome)
+        elif not isinstance(outcome, Exception):
+            self._sample(time.monotonic() - token)
+
+    def release(self, token: float) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def overload(self, outcome: object) -> None:
+        """Apply an overload signal: multiplicative cut, plus a pause for ``Retry-After``."""
+        now = time.monotonic()
+        delay = retry_after(outcome)
+        if delay:
+            self._resume_at = max(self._resume_at, now + delay)
+        if now - self._last_cut >= (self.p50 or 1.0):
+            self.limit = max(float(self.min_limit), self.limit * self.backoff)
+            self.cuts += 1
+            self._last_cut = now
+            self._samples.clear()
+        self._wake()
+
+    async def paused(self) -> None:
+        """Sleep out any ``Retry-After`` pause currently in force."""
+        wait = self._resume_at - time.monotonic()
+        if wait > 0:
+            await sleep(wait)
+
+    def _sample(self, latency: float) -> None:
+        self._samples.append(latency)
+        if len(self._samples) < self.window:
+            return
+        self.p50 = statistics.median(self._samples)
+        self._samples.clear()
+        if self.baseline is None or self.p50 < self.baseline:
+            self.baseline = self.p50
+        if self.p50 <= self.baseline * self.tolerance:
+            if self.limit < self.max_limit:
+                self.limit = min(float(self.max_limit), self.limit + self.step)
+                self.raises += 1
+                self._wake()
+        else:
+            self.baseline += (self.p50 - self.baseline) * 0.2
+
+    def _wake(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "p50": self.p50,
+            "baseline": self.baseline,
+            "raises": self.raises,
+            "cuts": self.cuts,
+        }
+
+
 @dataclass
 class BatchRun:
     """One concurrent batch execution: its items, concurrency cap, and results.
@@ -44,28 +232,46 @@ class BatchRun:
     Standard use: ``BatchRun.create(func, items).run_sync()`` — ``process`` calls
     ``func`` per item under the concurrency cap. Subclasses override ``process``
     (and optionally ``batch_and_run`` for setup/teardown) for custom execution.
+
+    ``items`` may be any iterable — a generator, or an async iterable — and is
+    consumed lazily: the producer in ``build`` admits a new item only when one
+    of the ``max_concurrent`` slots frees up, so at most ``max_concurrent``
+    tasks exist at once. ``pending`` maps item index → item for the ones in
+    flight, so after a fatal abort it holds the items that were interrupted.
+    To resume after an abort, pass a shared iterator (``iter(rows)``) as
+    ``items``: it is left positioned after the last item admitted. A list or
+    range is never consumed, so it still holds every item, processed or not.
+
+    ``concurrency`` swaps the fixed cap for another ``ConcurrencyControl``
+    (e.g. ``AdaptiveConcurrency()``); its ``ceiling`` then replaces
+    ``max_concurrent`` as the hard cap.
     """
 
     max_concurrent: int
-    pending: list[Any]
+    items: Iterable[Any] | AsyncIterable[Any]
     results: BatchResults
     func: Callable[[Any], Awaitable[Any]] | None = field(default=None, kw_only=True)
+    concurrency: ConcurrencyControl | None = field(default=None, kw_only=True)
+    pending: dict[int, Any] = field(default_factory=dict, init=False)
+    _sink: MemoryObjectSendStream[tuple[Any, Any]] | None = field(default=None, init=False, repr=False)
 
     @classmethod
     def create(
         cls,
         func: Callable[[Any], Awaitable[Any]],
-        items: Iterable[Any],
+        items: Iterable[Any] | AsyncIterable[Any],
         *,
         max_concurrent: int = 20,
         is_fatal: Callable[[object], bool] = lambda _: False,
+        concurrency: ConcurrencyControl | None = None,
     ) -> Self:
         """Construct an op over ``items`` with a fresh ``BatchResults``. No execution."""
         return cls(
             func=func,
             max_concurrent=max_concurrent,
-            pending=list(items),
+            items=items,
             results=BatchResults(is_fatal=is_fatal),
+            concurrency=concurrency,
         )
 
     def run_sync(self) -> BatchResults:
@@ -76,26 +282,88 @@ class BatchRun:
         asyncio.run(self.batch_and_run())
         return self.results
 
+    async def stream(self) -> AsyncIterator[tuple[Any, Any]]:
+        """Run the batch, yielding ``(item, result_or_exception)`` in completion order.
+
+        Outcomes are still recorded in ``results``. A slow consumer applies
+        backpressure: workers wait once ``max_concurrent`` outcomes are unread.
+        Leaving the loop early cancels whatever is still in flight.
+        """
+        send, receive = create_memory_object_stream[tuple[Any, Any]](self.max_concurrent)
+        self._sink = send
+
+        async def drive() -> None:
+            async with send:
+                await self.batch_and_run()
+
+        # A plain task, not a task group: the consumer may abandon this generator
+        # mid-iteration, and a cancel scope can't be left open across its yields.
+        task = asyncio.ensure_future(drive())
+        try:
+            async for outcome in receive:
+                yield outcome
+            await task
+        finally:
+            task.cancel()
+            receive.close()
+            self._sink = None
+
     async def batch_and_run(self) -> None:
         """Public entry point — owns the full lifecycle. Override to wrap setup/teardown around build."""
         await self.build()
 
     async def build(self) -> None:
-        """Schedule and run ``process`` for every pending item under the concurrency cap."""
-        limiter = CapacityLimiter(self.max_concurrent)
+        """Feed items to ``process``, admitting each only when ``concurrency`` has room."""
+        gate = self.concurrency = self.concurrency or FixedConcurrency(self.max_concurrent)
+        limiter = CapacityLimiter(gate.ceiling)
+        items = _aiter(self.items)
         async with create_task_group() as tg:
-            for item in self.pending[:]:
-                tg.start_soon(self.process, item, limiter, tg.cancel_scope.cancel)
+            for index in count():
+                token = await gate.acquire()  # before pulling, so a lazy source is never read ahead
+                try:
+                    item = await anext(items)
+                except StopAsyncIteration:
+                    gate.release(token)
+                    break
+                self.pending[index] = item
+                tg.start_soon(self._run_one, index, item, limiter, gate, token, tg.cancel_scope.cancel)
 
-    async def process(self, item: Any, limiter: CapacityLimiter, abort: Callable[[], None]) -> None:
-        """Execute ``func(item)`` under the concurrency cap; capture, classify, and record the outcome."""
+    async def _run_one(
+        self,
+        index: int,
+        item: Any,
+        limiter: CapacityLimiter,
+        gate: ConcurrencyControl,
+        token: float,
+        abort: Callable[[], None],
+    ) -> None:
+        try:
+            result = await self.process(item, limiter)
+            gate.observe(token, result)
+            fatal = self.results.is_fatal(result)
+            del self.pending[index]
+            self.results.record(item, result, fatal=fatal)
+            if self._sink is not None:
+                await self._sink.send((item, result))
+            if fatal:
+                abort()
+        finally:
+            gate.release(token)
+
+    async def process(self, item: Any, limiter: CapacityLimiter) -> Any:
+        """Execute ``func(item)`` under the concurrency cap; return its result, or the exception it raised."""
         async with limiter:
             try:
-                result = await self.func(item)  # type: ignore[misc]
+                return await self.func(item)  # type: ignore[misc]
             except Exception as exc:
-                result = exc
-        fatal = self.results.is_fatal(result)
-        self.pending.remove(item)
-        self.results.record(item, result, fatal=fatal)
-        if fatal:
-            abort()
+                return exc
+
+
+async def _aiter(items: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+    """Iterate sync or async ``items`` uniformly, pulling one item at a time."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
@@ -7,8 +7,12 @@ notation, and pivots order-level custom_attributes into their own columns.
 Custom-attribute column names are deduped across all orders and sorted
 alphabetically before the CSV header is written.
 
+Orders are flattened as pages arrive and spilled to a JSONL file beside the
+output while the header union is tracked; the CSV is then written in one
+sequential pass over the spill. Memory stays flat however many orders match.
+
 Usage (from monorepo root):
-    scripts/export_orders_by_product.py <product_id> [--output PATH]
+    scripts/export_orders_by_product.py <product_id> [--output PATH] [--bulk] [--gzip]
 
     product_id  Any of:
                   7678746361950
@@ -17,17 +21,25 @@ Usage (from monorepo root):
                   https://09fe59-3.myshopify.com/admin/products/7678746361950/variants
 
     --output    CSV output path (default: orders_<product_id>.csv)
+    --bulk      Fetch through one Bulk Operations job instead of paging
+                (recommended for season-end exports of thousands of orders)
+    --gzip      Gzip the CSV (default path gets a .csv.gz suffix; implied
+                by an --output path ending in .gz)
 """
 
 import csv
+import gzip
 import json
 import os
 import sys
+import tempfile
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from benedict import benedict as bdict
 from box import Box
+from bulk_ops import export as bulk_export
 from dotenv import load_dotenv
 from shop_client import ShopifyClient, schema
 
@@ -98,59 +110,77 @@ def order_to_row(order: Box) -> tuple[dict[str, Any], dict[str, str]]:
     return flat, custom_attrs
 
 
-def fetch_orders(client: ShopifyClient, product_id: str) -> list[Box]:
-    print(f"Fetching orders for product {product_id!r}...")
-    orders = client.run(
-        schema.orders.queries.by_product,
-        product_id=product_id,
-    )
-    print(f"  Retrieved {len(orders)} orders")
-    return orders
+def fetch_orders(client: ShopifyClient, product_id: str, bulk: bool = False) -> Iterator[Box]:
+    """Yield the product's orders as they arrive (pages are prefetched on worker threads)."""
+    print(f"Fetching orders for product {product_id!r}{' (bulk operation)' if bulk else ''}...")
+    if bulk:
+        return bulk_export(client, schema.orders.queries.by_product, product_id=product_id)
+    return client.stream(schema.orders.queries.by_product, product_id=product_id)
 
 
-def export_to_csv(orders: list[Box], output_path: Path) -> None:
-    # Pass 1: build all rows in memory, collect every CA key seen.
-    all_rows: list[tuple[dict[str, Any], dict[str, str]]] = []
-    all_ca_keys: set[str] = set()
+def _open_output(output_path: Path) -> IO[str]:
+    if output_path.suffix == ".gz":
+        return gzip.open(output_path, "wt", newline="", encoding="utf-8")
+    return open(output_path, "w", newline="", encoding="utf-8")
+
 
-    print(f"Flattening {len(orders)} orders...")
-    for order in orders:
-        flat, ca = order_to_row(order)
-        all_rows.append((flat, ca))
-        all_ca_keys.update(ca.keys())
+def export_to_csv(orders: Iterable[Box], output_path: Path) -> int:
+    """Write ``orders`` to ``output_path`` (gzipped if it ends in ``.gz``); return the row count.
 
-    # Determine standard columns: priority first, then the rest sorted.
+    Nothing is written when there are no orders.
+    """
     all_std_keys: set[str] = set()
-    for flat, _ in all_rows:
-        all_std_keys.update(flat.keys())
-
-    ordered_cols = [c for c in PRIORITY_COLUMNS if c in all_std_keys]
-    remaining = sorted(all_std_keys - set(ordered_cols))
-    ordered_cols.extend(remaining)
-
-    # Custom-attribute columns: alphabetical by attribute key.
-    ca_columns = [f"custom_attributes.{k}" for k in sorted(all_ca_keys)]
-    all_columns = ordered_cols + ca_columns
-
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=all_columns, extrasaction="ignore")
-        writer.writeheader()
-        for flat, ca in all_rows:
-            row: dict[str, Any] = dict(flat)
-            for k in sorted(all_ca_keys):
-                row[f"custom_attributes.{k}"] = ca.get(k, "")
-            writer.writerow(row)
+    all_ca_keys: set[str] = set()
+    count = 0
+
+    # Pass 1: flatten each order as it arrives and spill it; collect every key seen.
+    with tempfile.TemporaryFile("w+", encoding="utf-8", dir=output_path.parent, suffix=".jsonl") as spill:
+        for order in orders:
+            flat, ca = order_to_row(order)
+            all_std_keys.update(flat.keys())
+            all_ca_keys.update(ca.keys())
+            spill.write(json.dumps([flat, ca], default=str) + "\n")
+            count += 1
+            if count % 1000 == 0:
+                print(f"  Flattened {count} orders...")
+
+        if not count:
+            return 0
+        print(f"  Retrieved {count} orders")
+
+        # Determine standard columns: priority first, then the rest sorted.
+        ordered_cols = [c for c in PRIORITY_COLUMNS if c in all_std_keys]
+        remaining = sorted(all_std_keys - set(ordered_cols))
+        ordered_cols.extend(remaining)
+
+        # Custom-attribute columns: alphabetical by attribute key.
+        ca_keys = sorted(all_ca_keys)
+        ca_columns = [f"custom_attributes.{k}" for k in ca_keys]
+        all_columns = ordered_cols + ca_columns
+
+        # Pass 2: one sequential read of the spill.
+        spill.seek(0)
+        with _open_output(output_path) as f:
+            writer = csv.DictWriter(f, fieldnames=all_columns, extrasaction="ignore")
+            writer.writeheader()
+            for line in spill:
+                flat, ca = json.loads(line)
+                row: dict[str, Any] = dict(flat)
+                for k in ca_keys:
+                    row[f"custom_attributes.{k}"] = ca.get(k, "")
+                writer.writerow(row)
 
     print(
-        f"Wrote {len(all_rows)} rows × {len(all_columns)} columns "
+        f"Wrote {count} rows × {len(all_columns)} columns "
         f"({len(ca_columns)} custom-attribute columns) → {output_path}"
     )
+    return count
 
 
 def main() -> None:
     args = sys.argv[1:]
     if not args or args[0].startswith("-"):
-        sys.exit("Usage: export_orders_by_product.py <product_id> [--output PATH]")
+        sys.exit("Usage: export_orders_by_product.py <product_id> [--output PATH] [--bulk] [--gzip]")
 
     product_id = args[0]
 
@@ -162,15 +192,14 @@ def main() -> None:
         if idx + 1 >= len(args):
             sys.exit("--output requires a path argument")
         output_path = Path(args[idx + 1])
+    if "--gzip" in args and output_path.suffix != ".gz":
+        output_path = output_path.with_name(output_path.name + ".gz")
 
     client = ShopifyClient(store_id=STORE_ID, api_version=API_VERSION, token=TOKEN)
-    orders = fetch_orders(client, product_id)
+    orders = fetch_orders(client, product_id, bulk="--bulk" in args)
 
-    if not orders:
+    if not export_to_csv(orders, output_path):
         print("No orders found.")
-        return
-
-    export_to_csv(orders, output_path)
 
 
 if __name__ == "__main__":
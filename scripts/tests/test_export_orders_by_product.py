@@ -0,0 +1,116 @@
+"""
+Tests for export_to_csv (scripts/export_orders_by_product.py).
+
+The spilled export must write exactly what the previous in-memory exporter
+wrote for the same orders, both as a plain CSV and inside a gzipped one.
+``_in_memory_csv`` is that exporter, kept here as the reference.
+"""
+
+import csv
+import gzip
+import importlib.util
+import io
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from box import Box
+
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_ROOT / "lib" / "clients" / "shopify-client"))
+os.environ.setdefault("SHOPIFY__STORE_ID", "test-store")
+os.environ.setdefault("SHOPIFY__TOKEN__ADMIN", "x")
+
+_spec = importlib.util.spec_from_file_location("export_orders_by_product", _ROOT / "scripts" / "export_orders_by_product.py")
+exporter = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(exporter)
+
+ORDERS = [
+    {
+        "id": "gid://shopify/Order/1",
+        "name": "#1001",
+        "email": "ada@bars.com",
+        "created_at": "2026-03-01T12:00:00Z",
+        "cancelled_at": None,
+        "total_price_set": {"shop_money": {"amount": "95.00", "currency_code": "USD"}},
+        "customer": {"id": "gid://shopify/Customer/1", "first_name": "Ada", "last_name": "Lovelace"},
+        "tags": ["kickball", "waitlist"],
+        "subtotal_line_items_quantity": 2,
+        "test": False,
+        "custom_attributes": [{"key": "Team", "value": "Red, \"Rovers\""}, {"key": "Shirt", "value": "M"}],
+    },
+    {
+        "id": "gid://shopify/Order/2",
+        "name": "#1002",
+        "email": "grace@bars.com",
+        "note": "line one\nline two",
+        "total_price_set": {"shop_money": {"amount": "0.00", "currency_code": "USD"}},
+        "customer": None,
+        "current_total_weight": 1.5,
+        "custom_attributes": [{"key": "Pronouns", "value": "she/her"}, {"key": "", "value": "dropped"}],
+    },
+    {
+        "id": "gid://shopify/Order/3",
+        "name": "#1003",
+        "email": "linus@bars.com",
+        "display_financial_status": "REFUNDED",
+        "custom_attributes": None,
+        "line_items": {"nodes": [{"title": "Dodgeball – Sunday", "quantity": 1}]},
+    },
+]
+
+
+def _orders() -> list[Box]:
+    return [Box(order) for order in ORDERS]
+
+
+def _in_memory_csv(orders: list[Box]) -> str:
+    """The previous exporter: every row held in memory, then written in one go."""
+    all_rows: list[tuple[dict[str, Any], dict[str, str]]] = []
+    all_ca_keys: set[str] = set()
+    for order in orders:
+        flat, ca = exporter.order_to_row(order)
+        all_rows.append((flat, ca))
+        all_ca_keys.update(ca.keys())
+
+    all_std_keys: set[str] = set()
+    for flat, _ in all_rows:
+        all_std_keys.update(flat.keys())
+    ordered_cols = [c for c in exporter.PRIORITY_COLUMNS if c in all_std_keys]
+    ordered_cols.extend(sorted(all_std_keys - set(ordered_cols)))
+    all_columns = ordered_cols + [f"custom_attributes.{k}" for k in sorted(all_ca_keys)]
+
+    f = io.StringIO(newline="")
+    writer = csv.DictWriter(f, fieldnames=all_columns, extrasaction="ignore")
+    writer.writeheader()
+    for flat, ca in all_rows:
+        row: dict[str, Any] = dict(flat)
+        for k in sorted(all_ca_keys):
+            row[f"custom_attributes.{k}"] = ca.get(k, "")
+        writer.writerow(row)
+    return f.getvalue()
+
+
+def test_plain_output_matches_in_memory_export(tmp_path):
+    output = tmp_path / "orders.csv"
+
+    assert exporter.export_to_csv(iter(_orders()), output) == len(ORDERS)
+
+    assert output.read_bytes() == _in_memory_csv(_orders()).encode("utf-8")
+    assert list(tmp_path.iterdir()) == [output]  # the spill is gone
+
+
+def test_gzip_output_matches_in_memory_export(tmp_path):
+    output = tmp_path / "orders.csv.gz"
+
+    assert exporter.export_to_csv(iter(_orders()), output) == len(ORDERS)
+
+    assert gzip.decompress(output.read_bytes()) == _in_memory_csv(_orders()).encode("utf-8")
+
+
+@pytest.mark.parametrize("name", ["orders.csv", "orders.csv.gz"])
+def test_no_orders_writes_nothing(tmp_path, name):
+    assert exporter.export_to_csv(iter([]), tmp_path / name) == 0
+    assert list(tmp_path.iterdir()) == []